@@ -0,0 +1,38 @@
+"""unique workdays role date
+
+Revision ID: 5b7e2d9a4c1f
+Revises: d8cb9ab652d3
+Create Date: 2026-10-18 09:12:41.220517
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b7e2d9a4c1f"
+down_revision: Union[str, Sequence[str], None] = "d8cb9ab652d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # remove duplicados criados pela checagem antiga (read-then-insert), mantendo o menor id
+    op.execute(
+        """
+        DELETE FROM work_days wd
+        USING work_days dup
+        WHERE wd.role_id = dup.role_id
+          AND wd.date = dup.date
+          AND wd.id > dup.id
+        """
+    )
+
+    op.create_index("uq_work_days_role_id_date", "work_days", ["role_id", "date"], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("uq_work_days_role_id_date", table_name="work_days")
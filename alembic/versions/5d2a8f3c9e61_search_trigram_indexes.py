@@ -0,0 +1,47 @@
+"""search trigram indexes
+
+Revision ID: 5d2a8f3c9e61
+Revises: e41b8c6f2d93
+Create Date: 2026-10-18 17:48:26.118730
+
+"""
+
+import logging
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d2a8f3c9e61"
+down_revision: Union[str, Sequence[str], None] = "e41b8c6f2d93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGRAM_INDEXES = (
+    ("ix_companies_name_trgm", "companies", "name"),
+    ("ix_users_email_trgm", "users", "email"),
+    ("ix_users_first_name_trgm", "users", "first_name"),
+    ("ix_users_last_name_trgm", "users", "last_name"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # sem o pacote do pg_trgm no servidor o schema migra, mas o /search responde 503 ate a extensao ser instalada
+    available = op.get_bind().execute(sa.text("SELECT EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm')")).scalar()
+    if not available:
+        logging.getLogger("alembic.runtime.migration").warning("pg_trgm not available on this server; skipping trigram indexes, /search will return 503")
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin ({column} gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # a extensao fica: outros objetos podem depender dela
+    for name, _, _ in TRIGRAM_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
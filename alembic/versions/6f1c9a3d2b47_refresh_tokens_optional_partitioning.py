@@ -0,0 +1,119 @@
+"""refresh tokens optional partitioning
+
+Revision ID: 6f1c9a3d2b47
+Revises: e2b7c5d91f08
+Create Date: 2026-10-18 18:52:10.417305
+
+Opcional: so particiona com `alembic -x partition_refresh_tokens=true upgrade head` (PostgreSQL).
+Sem a flag a revisao nao altera nada. A tabela vira RANGE(expires_at) com particoes mensais
+refresh_tokens_pYYYYMM + default; o RefreshTokenPurgeJob cria as proximas e derruba as vencidas.
+"""
+
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = "6f1c9a3d2b47"
+down_revision: Union[str, Sequence[str], None] = "e2b7c5d91f08"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 2
+
+
+def _enabled() -> bool:
+    flag = context.get_x_argument(as_dictionary=True).get("partition_refresh_tokens", "")
+    return op.get_bind().dialect.name == "postgresql" and flag.lower() in ("1", "true", "yes")
+
+
+def _is_partitioned() -> bool:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return False
+    return bool(bind.execute(sa.text("SELECT EXISTS (SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid WHERE c.relname = 'refresh_tokens')")).scalar())
+
+
+def _month(index: int) -> datetime:
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def _month_index(value: datetime) -> int:
+    return value.year * 12 + value.month - 1
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not _enabled() or _is_partitioned():
+        return
+
+    op.drop_index("ix_refresh_tokens_user_id", table_name="refresh_tokens")
+    op.drop_index("ix_refresh_tokens_token_hash", table_name="refresh_tokens")
+    op.execute("ALTER TABLE refresh_tokens RENAME CONSTRAINT refresh_tokens_pkey TO refresh_tokens_unpartitioned_pkey")
+    op.rename_table("refresh_tokens", "refresh_tokens_unpartitioned")
+
+    # a chave de particao precisa estar na PK
+    op.execute(
+        """
+        CREATE TABLE refresh_tokens (
+            id UUID NOT NULL,
+            user_id UUID NOT NULL REFERENCES users (id),
+            token_hash VARCHAR NOT NULL,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+            expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            revoked BOOLEAN,
+            replaced_by VARCHAR,
+            CONSTRAINT refresh_tokens_pkey PRIMARY KEY (id, expires_at)
+        ) PARTITION BY RANGE (expires_at)
+        """
+    )
+    op.execute("CREATE TABLE refresh_tokens_default PARTITION OF refresh_tokens DEFAULT")
+
+    # do mes atual ate MONTHS_AHEAD ou ate o token copiado que expira por ultimo
+    first = _month_index(datetime.now(timezone.utc))
+    last_expiry = op.get_bind().execute(sa.text("SELECT max(expires_at) FROM refresh_tokens_unpartitioned")).scalar()
+    last = max(first + MONTHS_AHEAD, _month_index(last_expiry) if last_expiry else first)
+    for index in range(first, last + 1):
+        start, end = _month(index), _month(index + 1)
+        op.execute(f"CREATE TABLE refresh_tokens_p{start:%Y%m} PARTITION OF refresh_tokens FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')")
+
+    op.create_index("ix_refresh_tokens_user_id", "refresh_tokens", ["user_id"])
+    op.create_index("ix_refresh_tokens_token_hash", "refresh_tokens", ["token_hash"])
+
+    # tokens ja expirados nao servem para nada: nao sao copiados
+    op.execute(
+        "INSERT INTO refresh_tokens (id, user_id, token_hash, created_at, expires_at, revoked, replaced_by) "
+        "SELECT id, user_id, token_hash, created_at, expires_at, revoked, replaced_by FROM refresh_tokens_unpartitioned WHERE expires_at >= now()"
+    )
+    op.drop_table("refresh_tokens_unpartitioned")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not _is_partitioned():
+        return
+
+    op.drop_index("ix_refresh_tokens_user_id", table_name="refresh_tokens")
+    op.drop_index("ix_refresh_tokens_token_hash", table_name="refresh_tokens")
+    op.execute("ALTER TABLE refresh_tokens RENAME CONSTRAINT refresh_tokens_pkey TO refresh_tokens_partitioned_pkey")
+    op.rename_table("refresh_tokens", "refresh_tokens_partitioned")
+
+    op.create_table(
+        "refresh_tokens",
+        sa.Column("id", sa.UUID(as_uuid=True), primary_key=True),
+        sa.Column("user_id", sa.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False, index=True),
+        sa.Column("token_hash", sa.String(), nullable=False, index=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("revoked", sa.Boolean(), nullable=True),
+        sa.Column("replaced_by", sa.String(), nullable=True),
+    )
+    op.execute(
+        "INSERT INTO refresh_tokens (id, user_id, token_hash, created_at, expires_at, revoked, replaced_by) "
+        "SELECT id, user_id, token_hash, created_at, expires_at, revoked, replaced_by FROM refresh_tokens_partitioned"
+    )
+    # DROP do pai leva todas as particoes junto
+    op.drop_table("refresh_tokens_partitioned")
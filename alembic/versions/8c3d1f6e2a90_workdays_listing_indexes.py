@@ -0,0 +1,31 @@
+"""workdays listing indexes
+
+Revision ID: 8c3d1f6e2a90
+Revises: 5b7e2d9a4c1f
+Create Date: 2026-10-18 10:41:07.583214
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c3d1f6e2a90"
+down_revision: Union[str, Sequence[str], None] = "5b7e2d9a4c1f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # keyset (date, id) do GET /workdays sem filtro de role; com role_id o uq_work_days_role_id_date ja atende
+    op.create_index("ix_work_days_date_id", "work_days", ["date", "id"])
+    # filtro por company_id faz join work_days -> roles
+    op.create_index("ix_roles_company_id", "roles", ["company_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_roles_company_id", table_name="roles")
+    op.drop_index("ix_work_days_date_id", table_name="work_days")
@@ -0,0 +1,47 @@
+"""work shifts overlap constraints and range indexes
+
+Revision ID: a4f19c2e7b35
+Revises: 8c3d1f6e2a90
+Create Date: 2026-10-18 10:12:41.503118
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a4f19c2e7b35"
+down_revision: Union[str, Sequence[str], None] = "8c3d1f6e2a90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # turnos sem dia de trabalho nao tem como ser consultados nem agendados
+    op.execute("DELETE FROM work_shifts WHERE work_day_id IS NULL")
+    op.alter_column("work_shifts", "work_day_id", existing_type=sa.Integer(), nullable=False)
+    op.create_check_constraint("ck_work_shifts_time_order", "work_shifts", "end_time > start_time")
+    op.create_index("ix_work_shifts_work_day_id_start_time", "work_shifts", ["work_day_id", "start_time"])
+    # int4range(id, id, '[]') WITH = faz o papel do "work_day_id WITH =" sem depender da extensao btree_gist
+    op.execute(
+        """
+        ALTER TABLE work_shifts
+        ADD CONSTRAINT ex_work_shifts_no_overlap
+        EXCLUDE USING gist (int4range(work_day_id, work_day_id, '[]') WITH =, tstzrange(start_time, end_time) WITH &&)
+        """
+    )
+    # consultas de sobreposicao que nao filtram por dia (por role, empresa ou janela de tempo)
+    op.execute("CREATE INDEX ix_work_shifts_time_range ON work_shifts USING gist (tstzrange(start_time, end_time))")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS ix_work_shifts_time_range")
+    op.execute("ALTER TABLE work_shifts DROP CONSTRAINT IF EXISTS ex_work_shifts_no_overlap")
+    op.drop_index("ix_work_shifts_work_day_id_start_time", table_name="work_shifts")
+    op.drop_constraint("ck_work_shifts_time_order", "work_shifts", type_="check")
+    op.alter_column("work_shifts", "work_day_id", existing_type=sa.Integer(), nullable=True)
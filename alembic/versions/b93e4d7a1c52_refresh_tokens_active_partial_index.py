@@ -0,0 +1,36 @@
+"""refresh tokens active partial index
+
+Revision ID: b93e4d7a1c52
+Revises: 6f1c9a3d2b47
+Create Date: 2026-10-18 19:20:44.902113
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b93e4d7a1c52"
+down_revision: Union[str, Sequence[str], None] = "6f1c9a3d2b47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # token_hash nunca e filtrado (a busca e por jti e o hash e comparado na linha)
+    op.drop_index("ix_refresh_tokens_token_hash", table_name="refresh_tokens")
+    # revoke_all_for_user / rotacao so tocam tokens ativos; revogados antigos ficam fora do indice
+    op.create_index("ix_refresh_tokens_user_id_active", "refresh_tokens", ["user_id"], postgresql_where=sa.text("revoked IS NOT TRUE"))
+    # range scan do RefreshTokenPurgeJob (expires_at < now)
+    op.create_index("ix_refresh_tokens_expires_at", "refresh_tokens", ["expires_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_refresh_tokens_expires_at", table_name="refresh_tokens")
+    op.drop_index("ix_refresh_tokens_user_id_active", table_name="refresh_tokens")
+    op.create_index("ix_refresh_tokens_token_hash", "refresh_tokens", ["token_hash"])
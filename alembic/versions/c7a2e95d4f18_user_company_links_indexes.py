@@ -0,0 +1,77 @@
+"""user company links indexes
+
+Revision ID: c7a2e95d4f18
+Revises: b93e4d7a1c52
+Create Date: 2026-10-18 16:20:33.904112
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c7a2e95d4f18"
+down_revision: Union[str, Sequence[str], None] = "b93e4d7a1c52"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # vinculos duplicados: fica o de dono, depois o menor id
+    op.execute(
+        """
+        DELETE FROM user_company_roles ucr
+        USING user_company_roles dup
+        WHERE ucr.user_id = dup.user_id
+          AND ucr.company_id = dup.company_id
+          AND (
+            COALESCE(dup.is_owner, false) > COALESCE(ucr.is_owner, false)
+            OR (COALESCE(dup.is_owner, false) = COALESCE(ucr.is_owner, false) AND dup.id < ucr.id)
+          )
+        """
+    )
+    # user_id na frente: atende list_companies_and_roles_by_user, cache de vinculos e o cascade de users
+    op.create_unique_constraint("uq_user_company_roles_user_id_company_id", "user_company_roles", ["user_id", "company_id"])
+    # list_users_and_roles_by_company e o cascade de companies
+    op.create_index("ix_user_company_roles_company_id", "user_company_roles", ["company_id"])
+    # ON DELETE SET NULL de roles; vinculos sem papel nao entram no indice
+    op.create_index("ix_user_company_roles_role_id", "user_company_roles", ["role_id"], postgresql_where=sa.text("role_id IS NOT NULL"))
+
+    # mais de uma solicitacao pendente por par vira rejeitada, mantendo a mais antiga
+    op.execute(
+        """
+        UPDATE user_company_requests ucr
+        SET status = 'rejected', accepted = false
+        FROM user_company_requests dup
+        WHERE ucr.status = 'pending'
+          AND dup.status = 'pending'
+          AND ucr.user_id = dup.user_id
+          AND ucr.company_id = dup.company_id
+          AND (dup.created_at, dup.id) < (ucr.created_at, ucr.id)
+        """
+    )
+    # get_pending_by_user_and_company e a garantia contra duas pendentes criadas em paralelo
+    op.create_index(
+        "uq_user_company_requests_pending",
+        "user_company_requests",
+        ["user_id", "company_id"],
+        unique=True,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    # cascade de users
+    op.create_index("ix_user_company_requests_user_id", "user_company_requests", ["user_id"])
+    # list_by_company (com ou sem status) ordenado por created_at
+    op.create_index("ix_user_company_requests_company_id_status_created_at", "user_company_requests", ["company_id", "status", "created_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_user_company_requests_company_id_status_created_at", table_name="user_company_requests")
+    op.drop_index("ix_user_company_requests_user_id", table_name="user_company_requests")
+    op.drop_index("uq_user_company_requests_pending", table_name="user_company_requests")
+    op.drop_index("ix_user_company_roles_role_id", table_name="user_company_roles")
+    op.drop_index("ix_user_company_roles_company_id", table_name="user_company_roles")
+    op.drop_constraint("uq_user_company_roles_user_id_company_id", "user_company_roles", type_="unique")
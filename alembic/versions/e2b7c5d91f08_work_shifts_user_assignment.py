@@ -0,0 +1,31 @@
+"""work shifts user assignment
+
+Revision ID: e2b7c5d91f08
+Revises: a4f19c2e7b35
+Create Date: 2026-10-18 11:03:27.218904
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2b7c5d91f08"
+down_revision: Union[str, Sequence[str], None] = "a4f19c2e7b35"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("work_shifts", sa.Column("user_id", sa.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="SET NULL"), nullable=True))
+    op.create_index("ix_work_shifts_user_id_start_time", "work_shifts", ["user_id", "start_time"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_work_shifts_user_id_start_time", table_name="work_shifts")
+    op.drop_column("work_shifts", "user_id")
@@ -0,0 +1,28 @@
+"""users listing index
+
+Revision ID: e41b8c6f2d93
+Revises: c7a2e95d4f18
+Create Date: 2026-10-18 17:05:12.446301
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e41b8c6f2d93"
+down_revision: Union[str, Sequence[str], None] = "c7a2e95d4f18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # keyset (created_at, id) desc do GET /users, lido de tras para frente
+    op.create_index("ix_users_created_at_id", "users", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_created_at_id", table_name="users")
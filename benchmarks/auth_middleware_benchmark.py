@@ -0,0 +1,83 @@
+"""Requisicoes/s num endpoint autenticado trivial: AuthMiddleware ASGI vs a antiga BaseHTTPMiddleware.
+
+Nao usa banco; so o middleware, o JWT real e um endpoint que devolve o user_id.
+Uso: python -m benchmarks.auth_middleware_benchmark [--requests 5000] [--concurrency 50]
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.app.controllers.middlewares.auth_middleware import AuthMiddleware
+from src.infra.services.jwt_token_service import JWTTokenService
+
+PUBLIC_PATHS = ["/auth/login", "/auth/refresh", "/auth/logout", "/users/register", "/docs", "/openapi.json", "/health"]
+
+
+class LegacyAuthMiddleware(BaseHTTPMiddleware):
+    # implementacao anterior, mantida aqui so para comparacao
+    def __init__(self, app, token_service, access_cookie_name: str, public_paths: list[str]):
+        super().__init__(app)
+        self.token_service = token_service
+        self.access_cookie_name = access_cookie_name
+        self.public_paths = public_paths
+
+    async def dispatch(self, request: Request, call_next):
+        if any(request.url.path.startswith(p) for p in self.public_paths):
+            return await call_next(request)
+        access_token = request.cookies.get(self.access_cookie_name)
+        if not access_token:
+            return JSONResponse({"detail": "Access token not found"}, status_code=status.HTTP_401_UNAUTHORIZED)
+        payload = self.token_service.verify_access_token(access_token)
+        if not payload:
+            return JSONResponse({"detail": "Access token invalid or expired"}, status_code=status.HTTP_401_UNAUTHORIZED)
+        request.state.user_id = payload.get("sub")
+        return await call_next(request)
+
+
+def build_app(middleware_cls, token_service) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/me")
+    async def me(request: Request):
+        return {"user_id": request.state.user_id}
+
+    app.add_middleware(middleware_cls, token_service=token_service, access_cookie_name="access_token", public_paths=PUBLIC_PATHS)
+    return app
+
+
+async def measure(app: FastAPI, token: str, requests: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", cookies={"access_token": token}) as client:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _call() -> None:
+            async with semaphore:
+                response = await client.get("/me")
+                assert response.status_code == 200
+
+        await asyncio.gather(*(_call() for _ in range(min(200, requests))))
+        started = time.perf_counter()
+        await asyncio.gather(*(_call() for _ in range(requests)))
+        return requests / (time.perf_counter() - started)
+
+
+async def main(requests: int, concurrency: int) -> None:
+    token_service = JWTTokenService()
+    token = token_service.create_access_token("00000000-0000-0000-0000-000000000001")
+    for name, cls in (("BaseHTTPMiddleware", LegacyAuthMiddleware), ("ASGI", AuthMiddleware)):
+        rps = await measure(build_app(cls, token_service), token, requests, concurrency)
+        print(f"{name:>20}: {rps:8.0f} req/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
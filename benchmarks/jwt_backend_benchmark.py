@@ -0,0 +1,42 @@
+"""Throughput de encode/decode de access tokens por backend e algoritmo.
+
+Chaves geradas na hora; nao usa banco nem a app.
+Uso: python -m benchmarks.jwt_backend_benchmark [--iterations 5000]
+"""
+
+import argparse
+import time
+
+from src.infra.services.jwt_backends import JWT_BACKENDS
+from src.infra.services.jwt_keys import SUPPORTED_ALGORITHMS, KeyRing, generate_jwk
+
+
+def _ops_per_second(func, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return iterations / (time.perf_counter() - started)
+
+
+def main(iterations: int) -> None:
+    payload = {"sub": "00000000-0000-0000-0000-000000000001", "iat": int(time.time()), "exp": int(time.time()) + 900}
+    print(f"{'backend':>12} {'alg':>6} {'encode/s':>10} {'decode/s':>10}")
+    for alg in SUPPORTED_ALGORITHMS:
+        ring = KeyRing.from_jwks({"keys": [generate_jwk(alg, kid="bench")]})
+        for name, backend_cls in JWT_BACKENDS.items():
+            try:
+                backend = backend_cls(ring)
+            except ValueError:
+                print(f"{name:>12} {alg:>6} {'n/a':>10} {'n/a':>10}")
+                continue
+            token = backend.encode(payload)
+            encode_rate = _ops_per_second(lambda: backend.encode(payload), iterations)
+            decode_rate = _ops_per_second(lambda: backend.decode(token), iterations)
+            print(f"{name:>12} {alg:>6} {encode_rate:>10.0f} {decode_rate:>10.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+    main(args.iterations)
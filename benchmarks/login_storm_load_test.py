@@ -0,0 +1,88 @@
+"""Latencia de /health enquanto uma rajada de logins roda no mesmo worker.
+
+Usa o banco de SQLALCHEMY_DATABASE_URI (com as migrations aplicadas).
+Uso: python -m benchmarks.login_storm_load_test [--logins 200] [--concurrency 50] [--inline]
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+import httpx
+
+from main import app
+from src.app.dependencies import get_password_hasher
+from src.infra.services.password_hasher import pwd_ctx
+
+
+class InlinePasswordHasher:
+    # comportamento antigo: bcrypt direto no event loop
+    async def hash(self, password: str) -> str:
+        return pwd_ctx.hash(password)
+
+    async def verify(self, plain: str, hashed: str) -> bool:
+        return pwd_ctx.verify(plain, hashed)
+
+    def metrics(self) -> dict:
+        return {}
+
+
+def _percentile(samples: list[float], p: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))] if ordered else 0.0
+
+
+async def run(logins: int, concurrency: int) -> None:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        email = f"storm-{uuid.uuid4().hex[:8]}@bench.local"
+        await client.post("/users/register", json={"first_name": "Storm", "last_name": "Bench", "email": email, "password": "secret", "active": True})
+
+        health_ms: list[float] = []
+        statuses: dict[int, int] = {}
+        done = asyncio.Event()
+
+        async def _probe() -> None:
+            while not done.is_set():
+                started = time.perf_counter()
+                await client.get("/health")
+                health_ms.append((time.perf_counter() - started) * 1000)
+                await asyncio.sleep(0.01)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _login() -> None:
+            async with semaphore:
+                response = await client.post("/auth/login", json={"email": email, "password": "secret"})
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        probe = asyncio.create_task(_probe())
+        started = time.perf_counter()
+        await asyncio.gather(*(_login() for _ in range(logins)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await probe
+
+        print(f"logins={logins} concurrency={concurrency} elapsed={elapsed:.2f}s statuses={statuses}")
+        print(f"/health samples={len(health_ms)} p50={_percentile(health_ms, 0.5):.1f}ms p99={_percentile(health_ms, 0.99):.1f}ms max={max(health_ms, default=0):.1f}ms")
+        # os cookies do login autenticam a chamada
+        metrics = await client.get("/metrics")
+        if metrics.status_code == 200:
+            print(metrics.json())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--inline", action="store_true", help="roda bcrypt no event loop para comparar")
+    args = parser.parse_args()
+
+    if args.inline:
+        app.dependency_overrides[get_password_hasher] = InlinePasswordHasher
+    asyncio.run(run(args.logins, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
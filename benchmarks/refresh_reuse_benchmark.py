@@ -0,0 +1,91 @@
+"""Latencia da deteccao de reuso de refresh token: indice parcial e bloom filter.
+
+Semeia um usuario com muitos tokens revogados numa transacao que e desfeita no final.
+Usa o banco de SQLALCHEMY_DATABASE_URI (com as migrations aplicadas).
+Uso: python -m benchmarks.refresh_reuse_benchmark [--revoked 200000] [--samples 200]
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.domain.errors import RefreshReuseDetected
+from src.infra.db.unit_of_work import SqlAlchemyUnitOfWork
+from src.infra.repositories.jwt_repository import JWTRepository
+from src.infra.repositories.users_repository import UsersRepository
+from src.infra.services.jwt_token_service import JWTTokenService
+from src.infra.services.revoked_jti_filter import RevokedJtiBloomFilter
+from src.infra.settings.config import get_settings
+from src.usecases.auth_service import AuthService
+
+
+def _percentiles(samples: list[float]) -> str:
+    ordered = sorted(samples)
+    return f"p50={ordered[len(ordered) // 2]:.3f}ms p99={ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))]:.3f}ms"
+
+
+async def _time_reuse(service: AuthService, jti: str, samples: int) -> list[float]:
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        try:
+            await service.rotate_refresh("raw", jti)
+        except RefreshReuseDetected:
+            pass
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+async def main(revoked: int, samples: int) -> None:
+    engine = create_async_engine(get_settings().SQLALCHEMY_DATABASE_URI)
+    async with engine.connect() as conn:
+        tx = await conn.begin()
+        # commits da unit of work viram savepoints; tudo e desfeito no rollback final
+        session = AsyncSession(bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint")
+        try:
+            user = await UsersRepository(session).create(
+                first_name="Bench", last_name="Reuse", email=f"reuse-{uuid.uuid4().hex[:8]}@bench.local", hashed_password="hashed", active=True
+            )
+            await session.execute(
+                text(
+                    "INSERT INTO refresh_tokens (id, user_id, token_hash, expires_at, revoked) "
+                    "SELECT gen_random_uuid(), :user_id, md5(g::text), now() + interval '1 day', true FROM generate_series(1, :n) g"
+                ),
+                {"user_id": user.id, "n": revoked},
+            )
+            repo = JWTRepository(session)
+            reused_jti = str(uuid.uuid4())
+            await repo.save_refresh_token(jti=reused_jti, user_id=user.id, token_hash="hash", expires_at=datetime.now(timezone.utc) + timedelta(days=1))
+            await repo.revoke_token(await repo.get_by_jti(reused_jti))
+            await session.execute(text("ANALYZE refresh_tokens"))
+
+            token_service = JWTTokenService()
+            uow = SqlAlchemyUnitOfWork(session)
+            without_filter = AuthService(None, repo, token_service, 1, None, uow)
+            print(f"{revoked} revoked tokens for one user, {samples} reuse attempts each")
+            print(f"  DB path, partial index:      {_percentiles(await _time_reuse(without_filter, reused_jti, samples))}")
+
+            await session.execute(text("DROP INDEX ix_refresh_tokens_user_id_active"))
+            await session.execute(text("ANALYZE refresh_tokens"))
+            print(f"  DB path, user_id index only: {_percentiles(await _time_reuse(without_filter, reused_jti, samples))}")
+
+            with_filter = AuthService(None, repo, token_service, 1, None, uow, revoked_filter=RevokedJtiBloomFilter())
+            await _time_reuse(with_filter, reused_jti, 1)
+            print(f"  bloom filter hit:            {_percentiles(await _time_reuse(with_filter, reused_jti, samples))}")
+        finally:
+            await session.close()
+            await tx.rollback()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--revoked", type=int, default=200_000)
+    parser.add_argument("--samples", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.revoked, args.samples))
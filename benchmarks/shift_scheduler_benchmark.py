@@ -0,0 +1,47 @@
+"""Tempo do escalonador de turnos em funcao do tamanho do problema.
+
+Uso: python -m benchmarks.shift_scheduler_benchmark
+"""
+
+import argparse
+import time
+from datetime import date, datetime, timedelta, timezone
+
+from src.usecases.scheduling.shift_scheduler import SchedulingProblem, ShiftSlot, solve_schedule
+
+
+def build_problem(users: int, days: int, roles: int = 10, cooldown_days: int = 1) -> SchedulingProblem:
+    users_by_role = {f"role-{r}": [f"user-{u}" for u in range(r, users, roles)] for r in range(roles)}
+    # turnos suficientes para ocupar quase toda a equipe respeitando o descanso
+    shifts_per_day = {role_id: max(1, len(role_users) // (cooldown_days + 1)) for role_id, role_users in users_by_role.items()}
+
+    first_day = date(2026, 1, 1).toordinal()
+    slots = []
+    shift_id = 0
+    for offset in range(days):
+        day = first_day + offset
+        start = datetime.combine(date.fromordinal(day), datetime.min.time(), tzinfo=timezone.utc)
+        for role_id, count in shifts_per_day.items():
+            for n in range(count):
+                shift_id += 1
+                slots.append(ShiftSlot(shift_id=shift_id, role_id=role_id, day=day, start_time=start + timedelta(minutes=n)))
+
+    return SchedulingProblem(slots=slots, users_by_role=users_by_role, cooldown_by_role={role_id: cooldown_days for role_id in users_by_role})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cooldown-days", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'users':>6} {'days':>5} {'shifts':>8} {'assigned':>9} {'seconds':>8}")
+    for users, days in ((50, 30), (100, 90), (250, 180), (500, 365), (1000, 365)):
+        problem = build_problem(users, days, cooldown_days=args.cooldown_days)
+        started = time.perf_counter()
+        result = solve_schedule(problem)
+        elapsed = time.perf_counter() - started
+        print(f"{users:>6} {days:>5} {len(problem.slots):>8} {len(result.assignments):>9} {elapsed:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
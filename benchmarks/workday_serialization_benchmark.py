@@ -0,0 +1,56 @@
+"""CPU por resposta do GET /workdays: asdict + validacao pelo response_model vs TrustedDTOEncoder.
+
+Nao usa banco: serializa uma pagina de WorkDay montada em memoria.
+Uso: python -m benchmarks.workday_serialization_benchmark [--rows 10000] [--repeat 20]
+"""
+
+import argparse
+import time
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from pydantic import TypeAdapter
+
+from src.app.controllers.schemas.pydantic.workdays_dtos import WORKDAY_ENCODER, WorkdayPageResponse
+from src.domain.entities.work_day import WorkDay
+
+
+def build_page(rows: int) -> list[WorkDay]:
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [WorkDay(id=i, role_id=f"role-{i % 10}", date=start + timedelta(days=i // 10), is_holiday=False, weekday=(i // 10) % 7) for i in range(rows)]
+
+
+def cpu_ms_per_call(fn: Callable[[], bytes], repeat: int) -> float:
+    fn()
+    started = time.process_time()
+    for _ in range(repeat):
+        fn()
+    return (time.process_time() - started) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    items = build_page(args.rows)
+    page_model = TypeAdapter(WorkdayPageResponse)
+
+    def response_model_path() -> bytes:
+        # caminho antigo: dicts do asdict revalidados pelo response_model e entao serializados
+        return page_model.dump_json(page_model.validate_python({"items": [asdict(w) for w in items], "next_cursor": None}))
+
+    def trusted_path() -> bytes:
+        return bytes(WORKDAY_ENCODER.page(items, None).body)
+
+    assert response_model_path() == trusted_path()
+
+    print(f"{'path':<24} {'rows':>7} {'cpu ms/resp':>12}")
+    for name, fn in (("asdict+response_model", response_model_path), ("trusted encoder", trusted_path)):
+        print(f"{name:<24} {args.rows:>7} {cpu_ms_per_call(fn, args.repeat):>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
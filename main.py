@@ -1,42 +1,92 @@
+from contextlib import asynccontextmanager
+from datetime import timedelta
+
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import MetaData
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.app.controllers import auth_router, company_router, link_user_to_company_router, role_router, user_company_requests_router, user_router, workday_router
+from src.app.controllers import (
+    auth_router,
+    company_router,
+    link_user_to_company_router,
+    role_router,
+    schedule_router,
+    search_router,
+    user_company_requests_router,
+    user_router,
+    workday_router,
+    workshift_router,
+)
 from src.app.controllers.auth_config import AuthCookieSettings
 from src.app.controllers.middlewares.auth_middleware import AuthMiddleware
+from src.app.controllers.middlewares.primary_stickiness_middleware import PrimaryStickinessMiddleware
 from src.app.dependencies import (
     get_auth_cookie_settings,
     get_companies_repository,
     get_jwt_repository,
+    get_password_hasher,
+    get_permissions_query_service,
+    get_revoked_token_filter,
     get_refresh_token_expire_days,
     get_roles_repository,
+    get_search_repository,
     get_user_company_requests_repository,
     get_token_service,
+    get_unit_of_work,
     get_user_company_roles_repository,
     get_users_repository,
     get_workdays_repository,
+    get_workshifts_repository,
 )
 from src.infra.db import models as _models  # noqa: F401
+from src.infra.db.engine_factory import connection_budget_warning
+from src.infra.db.unit_of_work import SqlAlchemyUnitOfWork
 from src.infra.repositories.companies_repository import CompaniesRepository
 from src.infra.repositories.jwt_repository import JWTRepository
+from src.infra.repositories.permissions_query_service import PermissionsQueryService
 from src.infra.repositories.roles_repository import RolesRepository
+from src.infra.repositories.search_repository import SearchRepository
 from src.infra.repositories.user_company_requests_repository import UserCompanyRequestsRepository
 from src.infra.repositories.user_company_roles_repository import UserCompanyRolesRepository
 from src.infra.repositories.users_repository import UsersRepository
 from src.infra.repositories.workdays_repository import WorkdaysRepository
-from src.infra.services.jwt_token_service import JWTTokenService
+from src.infra.repositories.workshifts_repository import WorkShiftsRepository
+from src.infra.services.jwt_backends import build_jwt_backend
+from src.infra.services.jwt_keys import KeyRing
+from src.infra.services.jwt_token_service import JWTTokenService, access_revocation_warning
+from src.infra.services.membership_cache import build_cache_backend, build_membership_cache, resolve_membership_cache_backend
+from src.infra.services.password_hasher import ThreadPoolPasswordHasher
+from src.infra.services.refresh_token_purge_job import RefreshTokenPurgeJob
+from src.infra.services.revoked_jti_filter import RevokedJtiBloomFilter
+from src.infra.services.verified_token_cache import VerifiedTokenCache
 from src.infra.settings.config import get_settings
-from src.infra.settings.connection import get_db_session
+from src.infra.settings.connection import (
+    PRIMARY_UNTIL_COOKIE,
+    PRIMARY_UNTIL_STATE,
+    async_session_factory,
+    engine,
+    engine_options,
+    get_db_session,
+    pool_metrics,
+    replica_engines,
+    replica_router,
+)
+from src.infra.settings.logging_config import app_logger
 from src.interfaces.icompanies_repository import ICompaniesRepository
 from src.interfaces.ijwt_repository import IJWTRepository
+from src.interfaces.ipassword_hasher import IPasswordHasher
+from src.interfaces.ipermissions_query_service import IPermissionsQueryService
+from src.interfaces.irevoked_token_filter import IRevokedTokenFilter
+from src.interfaces.isearch_repository import ISearchRepository
 from src.interfaces.iroles_repository import IRolesRepository
 from src.interfaces.itoken_service import ITokenService
+from src.interfaces.iunit_of_work import IUnitOfWork
 from src.interfaces.iuser_company_requests_repository import IUserCompanyRequestsRepository
 from src.interfaces.iuser_company_roles_repository import IUserCompanyRolesRepository
 from src.interfaces.iusers_repository import IUsersRepository
 from src.interfaces.iworkdays_repository import IWorkdaysRepository
+from src.interfaces.iworkshifts_repository import IWorkShiftsRepository
 
 origins = [
     "http://localhost",
@@ -49,7 +99,25 @@ origins = [
 
 metadata = MetaData()
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    budget_warning = connection_budget_warning(engine_options)
+    if budget_warning:
+        app_logger.warning(budget_warning)
+    if membership_cache_warning:
+        app_logger.warning(membership_cache_warning)
+    if revocation_warning:
+        app_logger.warning(revocation_warning)
+    purge_job.start()
+    try:
+        yield
+    finally:
+        await purge_job.stop()
+        password_hasher.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
 
 settings = get_settings()
 
@@ -61,17 +129,50 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-token_service = JWTTokenService()
-public_paths = ["/auth/login", "/auth/refresh", "/auth/logout", "/users/register", "/docs", "/openapi.json", "/health"]
+# chaves parseadas uma unica vez; a ativa assina e todas verificam (rotacao por kid)
+key_ring = KeyRing.from_file(settings.JWT_KEYS_FILE) if settings.JWT_KEYS_FILE else KeyRing.from_secret(settings.ACCESS_SECRET, settings.ALGORITHM)
+token_service = JWTTokenService(
+    backend=build_jwt_backend(settings.JWT_BACKEND, key_ring),
+    cache=VerifiedTokenCache(max_entries=settings.ACCESS_TOKEN_CACHE_SIZE),
+    revocations=build_cache_backend(settings.ACCESS_TOKEN_REVOCATION_BACKEND, max_entries=settings.ACCESS_TOKEN_REVOCATION_MAX_ENTRIES),
+    access_token_ttl_seconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+revocation_warning = access_revocation_warning(settings.ACCESS_TOKEN_REVOCATION_BACKEND, settings.WEB_CONCURRENCY)
+password_hasher = ThreadPoolPasswordHasher(max_workers=settings.PASSWORD_HASH_WORKERS, max_queue=settings.PASSWORD_HASH_MAX_QUEUE)
+revoked_filter = (
+    RevokedJtiBloomFilter(capacity=settings.REFRESH_REUSE_FILTER_CAPACITY, max_age_seconds=settings.REFRESH_TOKEN_EXPIRE_DAYS * 86_400)
+    if settings.REFRESH_REUSE_FILTER_CAPACITY > 0
+    else None
+)
+# vinculos usuario -> empresa entre requests; os repositorios invalidam a cada mudanca
+membership_cache_backend, membership_cache_warning = resolve_membership_cache_backend(settings.MEMBERSHIP_CACHE_BACKEND, settings.WEB_CONCURRENCY)
+membership_cache = build_membership_cache(
+    membership_cache_backend,
+    ttl_seconds=settings.MEMBERSHIP_CACHE_TTL_SECONDS,
+    max_entries=settings.MEMBERSHIP_CACHE_MAX_ENTRIES,
+)
+purge_job = RefreshTokenPurgeJob(
+    async_session_factory,
+    interval_seconds=settings.REFRESH_TOKEN_PURGE_INTERVAL_SECONDS,
+    batch_size=settings.REFRESH_TOKEN_PURGE_BATCH_SIZE,
+    revoked_retention=timedelta(days=settings.REFRESH_TOKEN_REVOKED_RETENTION_DAYS),
+)
+public_paths = ["/auth/login", "/auth/refresh", "/auth/logout", "/users/register", "/docs", "/openapi.json", "/health", "/.well-known/jwks.json"]
 app.add_middleware(AuthMiddleware, token_service=token_service, access_cookie_name=settings.ACCESS_COOKIE_NAME, public_paths=public_paths)
+app.add_middleware(
+    PrimaryStickinessMiddleware,
+    cookie_name=PRIMARY_UNTIL_COOKIE,
+    state_key=PRIMARY_UNTIL_STATE,
+    max_age_seconds=settings.DB_STICKY_PRIMARY_SECONDS,
+)
 
 
 def provide_users_repository(session: AsyncSession = Depends(get_db_session)) -> IUsersRepository:
-    return UsersRepository(session)
+    return UsersRepository(session, membership_cache)
 
 
 def provide_companies_repository(session: AsyncSession = Depends(get_db_session)) -> ICompaniesRepository:
-    return CompaniesRepository(session)
+    return CompaniesRepository(session, membership_cache)
 
 
 def provide_roles_repository(session: AsyncSession = Depends(get_db_session)) -> IRolesRepository:
@@ -79,25 +180,51 @@ def provide_roles_repository(session: AsyncSession = Depends(get_db_session)) ->
 
 
 def provide_user_company_roles_repository(session: AsyncSession = Depends(get_db_session)) -> IUserCompanyRolesRepository:
-    return UserCompanyRolesRepository(session)
+    return UserCompanyRolesRepository(session, membership_cache)
 
 
 def provide_user_company_requests_repository(session: AsyncSession = Depends(get_db_session)) -> IUserCompanyRequestsRepository:
-    return UserCompanyRequestsRepository(session)
+    return UserCompanyRequestsRepository(session, membership_cache)
 
 
 def provide_workdays_repository(session: AsyncSession = Depends(get_db_session)) -> IWorkdaysRepository:
     return WorkdaysRepository(session)
 
 
+def provide_workshifts_repository(session: AsyncSession = Depends(get_db_session)) -> IWorkShiftsRepository:
+    return WorkShiftsRepository(session)
+
+
 def provide_jwt_repository(session: AsyncSession = Depends(get_db_session)) -> IJWTRepository:
     return JWTRepository(session)
 
 
+def provide_permissions_query_service(session: AsyncSession = Depends(get_db_session)) -> IPermissionsQueryService:
+    # uma instancia por request: o memo de is_company_owner nao vaza entre requests
+    return PermissionsQueryService(session, membership_cache)
+
+
+def provide_search_repository(session: AsyncSession = Depends(get_db_session)) -> ISearchRepository:
+    return SearchRepository(session)
+
+
+def provide_unit_of_work(session: AsyncSession = Depends(get_db_session)) -> IUnitOfWork:
+    # o Depends(get_db_session) e cacheado por request: mesma sessao dos repositorios
+    return SqlAlchemyUnitOfWork(session)
+
+
 def provide_token_service() -> ITokenService:
     return token_service
 
 
+def provide_password_hasher() -> IPasswordHasher:
+    return password_hasher
+
+
+def provide_revoked_token_filter() -> IRevokedTokenFilter | None:
+    return revoked_filter
+
+
 auth_cookie_settings = AuthCookieSettings(
     access_cookie_name=settings.ACCESS_COOKIE_NAME,
     refresh_cookie_name=settings.REFRESH_COOKIE_NAME,
@@ -123,8 +250,14 @@ app.dependency_overrides[get_roles_repository] = provide_roles_repository
 app.dependency_overrides[get_user_company_roles_repository] = provide_user_company_roles_repository
 app.dependency_overrides[get_user_company_requests_repository] = provide_user_company_requests_repository
 app.dependency_overrides[get_workdays_repository] = provide_workdays_repository
+app.dependency_overrides[get_workshifts_repository] = provide_workshifts_repository
 app.dependency_overrides[get_jwt_repository] = provide_jwt_repository
+app.dependency_overrides[get_permissions_query_service] = provide_permissions_query_service
+app.dependency_overrides[get_search_repository] = provide_search_repository
+app.dependency_overrides[get_unit_of_work] = provide_unit_of_work
 app.dependency_overrides[get_token_service] = provide_token_service
+app.dependency_overrides[get_password_hasher] = provide_password_hasher
+app.dependency_overrides[get_revoked_token_filter] = provide_revoked_token_filter
 app.dependency_overrides[get_refresh_token_expire_days] = provide_refresh_token_expire_days
 app.dependency_overrides[get_auth_cookie_settings] = provide_auth_cookie_settings
 
@@ -136,8 +269,31 @@ app.include_router(role_router.router)
 app.include_router(link_user_to_company_router.router)
 app.include_router(user_company_requests_router.router)
 app.include_router(workday_router.router)
+app.include_router(workshift_router.router)
+app.include_router(schedule_router.router)
+app.include_router(search_router.router)
 
 
 @app.get("/health")
 async def health():
     return {"status": "ok"}
+
+
+@app.get("/.well-known/jwks.json")
+async def jwks():
+    # so chaves publicas: outros servicos verificam tokens sem o segredo HMAC
+    return key_ring.public_jwks()
+
+
+@app.get("/metrics")
+async def metrics():
+    return {
+        "password_hasher": password_hasher.metrics(),
+        "access_token_cache": token_service.metrics(),
+        "refresh_token_purge": purge_job.metrics(),
+        "refresh_reuse_filter": revoked_filter.metrics() if revoked_filter else None,
+        "membership_cache": membership_cache.metrics() if membership_cache else None,
+        "db_pool": pool_metrics.snapshot(engine.pool) if pool_metrics else None,
+        "db_replica_pools": [metrics.snapshot(replica.pool) if metrics else None for replica, metrics in replica_engines],
+        "db_routing": replica_router.metrics(),
+    }
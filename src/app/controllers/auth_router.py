@@ -9,13 +9,19 @@ from src.app.controllers.schemas.pydantic.user_schemas import UserDetailResponse
 from src.app.dependencies import (
     get_auth_cookie_settings,
     get_jwt_repository,
+    get_password_hasher,
     get_refresh_token_expire_days,
+    get_revoked_token_filter,
     get_token_service,
+    get_unit_of_work,
     get_users_repository,
 )
-from src.domain.errors import InvalidCredentials, RefreshExpired, RefreshInvalid, RefreshNotFound, RefreshReuseDetected
+from src.domain.errors import InvalidCredentials, RefreshExpired, RefreshInvalid, RefreshNotFound, RefreshReuseDetected, ServiceOverloadedError
 from src.interfaces.ijwt_repository import IJWTRepository
+from src.interfaces.ipassword_hasher import IPasswordHasher
+from src.interfaces.irevoked_token_filter import IRevokedTokenFilter
 from src.interfaces.itoken_service import ITokenService
+from src.interfaces.iunit_of_work import IUnitOfWork
 from src.interfaces.iusers_repository import IUsersRepository
 from src.usecases.auth_service import AuthService
 
@@ -27,8 +33,11 @@ def get_auth_service(
     jwt_repository: IJWTRepository = Depends(get_jwt_repository),
     token_service: ITokenService = Depends(get_token_service),
     refresh_token_expire_days: int = Depends(get_refresh_token_expire_days),
+    password_hasher: IPasswordHasher = Depends(get_password_hasher),
+    revoked_filter: IRevokedTokenFilter | None = Depends(get_revoked_token_filter),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
 ) -> AuthService:
-    return AuthService(users_repository, jwt_repository, token_service, refresh_token_expire_days)
+    return AuthService(users_repository, jwt_repository, token_service, refresh_token_expire_days, password_hasher, uow, revoked_filter)
 
 
 def _set_access_cookie(response: Response, access_token: str, settings: AuthCookieSettings):
@@ -70,6 +79,8 @@ async def login(
         result = await auth_service.login(body.email, body.password)
     except InvalidCredentials as exc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Credenciais inválidas") from exc
+    except ServiceOverloadedError as exc:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc), headers={"Retry-After": "1"}) from exc
 
     # coloca access + refresh em cookies HttpOnly
     _set_access_cookie(response, result.access_token, settings)
@@ -1,13 +1,12 @@
-from dataclasses import asdict
-
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from pydantic import BaseModel
 
 from src.app.controllers.schemas.pydantic.update_company_dto import PayloadUpdateCompanyDTO
-from src.app.controllers.schemas.pydantic.user_schemas import CompanyResponse
-from src.app.dependencies import get_companies_repository
+from src.app.controllers.schemas.pydantic.user_schemas import COMPANY_ENCODER, CompanyResponse
+from src.app.dependencies import get_companies_repository, get_unit_of_work
 from src.domain.errors import NotFoundError
 from src.interfaces.icompanies_repository import ICompaniesRepository
+from src.interfaces.iunit_of_work import IUnitOfWork
 from src.usecases.companies.create_company_usecase import CreateCompanyUseCase
 from src.usecases.companies.delete_company_usecase import DeleteCompanyUseCase
 from src.usecases.companies.list_companies_usecase import ListCompaniesUseCase
@@ -16,20 +15,29 @@ from src.usecases.companies.update_companies_usecase import UpdateCompaniesUseca
 router = APIRouter(tags=["companies"], prefix="/companies")
 
 
-def get_create_company_usecase(companies_repository: ICompaniesRepository = Depends(get_companies_repository)):
-    return CreateCompanyUseCase(companies_repository)
+def get_create_company_usecase(
+    companies_repository: ICompaniesRepository = Depends(get_companies_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+):
+    return CreateCompanyUseCase(companies_repository, uow)
 
 
 def get_list_company_usecase(companies_repository: ICompaniesRepository = Depends(get_companies_repository)):
     return ListCompaniesUseCase(companies_repository)
 
 
-def get_update_company_usecase(companies_repository: ICompaniesRepository = Depends(get_companies_repository)):
-    return UpdateCompaniesUsecase(companies_repository)
+def get_update_company_usecase(
+    companies_repository: ICompaniesRepository = Depends(get_companies_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+):
+    return UpdateCompaniesUsecase(companies_repository, uow)
 
 
-def get_delete_company_usecase(companies_repository: ICompaniesRepository = Depends(get_companies_repository)):
-    return DeleteCompanyUseCase(companies_repository)
+def get_delete_company_usecase(
+    companies_repository: ICompaniesRepository = Depends(get_companies_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+):
+    return DeleteCompanyUseCase(companies_repository, uow)
 
 
 class CreateCompanyRequestBody(BaseModel):
@@ -40,7 +48,7 @@ class CreateCompanyRequestBody(BaseModel):
 async def list_companies(list_companies_usecase: ListCompaniesUseCase = Depends(get_list_company_usecase)):
     try:
         companies = await list_companies_usecase.execute()
-        return [CompanyResponse(**asdict(company)) for company in companies]
+        return COMPANY_ENCODER.many(companies)
     except Exception as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Could not list companies") from exc
 
@@ -53,7 +61,7 @@ async def create_company(request: Request, body: CreateCompanyRequestBody, creat
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Access not provided")
 
         new_company = await create_company_usecase.execute(name=body.name, owner_id=user_id)
-        return CompanyResponse(**asdict(new_company))
+        return COMPANY_ENCODER.one(new_company, status_code=status.HTTP_201_CREATED)
     except Exception as exc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Access token is not valid") from exc
 
@@ -64,7 +72,7 @@ async def update_company(company_id: str, payload: PayloadUpdateCompanyDTO, upda
         company = await update_companies_usecase.execute(id=company_id, name=payload.name)
         if not company:
             raise NotFoundError("Company not found")
-        return CompanyResponse(**asdict(company))
+        return COMPANY_ENCODER.one(company)
     except NotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
@@ -1,10 +1,15 @@
-from dataclasses import asdict
-
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
 
-from src.app.controllers.schemas.pydantic.user_schemas import CompaniesRolesFromUserResponse, UsersRolesFromCompanyResponse
-from src.app.dependencies import get_user_company_roles_repository
+from src.app.controllers.schemas.pydantic.user_schemas import (
+    COMPANIES_ROLES_FROM_USER_ENCODER,
+    USERS_ROLES_FROM_COMPANY_ENCODER,
+    CompaniesRolesFromUserResponse,
+    UsersRolesFromCompanyResponse,
+)
+from src.app.dependencies import get_unit_of_work, get_user_company_roles_repository
+from src.domain.errors import AlreadyExistsError
+from src.interfaces.iunit_of_work import IUnitOfWork
 from src.interfaces.iuser_company_roles_repository import IUserCompanyRolesRepository
 from src.usecases.link_users_to_companies.assign_user_role_to_company_usecase import AssignUserRoleToCompanyUseCase
 from src.usecases.link_users_to_companies.delete_user_role_to_company_usecase import DeleteUserRoleToCompanyUseCase
@@ -22,12 +27,18 @@ def get_list_companies_usecase(user_company_roles_repository: IUserCompanyRolesR
     return ListCompaniesAndRolesByUserUseCase(user_company_roles_repository)
 
 
-def get_assign_user_role_to_company_usecase(user_company_roles_repository: IUserCompanyRolesRepository = Depends(get_user_company_roles_repository)):
-    return AssignUserRoleToCompanyUseCase(user_company_roles_repository)
+def get_assign_user_role_to_company_usecase(
+    user_company_roles_repository: IUserCompanyRolesRepository = Depends(get_user_company_roles_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+):
+    return AssignUserRoleToCompanyUseCase(user_company_roles_repository, uow)
 
 
-def get_delete_user_role_to_company_usecase(user_company_roles_repository: IUserCompanyRolesRepository = Depends(get_user_company_roles_repository)):
-    return DeleteUserRoleToCompanyUseCase(user_company_roles_repository)
+def get_delete_user_role_to_company_usecase(
+    user_company_roles_repository: IUserCompanyRolesRepository = Depends(get_user_company_roles_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+):
+    return DeleteUserRoleToCompanyUseCase(user_company_roles_repository, uow)
 
 
 class LinkUserToCompanyRequest(BaseModel):
@@ -39,18 +50,21 @@ class LinkUserToCompanyRequest(BaseModel):
 @router.get("/by-company/{company_id}", response_model=list[UsersRolesFromCompanyResponse])
 async def list_user_company_links_by_company(company_id: str, list_users_by_company_usecase: ListUserAndRolesByCompanyUseCase = Depends(get_list_users_usecase)):
     results = await list_users_by_company_usecase.execute(company_id)
-    return [UsersRolesFromCompanyResponse(**asdict(item)) for item in results]
+    return USERS_ROLES_FROM_COMPANY_ENCODER.many(results)
 
 
 @router.get("/by-user/{user_id}", response_model=list[CompaniesRolesFromUserResponse])
 async def list_user_company_links_by_user(user_id: str, list_users_by_company_usecase: ListCompaniesAndRolesByUserUseCase = Depends(get_list_companies_usecase)):
     results = await list_users_by_company_usecase.execute(user_id)
-    return [CompaniesRolesFromUserResponse(**asdict(item)) for item in results]
+    return COMPANIES_ROLES_FROM_USER_ENCODER.many(results)
 
 
 @router.post("/user_to_company", status_code=status.HTTP_201_CREATED)
 async def link_user_to_company(payload: LinkUserToCompanyRequest, assign_user_role_to_company_usecase: AssignUserRoleToCompanyUseCase = Depends(get_assign_user_role_to_company_usecase)):
-    await assign_user_role_to_company_usecase.execute(payload.user_id, payload.company_id, payload.role_id)
+    try:
+        await assign_user_role_to_company_usecase.execute(payload.user_id, payload.company_id, payload.role_id)
+    except AlreadyExistsError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
     return None
 
 
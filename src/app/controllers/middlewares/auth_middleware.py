@@ -1,33 +1,66 @@
 # app/presentation/middlewares/auth_middleware.py
-from fastapi import Request, status
+import re
+from typing import Iterable, Optional
+
+from fastapi import status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from src.interfaces.itoken_service import ITokenService
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, token_service: ITokenService, access_cookie_name: str, public_paths: list[str]):
-        super().__init__(app)
+def compile_public_paths(public_paths: Iterable[str]) -> "re.Pattern[str]":
+    # mesmo criterio do antigo startswith, mas num unico match ancorado no inicio do path
+    prefixes = sorted({p for p in public_paths if p}, key=len, reverse=True)
+    if not prefixes:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(re.escape(p) for p in prefixes))
+
+
+def read_cookie(scope: Scope, name: str) -> Optional[str]:
+    # le o cookie direto dos headers do scope, sem montar Request nem parsear todos os cookies
+    for header_name, header_value in scope["headers"]:
+        if header_name != b"cookie":
+            continue
+        for chunk in header_value.decode("latin-1").split(";"):
+            key, sep, value = chunk.partition("=")
+            if sep and key.strip() == name:
+                return value.strip().strip('"') or None
+    return None
+
+
+class AuthMiddleware:
+    def __init__(self, app: ASGIApp, token_service: ITokenService, access_cookie_name: str, public_paths: list[str]):
+        self.app = app
         self.token_service = token_service
         self.access_cookie_name = access_cookie_name
         self.public_paths = public_paths
+        self._public_path_re = compile_public_paths(public_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next):
         # libera rotas públicas
-        if any(request.url.path.startswith(p) for p in self.public_paths):
-            return await call_next(request)
+        if self._public_path_re.match(scope["path"]):
+            await self.app(scope, receive, send)
+            return
 
         # obter access token do cookie
-        access_token = request.cookies.get(self.access_cookie_name)
+        access_token = read_cookie(scope, self.access_cookie_name)
         if not access_token:
-            return JSONResponse({"detail": "Access token not found"}, status_code=status.HTTP_401_UNAUTHORIZED)
+            response = JSONResponse({"detail": "Access token not found"}, status_code=status.HTTP_401_UNAUTHORIZED)
+            await response(scope, receive, send)
+            return
 
-        payload = self.token_service.verify_access_token(access_token)
+        payload = await self.token_service.verify_access_token(access_token)
         if not payload:
             # token inválido ou expirado
-            return JSONResponse({"detail": "Access token invalid or expired"}, status_code=status.HTTP_401_UNAUTHORIZED)
+            response = JSONResponse({"detail": "Access token invalid or expired"}, status_code=status.HTTP_401_UNAUTHORIZED)
+            await response(scope, receive, send)
+            return
 
-        # coloca user_id no state para uso nos endpoints
-        request.state.user_id = payload.get("sub")
-        return await call_next(request)
+        # coloca user_id no state (request.state.user_id nos endpoints)
+        scope.setdefault("state", {})["user_id"] = payload.get("sub")
+        await self.app(scope, receive, send)
@@ -0,0 +1,28 @@
+import math
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class PrimaryStickinessMiddleware:
+    # devolve ao cliente, em cookie, o prazo de leitura no primario gravado por get_db_session depois do commit;
+    # o proximo request do cliente, em qualquer worker, le do primario ate esse prazo
+    def __init__(self, app: ASGIApp, cookie_name: str, state_key: str, max_age_seconds: float):
+        self.app = app
+        self.cookie_name = cookie_name
+        self.state_key = state_key
+        self.max_age = max(1, math.ceil(max_age_seconds))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                deadline = scope.get("state", {}).get(self.state_key)
+                if deadline is not None:
+                    cookie = f"{self.cookie_name}={deadline:.3f}; Max-Age={self.max_age}; Path=/; HttpOnly; SameSite=lax"
+                    message["headers"] = [*message.get("headers", []), (b"set-cookie", cookie.encode("latin-1"))]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
@@ -1,14 +1,13 @@
-from dataclasses import asdict
-
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from pydantic import BaseModel
 
 from src.app.controllers.schemas.dtos.update_role_dto import PayloadUpdateRoleDTO
-from src.app.controllers.schemas.pydantic.user_schemas import RoleResponse
-from src.app.dependencies import get_roles_repository, get_users_repository
+from src.app.controllers.schemas.pydantic.user_schemas import ROLE_ENCODER, RoleResponse
+from src.app.dependencies import get_permissions_query_service, get_roles_repository, get_unit_of_work
 from src.domain.errors import NotFoundError, PermissionDeniedError
+from src.interfaces.ipermissions_query_service import IPermissionsQueryService
 from src.interfaces.iroles_repository import IRolesRepository
-from src.interfaces.iusers_repository import IUsersRepository
+from src.interfaces.iunit_of_work import IUnitOfWork
 from src.usecases.roles.create_role_usecase import CreateRoleUseCase
 from src.usecases.roles.delete_role_usecase import DeleteRoleUseCase
 from src.usecases.roles.list_roles_usecase import ListRolesUseCase
@@ -19,21 +18,28 @@ router = APIRouter(tags=["roles"], prefix="/roles")
 
 def get_create_role_usecase(
     roles_repository: IRolesRepository = Depends(get_roles_repository),
-    users_repository: IUsersRepository = Depends(get_users_repository),
+    permissions: IPermissionsQueryService = Depends(get_permissions_query_service),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
 ):
-    return CreateRoleUseCase(roles_repository, users_repository)
+    return CreateRoleUseCase(roles_repository, permissions, uow)
 
 
 def get_list_role_usecase(roles_repository: IRolesRepository = Depends(get_roles_repository)):
     return ListRolesUseCase(roles_repository)
 
 
-def get_update_role_usecase(roles_repository: IRolesRepository = Depends(get_roles_repository)):
-    return UpdateRolesUsecase(roles_repository)
+def get_update_role_usecase(
+    roles_repository: IRolesRepository = Depends(get_roles_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+):
+    return UpdateRolesUsecase(roles_repository, uow)
 
 
-def get_delete_role_usecase(roles_repository: IRolesRepository = Depends(get_roles_repository)):
-    return DeleteRoleUseCase(roles_repository)
+def get_delete_role_usecase(
+    roles_repository: IRolesRepository = Depends(get_roles_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+):
+    return DeleteRoleUseCase(roles_repository, uow)
 
 
 class CreateRoleRequestBody(BaseModel):
@@ -46,7 +52,7 @@ class CreateRoleRequestBody(BaseModel):
 async def list_roles(list_roles_usecase: ListRolesUseCase = Depends(get_list_role_usecase)):
     try:
         roles = await list_roles_usecase.execute()
-        return [RoleResponse(**asdict(role)) for role in roles]
+        return ROLE_ENCODER.many(roles)
     except Exception as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Could not list roles") from exc
 
@@ -65,7 +71,7 @@ async def create_role(request: Request, body: CreateRoleRequestBody, create_role
             number_of_cooldown_days=body.number_of_cooldown_days,
         )
 
-        return RoleResponse(**asdict(new_role))
+        return ROLE_ENCODER.one(new_role, status_code=status.HTTP_201_CREATED)
 
     except PermissionDeniedError as exc:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
@@ -79,7 +85,7 @@ async def update_role(role_id: str, payload: PayloadUpdateRoleDTO, update_roles_
         role = await update_roles_usecase.execute(id=role_id, name=payload.name, number_of_cooldown_days=payload.number_of_cooldown_days)
         if not role:
             raise NotFoundError("Role not found")
-        return RoleResponse(**asdict(role))
+        return ROLE_ENCODER.one(role)
     except NotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
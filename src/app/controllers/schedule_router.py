@@ -0,0 +1,75 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+
+from src.app.controllers.schemas.pydantic.schedule_dtos import SCHEDULE_ENCODER, IncrementalScheduleDTO, IncrementalSchedulePayload, SchedulePayload, ScheduleResponse
+from src.app.dependencies import (
+    get_permissions_query_service,
+    get_unit_of_work,
+    get_user_company_roles_repository,
+    get_workdays_repository,
+    get_workshifts_repository,
+)
+from src.domain.errors import NotFoundError, PermissionDeniedError, ValidationError
+from src.interfaces.ipermissions_query_service import IPermissionsQueryService
+from src.interfaces.iunit_of_work import IUnitOfWork
+from src.interfaces.iuser_company_roles_repository import IUserCompanyRolesRepository
+from src.interfaces.iworkdays_repository import IWorkdaysRepository
+from src.interfaces.iworkshifts_repository import IWorkShiftsRepository
+from src.usecases.scheduling.incremental_reschedule_usecase import IncrementalRescheduleUseCase
+from src.usecases.scheduling.schedule_company_shifts_usecase import ScheduleCompanyShiftsUseCase
+
+router = APIRouter(tags=["schedules"], prefix="/schedules")
+
+
+def get_schedule_company_shifts_usecase(
+    workshifts_repository: IWorkShiftsRepository = Depends(get_workshifts_repository),
+    user_company_roles_repository: IUserCompanyRolesRepository = Depends(get_user_company_roles_repository),
+    permissions: IPermissionsQueryService = Depends(get_permissions_query_service),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+):
+    return ScheduleCompanyShiftsUseCase(workshifts_repository, user_company_roles_repository, permissions, uow)
+
+
+def get_incremental_reschedule_usecase(
+    workshifts_repository: IWorkShiftsRepository = Depends(get_workshifts_repository),
+    workdays_repository: IWorkdaysRepository = Depends(get_workdays_repository),
+    user_company_roles_repository: IUserCompanyRolesRepository = Depends(get_user_company_roles_repository),
+    permissions: IPermissionsQueryService = Depends(get_permissions_query_service),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+):
+    return IncrementalRescheduleUseCase(workshifts_repository, workdays_repository, user_company_roles_repository, permissions, uow)
+
+
+@router.post("", response_model=ScheduleResponse)
+async def schedule_company_shifts(request: Request, payload: SchedulePayload, schedule_usecase: ScheduleCompanyShiftsUseCase = Depends(get_schedule_company_shifts_usecase)):
+    user_id = getattr(request.state, "user_id", None)
+    if not user_id:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Access not provided")
+
+    try:
+        summary = await schedule_usecase.execute(user_id=user_id, company_id=payload.company_id, date_from=payload.date_from, date_to=payload.date_to)
+        return SCHEDULE_ENCODER.one(summary)
+    except ValidationError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except PermissionDeniedError as exc:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
+    except NotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+
+
+@router.post("/incremental", response_model=ScheduleResponse)
+async def incremental_reschedule(
+    request: Request,
+    payload: IncrementalSchedulePayload,
+    incremental_usecase: IncrementalRescheduleUseCase = Depends(get_incremental_reschedule_usecase),
+):
+    user_id = getattr(request.state, "user_id", None)
+    if not user_id:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Access not provided")
+
+    try:
+        summary = await incremental_usecase.execute(user_id=user_id, change_set=IncrementalScheduleDTO.from_payload(payload))
+        return SCHEDULE_ENCODER.one(summary)
+    except PermissionDeniedError as exc:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
+    except NotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
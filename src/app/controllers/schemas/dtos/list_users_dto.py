@@ -0,0 +1,45 @@
+import base64
+import binascii
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from src.interfaces.types.user_types import UserCursor, UserListFilters
+
+
+class UserCursorDTO:
+    # cursor opaco para o cliente: base64("<created_at iso>|<id>")
+    @staticmethod
+    def encode(cursor: Optional[UserCursor]) -> Optional[str]:
+        if cursor is None:
+            return None
+        raw = f"{cursor.created_at.isoformat()}|{cursor.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode(value: str) -> UserCursor:
+        try:
+            created_at, user_id = base64.urlsafe_b64decode(value.encode()).decode().split("|", 1)
+            return UserCursor(created_at=datetime.fromisoformat(created_at), id=str(uuid.UUID(user_id)))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+            raise ValueError("Invalid cursor") from exc
+
+
+class ListUsersDTO:
+    @staticmethod
+    def from_query(
+        email: Optional[str],
+        name: Optional[str],
+        fields: Optional[str],
+        cursor: Optional[str],
+        limit: int,
+    ) -> UserListFilters:
+        # fields=id,email -> ("id", "email"), sem repetir
+        parsed_fields = tuple(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip())) if fields is not None else None
+        return UserListFilters(
+            email_prefix=email or None,
+            name_prefix=name or None,
+            fields=parsed_fields,
+            cursor=UserCursorDTO.decode(cursor) if cursor else None,
+            limit=limit,
+        )
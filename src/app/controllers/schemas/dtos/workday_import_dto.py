@@ -0,0 +1,75 @@
+import csv
+import json
+from datetime import datetime, timezone
+from typing import AsyncIterator, Optional
+
+from pydantic import BaseModel, field_validator
+from pydantic import ValidationError as PydanticValidationError
+
+from src.domain.entities.work_day import WorkDay
+
+NDJSON_CONTENT_TYPES = {"application/x-ndjson", "application/jsonl", "application/json-lines"}
+
+CSV_CONTENT_TYPES = {"text/csv"}
+
+
+class ImportWorkdayRecord(BaseModel):
+    role_id: str
+    date: datetime
+    is_holiday: bool = False
+
+    @field_validator("date")
+    @classmethod
+    def normalize_date(cls, v: datetime) -> datetime:
+        if v.tzinfo is None:
+            v = v.replace(tzinfo=timezone.utc)
+        return v.astimezone(timezone.utc)
+
+
+class WorkdayImportDTO:
+    @staticmethod
+    def media_type(content_type: Optional[str]) -> str:
+        return (content_type or "").split(";", 1)[0].strip().lower()
+
+    @classmethod
+    def is_supported(cls, content_type: Optional[str]) -> bool:
+        media_type = cls.media_type(content_type)
+        return media_type in NDJSON_CONTENT_TYPES or media_type in CSV_CONTENT_TYPES
+
+    @staticmethod
+    async def _lines(stream: AsyncIterator[bytes]) -> AsyncIterator[str]:
+        buffer = b""
+        async for chunk in stream:
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                yield line.decode("utf-8").rstrip("\r")
+        if buffer:
+            yield buffer.decode("utf-8").rstrip("\r")
+
+    @staticmethod
+    def _to_workday(record: ImportWorkdayRecord) -> WorkDay:
+        return WorkDay(id=None, role_id=record.role_id, date=record.date, is_holiday=record.is_holiday, weekday=record.date.weekday())
+
+    @classmethod
+    async def iter_workdays(cls, stream: AsyncIterator[bytes], content_type: Optional[str]) -> AsyncIterator[WorkDay]:
+        is_csv = cls.media_type(content_type) in CSV_CONTENT_TYPES
+        header: Optional[list[str]] = None
+        line_number = 0
+
+        async for line in cls._lines(stream):
+            line_number += 1
+            if not line.strip():
+                continue
+            try:
+                if is_csv:
+                    values = next(csv.reader([line]))
+                    if header is None:
+                        header = [value.strip() for value in values]
+                        continue
+                    record = ImportWorkdayRecord.model_validate(dict(zip(header, values)))
+                else:
+                    record = ImportWorkdayRecord.model_validate(json.loads(line))
+            except (PydanticValidationError, json.JSONDecodeError) as exc:
+                raise ValueError(f"Invalid workday record at line {line_number}") from exc
+            yield cls._to_workday(record)
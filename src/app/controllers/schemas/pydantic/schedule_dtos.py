@@ -0,0 +1,64 @@
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, field_validator
+
+from src.app.controllers.schemas.pydantic.trusted_encoder import TrustedDTOEncoder
+from src.interfaces.types.workshift_types import ScheduleChangeSet, ScheduleSummary
+
+
+class SchedulePayload(BaseModel):
+    company_id: str
+    date_from: datetime
+    date_to: datetime
+
+    @field_validator("date_from", "date_to")
+    @classmethod
+    def normalize_date(cls, v: datetime) -> datetime:
+        if v.tzinfo is None:
+            v = v.replace(tzinfo=timezone.utc)
+        return v.astimezone(timezone.utc)
+
+
+class IncrementalSchedulePayload(BaseModel):
+    company_id: str
+    work_day_ids: List[int] = []
+    removed_user_ids: List[str] = []
+    since: Optional[datetime] = None
+
+    @field_validator("since")
+    @classmethod
+    def normalize_since(cls, v: Optional[datetime]) -> Optional[datetime]:
+        if v is None:
+            return None
+        if v.tzinfo is None:
+            v = v.replace(tzinfo=timezone.utc)
+        return v.astimezone(timezone.utc)
+
+
+class IncrementalScheduleDTO:
+    @staticmethod
+    def from_payload(payload: IncrementalSchedulePayload) -> ScheduleChangeSet:
+        return ScheduleChangeSet(
+            company_id=payload.company_id,
+            work_day_ids=list(payload.work_day_ids),
+            removed_user_ids=list(payload.removed_user_ids),
+            since=payload.since,
+        )
+
+
+class ShiftAssignmentChangeResponse(BaseModel):
+    shift_id: int
+    previous_user_id: Optional[str]
+    user_id: Optional[str]
+
+
+class ScheduleResponse(BaseModel):
+    total_shifts: int
+    assigned: int
+    unassigned_shift_ids: List[int]
+    load: Dict[str, int]
+    changes: List[ShiftAssignmentChangeResponse]
+
+
+SCHEDULE_ENCODER = TrustedDTOEncoder(ScheduleSummary, ScheduleResponse)
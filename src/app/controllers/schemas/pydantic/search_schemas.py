@@ -0,0 +1,15 @@
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel
+
+
+class SearchHitResponse(BaseModel):
+    kind: Literal["user", "company"]
+    id: str
+    label: str
+    detail: Optional[str] = None
+    score: float
+
+
+class SearchResponse(BaseModel):
+    items: List[SearchHitResponse]
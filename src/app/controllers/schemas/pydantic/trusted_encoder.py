@@ -0,0 +1,57 @@
+from dataclasses import fields, is_dataclass
+from typing import Any, Generic, List, Optional, Sequence, Type, TypedDict, TypeVar, get_args, get_origin, get_type_hints
+
+from fastapi import Response, status
+from pydantic import BaseModel, TypeAdapter
+
+T = TypeVar("T")
+
+
+def _inner_class(annotation: Any) -> Optional[type]:
+    # Optional[X] / List[X] -> X; usado so para casar dataclass aninhada com o model aninhado
+    if get_origin(annotation) is None:
+        return annotation if isinstance(annotation, type) else None
+    for arg in get_args(annotation):
+        inner = _inner_class(arg)
+        if inner is not None and inner is not type(None):
+            return inner
+    return None
+
+
+def check_matches_response_model(dto_type: type, response_model: Type[BaseModel]) -> None:
+    # mesmos campos na mesma ordem: o JSON sai igual ao do response_model e nada a mais vaza (ex.: hashed_password)
+    dto_fields = [f.name for f in fields(dto_type)]
+    model_fields = list(response_model.model_fields)
+    if dto_fields != model_fields:
+        raise TypeError(f"{dto_type.__name__} fields {dto_fields} do not match {response_model.__name__} fields {model_fields}")
+
+    dto_hints = get_type_hints(dto_type)
+    for name, info in response_model.model_fields.items():
+        nested_model, nested_dto = _inner_class(info.annotation), _inner_class(dto_hints[name])
+        if nested_model and issubclass(nested_model, BaseModel) and nested_dto and is_dataclass(nested_dto):
+            check_matches_response_model(nested_dto, nested_model)
+
+
+class TrustedDTOEncoder(Generic[T]):
+    # dataclasses que os casos de uso devolvem ja estao validadas: serializa direto para bytes JSON
+    # (pydantic-core, schema compilado uma vez no import), sem asdict e sem revalidar pelo response_model.
+    # o response_model continua no decorator so para o OpenAPI
+    def __init__(self, dto_type: Type[T], response_model: Type[BaseModel]):
+        check_matches_response_model(dto_type, response_model)
+        self._one = TypeAdapter(dto_type)
+        self._many = TypeAdapter(List[dto_type])  # type: ignore[valid-type]
+        page = TypedDict(f"{dto_type.__name__}Page", {"items": List[dto_type], "next_cursor": Optional[str]})  # type: ignore[misc, valid-type]
+        self._page = TypeAdapter(page)
+
+    @staticmethod
+    def _response(content: bytes, status_code: int) -> Response:
+        return Response(content=content, status_code=status_code, media_type="application/json")
+
+    def one(self, value: T, status_code: int = status.HTTP_200_OK) -> Response:
+        return self._response(self._one.dump_json(value), status_code)
+
+    def many(self, values: Sequence[T], status_code: int = status.HTTP_200_OK) -> Response:
+        return self._response(self._many.dump_json(list(values)), status_code)
+
+    def page(self, items: Sequence[T], next_cursor: Optional[str]) -> Response:
+        return self._response(self._page.dump_json({"items": list(items), "next_cursor": next_cursor}), status.HTTP_200_OK)
@@ -3,6 +3,11 @@ from typing import List, Optional
 
 from pydantic import BaseModel
 
+from src.app.controllers.schemas.pydantic.trusted_encoder import TrustedDTOEncoder
+from src.domain.entities.company import Company
+from src.domain.entities.role import Role
+from src.interfaces.types.user_types import CompaniesRolesFromUser, UsersRolesFromCompany
+
 
 class UserCreateRequest(BaseModel):
     first_name: str
@@ -48,6 +53,21 @@ class UserResponse(BaseModel):
     created_at: Optional[datetime]
 
 
+class UserListItemResponse(BaseModel):
+    # com fields= so as colunas pedidas aparecem (response_model_exclude_unset)
+    id: Optional[str] = None
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    email: Optional[str] = None
+    active: Optional[bool] = None
+    created_at: Optional[datetime] = None
+
+
+class UserPageResponse(BaseModel):
+    items: List[UserListItemResponse]
+    next_cursor: Optional[str] = None
+
+
 class UserDetailResponse(UserResponse):
     companies_roles: List[UserCompanyRoleResponse]
 
@@ -93,3 +113,10 @@ class UserCompanyRequestWithUserResponse(BaseModel):
     accepted: bool
     created_at: Optional[datetime]
     updated_at: Optional[datetime]
+
+
+# so DTOs sem campos sensiveis; User (hashed_password) segue pelo response_model
+COMPANY_ENCODER = TrustedDTOEncoder(Company, CompanyResponse)
+ROLE_ENCODER = TrustedDTOEncoder(Role, RoleResponse)
+USERS_ROLES_FROM_COMPANY_ENCODER = TrustedDTOEncoder(UsersRolesFromCompany, UsersRolesFromCompanyResponse)
+COMPANIES_ROLES_FROM_USER_ENCODER = TrustedDTOEncoder(CompaniesRolesFromUser, CompaniesRolesFromUserResponse)
@@ -1,10 +1,20 @@
-from datetime import datetime, timezone
+import base64
+import binascii
+from datetime import date, datetime, timezone
 from typing import List, Optional
 
 from pydantic import BaseModel, field_validator
 
+from src.app.controllers.schemas.pydantic.trusted_encoder import TrustedDTOEncoder
 from src.domain.entities.work_day import WorkDay
-from src.interfaces.types.workday_types import BatchCreateWorkdays, PartialWorkdayUpdate
+from src.interfaces.types.workday_types import (
+    BatchCreateWorkdays,
+    PartialWorkdayUpdate,
+    WorkdayConflictMode,
+    WorkdayCursor,
+    WorkdayImportResult,
+    WorkdayListFilters,
+)
 
 
 class CreateWorkdayPayload(BaseModel):
@@ -49,6 +59,11 @@ class BatchCreateWorkdaysPayload(BaseModel):
     start_date: datetime
     end_date: datetime
     role_id: str
+    conflict: WorkdayConflictMode = "error"
+    weekdays: Optional[List[int]] = None
+    every_n_days: int = 1
+    holidays: List[date] = []
+    apply_cooldown: bool = False
 
     @field_validator("start_date", "end_date")
     @classmethod
@@ -79,6 +94,7 @@ class DateWorkdayPayload(BaseModel):
 class BatchIndividualCreateWorkdaysPayload(BaseModel):
     role_id: str
     dates: List[DateWorkdayPayload]
+    conflict: WorkdayConflictMode = "error"
 
 
 class BatchIndividualCreateWorkdaysDTO:
@@ -100,7 +116,16 @@ class BatchIndividualCreateWorkdaysDTO:
 class BatchCreateWorkdaysDTO:
     @staticmethod
     def from_payload(payload: BatchCreateWorkdaysPayload) -> BatchCreateWorkdays:
-        return BatchCreateWorkdays(start_date=payload.start_date, end_date=payload.end_date, role_id=payload.role_id)
+        return BatchCreateWorkdays(
+            start_date=payload.start_date,
+            end_date=payload.end_date,
+            role_id=payload.role_id,
+            conflict=payload.conflict,
+            weekdays=payload.weekdays,
+            every_n_days=payload.every_n_days,
+            holidays=list(payload.holidays),
+            apply_cooldown=payload.apply_cooldown,
+        )
 
 
 class BatchDeleteWorkdaysPayload(BaseModel):
@@ -113,3 +138,66 @@ class WorkdayResponse(BaseModel):
     date: datetime
     is_holiday: bool
     weekday: Optional[int] = None
+
+
+class WorkdayPageResponse(BaseModel):
+    items: List[WorkdayResponse]
+    next_cursor: Optional[str] = None
+
+
+class WorkdayImportResponse(BaseModel):
+    received: int
+    inserted: int
+    updated: int
+    skipped: int
+
+
+WORKDAY_ENCODER = TrustedDTOEncoder(WorkDay, WorkdayResponse)
+WORKDAY_IMPORT_ENCODER = TrustedDTOEncoder(WorkdayImportResult, WorkdayImportResponse)
+
+
+class WorkdayCursorDTO:
+    # cursor opaco para o cliente: base64("<date iso>|<id>")
+    @staticmethod
+    def encode(cursor: Optional[WorkdayCursor]) -> Optional[str]:
+        if cursor is None:
+            return None
+        raw = f"{cursor.date.isoformat()}|{cursor.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode(value: str) -> WorkdayCursor:
+        try:
+            date, workday_id = base64.urlsafe_b64decode(value.encode()).decode().split("|", 1)
+            return WorkdayCursor(date=datetime.fromisoformat(date), id=int(workday_id))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+            raise ValueError("Invalid cursor") from exc
+
+
+class ListWorkdaysDTO:
+    @staticmethod
+    def _to_utc(value: Optional[datetime]) -> Optional[datetime]:
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+
+    @classmethod
+    def from_query(
+        cls,
+        role_id: Optional[str],
+        company_id: Optional[str],
+        date_from: Optional[datetime],
+        date_to: Optional[datetime],
+        cursor: Optional[str],
+        limit: int,
+    ) -> WorkdayListFilters:
+        return WorkdayListFilters(
+            role_id=role_id,
+            company_id=company_id,
+            date_from=cls._to_utc(date_from),
+            date_to=cls._to_utc(date_to),
+            cursor=WorkdayCursorDTO.decode(cursor) if cursor else None,
+            limit=limit,
+        )
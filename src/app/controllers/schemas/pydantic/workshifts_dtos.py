@@ -0,0 +1,92 @@
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from pydantic import BaseModel, field_validator
+
+from src.app.controllers.schemas.pydantic.trusted_encoder import TrustedDTOEncoder
+from src.domain.entities.work_shift import WorkShift
+from src.interfaces.types.workshift_types import PartialWorkShiftUpdate, WorkShiftListFilters
+
+
+def _to_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+class CreateWorkShiftPayload(BaseModel):
+    work_day_id: int
+    start_time: datetime
+    end_time: datetime
+
+    @field_validator("start_time", "end_time")
+    @classmethod
+    def normalize_time(cls, v: datetime) -> datetime:
+        return _to_utc(v)  # type: ignore[return-value]
+
+    def to_domain(self) -> WorkShift:
+        return WorkShift(id=None, work_day_id=self.work_day_id, start_time=self.start_time, end_time=self.end_time)
+
+
+class UpdateWorkShiftPayload(BaseModel):
+    work_day_id: Optional[int] = None
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+
+    @field_validator("start_time", "end_time")
+    @classmethod
+    def normalize_time(cls, v: Optional[datetime]) -> Optional[datetime]:
+        return _to_utc(v)
+
+
+class UpdateWorkShiftDTO:
+    @staticmethod
+    def from_payload(payload: UpdateWorkShiftPayload) -> PartialWorkShiftUpdate:
+        return PartialWorkShiftUpdate(**payload.model_dump(exclude_unset=True))
+
+
+class BatchCreateWorkShiftsPayload(BaseModel):
+    shifts: List[CreateWorkShiftPayload]
+
+
+class BatchCreateWorkShiftsDTO:
+    @staticmethod
+    def from_payload(payload: BatchCreateWorkShiftsPayload) -> List[WorkShift]:
+        return [shift.to_domain() for shift in payload.shifts]
+
+
+class BatchDeleteWorkShiftsPayload(BaseModel):
+    work_shift_ids: List[int]
+
+
+class WorkShiftResponse(BaseModel):
+    id: Optional[int]
+    work_day_id: int
+    start_time: datetime
+    end_time: datetime
+    user_id: Optional[str] = None
+
+
+WORKSHIFT_ENCODER = TrustedDTOEncoder(WorkShift, WorkShiftResponse)
+
+
+class ListWorkShiftsDTO:
+    @staticmethod
+    def from_query(
+        work_day_id: Optional[int],
+        role_id: Optional[str],
+        company_id: Optional[str],
+        window_start: Optional[datetime],
+        window_end: Optional[datetime],
+        limit: int,
+    ) -> WorkShiftListFilters:
+        return WorkShiftListFilters(
+            work_day_id=work_day_id,
+            role_id=role_id,
+            company_id=company_id,
+            window_start=_to_utc(window_start),
+            window_end=_to_utc(window_end),
+            limit=limit,
+        )
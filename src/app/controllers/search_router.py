@@ -0,0 +1,31 @@
+from dataclasses import asdict
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from src.app.controllers.schemas.pydantic.search_schemas import SearchResponse
+from src.app.dependencies import get_search_repository
+from src.domain.errors import ServiceUnavailableError, ValidationError
+from src.interfaces.isearch_repository import ISearchRepository
+from src.usecases.search.search_usecase import MAX_SEARCH_LIMIT, SearchScope, SearchUseCase
+
+router = APIRouter(tags=["search"], prefix="/search")
+
+
+def get_search_usecase(search_repository: ISearchRepository = Depends(get_search_repository)):
+    return SearchUseCase(search_repository)
+
+
+@router.get("", response_model=SearchResponse)
+async def search(
+    q: str,
+    type: SearchScope = "all",
+    limit: int = Query(20, ge=1, le=MAX_SEARCH_LIMIT),
+    search_usecase: SearchUseCase = Depends(get_search_usecase),
+):
+    try:
+        hits = await search_usecase.execute(q, scope=type, limit=limit)
+    except ValidationError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except ServiceUnavailableError as exc:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)) from exc
+    return {"items": [asdict(hit) for hit in hits]}
@@ -10,15 +10,17 @@ from src.app.controllers.schemas.pydantic.user_schemas import (
 )
 from src.app.dependencies import (
     get_companies_repository,
+    get_permissions_query_service,
+    get_unit_of_work,
     get_user_company_requests_repository,
-    get_user_company_roles_repository,
     get_users_repository,
 )
 from src.domain.entities.user_company_requests import UserCompanyRequestStatus
 from src.domain.errors import AlreadyExistsError, NotFoundError, PermissionDeniedError, ValidationError
 from src.interfaces.icompanies_repository import ICompaniesRepository
+from src.interfaces.ipermissions_query_service import IPermissionsQueryService
+from src.interfaces.iunit_of_work import IUnitOfWork
 from src.interfaces.iuser_company_requests_repository import IUserCompanyRequestsRepository
-from src.interfaces.iuser_company_roles_repository import IUserCompanyRolesRepository
 from src.interfaces.iusers_repository import IUsersRepository
 from src.interfaces.types.user_types import UserCompanyRequestDTO, UserCompanyRequestWithUser
 from src.usecases.user_company_requests.approve_user_company_request_usecase import ApproveUserCompanyRequestUseCase
@@ -33,36 +35,39 @@ def get_create_request_usecase(
     user_company_requests_repository: IUserCompanyRequestsRepository = Depends(get_user_company_requests_repository),
     users_repository: IUsersRepository = Depends(get_users_repository),
     companies_repository: ICompaniesRepository = Depends(get_companies_repository),
-    user_company_roles_repository: IUserCompanyRolesRepository = Depends(get_user_company_roles_repository),
+    permissions: IPermissionsQueryService = Depends(get_permissions_query_service),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
 ):
     return CreateUserCompanyRequestUseCase(
         user_company_requests_repository=user_company_requests_repository,
         users_repository=users_repository,
         companies_repository=companies_repository,
-        user_company_roles_repository=user_company_roles_repository,
+        permissions=permissions,
+        uow=uow,
     )
 
 
 def get_list_requests_usecase(
     user_company_requests_repository: IUserCompanyRequestsRepository = Depends(get_user_company_requests_repository),
-    users_repository: IUsersRepository = Depends(get_users_repository),
+    permissions: IPermissionsQueryService = Depends(get_permissions_query_service),
 ):
-    return ListRequestsByCompanyUseCase(user_company_requests_repository, users_repository)
+    return ListRequestsByCompanyUseCase(user_company_requests_repository, permissions)
 
 
 def get_approve_request_usecase(
     user_company_requests_repository: IUserCompanyRequestsRepository = Depends(get_user_company_requests_repository),
-    users_repository: IUsersRepository = Depends(get_users_repository),
-    user_company_roles_repository: IUserCompanyRolesRepository = Depends(get_user_company_roles_repository),
+    permissions: IPermissionsQueryService = Depends(get_permissions_query_service),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
 ):
-    return ApproveUserCompanyRequestUseCase(user_company_requests_repository, users_repository, user_company_roles_repository)
+    return ApproveUserCompanyRequestUseCase(user_company_requests_repository, permissions, uow)
 
 
 def get_reject_request_usecase(
     user_company_requests_repository: IUserCompanyRequestsRepository = Depends(get_user_company_requests_repository),
-    users_repository: IUsersRepository = Depends(get_users_repository),
+    permissions: IPermissionsQueryService = Depends(get_permissions_query_service),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
 ):
-    return RejectUserCompanyRequestUseCase(user_company_requests_repository, users_repository)
+    return RejectUserCompanyRequestUseCase(user_company_requests_repository, permissions, uow)
 
 
 def _to_request_response(dto: UserCompanyRequestDTO) -> UserCompanyRequestResponse:
@@ -143,6 +148,8 @@ async def approve_company_request(
     try:
         updated = await approve_request_usecase.execute(request_id=request_id, owner_id=user_id)
         return _to_request_response(updated)
+    except AlreadyExistsError as exc:
+        raise HTTPException(status_code=http_status.HTTP_409_CONFLICT, detail=str(exc)) from exc
     except PermissionDeniedError as exc:
         raise HTTPException(status_code=http_status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
     except ValidationError as exc:
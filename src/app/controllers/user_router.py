@@ -1,24 +1,32 @@
 from dataclasses import asdict
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
+from src.app.controllers.schemas.dtos.list_users_dto import ListUsersDTO, UserCursorDTO
 from src.app.controllers.schemas.dtos.update_user_dto import UpdateUserDTO
-from src.app.controllers.schemas.pydantic.user_schemas import UserCreateRequest, UserDetailResponse, UserResponse, UserUpdateRequest
-from src.app.dependencies import get_users_repository
-from src.domain.errors import AlreadyExistsError, NotFoundError
+from src.app.controllers.schemas.pydantic.user_schemas import UserCreateRequest, UserDetailResponse, UserPageResponse, UserResponse, UserUpdateRequest
+from src.app.dependencies import get_password_hasher, get_unit_of_work, get_users_repository
+from src.domain.errors import AlreadyExistsError, NotFoundError, ServiceOverloadedError, ValidationError
+from src.interfaces.ipassword_hasher import IPasswordHasher
+from src.interfaces.iunit_of_work import IUnitOfWork
 from src.interfaces.iusers_repository import IUsersRepository
 from src.interfaces.types.user_types import UserUpdatePayload
 from src.usecases.users.create_user_usecase import CreateUserUseCase
 from src.usecases.users.delete_user_usecase import DeleteUserUseCase
-from src.usecases.users.list_users_usecase import ListUsersUseCase
+from src.usecases.users.list_users_usecase import MAX_USERS_PAGE_SIZE, ListUsersUseCase
 from src.usecases.users.retrieve_user_usecase import RetrieveUserUseCase
 from src.usecases.users.update_user_usecase import UpdateUserUseCase
 
 router = APIRouter(tags=["users"], prefix="/users")
 
 
-def get_create_user_usecase(users_repository: IUsersRepository = Depends(get_users_repository)):
-    return CreateUserUseCase(users_repository)
+def get_create_user_usecase(
+    users_repository: IUsersRepository = Depends(get_users_repository),
+    password_hasher: IPasswordHasher = Depends(get_password_hasher),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+):
+    return CreateUserUseCase(users_repository, password_hasher, uow)
 
 
 def get_list_users_usecase(users_repository: IUsersRepository = Depends(get_users_repository)):
@@ -29,12 +37,18 @@ def get_retrieve_user_usecase(users_repository: IUsersRepository = Depends(get_u
     return RetrieveUserUseCase(users_repository)
 
 
-def get_update_user_usecase(users_repository: IUsersRepository = Depends(get_users_repository)):
-    return UpdateUserUseCase(users_repository)
+def get_update_user_usecase(
+    users_repository: IUsersRepository = Depends(get_users_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+):
+    return UpdateUserUseCase(users_repository, uow)
 
 
-def get_delete_user_usecase(users_repository: IUsersRepository = Depends(get_users_repository)):
-    return DeleteUserUseCase(users_repository)
+def get_delete_user_usecase(
+    users_repository: IUsersRepository = Depends(get_users_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+):
+    return DeleteUserUseCase(users_repository, uow)
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -44,12 +58,25 @@ async def create(payload: UserCreateRequest, create_usecase: CreateUserUseCase =
         return UserResponse(**asdict(new_user))
     except AlreadyExistsError as exc:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
-
-
-@router.get("", response_model=list[UserResponse])
-async def list(list_users_usecase: ListUsersUseCase = Depends(get_list_users_usecase)):
-    users = await list_users_usecase.execute()
-    return [UserResponse(**asdict(user)) for user in users]
+    except ServiceOverloadedError as exc:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc), headers={"Retry-After": "1"}) from exc
+
+
+@router.get("", response_model=UserPageResponse, response_model_exclude_unset=True)
+async def list(
+    email: Optional[str] = Query(None, description="prefixo do email"),
+    name: Optional[str] = Query(None, description="prefixo de first_name ou last_name"),
+    fields: Optional[str] = Query(None, description="colunas separadas por virgula, ex. id,email"),
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_USERS_PAGE_SIZE),
+    list_users_usecase: ListUsersUseCase = Depends(get_list_users_usecase),
+):
+    try:
+        filters = ListUsersDTO.from_query(email=email, name=name, fields=fields, cursor=cursor, limit=limit)
+        page = await list_users_usecase.execute(filters)
+    except (ValueError, ValidationError) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return {"items": page.items, "next_cursor": UserCursorDTO.encode(page.next_cursor)}
 
 
 @router.get("/{user_id}", response_model=UserDetailResponse)
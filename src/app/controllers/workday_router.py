@@ -1,29 +1,40 @@
-from dataclasses import asdict
 from datetime import datetime
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 
+from src.app.controllers.schemas.dtos.workday_import_dto import WorkdayImportDTO
 from src.app.controllers.schemas.pydantic.workdays_dtos import (
+    WORKDAY_ENCODER,
+    WORKDAY_IMPORT_ENCODER,
     BatchCreateWorkdaysDTO,
     BatchCreateWorkdaysPayload,
     BatchDeleteWorkdaysPayload,
     BatchIndividualCreateWorkdaysDTO,
     BatchIndividualCreateWorkdaysPayload,
     CreateWorkdayPayload,
+    ListWorkdaysDTO,
     UpdateWorkdayDTO,
     UpdateWorkdayPayload,
+    WorkdayCursorDTO,
+    WorkdayImportResponse,
+    WorkdayPageResponse,
     WorkdayResponse,
 )
-from src.app.dependencies import get_workdays_repository
+from src.app.dependencies import get_roles_repository, get_unit_of_work, get_workdays_repository
 from src.domain.entities.work_day import WorkDay
-from src.domain.errors import AlreadyExistsError, NotFoundError
+from src.domain.errors import AlreadyExistsError, NotFoundError, ValidationError
+from src.interfaces.iroles_repository import IRolesRepository
+from src.interfaces.iunit_of_work import IUnitOfWork
 from src.interfaces.iworkdays_repository import IWorkdaysRepository
+from src.interfaces.types.workday_types import WorkdayConflictMode
 from src.usecases.workdays.batch_delete_workday_usecase import BatchDeleteWorkdayUseCase
 from src.usecases.workdays.batch_individual_create_workday_usecase import BatchIndividualCreateWorkdayUseCase
 from src.usecases.workdays.batch_interval_create_workday_usecase import BatchIntervalCreateWorkdayUseCase
 from src.usecases.workdays.create_workday_usecase import CreateWorkdayUseCase
 from src.usecases.workdays.delete_workday_usecase import DeleteWorkdayUseCase
-from src.usecases.workdays.list_workdays_usecase import ListWorkdaysUseCase
+from src.usecases.workdays.import_workdays_usecase import ImportWorkdaysUseCase
+from src.usecases.workdays.list_workdays_usecase import MAX_WORKDAYS_PAGE_SIZE, ListWorkdaysUseCase
 from src.usecases.workdays.update_workday_usecase import UpdateWorkdayUseCase
 
 router = APIRouter(tags=["workdays"], prefix="/workdays")
@@ -33,35 +44,72 @@ def get_list_workday_usecase(workdays_repository: IWorkdaysRepository = Depends(
     return ListWorkdaysUseCase(workdays_repository)
 
 
-def get_create_workday_usecase(workdays_repository: IWorkdaysRepository = Depends(get_workdays_repository)):
-    return CreateWorkdayUseCase(workdays_repository)
+def get_create_workday_usecase(
+    workdays_repository: IWorkdaysRepository = Depends(get_workdays_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+):
+    return CreateWorkdayUseCase(workdays_repository, uow)
 
 
-def get_update_workday_usecase(workdays_repository: IWorkdaysRepository = Depends(get_workdays_repository)):
-    return UpdateWorkdayUseCase(workdays_repository)
+def get_update_workday_usecase(
+    workdays_repository: IWorkdaysRepository = Depends(get_workdays_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+):
+    return UpdateWorkdayUseCase(workdays_repository, uow)
 
 
-def get_delete_workday_usecase(workdays_repository: IWorkdaysRepository = Depends(get_workdays_repository)):
-    return DeleteWorkdayUseCase(workdays_repository)
+def get_delete_workday_usecase(
+    workdays_repository: IWorkdaysRepository = Depends(get_workdays_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+):
+    return DeleteWorkdayUseCase(workdays_repository, uow)
 
 
-def get_batch_interval_create_workday_usecase(workdays_repository: IWorkdaysRepository = Depends(get_workdays_repository)):
-    return BatchIntervalCreateWorkdayUseCase(workdays_repository)
+def get_batch_interval_create_workday_usecase(
+    workdays_repository: IWorkdaysRepository = Depends(get_workdays_repository),
+    roles_repository: IRolesRepository = Depends(get_roles_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+):
+    return BatchIntervalCreateWorkdayUseCase(workdays_repository, roles_repository, uow)
 
 
-def get_batch_individual_create_workday_usecase(workdays_repository: IWorkdaysRepository = Depends(get_workdays_repository)):
-    return BatchIndividualCreateWorkdayUseCase(workdays_repository)
+def get_batch_individual_create_workday_usecase(
+    workdays_repository: IWorkdaysRepository = Depends(get_workdays_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+):
+    return BatchIndividualCreateWorkdayUseCase(workdays_repository, uow)
 
 
-def get_batch_delete_workday_usecase(workdays_repository: IWorkdaysRepository = Depends(get_workdays_repository)):
-    return BatchDeleteWorkdayUseCase(workdays_repository)
+def get_batch_delete_workday_usecase(
+    workdays_repository: IWorkdaysRepository = Depends(get_workdays_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+):
+    return BatchDeleteWorkdayUseCase(workdays_repository, uow)
 
 
-@router.get("", response_model=list[WorkdayResponse])
-async def list_workdays(list_workdays_usecase: ListWorkdaysUseCase = Depends(get_list_workday_usecase)):
+def get_import_workdays_usecase(
+    workdays_repository: IWorkdaysRepository = Depends(get_workdays_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+):
+    return ImportWorkdaysUseCase(workdays_repository, uow)
+
+
+@router.get("", response_model=WorkdayPageResponse)
+async def list_workdays(
+    role_id: Optional[str] = None,
+    company_id: Optional[str] = None,
+    date_from: Optional[datetime] = Query(None, alias="from"),
+    date_to: Optional[datetime] = Query(None, alias="to"),
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_WORKDAYS_PAGE_SIZE),
+    list_workdays_usecase: ListWorkdaysUseCase = Depends(get_list_workday_usecase),
+):
     try:
-        workdays = await list_workdays_usecase.execute()
-        return [asdict(w) for w in workdays]
+        filters = ListWorkdaysDTO.from_query(role_id=role_id, company_id=company_id, date_from=date_from, date_to=date_to, cursor=cursor, limit=limit)
+        page = await list_workdays_usecase.execute(filters)
+        return WORKDAY_ENCODER.page(page.items, WorkdayCursorDTO.encode(page.next_cursor))
+    except (ValueError, ValidationError) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     except Exception as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
@@ -77,25 +125,29 @@ async def create_workday(payload: CreateWorkdayPayload, create_workday_usecase:
             workday=WorkDay(id=None, role_id=payload.role_id, date=payload.date, is_holiday=payload.is_holiday, weekday=weekday)
         )
 
-        return asdict(new_workday)
+        return WORKDAY_ENCODER.one(new_workday, status_code=status.HTTP_201_CREATED)
     except AlreadyExistsError as exc:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+    except NotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
 
 @router.patch("/{workday_id}", response_model=WorkdayResponse)
 async def update_workday(workday_id: int, payload: UpdateWorkdayPayload, update_workday_usecase: UpdateWorkdayUseCase = Depends(get_update_workday_usecase)):
     try:
         updated_workday = await update_workday_usecase.execute(workday_id=workday_id, payload=UpdateWorkdayDTO.from_payload(payload))
-        return asdict(updated_workday)
+        return WORKDAY_ENCODER.one(updated_workday)
     except NotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except AlreadyExistsError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
 
 
 @router.post("/batch_individuals", response_model=list[WorkdayResponse])
 async def batch_individual_create_workdays(payload: BatchIndividualCreateWorkdaysPayload, batch_create_workday_usecase: BatchIndividualCreateWorkdayUseCase = Depends(get_batch_individual_create_workday_usecase)):
     try:
-        workdays = await batch_create_workday_usecase.execute(payloads=BatchIndividualCreateWorkdaysDTO().from_payload(payload))
-        return [asdict(w) for w in workdays]
+        workdays = await batch_create_workday_usecase.execute(payloads=BatchIndividualCreateWorkdaysDTO().from_payload(payload), conflict=payload.conflict)
+        return WORKDAY_ENCODER.many(workdays)
     except AlreadyExistsError as exc:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
 
@@ -104,9 +156,28 @@ async def batch_individual_create_workdays(payload: BatchIndividualCreateWorkday
 async def batch_create_workdays(payload: BatchCreateWorkdaysPayload, batch_create_workday_usecase: BatchIntervalCreateWorkdayUseCase = Depends(get_batch_interval_create_workday_usecase)):
     try:
         workdays = await batch_create_workday_usecase.execute(payload=BatchCreateWorkdaysDTO().from_payload(payload))
-        return [asdict(w) for w in workdays]
+        return WORKDAY_ENCODER.many(workdays)
+    except AlreadyExistsError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+    except ValidationError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except NotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+
+
+@router.post("/import", response_model=WorkdayImportResponse)
+async def import_workdays(request: Request, conflict: WorkdayConflictMode = "error", import_workdays_usecase: ImportWorkdaysUseCase = Depends(get_import_workdays_usecase)):
+    content_type = request.headers.get("content-type")
+    if not WorkdayImportDTO.is_supported(content_type):
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail="Use application/x-ndjson or text/csv")
+
+    try:
+        result = await import_workdays_usecase.execute(WorkdayImportDTO.iter_workdays(request.stream(), content_type), conflict=conflict)
+        return WORKDAY_IMPORT_ENCODER.one(result)
     except AlreadyExistsError as exc:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+    except (ValueError, ValidationError) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
 
 @router.delete("/batch_delete", status_code=status.HTTP_200_OK)
@@ -0,0 +1,156 @@
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from src.app.controllers.schemas.pydantic.workshifts_dtos import (
+    WORKSHIFT_ENCODER,
+    BatchCreateWorkShiftsDTO,
+    BatchCreateWorkShiftsPayload,
+    BatchDeleteWorkShiftsPayload,
+    CreateWorkShiftPayload,
+    ListWorkShiftsDTO,
+    UpdateWorkShiftDTO,
+    UpdateWorkShiftPayload,
+    WorkShiftResponse,
+)
+from src.app.dependencies import get_unit_of_work, get_workdays_repository, get_workshifts_repository
+from src.domain.errors import AlreadyExistsError, NotFoundError, ValidationError
+from src.interfaces.iunit_of_work import IUnitOfWork
+from src.interfaces.iworkdays_repository import IWorkdaysRepository
+from src.interfaces.iworkshifts_repository import IWorkShiftsRepository
+from src.usecases.workshifts.batch_create_workshifts_usecase import BatchCreateWorkShiftsUseCase
+from src.usecases.workshifts.batch_delete_workshifts_usecase import BatchDeleteWorkShiftsUseCase
+from src.usecases.workshifts.check_workshift_conflicts_usecase import CheckWorkShiftConflictsUseCase
+from src.usecases.workshifts.create_workshift_usecase import CreateWorkShiftUseCase
+from src.usecases.workshifts.delete_workshift_usecase import DeleteWorkShiftUseCase
+from src.usecases.workshifts.list_workshifts_usecase import MAX_WORKSHIFTS_PAGE_SIZE, ListWorkShiftsUseCase
+from src.usecases.workshifts.update_workshift_usecase import UpdateWorkShiftUseCase
+
+router = APIRouter(tags=["workshifts"], prefix="/workshifts")
+
+
+def get_list_workshifts_usecase(workshifts_repository: IWorkShiftsRepository = Depends(get_workshifts_repository)):
+    return ListWorkShiftsUseCase(workshifts_repository)
+
+
+def get_create_workshift_usecase(
+    workshifts_repository: IWorkShiftsRepository = Depends(get_workshifts_repository),
+    workdays_repository: IWorkdaysRepository = Depends(get_workdays_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+):
+    return CreateWorkShiftUseCase(workshifts_repository, workdays_repository, uow)
+
+
+def get_batch_create_workshifts_usecase(
+    workshifts_repository: IWorkShiftsRepository = Depends(get_workshifts_repository),
+    workdays_repository: IWorkdaysRepository = Depends(get_workdays_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+):
+    return BatchCreateWorkShiftsUseCase(workshifts_repository, workdays_repository, uow)
+
+
+def get_check_workshift_conflicts_usecase(workshifts_repository: IWorkShiftsRepository = Depends(get_workshifts_repository)):
+    return CheckWorkShiftConflictsUseCase(workshifts_repository)
+
+
+def get_update_workshift_usecase(
+    workshifts_repository: IWorkShiftsRepository = Depends(get_workshifts_repository),
+    workdays_repository: IWorkdaysRepository = Depends(get_workdays_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+):
+    return UpdateWorkShiftUseCase(workshifts_repository, workdays_repository, uow)
+
+
+def get_delete_workshift_usecase(
+    workshifts_repository: IWorkShiftsRepository = Depends(get_workshifts_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+):
+    return DeleteWorkShiftUseCase(workshifts_repository, uow)
+
+
+def get_batch_delete_workshifts_usecase(
+    workshifts_repository: IWorkShiftsRepository = Depends(get_workshifts_repository),
+    uow: IUnitOfWork = Depends(get_unit_of_work),
+):
+    return BatchDeleteWorkShiftsUseCase(workshifts_repository, uow)
+
+
+@router.get("", response_model=list[WorkShiftResponse])
+async def list_workshifts(
+    work_day_id: Optional[int] = None,
+    role_id: Optional[str] = None,
+    company_id: Optional[str] = None,
+    window_start: Optional[datetime] = Query(None, alias="from"),
+    window_end: Optional[datetime] = Query(None, alias="to"),
+    limit: int = Query(MAX_WORKSHIFTS_PAGE_SIZE, ge=1, le=MAX_WORKSHIFTS_PAGE_SIZE),
+    list_workshifts_usecase: ListWorkShiftsUseCase = Depends(get_list_workshifts_usecase),
+):
+    try:
+        filters = ListWorkShiftsDTO.from_query(
+            work_day_id=work_day_id, role_id=role_id, company_id=company_id, window_start=window_start, window_end=window_end, limit=limit
+        )
+        work_shifts = await list_workshifts_usecase.execute(filters)
+        return WORKSHIFT_ENCODER.many(work_shifts)
+    except ValidationError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+@router.post("", response_model=WorkShiftResponse, status_code=status.HTTP_201_CREATED)
+async def create_workshift(payload: CreateWorkShiftPayload, create_workshift_usecase: CreateWorkShiftUseCase = Depends(get_create_workshift_usecase)):
+    try:
+        work_shift = await create_workshift_usecase.execute(payload.to_domain())
+        return WORKSHIFT_ENCODER.one(work_shift, status_code=status.HTTP_201_CREATED)
+    except ValidationError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except NotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except AlreadyExistsError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+
+
+@router.post("/batch", response_model=list[WorkShiftResponse], status_code=status.HTTP_201_CREATED)
+async def batch_create_workshifts(payload: BatchCreateWorkShiftsPayload, batch_create_workshifts_usecase: BatchCreateWorkShiftsUseCase = Depends(get_batch_create_workshifts_usecase)):
+    try:
+        work_shifts = await batch_create_workshifts_usecase.execute(BatchCreateWorkShiftsDTO.from_payload(payload))
+        return WORKSHIFT_ENCODER.many(work_shifts, status_code=status.HTTP_201_CREATED)
+    except ValidationError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except NotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except AlreadyExistsError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+
+
+@router.post("/conflicts", response_model=list[WorkShiftResponse])
+async def check_workshift_conflicts(payload: BatchCreateWorkShiftsPayload, check_conflicts_usecase: CheckWorkShiftConflictsUseCase = Depends(get_check_workshift_conflicts_usecase)):
+    try:
+        conflicts = await check_conflicts_usecase.execute(BatchCreateWorkShiftsDTO.from_payload(payload))
+        return WORKSHIFT_ENCODER.many(conflicts)
+    except ValidationError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+@router.patch("/{work_shift_id}", response_model=WorkShiftResponse)
+async def update_workshift(work_shift_id: int, payload: UpdateWorkShiftPayload, update_workshift_usecase: UpdateWorkShiftUseCase = Depends(get_update_workshift_usecase)):
+    try:
+        work_shift = await update_workshift_usecase.execute(work_shift_id=work_shift_id, payload=UpdateWorkShiftDTO.from_payload(payload))
+        return WORKSHIFT_ENCODER.one(work_shift)
+    except ValidationError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except NotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except AlreadyExistsError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+
+
+@router.delete("/batch_delete", status_code=status.HTTP_200_OK)
+async def batch_delete_workshifts(payload: BatchDeleteWorkShiftsPayload, batch_delete_workshifts_usecase: BatchDeleteWorkShiftsUseCase = Depends(get_batch_delete_workshifts_usecase)):
+    await batch_delete_workshifts_usecase.execute(work_shift_ids=list(payload.work_shift_ids))
+    return {"detail": "Work shifts deleted successfully"}
+
+
+@router.delete("/{work_shift_id}")
+async def delete_workshift(work_shift_id: int, delete_workshift_usecase: DeleteWorkShiftUseCase = Depends(get_delete_workshift_usecase)):
+    await delete_workshift_usecase.execute(work_shift_id=work_shift_id)
+    return {"detail": "Work shift deleted successfully"}
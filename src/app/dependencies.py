@@ -1,11 +1,17 @@
 from src.interfaces.icompanies_repository import ICompaniesRepository
 from src.interfaces.ijwt_repository import IJWTRepository
+from src.interfaces.ipassword_hasher import IPasswordHasher
+from src.interfaces.ipermissions_query_service import IPermissionsQueryService
+from src.interfaces.irevoked_token_filter import IRevokedTokenFilter
+from src.interfaces.isearch_repository import ISearchRepository
 from src.interfaces.iroles_repository import IRolesRepository
 from src.interfaces.iuser_company_requests_repository import IUserCompanyRequestsRepository
 from src.interfaces.iuser_company_roles_repository import IUserCompanyRolesRepository
 from src.interfaces.iusers_repository import IUsersRepository
 from src.interfaces.iworkdays_repository import IWorkdaysRepository
+from src.interfaces.iworkshifts_repository import IWorkShiftsRepository
 from src.interfaces.itoken_service import ITokenService
+from src.interfaces.iunit_of_work import IUnitOfWork
 from src.app.controllers.auth_config import AuthCookieSettings
 
 
@@ -37,14 +43,38 @@ def get_workdays_repository() -> IWorkdaysRepository:
     raise _not_configured("get_workdays_repository")
 
 
+def get_workshifts_repository() -> IWorkShiftsRepository:
+    raise _not_configured("get_workshifts_repository")
+
+
 def get_jwt_repository() -> IJWTRepository:
     raise _not_configured("get_jwt_repository")
 
 
+def get_permissions_query_service() -> IPermissionsQueryService:
+    raise _not_configured("get_permissions_query_service")
+
+
+def get_search_repository() -> ISearchRepository:
+    raise _not_configured("get_search_repository")
+
+
+def get_unit_of_work() -> IUnitOfWork:
+    raise _not_configured("get_unit_of_work")
+
+
 def get_token_service() -> ITokenService:
     raise _not_configured("get_token_service")
 
 
+def get_password_hasher() -> IPasswordHasher:
+    raise _not_configured("get_password_hasher")
+
+
+def get_revoked_token_filter() -> IRevokedTokenFilter | None:
+    raise _not_configured("get_revoked_token_filter")
+
+
 def get_refresh_token_expire_days() -> int:
     raise _not_configured("get_refresh_token_expire_days")
 
@@ -1,10 +1,12 @@
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Optional
 
 
 @dataclass(slots=True)
 class WorkShift:
-    id: int
-    work_day_id: str
+    id: Optional[int]
+    work_day_id: int
     start_time: datetime
     end_time: datetime
+    user_id: Optional[str] = None
@@ -18,6 +18,14 @@ class ValidationError(DomainError):
     pass
 
 
+class ServiceOverloadedError(DomainError):
+    pass
+
+
+class ServiceUnavailableError(DomainError):
+    pass
+
+
 class AuthError(DomainError):
     pass
 
@@ -0,0 +1,71 @@
+from typing import Any, Generic, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class IntervalTree(Generic[T]):
+    """Arvore de intervalos estatica sobre intervalos semiabertos [start, end).
+
+    Os intervalos ficam ordenados por inicio num array; cada posicao e a raiz implicita
+    da sua metade e guarda o maior fim da subarvore, o que permite podar a busca.
+    """
+
+    __slots__ = ("_starts", "_ends", "_items", "_max_end")
+
+    def __init__(self, intervals: Iterable[Tuple[Any, Any, T]]):
+        ordered = sorted(intervals, key=lambda interval: interval[0])
+        self._starts = [interval[0] for interval in ordered]
+        self._ends = [interval[1] for interval in ordered]
+        self._items: List[T] = [interval[2] for interval in ordered]
+        self._max_end: List[Any] = [None] * len(ordered)
+        self._build(0, len(ordered))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _build(self, lo: int, hi: int) -> Optional[Any]:
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        max_end = self._ends[mid]
+        for child in (self._build(lo, mid), self._build(mid + 1, hi)):
+            if child is not None and child > max_end:
+                max_end = child
+        self._max_end[mid] = max_end
+        return max_end
+
+    def overlapping(self, start: Any, end: Any) -> List[T]:
+        # resultado em ordem de inicio
+        found: List[T] = []
+        self._collect(0, len(self._items), start, end, found)
+        return found
+
+    def overlaps(self, start: Any, end: Any) -> bool:
+        return bool(self.overlapping(start, end))
+
+    def _collect(self, lo: int, hi: int, start: Any, end: Any, found: List[T]) -> None:
+        if lo >= hi:
+            return
+        mid = (lo + hi) // 2
+        # nada nesta subarvore termina depois de start
+        if self._max_end[mid] <= start:
+            return
+        self._collect(lo, mid, start, end, found)
+        # a direita tudo comeca em starts[mid] ou depois
+        if self._starts[mid] >= end:
+            return
+        if self._ends[mid] > start:
+            found.append(self._items[mid])
+        self._collect(mid + 1, hi, start, end, found)
+
+
+def overlapping_pairs(intervals: Sequence[Tuple[Any, Any, T]]) -> List[Tuple[T, T]]:
+    # varredura por inicio: cada intervalo so e comparado com os que ainda estao abertos
+    ordered = sorted(intervals, key=lambda interval: interval[0])
+    pairs: List[Tuple[T, T]] = []
+    active: List[Tuple[Any, Any, T]] = []
+    for current in ordered:
+        active = [interval for interval in active if interval[1] > current[0]]
+        pairs.extend((interval[2], current[2]) for interval in active)
+        active.append(current)
+    return pairs
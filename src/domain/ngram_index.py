@@ -0,0 +1,51 @@
+import re
+from collections import Counter
+from typing import Dict, Generic, Hashable, List, Set, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+_WORD = re.compile(r"[^\W_]+")
+
+# mesmo valor padrao de pg_trgm.word_similarity_threshold
+DEFAULT_SIMILARITY_THRESHOLD = 0.6
+
+
+def trigrams(text: str) -> Set[str]:
+    # como o pg_trgm: minusculas, palavras alfanumericas com "  " antes e " " depois
+    grams: Set[str] = set()
+    for word in _WORD.findall(text.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class NGramIndex(Generic[K]):
+    """Indice invertido de trigramas em memoria, substituto do GIN gin_trgm_ops.
+
+    O score e a fracao dos trigramas da consulta presentes no documento, uma
+    aproximacao do word_similarity do pg_trgm (que exige um trecho continuo).
+    """
+
+    __slots__ = ("_postings",)
+
+    def __init__(self):
+        self._postings: Dict[str, Set[K]] = {}
+
+    def add(self, key: K, *texts: str) -> None:
+        for text in texts:
+            for gram in trigrams(text or ""):
+                self._postings.setdefault(gram, set()).add(key)
+
+    def search(self, query: str, limit: int, threshold: float = DEFAULT_SIMILARITY_THRESHOLD) -> List[Tuple[K, float]]:
+        grams = trigrams(query)
+        if not grams:
+            return []
+
+        # so documentos que dividem ao menos um trigrama com a consulta sao visitados
+        hits: Counter = Counter()
+        for gram in grams:
+            hits.update(self._postings.get(gram, ()))
+
+        scored = [(key, count / len(grams)) for key, count in hits.items() if count / len(grams) >= threshold]
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored[:limit]
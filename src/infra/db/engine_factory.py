@@ -0,0 +1,144 @@
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+# esperas de checkout guardadas para os percentis do /metrics
+_WAIT_WINDOW = 1024
+
+
+@dataclass(slots=True, frozen=True)
+class EngineOptions:
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout_seconds: float = 30.0
+    # reabre conexoes mais velhas que isso (firewalls/pgbouncer derrubam conexoes ociosas); -1 desliga
+    pool_recycle_seconds: int = 1800
+    pool_pre_ping: bool = True
+    # cache de prepared statements do asyncpg por conexao; 0 para pgbouncer em modo transaction
+    statement_cache_size: int = 100
+    # statement_timeout do PostgreSQL; 0 desliga
+    statement_timeout_ms: int = 0
+    workers: int = 1
+    # conexoes que esta app pode abrir no banco, somando todos os workers; 0 nao checa
+    connection_budget: int = 0
+
+    @classmethod
+    def from_settings(cls, settings) -> "EngineOptions":
+        return cls(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout_seconds=settings.DB_POOL_TIMEOUT_SECONDS,
+            pool_recycle_seconds=settings.DB_POOL_RECYCLE_SECONDS,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+            statement_cache_size=settings.DB_STATEMENT_CACHE_SIZE,
+            statement_timeout_ms=settings.DB_STATEMENT_TIMEOUT_MS,
+            workers=settings.WEB_CONCURRENCY,
+            connection_budget=settings.DB_CONNECTION_BUDGET,
+        )
+
+
+class PoolMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._waits: Deque[float] = deque(maxlen=_WAIT_WINDOW)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            self._waits.append(seconds)
+
+    def _percentile(self, ordered: list, fraction: float) -> float:
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def snapshot(self, pool: Optional[Pool] = None) -> Dict[str, Any]:
+        with self._lock:
+            ordered = sorted(self._waits)
+            data: Dict[str, Any] = {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+                "wait_seconds_p50": round(self._percentile(ordered, 0.50), 6),
+                "wait_seconds_p99": round(self._percentile(ordered, 0.99), 6),
+            }
+        if isinstance(pool, AsyncAdaptedQueuePool):
+            data.update(size=pool.size(), in_use=pool.checkedout(), idle=pool.checkedin(), overflow=max(0, pool.overflow()))
+        return data
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    # build_engine cria uma subclasse por engine com o seu PoolMetrics; sobrevive ao recreate() do dispose
+    pool_metrics: PoolMetrics
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except exc.TimeoutError:
+            self.pool_metrics.record_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        self.pool_metrics.record_wait(time.perf_counter() - started)
+        return entry
+
+
+def connection_budget_warning(options: EngineOptions) -> Optional[str]:
+    if options.connection_budget <= 0:
+        return None
+    steady = options.workers * options.pool_size
+    peak = options.workers * (options.pool_size + options.max_overflow)
+    if steady > options.connection_budget:
+        return (
+            f"DB pool oversubscribed: {options.workers} workers x pool_size {options.pool_size} = {steady} connections "
+            f"> budget {options.connection_budget} (peak with overflow: {peak})"
+        )
+    if peak > options.connection_budget:
+        return f"DB pool may exceed budget under load: {options.workers} workers x (pool_size + max_overflow) = {peak} > budget {options.connection_budget}"
+    return None
+
+
+def build_engine(database_url: str, options: EngineOptions = EngineOptions()) -> Tuple[AsyncEngine, Optional[PoolMetrics]]:
+    url = make_url(database_url)
+    # sqlite/aiosqlite usa pool proprio e nao aceita os parametros de QueuePool nem do asyncpg
+    if url.get_backend_name() != "postgresql":
+        return create_async_engine(database_url), None
+
+    metrics = PoolMetrics()
+    poolclass = type("TimedAsyncAdaptedQueuePool", (TimedAsyncAdaptedQueuePool,), {"pool_metrics": metrics})
+
+    connect_args: Dict[str, Any] = {}
+    if url.get_driver_name() == "asyncpg":
+        # o cache do adaptador do SQLAlchemy e o do asyncpg andam juntos (os dois precisam ser 0 atras de pgbouncer)
+        connect_args["prepared_statement_cache_size"] = options.statement_cache_size
+        connect_args["statement_cache_size"] = options.statement_cache_size
+        if options.statement_timeout_ms > 0:
+            connect_args["server_settings"] = {"statement_timeout": str(options.statement_timeout_ms)}
+
+    engine = create_async_engine(
+        database_url,
+        poolclass=poolclass,
+        pool_size=options.pool_size,
+        max_overflow=options.max_overflow,
+        pool_timeout=options.pool_timeout_seconds,
+        pool_recycle=options.pool_recycle_seconds,
+        pool_pre_ping=options.pool_pre_ping,
+        connect_args=connect_args,
+    )
+    return engine, metrics
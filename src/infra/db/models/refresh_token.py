@@ -1,7 +1,7 @@
 import uuid
 from typing import TypedDict
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String, func, inspect
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, String, func, inspect, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -20,10 +20,14 @@ class RefreshTokenDict(TypedDict):
 
 class RefreshToken(Base):
     __tablename__ = "refresh_tokens"
+    __table_args__ = (
+        Index("ix_refresh_tokens_user_id_active", "user_id", postgresql_where=text("revoked IS NOT TRUE")),
+        Index("ix_refresh_tokens_expires_at", "expires_at"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
-    token_hash = Column(String, nullable=False, index=True)
+    token_hash = Column(String, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     expires_at = Column(DateTime(timezone=True), nullable=False)
     revoked = Column(Boolean, default=False)
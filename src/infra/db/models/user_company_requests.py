@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, func
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, func, text
 from sqlalchemy import Enum as SqlEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
@@ -11,6 +11,13 @@ from src.infra.settings.base import Base
 
 class UserCompanyRequest(Base):
     __tablename__ = "user_company_requests"
+    __table_args__ = (
+        Index("uq_user_company_requests_pending", "user_id", "company_id", unique=True, postgresql_where=text("status = 'pending'")),
+        Index("ix_user_company_requests_user_id", "user_id"),
+        Index("ix_user_company_requests_company_id_status_created_at", "company_id", "status", "created_at"),
+    )
+    # updated_at (onupdate no servidor) volta no RETURNING do UPDATE, sem refresh()
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"))
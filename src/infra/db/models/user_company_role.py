@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Boolean, Column, ForeignKey
+from sqlalchemy import Boolean, Column, ForeignKey, Index, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -9,6 +9,11 @@ from src.infra.settings.base import Base
 
 class UserCompanyRole(Base):
     __tablename__ = "user_company_roles"
+    __table_args__ = (
+        UniqueConstraint("user_id", "company_id", name="uq_user_company_roles_user_id_company_id"),
+        Index("ix_user_company_roles_company_id", "company_id"),
+        Index("ix_user_company_roles_role_id", "role_id", postgresql_where=text("role_id IS NOT NULL")),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"))
@@ -1,4 +1,4 @@
-from sqlalchemy import UUID, Boolean, Column, DateTime, ForeignKey, Integer
+from sqlalchemy import UUID, Boolean, Column, DateTime, ForeignKey, Index, Integer
 from sqlalchemy.orm import relationship
 
 from src.infra.settings.base import Base
@@ -6,6 +6,10 @@ from src.infra.settings.base import Base
 
 class WorkDay(Base):
     __tablename__ = "work_days"
+    __table_args__ = (
+        Index("uq_work_days_role_id_date", "role_id", "date", unique=True),
+        Index("ix_work_days_date_id", "date", "id"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
 
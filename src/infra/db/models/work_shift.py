@@ -1,4 +1,4 @@
-from sqlalchemy import UUID, Column, DateTime, ForeignKey, Integer
+from sqlalchemy import UUID, CheckConstraint, Column, DateTime, ForeignKey, Index, Integer
 from sqlalchemy.orm import relationship
 
 from src.infra.settings.base import Base
@@ -6,13 +6,23 @@ from src.infra.settings.base import Base
 
 class WorkShift(Base):
     __tablename__ = "work_shifts"
+    # no PostgreSQL a migration tambem cria a exclusion constraint ex_work_shifts_no_overlap
+    # e o indice GiST ix_work_shifts_time_range sobre tstzrange(start_time, end_time)
+    __table_args__ = (
+        CheckConstraint("end_time > start_time", name="ck_work_shifts_time_order"),
+        Index("ix_work_shifts_work_day_id_start_time", "work_day_id", "start_time"),
+        Index("ix_work_shifts_user_id_start_time", "user_id", "start_time"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
 
-    work_day_id = Column(UUID(as_uuid=True), ForeignKey("work_days.id", ondelete="CASCADE"))
+    work_day_id = Column(Integer, ForeignKey("work_days.id", ondelete="CASCADE"), nullable=False)
 
     start_time = Column(DateTime(timezone=True), nullable=False)
 
     end_time = Column(DateTime(timezone=True), nullable=False)
 
+    # preenchido pelo escalonador (src/usecases/scheduling)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+
     work_day = relationship("WorkDay", back_populates="work_shifts")
@@ -0,0 +1,70 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Optional, Sequence, Tuple, TypeVar
+
+from src.domain.entities.company import Company as DomainCompany
+from src.domain.entities.role import Role as DomainRole
+from src.domain.entities.work_day import WorkDay as DomainWorkDay
+from src.domain.entities.work_shift import WorkShift as DomainWorkShift
+from src.infra.db.models.company import Company
+from src.infra.db.models.role import Role
+from src.infra.db.models.user import User
+from src.infra.db.models.work_day import WorkDay
+from src.infra.db.models.work_shift import WorkShift
+from src.interfaces.types.user_types import CompanyDTO, RoleDTO, UserSummaryDTO
+
+# projecoes das listagens somente leitura: select(*projection.columns) devolve Row (tupla), sem entidade ORM,
+# identity map ou change tracking; cada linha vira direto a dataclass de saida
+
+T = TypeVar("T")
+
+
+def _str_or_none(value: Any) -> Optional[str]:
+    return str(value) if value is not None else None
+
+
+@dataclass(slots=True, frozen=True)
+class Projection(Generic[T]):
+    columns: Tuple[Any, ...]
+    build: Callable[..., T]
+
+    def from_row(self, row: Sequence[Any], offset: int = 0) -> T:
+        # offset: posicao da primeira coluna desta projecao quando o select junta varias
+        return self.build(*row[offset : offset + len(self.columns)])
+
+    def from_outer_row(self, row: Sequence[Any], offset: int = 0) -> Optional[T]:
+        # lado opcional de um LEFT JOIN: a primeira coluna (pk) nula significa "sem registro"
+        if row[offset] is None:
+            return None
+        return self.from_row(row, offset)
+
+
+ROLE = Projection(
+    columns=(Role.id, Role.name, Role.company_id, Role.number_of_cooldown_days),
+    build=lambda id, name, company_id, cooldown: DomainRole(id=str(id), name=name, company_id=_str_or_none(company_id), number_of_cooldown_days=cooldown),
+)
+
+ROLE_DTO = Projection(
+    columns=ROLE.columns,
+    build=lambda id, name, company_id, cooldown: RoleDTO(id=str(id), name=name, company_id=_str_or_none(company_id), number_of_cooldown_days=cooldown),
+)
+
+COMPANY = Projection(columns=(Company.id, Company.name), build=lambda id, name: DomainCompany(id=str(id), name=name))
+
+COMPANY_DTO = Projection(columns=COMPANY.columns, build=lambda id, name: CompanyDTO(id=str(id), name=name))
+
+USER_SUMMARY = Projection(
+    columns=(User.id, User.first_name, User.last_name, User.email, User.active),
+    build=lambda id, first_name, last_name, email, active: UserSummaryDTO(id=str(id), name=f"{first_name}.{last_name}", email=email, active=active),
+)
+
+WORKDAY = Projection(
+    columns=(WorkDay.id, WorkDay.role_id, WorkDay.date, WorkDay.is_holiday, WorkDay.weekday),
+    build=lambda id, role_id, date, is_holiday, weekday: DomainWorkDay(id=id, role_id=str(role_id), date=date, is_holiday=is_holiday, weekday=weekday),
+)
+
+WORKSHIFT = Projection(
+    columns=(WorkShift.id, WorkShift.work_day_id, WorkShift.start_time, WorkShift.end_time, WorkShift.user_id),
+    build=lambda id, work_day_id, start_time, end_time, user_id: DomainWorkShift(
+        id=id, work_day_id=work_day_id, start_time=start_time, end_time=end_time, user_id=_str_or_none(user_id)
+    ),
+)
@@ -0,0 +1,75 @@
+from datetime import datetime
+from typing import List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# particoes mensais por expires_at criadas pela migration 6f1c9a3d2b47 (opcional):
+# refresh_tokens_pYYYYMM cobre [primeiro dia do mes, primeiro dia do mes seguinte)
+PARTITION_PREFIX = "refresh_tokens_p"
+
+
+def _month_start(value: datetime) -> datetime:
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _add_months(value: datetime, months: int) -> datetime:
+    index = value.year * 12 + value.month - 1 + months
+    return value.replace(year=index // 12, month=index % 12 + 1, day=1)
+
+
+def partition_name(month: datetime) -> str:
+    return f"{PARTITION_PREFIX}{month:%Y%m}"
+
+
+def partition_bounds(month: datetime) -> Tuple[datetime, datetime]:
+    start = _month_start(month)
+    return start, _add_months(start, 1)
+
+
+async def is_partitioned(session: AsyncSession) -> bool:
+    if session.get_bind().dialect.name != "postgresql":
+        return False
+    stmt = text(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+        "WHERE c.relname = 'refresh_tokens' AND c.relnamespace = current_schema()::regnamespace)"
+    )
+    return bool(await session.scalar(stmt))
+
+
+async def _existing_partitions(session: AsyncSession) -> List[str]:
+    stmt = text(
+        "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid JOIN pg_class p ON p.oid = i.inhparent "
+        "WHERE p.relname = 'refresh_tokens' AND p.relnamespace = current_schema()::regnamespace"
+    )
+    return list((await session.scalars(stmt)).all())
+
+
+async def ensure_partitions(session: AsyncSession, now: datetime, months_ahead: int) -> List[str]:
+    # cria as particoes do mes atual ate months_ahead; tokens novos nunca caem na default
+    existing = set(await _existing_partitions(session))
+    created: List[str] = []
+    for offset in range(months_ahead + 1):
+        start, end = partition_bounds(_add_months(_month_start(now), offset))
+        name = partition_name(start)
+        if name in existing:
+            continue
+        await session.execute(
+            text(f"CREATE TABLE {name} PARTITION OF refresh_tokens FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')")
+        )
+        created.append(name)
+    return created
+
+
+async def drop_expired_partitions(session: AsyncSession, now: datetime) -> List[str]:
+    # particao cujo limite superior ja passou so tem tokens expirados: DROP e instantaneo, sem VACUUM
+    dropped: List[str] = []
+    for name in sorted(await _existing_partitions(session)):
+        suffix = name[len(PARTITION_PREFIX):]
+        if not name.startswith(PARTITION_PREFIX) or len(suffix) != 6 or not suffix.isdigit():
+            continue
+        _, end = partition_bounds(datetime(int(suffix[:4]), int(suffix[4:]), 1, tzinfo=now.tzinfo))
+        if end <= now:
+            await session.execute(text(f"DROP TABLE {name}"))
+            dropped.append(name)
+    return dropped
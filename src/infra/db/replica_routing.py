@@ -0,0 +1,132 @@
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence
+
+# metodos que nunca escrevem; o resto vai sempre para o primario
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# flag em session.info das sessoes ligadas a uma replica: o que elas leem pode estar atrasado em relacao ao primario
+READ_REPLICA_INFO_KEY = "read_replica"
+
+
+def is_replica_session(session: Any) -> bool:
+    return bool(session.info.get(READ_REPLICA_INFO_KEY))
+
+
+class StickyPrimaryWindow:
+    # chaves (usuario/cliente) que escreveram ha menos de window_seconds leem do primario,
+    # cobrindo o atraso de replicacao no fluxo "salva e recarrega"
+    def __init__(self, window_seconds: float, max_entries: int = 10_000, clock: Callable[[], float] = time.monotonic):
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._until: "OrderedDict[str, float]" = OrderedDict()
+
+    def mark(self, keys: Iterable[str]) -> None:
+        until = self._clock() + self.window_seconds
+        with self._lock:
+            for key in keys:
+                self._until[key] = until
+                self._until.move_to_end(key)
+            while len(self._until) > self.max_entries:
+                self._until.popitem(last=False)
+
+    def is_sticky(self, keys: Iterable[str]) -> bool:
+        now = self._clock()
+        with self._lock:
+            for key in keys:
+                until = self._until.get(key)
+                if until is None:
+                    continue
+                if until > now:
+                    return True
+                del self._until[key]
+        return False
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._until)
+
+
+class ReplicaRouter:
+    # escolhe a fabrica de sessao do request: escrita e leitura logo apos escrita no primario,
+    # leituras restantes em round-robin pelas replicas.
+    # a janela local vale so para este worker; entre workers vale o prazo devolvido por mark_committed
+    # (epoch, via cookie), que qualquer worker respeita em session_factory_for(primary_until=...)
+    def __init__(
+        self,
+        primary: Callable[[], Any],
+        replicas: Sequence[Callable[[], Any]] = (),
+        sticky_seconds: float = 5.0,
+        max_tracked_clients: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ):
+        self.primary = primary
+        self._wall_clock = wall_clock
+        self.replicas = list(replicas)
+        self.sticky = StickyPrimaryWindow(sticky_seconds, max_entries=max_tracked_clients, clock=clock)
+        self._next_replica = itertools.cycle(self.replicas) if self.replicas else None
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._primary_reads = 0
+        self._replica_reads = 0
+        self._sticky_reads = 0
+
+    def mark_committed(self, keys: Sequence[str]) -> Optional[float]:
+        # a janela conta a partir do commit (uma escrita lenta nao a consome); devolve o prazo para o cliente
+        if not self.replicas:
+            return None
+        keys = [key for key in keys if key]
+        if keys:
+            self.sticky.mark(keys)
+        return self._wall_clock() + self.sticky.window_seconds
+
+    def _honours(self, primary_until: Optional[float]) -> bool:
+        # prazo vindo do cliente: so vale dentro de uma janela a partir de agora (nao fixa o primario para sempre)
+        if primary_until is None:
+            return False
+        now = self._wall_clock()
+        return now < primary_until <= now + self.sticky.window_seconds
+
+    def session_factory_for(self, method: str, keys: Sequence[str] = (), primary_until: Optional[float] = None) -> Callable[[], Any]:
+        keys = [key for key in keys if key]
+        if method.upper() not in SAFE_METHODS:
+            # marca antes de escrever: uma leitura concorrente do mesmo cliente ja vai ao primario
+            if self.replicas and keys:
+                self.sticky.mark(keys)
+            with self._lock:
+                self._writes += 1
+            return self.primary
+
+        if self._next_replica is None:
+            with self._lock:
+                self._primary_reads += 1
+            return self.primary
+        if self._honours(primary_until) or (keys and self.sticky.is_sticky(keys)):
+            with self._lock:
+                self._sticky_reads += 1
+            return self.primary
+
+        with self._lock:
+            self._replica_reads += 1
+            return next(self._next_replica)
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "replicas": len(self.replicas),
+                "writes": self._writes,
+                "primary_reads": self._primary_reads,
+                "replica_reads": self._replica_reads,
+                "sticky_primary_reads": self._sticky_reads,
+                "sticky_clients": len(self.sticky),
+                "sticky_seconds": self.sticky.window_seconds,
+            }
+
+
+def parse_replica_urls(value: Optional[str]) -> list[str]:
+    return [url.strip() for url in (value or "").split(",") if url.strip()]
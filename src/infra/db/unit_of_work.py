@@ -0,0 +1,29 @@
+from typing import Awaitable, Callable, List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.interfaces.iunit_of_work import IUnitOfWork
+
+_AFTER_COMMIT_KEY = "uow_after_commit"
+
+AfterCommitCallback = Callable[[], Awaitable[None]]
+
+
+def run_after_commit(session: AsyncSession, callback: AfterCommitCallback) -> None:
+    # efeitos fora do banco (ex.: invalidar cache) so rodam se a transacao for confirmada
+    session.info.setdefault(_AFTER_COMMIT_KEY, []).append(callback)
+
+
+class SqlAlchemyUnitOfWork(IUnitOfWork):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def commit(self) -> None:
+        await self.session.commit()
+        callbacks: List[AfterCommitCallback] = self.session.info.pop(_AFTER_COMMIT_KEY, [])
+        for callback in callbacks:
+            await callback()
+
+    async def rollback(self) -> None:
+        self.session.info.pop(_AFTER_COMMIT_KEY, None)
+        await self.session.rollback()
@@ -1,25 +1,31 @@
+from functools import partial
+from typing import Optional
+
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.company import Company as DomainCompany
 from src.infra.db.models.company import Company
 from src.infra.db.models.user_company_role import UserCompanyRole
+from src.infra.db.read_models import COMPANY
+from src.infra.db.unit_of_work import run_after_commit
 from src.infra.settings.logging_config import app_logger
 from src.interfaces.icompanies_repository import ICompaniesRepository
+from src.interfaces.imembership_cache import IMembershipCache
 
 
 class CompaniesRepository(ICompaniesRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, membership_cache: Optional[IMembershipCache] = None):
         self.session = session
+        self.membership_cache = membership_cache
 
     @staticmethod
     def _to_domain_company(model: Company) -> DomainCompany:
         return DomainCompany(id=str(model.id), name=model.name)
 
     async def list(self) -> list[DomainCompany]:
-        result = await self.session.execute(select(Company))  # type: ignore[arg-type]
-        companies = result.scalars().all()
-        return [self._to_domain_company(company) for company in companies]
+        result = await self.session.execute(select(*COMPANY.columns))
+        return [COMPANY.from_row(row) for row in result]
 
     async def create(self, name: str, owner_id: str) -> DomainCompany:
         new_register = Company(name=name)
@@ -27,13 +33,12 @@ class CompaniesRepository(ICompaniesRepository):
         if not new_register:
             raise ValueError("Could not create company")
 
-        self.session.add(new_register)
-        await self.session.commit()
-        await self.session.refresh(new_register)
-
-        company_role_user = UserCompanyRole(user_id=owner_id, company_id=new_register.id, is_owner=True, role_id=None)
-        self.session.add(company_role_user)
-        await self.session.commit()
+        # empresa e vinculo do dono saem no mesmo flush (o relationship ordena os INSERTs)
+        company_role_user = UserCompanyRole(user_id=owner_id, company=new_register, is_owner=True, role_id=None)
+        self.session.add_all([new_register, company_role_user])
+        await self.session.flush()
+        if self.membership_cache is not None:
+            run_after_commit(self.session, partial(self.membership_cache.invalidate_users, [str(owner_id)]))
 
         return self._to_domain_company(new_register)
 
@@ -59,12 +64,16 @@ class CompaniesRepository(ICompaniesRepository):
         for attr, value in not_none_args.items():
             setattr(company, attr, value)
 
-        self.session.add(company)
-        await self.session.commit()
-        await self.session.refresh(company)
+        await self.session.flush()
         return self._to_domain_company(company)
 
     async def delete(self, id: str) -> None:
         app_logger.info(f"[COMPANY][DELETE] company_id: {id}")
+        # os vinculos somem em cascata; guarda quem era membro para invalidar o cache
+        member_ids = []
+        if self.membership_cache is not None:
+            result = await self.session.execute(select(UserCompanyRole.user_id).where(UserCompanyRole.company_id == id))
+            member_ids = [str(user_id) for user_id in result.scalars().all()]
         await self.session.execute(delete(Company).where(Company.id == id))
-        await self.session.commit()
+        if member_ids:
+            run_after_commit(self.session, partial(self.membership_cache.invalidate_users, member_ids))
@@ -1,13 +1,15 @@
+import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import select, update
+from sqlalchemy import and_, case, delete, func, insert, literal, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.refresh_token import RefreshToken as DomainRefreshToken
 from src.infra.db.models.refresh_token import RefreshToken
 from src.infra.settings.logging_config import app_logger
 from src.interfaces.ijwt_repository import IJWTRepository
+from src.interfaces.types.auth_types import RefreshRotationResult
 
 
 class JWTRepository(IJWTRepository):
@@ -32,8 +34,8 @@ class JWTRepository(IJWTRepository):
         app_logger.info(f"[REFRESH TOKEN][SAVE] new_register: (id= {jti}, user_id= {user_id}, token_hash= {token_hash}, expires_at= {expires_at})")
 
         self.session.add(new_register)
-        await self.session.commit()
-        await self.session.refresh(new_register)
+        # created_at (server_default) volta no RETURNING do INSERT
+        await self.session.flush()
         return self._to_domain_refresh(new_register)
 
     async def get_by_jti(self, jti: str) -> Optional[DomainRefreshToken]:
@@ -52,20 +54,119 @@ class JWTRepository(IJWTRepository):
             .values(revoked=True, replaced_by=replaced_by)
         )
         await self.session.execute(stmt)
-        await self.session.commit()
 
     async def delete_token(self, token: DomainRefreshToken) -> None:
         db_token = await self.session.get(RefreshToken, token.id)
         if db_token:
             await self.session.delete(db_token)
-            await self.session.commit()
+            await self.session.flush()
 
     async def revoke_all_for_user(self, user_id: str) -> None:
         app_logger.info(f"[REFRESH TOKEN][REVOKEALL] user_id: {user_id}")
         stmt = (
             update(RefreshToken)
-            .where(RefreshToken.user_id == user_id, RefreshToken.revoked == False)  # noqa: E712
+            # mesmo predicado do indice parcial ix_refresh_tokens_user_id_active
+            .where(RefreshToken.user_id == user_id, RefreshToken.revoked.is_not(True))
             .values(revoked=True)
         )
         await self.session.execute(stmt)
-        await self.session.commit()
+
+    async def rotate_refresh_token(
+        self, jti: str, token_hash: str, new_jti: str, new_token_hash: str, new_expires_at: datetime, now: datetime
+    ) -> RefreshRotationResult:
+        try:
+            jti_uuid, new_jti_uuid = uuid.UUID(jti), uuid.UUID(new_jti)
+        except ValueError:
+            return RefreshRotationResult(status="not_found")
+
+        app_logger.info(f"[REFRESH TOKEN][ROTATE] jti: {jti}, new_jti: {new_jti}")
+        if self.session.get_bind().dialect.name == "postgresql":
+            row = await self._rotate_single_statement(jti_uuid, token_hash, new_jti_uuid, new_token_hash, new_expires_at, now)
+        else:
+            row = await self._rotate_sequential(jti_uuid, token_hash, new_jti_uuid, new_token_hash, new_expires_at, now)
+
+        if row is None:
+            return RefreshRotationResult(status="not_found")
+        user_id, revoked, hash_ok, fresh = str(row[0]), row[1], row[2], row[3]
+        if revoked:
+            return RefreshRotationResult(status="reused", user_id=user_id)
+        if not hash_ok:
+            return RefreshRotationResult(status="invalid", user_id=user_id)
+        if not fresh:
+            return RefreshRotationResult(status="expired", user_id=user_id)
+        return RefreshRotationResult(status="rotated", user_id=user_id)
+
+    async def _rotate_single_statement(self, jti, token_hash, new_jti, new_token_hash, new_expires_at, now):
+        # um unico statement: trava a linha apresentada (FOR UPDATE), revoga as sessoes do usuario,
+        # encadeia replaced_by e insere o novo token. Um refresh concorrente com o mesmo jti espera
+        # o lock, ve revoked = true e cai em "reused" em vez de emitir um segundo token.
+        table = RefreshToken.__table__
+        target = (
+            select(table.c.id, table.c.user_id, table.c.token_hash, table.c.revoked, table.c.expires_at)
+            .where(table.c.id == jti)
+            .with_for_update()
+            .cte("target")
+        )
+        already_revoked = target.c.revoked.is_(True)
+        hash_ok = target.c.token_hash == token_hash
+        fresh = target.c.expires_at >= now
+        valid = and_(~already_revoked, hash_ok, fresh)
+
+        valid_target = select(target.c.user_id).where(valid).cte("valid_target")
+        # reuso e hash invalido revogam tudo; refresh expirado (mas legitimo) nao revoga nada
+        revoked = (
+            update(table)
+            .where(table.c.user_id == target.c.user_id, table.c.revoked.is_not(True), or_(already_revoked, ~hash_ok, fresh))
+            .values(revoked=True, replaced_by=case((and_(table.c.id == jti, valid), str(new_jti)), else_=table.c.replaced_by))
+            .returning(table.c.id)
+            .cte("revoked")
+        )
+        inserted = (
+            insert(table)
+            .from_select(
+                ["id", "user_id", "token_hash", "expires_at", "revoked"],
+                select(literal(new_jti, table.c.id.type), valid_target.c.user_id, literal(new_token_hash), literal(new_expires_at, table.c.expires_at.type), literal(False)),
+            )
+            .returning(table.c.id)
+            .cte("inserted")
+        )
+        stmt = select(
+            target.c.user_id,
+            already_revoked,
+            hash_ok,
+            fresh,
+            # CTEs de escrita so sao renderizados se referenciados
+            select(func.count()).select_from(revoked).scalar_subquery(),
+            select(func.count()).select_from(inserted).scalar_subquery(),
+        )
+        return (await self.session.execute(stmt)).first()
+
+    async def _rotate_sequential(self, jti, token_hash, new_jti, new_token_hash, new_expires_at, now):
+        # fallback para bancos sem CTE de escrita: mesmas regras, uma transacao
+        record = await self.session.scalar(select(RefreshToken).where(RefreshToken.id == jti).with_for_update())
+        if record is None:
+            return None
+        expires_at = record.expires_at if record.expires_at.tzinfo else record.expires_at.replace(tzinfo=now.tzinfo)
+        already_revoked, hash_ok, fresh = bool(record.revoked), record.token_hash == token_hash, expires_at >= now
+        valid = not already_revoked and hash_ok and fresh
+
+        if already_revoked or not hash_ok or fresh:
+            await self.session.execute(
+                update(RefreshToken).where(RefreshToken.user_id == record.user_id, RefreshToken.revoked.is_not(True)).values(revoked=True)
+            )
+        if valid:
+            await self.session.execute(update(RefreshToken).where(RefreshToken.id == jti).values(replaced_by=str(new_jti)))
+            self.session.add(RefreshToken(id=new_jti, user_id=record.user_id, token_hash=new_token_hash, expires_at=new_expires_at, revoked=False))
+            await self.session.flush()
+        return record.user_id, already_revoked, hash_ok, fresh
+
+    async def purge_expired(self, now: datetime, revoked_before: datetime, batch_size: int) -> int:
+        # lote limitado e SKIP LOCKED: nao disputa lock com refresh em andamento
+        batch = (
+            select(RefreshToken.id)
+            .where(or_(RefreshToken.expires_at < now, and_(RefreshToken.revoked.is_(True), RefreshToken.created_at < revoked_before)))
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(delete(RefreshToken).where(RefreshToken.id.in_(batch.scalar_subquery())))
+        return result.rowcount or 0
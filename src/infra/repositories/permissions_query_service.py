@@ -0,0 +1,90 @@
+import uuid
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infra.db.models.user import User
+from src.infra.db.models.user_company_role import UserCompanyRole
+from src.infra.db.replica_routing import is_replica_session
+from src.interfaces.imembership_cache import IMembershipCache
+from src.interfaces.ipermissions_query_service import IPermissionsQueryService
+
+
+def _is_uuid(value: str) -> bool:
+    try:
+        uuid.UUID(str(value))
+    except ValueError:
+        return False
+    return True
+
+
+class PermissionsQueryService(IPermissionsQueryService):
+    # uma instancia por request (mesma sessao): o memo vale so durante a request;
+    # o membership_cache (opcional) e compartilhado entre requests
+    def __init__(self, session: AsyncSession, membership_cache: Optional[IMembershipCache] = None):
+        self.session = session
+        self.membership_cache = membership_cache
+        self._owner_memo: Dict[Tuple[str, str], bool] = {}
+        self._user_memo: Dict[str, bool] = {}
+        self._memberships_memo: Dict[str, Dict[str, bool]] = {}
+
+    async def _memberships(self, user_id: str) -> Dict[str, bool]:
+        # company_id -> is_owner; uma linha por vinculo, via indice de user_id
+        if user_id in self._memberships_memo:
+            return self._memberships_memo[user_id]
+
+        memberships: Optional[Dict[str, bool]] = None
+        if self.membership_cache is not None:
+            memberships = await self.membership_cache.get(user_id)
+        if memberships is None:
+            memberships = {}
+            if _is_uuid(user_id):
+                rows = await self.session.execute(
+                    select(UserCompanyRole.company_id, UserCompanyRole.is_owner).where(UserCompanyRole.user_id == user_id)
+                )
+                for company_id, is_owner in rows:
+                    key = str(company_id)
+                    memberships[key] = memberships.get(key, False) or bool(is_owner)
+            # leitura de replica atrasada repopularia o cache com vinculos anteriores a uma escrita ja invalidada
+            if self.membership_cache is not None and not is_replica_session(self.session):
+                await self.membership_cache.set(user_id, memberships)
+
+        self._memberships_memo[user_id] = memberships
+        if memberships:
+            self._user_memo[user_id] = True
+        return memberships
+
+    async def is_company_owner(self, user_id: str, company_id: str) -> bool:
+        key = (str(user_id), str(company_id))
+        if key in self._owner_memo:
+            return self._owner_memo[key]
+
+        if self.membership_cache is not None:
+            is_owner = (await self._memberships(key[0])).get(key[1]) is True
+        else:
+            # EXISTS direto em user_company_roles, sem carregar usuario/empresas/papeis
+            is_owner = False
+            if _is_uuid(user_id) and _is_uuid(company_id):
+                stmt = select(
+                    exists().where(
+                        UserCompanyRole.user_id == user_id,
+                        UserCompanyRole.company_id == company_id,
+                        UserCompanyRole.is_owner.is_(True),
+                    )
+                )
+                is_owner = bool(await self.session.scalar(stmt))
+        self._owner_memo[key] = is_owner
+        if is_owner:
+            self._user_memo[key[0]] = True
+        return is_owner
+
+    async def is_company_member(self, user_id: str, company_id: str) -> bool:
+        return str(company_id) in await self._memberships(str(user_id))
+
+    async def user_exists(self, user_id: str) -> bool:
+        key = str(user_id)
+        if key not in self._user_memo:
+            found = _is_uuid(key) and bool(await self.session.scalar(select(exists().where(User.id == key))))
+            self._user_memo[key] = found
+        return self._user_memo[key]
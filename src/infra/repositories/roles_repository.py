@@ -4,6 +4,7 @@ from sqlalchemy.future import select
 
 from src.domain.entities.role import Role as DomainRole
 from src.infra.db.models.role import Role
+from src.infra.db.read_models import ROLE
 from src.infra.settings.logging_config import app_logger
 from src.interfaces.iroles_repository import IRolesRepository
 
@@ -22,9 +23,8 @@ class RolesRepository(IRolesRepository):
         )
 
     async def list(self) -> list[DomainRole]:
-        result = await self.session.execute(select(Role))  # type: ignore[arg-type]
-        roles = result.scalars().all()
-        return [self._to_domain_role(role) for role in roles]
+        result = await self.session.execute(select(*ROLE.columns))
+        return [ROLE.from_row(row) for row in result]
 
     async def create(self, company_id: str, name: str, number_of_cooldown_days: int) -> DomainRole:
         new_register = Role(company_id=company_id, name=name, number_of_cooldown_days=number_of_cooldown_days)
@@ -33,8 +33,7 @@ class RolesRepository(IRolesRepository):
             raise ValueError("Could not create role")
 
         self.session.add(new_register)
-        await self.session.commit()
-        await self.session.refresh(new_register)
+        await self.session.flush()
         return self._to_domain_role(new_register)
 
     async def get_by_id(self, id: str):
@@ -59,12 +58,9 @@ class RolesRepository(IRolesRepository):
         for attr, value in not_none_args.items():
             setattr(role, attr, value)
 
-        self.session.add(role)
-        await self.session.commit()
-        await self.session.refresh(role)
+        await self.session.flush()
         return self._to_domain_role(role)
 
     async def delete(self, id: str) -> None:
         app_logger.info(f"[ROLE][DELETE] role_id: {id}")
         await self.session.execute(delete(Role).where(Role.id == id))
-        await self.session.commit()
@@ -0,0 +1,81 @@
+from typing import Set
+
+from sqlalchemy import func, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.errors import ServiceUnavailableError
+from src.domain.ngram_index import NGramIndex
+from src.infra.db.models.company import Company
+from src.infra.db.models.user import User
+from src.interfaces.isearch_repository import ISearchRepository
+from src.interfaces.types.search_types import SearchHit
+
+# urls de engine com pg_trgm instalado; so o positivo fica em cache (instalar a extensao nao exige restart)
+_TRGM_INSTALLED: Set[str] = set()
+
+
+def _full_name(first_name: str | None, last_name: str | None) -> str:
+    return " ".join(part for part in (first_name, last_name) if part)
+
+
+class SearchRepository(ISearchRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _pg_trgm_installed(self) -> bool:
+        return bool(await self.session.scalar(text("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")))
+
+    async def _use_trigram_indexes(self) -> bool:
+        # fora do PostgreSQL (sqlite em dev) o indice em memoria atende; no PostgreSQL ele leria a tabela inteira
+        # a cada request, entao sem pg_trgm a busca fica indisponivel
+        bind = self.session.get_bind()
+        if bind.dialect.name != "postgresql":
+            return False
+        key = str(bind.engine.url)
+        if key not in _TRGM_INSTALLED:
+            if not await self._pg_trgm_installed():
+                raise ServiceUnavailableError("Search is unavailable: the pg_trgm extension is not installed")
+            _TRGM_INSTALLED.add(key)
+        return True
+
+    async def search_users(self, query: str, limit: int) -> list[SearchHit]:
+        if await self._use_trigram_indexes():
+            # "coluna %> q" e o operador de word_similarity que o GIN gin_trgm_ops atende; o OR vira BitmapOr
+            score = func.greatest(
+                func.word_similarity(query, User.email),
+                func.word_similarity(query, func.coalesce(User.first_name, "")),
+                func.word_similarity(query, func.coalesce(User.last_name, "")),
+            ).label("score")
+            stmt = (
+                select(User.id, User.first_name, User.last_name, User.email, score)
+                .where(or_(User.email.op("%>")(query), User.first_name.op("%>")(query), User.last_name.op("%>")(query)))
+                .order_by(score.desc(), User.email)
+                .limit(limit)
+            )
+            rows = await self.session.execute(stmt)
+            return [SearchHit(kind="user", id=str(r.id), label=_full_name(r.first_name, r.last_name), detail=r.email, score=float(r.score)) for r in rows]
+
+        # fora do PostgreSQL: indice de trigramas em memoria sobre as colunas projetadas
+        rows = (await self.session.execute(select(User.id, User.first_name, User.last_name, User.email))).all()
+        by_id = {str(r.id): r for r in rows}
+        index: NGramIndex[str] = NGramIndex()
+        for user_id, r in by_id.items():
+            index.add(user_id, r.email or "", r.first_name or "", r.last_name or "")
+        return [
+            SearchHit(kind="user", id=user_id, label=_full_name(by_id[user_id].first_name, by_id[user_id].last_name), detail=by_id[user_id].email, score=score)
+            for user_id, score in index.search(query, limit)
+        ]
+
+    async def search_companies(self, query: str, limit: int) -> list[SearchHit]:
+        if await self._use_trigram_indexes():
+            score = func.word_similarity(query, Company.name).label("score")
+            stmt = select(Company.id, Company.name, score).where(Company.name.op("%>")(query)).order_by(score.desc(), Company.name).limit(limit)
+            rows = await self.session.execute(stmt)
+            return [SearchHit(kind="company", id=str(r.id), label=r.name, detail=None, score=float(r.score)) for r in rows]
+
+        rows = (await self.session.execute(select(Company.id, Company.name))).all()
+        names = {str(r.id): r.name or "" for r in rows}
+        index: NGramIndex[str] = NGramIndex()
+        for company_id, name in names.items():
+            index.add(company_id, name)
+        return [SearchHit(kind="company", id=company_id, label=names[company_id], detail=None, score=score) for company_id, score in index.search(query, limit)]
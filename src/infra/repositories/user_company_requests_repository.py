@@ -1,20 +1,29 @@
 from __future__ import annotations
 
+from functools import partial
+from typing import Optional
+
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 
 from src.domain.entities.user_company_requests import UserCompanyRequestStatus, UserCompanyRequests
+from src.domain.errors import AlreadyExistsError
+from src.infra.db.models.user import User
 from src.infra.db.models.user_company_requests import UserCompanyRequest
 from src.infra.db.models.user_company_role import UserCompanyRole
+from src.infra.db.read_models import USER_SUMMARY
+from src.infra.db.unit_of_work import run_after_commit
 from src.infra.settings.logging_config import app_logger
+from src.interfaces.imembership_cache import IMembershipCache
 from src.interfaces.iuser_company_requests_repository import IUserCompanyRequestsRepository
-from src.interfaces.types.user_types import UserCompanyRequestWithUser, UserSummaryDTO
+from src.interfaces.types.user_types import UserCompanyRequestWithUser
 
 
 class UserCompanyRequestsRepository(IUserCompanyRequestsRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, membership_cache: Optional[IMembershipCache] = None):
         self.session = session
+        self.membership_cache = membership_cache
 
     @staticmethod
     def _to_domain(model: UserCompanyRequest) -> UserCompanyRequests:
@@ -28,15 +37,6 @@ class UserCompanyRequestsRepository(IUserCompanyRequestsRepository):
             updated_at=model.updated_at,
         )
 
-    @staticmethod
-    def _to_user_summary(user) -> UserSummaryDTO:
-        return UserSummaryDTO(
-            id=str(user.id),
-            name=f"{user.first_name}.{user.last_name}",
-            email=user.email,
-            active=user.active,
-        )
-
     async def _get_model_by_id(self, request_id: str) -> UserCompanyRequest | None:
         result = await self.session.execute(select(UserCompanyRequest).where(UserCompanyRequest.id == request_id))
         return result.scalars().first()
@@ -44,9 +44,16 @@ class UserCompanyRequestsRepository(IUserCompanyRequestsRepository):
     async def create(self, user_id: str, company_id: str) -> UserCompanyRequests:
         new_register = UserCompanyRequest(user_id=user_id, company_id=company_id)
         app_logger.info(f"[USER_COMPANY_REQUEST][CREATE] user_id: {user_id}, company_id: {company_id}")
-        self.session.add(new_register)
-        await self.session.commit()
-        await self.session.refresh(new_register)
+        # uq_user_company_requests_pending cobre duas solicitacoes criadas em paralelo
+        savepoint = await self.session.begin_nested()
+        try:
+            self.session.add(new_register)
+            await self.session.flush()
+        except IntegrityError as exc:
+            await savepoint.rollback()
+            raise AlreadyExistsError("User already has a pending request for this company") from exc
+
+        await savepoint.commit()
         return self._to_domain(new_register)
 
     async def get_by_id(self, request_id: str) -> UserCompanyRequests | None:
@@ -69,8 +76,16 @@ class UserCompanyRequestsRepository(IUserCompanyRequestsRepository):
 
     async def list_by_company(self, company_id: str, status: UserCompanyRequestStatus | None = None) -> list[UserCompanyRequestWithUser]:
         query = (
-            select(UserCompanyRequest)
-            .options(selectinload(UserCompanyRequest.user))
+            select(
+                UserCompanyRequest.id,
+                UserCompanyRequest.company_id,
+                UserCompanyRequest.status,
+                UserCompanyRequest.accepted,
+                UserCompanyRequest.created_at,
+                UserCompanyRequest.updated_at,
+                *USER_SUMMARY.columns,
+            )
+            .join(User, User.id == UserCompanyRequest.user_id)
             .where(UserCompanyRequest.company_id == company_id)
             .order_by(UserCompanyRequest.created_at.desc())
         )
@@ -78,23 +93,18 @@ class UserCompanyRequestsRepository(IUserCompanyRequestsRepository):
             query = query.where(UserCompanyRequest.status == status)
 
         result = await self.session.execute(query)
-        requests = result.scalars().all()
-
-        output: list[UserCompanyRequestWithUser] = []
-        for request in requests:
-            user = request.user
-            output.append(
-                UserCompanyRequestWithUser(
-                    id=str(request.id),
-                    user=self._to_user_summary(user),
-                    company_id=str(request.company_id),
-                    status=request.status,
-                    accepted=request.accepted,
-                    created_at=request.created_at,
-                    updated_at=request.updated_at,
-                )
+        return [
+            UserCompanyRequestWithUser(
+                id=str(request_id),
+                user=USER_SUMMARY.build(*user),
+                company_id=str(request_company_id),
+                status=request_status,
+                accepted=accepted,
+                created_at=created_at,
+                updated_at=updated_at,
             )
-        return output
+            for request_id, request_company_id, request_status, accepted, created_at, updated_at, *user in result
+        ]
 
     async def approve(self, request_id: str, role_id: str | None) -> UserCompanyRequests:
         request = await self._get_model_by_id(request_id)
@@ -113,10 +123,18 @@ class UserCompanyRequestsRepository(IUserCompanyRequestsRepository):
 
         app_logger.info(f"[USER_COMPANY_REQUEST][APPROVE] request_id: {request_id}")
 
-        self.session.add(request)
-        self.session.add(new_link)
-        await self.session.commit()
-        await self.session.refresh(request)
+        savepoint = await self.session.begin_nested()
+        try:
+            self.session.add(request)
+            self.session.add(new_link)
+            await self.session.flush()
+        except IntegrityError as exc:
+            await savepoint.rollback()
+            raise AlreadyExistsError("User already linked to company") from exc
+
+        await savepoint.commit()
+        if self.membership_cache is not None:
+            run_after_commit(self.session, partial(self.membership_cache.invalidate_users, [str(request.user_id)]))
         return self._to_domain(request)
 
     async def reject(self, request_id: str) -> UserCompanyRequests:
@@ -128,7 +146,5 @@ class UserCompanyRequestsRepository(IUserCompanyRequestsRepository):
         request.accepted = False
         app_logger.info(f"[USER_COMPANY_REQUEST][REJECT] request_id: {request_id}")
 
-        self.session.add(request)
-        await self.session.commit()
-        await self.session.refresh(request)
+        await self.session.flush()
         return self._to_domain(request)
@@ -1,112 +1,85 @@
+from functools import partial
+from typing import Optional
+
 from sqlalchemy import delete
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 
+from src.domain.errors import AlreadyExistsError
 from src.infra.db.models.company import Company as CompanyModel
 from src.infra.db.models.role import Role as RoleModel
+from src.infra.db.models.user import User as UserModel
 from src.infra.db.models.user_company_role import UserCompanyRole
+from src.infra.db.read_models import COMPANY_DTO, ROLE_DTO, USER_SUMMARY
+from src.infra.db.unit_of_work import run_after_commit
 from src.infra.settings.logging_config import app_logger
+from src.interfaces.imembership_cache import IMembershipCache
 from src.interfaces.iuser_company_roles_repository import IUserCompanyRolesRepository
-from src.interfaces.types.user_types import (
-    CompaniesRolesFromUser,
-    CompanyDTO,
-    RoleDTO,
-    UsersRolesFromCompany,
-    UserSummaryDTO,
-)
+from src.interfaces.types.user_types import CompaniesRolesFromUser, UsersRolesFromCompany
 
 
 class UserCompanyRolesRepository(IUserCompanyRolesRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, membership_cache: Optional[IMembershipCache] = None):
         self.session = session
+        self.membership_cache = membership_cache
 
-    @staticmethod
-    def _role_to_dto(role: RoleModel | None) -> RoleDTO | None:
-        if not role:
-            return None
-        return RoleDTO(
-            id=str(role.id),
-            name=str(role.name),
-            company_id=str(role.company_id) if str(role.company_id) else None,
-            number_of_cooldown_days=int(str(role.number_of_cooldown_days)),
-        )
-
-    @staticmethod
-    def _company_to_dto(company: CompanyModel | None) -> CompanyDTO | None:
-        if not company:
-            return None
-        return CompanyDTO(id=str(company.id), name=str(company.name))
+    def _invalidate_memberships(self, *user_ids) -> None:
+        # depois do commit da unit of work, para o proximo leitor nao repopular com o estado antigo
+        if self.membership_cache is not None:
+            ids = [str(user_id) for user_id in user_ids if user_id]
+            run_after_commit(self.session, partial(self.membership_cache.invalidate_users, ids))
 
     async def list_users_and_roles_by_company(self, company_id: str) -> list[UsersRolesFromCompany]:
+        # colunas de vinculo, usuario e cargo num unico JOIN; o cargo e opcional (role_id SET NULL)
+        role_offset = 1 + len(USER_SUMMARY.columns)
         query = (
-            select(UserCompanyRole)
-            .options(
-                selectinload(UserCompanyRole.user),
-                selectinload(UserCompanyRole.role),
-            )
-            .filter(UserCompanyRole.company_id == company_id)
+            select(UserCompanyRole.is_owner, *USER_SUMMARY.columns, *ROLE_DTO.columns)
+            .join(UserModel, UserModel.id == UserCompanyRole.user_id)
+            .outerjoin(RoleModel, RoleModel.id == UserCompanyRole.role_id)
+            .where(UserCompanyRole.company_id == company_id)
         )
 
         result = await self.session.execute(query)
-        user_company_roles = result.scalars().all()
-
-        output: list[UsersRolesFromCompany] = []
-        for ucr in user_company_roles:
-            user = ucr.user
-            role = ucr.role
-            is_owner = bool(ucr.is_owner)
-            output.append(
-                UsersRolesFromCompany(
-                    user=UserSummaryDTO(
-                        id=str(ucr.user_id),
-                        name=f"{user.first_name}.{user.last_name}",
-                        email=user.email,
-                        active=user.active,
-                    ),
-                    is_owner=is_owner,
-                    role=self._role_to_dto(role),
-                )
-            )
-        return output
+        return [
+            UsersRolesFromCompany(user=USER_SUMMARY.from_row(row, 1), is_owner=bool(row[0]), role=ROLE_DTO.from_outer_row(row, role_offset))
+            for row in result
+        ]
 
     async def list_companies_and_roles_by_user(self, user_id: str) -> list[CompaniesRolesFromUser]:
+        role_offset = 1 + len(COMPANY_DTO.columns)
         query = (
-            select(UserCompanyRole)
-            .options(
-                selectinload(UserCompanyRole.company),
-                selectinload(UserCompanyRole.role),
-            )
-            .filter(UserCompanyRole.user_id == user_id)
+            select(UserCompanyRole.is_owner, *COMPANY_DTO.columns, *ROLE_DTO.columns)
+            .join(CompanyModel, CompanyModel.id == UserCompanyRole.company_id)
+            .outerjoin(RoleModel, RoleModel.id == UserCompanyRole.role_id)
+            .where(UserCompanyRole.user_id == user_id)
         )
 
         result = await self.session.execute(query)
-        user_company_roles = result.scalars().all()
-
-        output: list[CompaniesRolesFromUser] = []
-        for ucr in user_company_roles:
-            company = ucr.company
-            role = ucr.role
-            is_owner = bool(ucr.is_owner)
-            output.append(
-                CompaniesRolesFromUser(
-                    company=CompanyDTO(id=str(company.id), name=company.name),
-                    is_owner=is_owner,
-                    role=self._role_to_dto(role),
-                )
-            )
-        return output
+        return [
+            CompaniesRolesFromUser(company=COMPANY_DTO.from_row(row, 1), is_owner=bool(row[0]), role=ROLE_DTO.from_outer_row(row, role_offset))
+            for row in result
+        ]
 
     async def assign_user_and_role_to_company(self, user_id: str, company_id: str, role_id: str | None) -> None:
         new_register = UserCompanyRole(user_id=user_id, company_id=company_id, role_id=role_id)
 
         app_logger.info(f"[USER][CREATE] new_register: (user_id: {user_id}, company_id: {company_id}, role_id: {role_id})")
 
-        self.session.add(new_register)
-        await self.session.commit()
-        await self.session.refresh(new_register)
+        # uq_user_company_roles_user_id_company_id: um vinculo por par usuario/empresa
+        savepoint = await self.session.begin_nested()
+        try:
+            self.session.add(new_register)
+            await self.session.flush()
+        except IntegrityError as exc:
+            await savepoint.rollback()
+            raise AlreadyExistsError("User already linked to company") from exc
+
+        await savepoint.commit()
+        self._invalidate_memberships(user_id)
 
     async def remove_user_company_role_register(self, register_id: str) -> None:
         app_logger.info(f"[USER][DELETE] user_id: {register_id}")
-        await self.session.execute(delete(UserCompanyRole).where(UserCompanyRole.id == register_id))
-        await self.session.commit()
+        result = await self.session.execute(delete(UserCompanyRole).where(UserCompanyRole.id == register_id).returning(UserCompanyRole.user_id))
+        user_ids = result.scalars().all()
+        self._invalidate_memberships(*user_ids)
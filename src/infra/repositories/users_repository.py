@@ -1,9 +1,9 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import Optional
 
-from passlib.context import CryptContext
-from sqlalchemy import delete, select
+from sqlalchemy import delete, literal, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -15,15 +15,17 @@ from src.infra.db.models.company import Company
 from src.infra.db.models.role import Role
 from src.infra.db.models.user import User
 from src.infra.db.models.user_company_role import UserCompanyRole
+from src.infra.db.unit_of_work import run_after_commit
 from src.infra.settings.logging_config import app_logger
+from src.interfaces.imembership_cache import IMembershipCache
 from src.interfaces.iusers_repository import IUsersRepository
-
-pwd_ctx = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from src.interfaces.types.user_types import USER_LIST_FIELDS, UserCursor, UserListFilters, UserPage
 
 
 class UsersRepository(IUsersRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, membership_cache: Optional[IMembershipCache] = None):
         self.session = session
+        self.membership_cache = membership_cache
 
     @staticmethod
     def _to_domain_company(model: Company | None) -> Optional[DomainCompany]:
@@ -70,21 +72,49 @@ class UsersRepository(IUsersRepository):
             companies_roles=companies_roles,
         )
 
-    async def list(self) -> list[DomainUser]:
-        result = await self.session.execute(select(User).order_by(User.created_at.desc()))  # type: ignore[arg-type]
-        users = result.scalars().all()
-        return [self._to_domain_user(user, include_roles=False) for user in users]
+    async def list(self, filters: UserListFilters) -> UserPage:
+        fields = filters.fields or USER_LIST_FIELDS
+        # created_at e id sempre vem junto: sao a chave do cursor
+        columns = dict.fromkeys((*fields, "created_at", "id"))
+        stmt = select(*(getattr(User, name) for name in columns))
+
+        # LIKE 'prefixo%' vira range scan nos indices de email/first_name/last_name
+        if filters.email_prefix:
+            stmt = stmt.where(User.email.startswith(filters.email_prefix, autoescape=True))
+        if filters.name_prefix:
+            stmt = stmt.where(
+                or_(
+                    User.first_name.startswith(filters.name_prefix, autoescape=True),
+                    User.last_name.startswith(filters.name_prefix, autoescape=True),
+                )
+            )
+        if filters.cursor is not None:
+            # keyset: continua estritamente depois do ultimo (created_at, id) entregue
+            after = tuple_(literal(filters.cursor.created_at, User.created_at.type), literal(filters.cursor.id, User.id.type))
+            stmt = stmt.where(tuple_(User.created_at, User.id) < after)
+
+        # busca um registro extra so para saber se existe proxima pagina
+        stmt = stmt.order_by(User.created_at.desc(), User.id.desc()).limit(filters.limit + 1)
 
-    async def create(self, first_name: str, last_name: str, email: str, password: str, active: bool) -> DomainUser:
-        new_register = User(first_name=first_name, last_name=last_name, email=email, hashed_password=pwd_ctx.hash(password), active=active)
+        result = await self.session.execute(stmt)
+        rows = result.mappings().all()
+
+        items = [{name: str(row[name]) if name == "id" else row[name] for name in fields} for row in rows[: filters.limit]]
+        next_cursor = None
+        if len(rows) > filters.limit:
+            last = rows[filters.limit - 1]
+            next_cursor = UserCursor(created_at=last["created_at"], id=str(last["id"]))
+        return UserPage(items=items, next_cursor=next_cursor)
+
+    async def create(self, first_name: str, last_name: str, email: str, hashed_password: str, active: bool) -> DomainUser:
+        new_register = User(first_name=first_name, last_name=last_name, email=email, hashed_password=hashed_password, active=active)
 
         app_logger.info(
             f"[USER][CREATE] new_register: (first_name: {new_register.first_name}, last_name: {new_register.last_name}, email: {new_register.email}, active: {new_register.active})"
         )
 
         self.session.add(new_register)
-        await self.session.commit()
-        await self.session.refresh(new_register)
+        await self.session.flush()
         return self._to_domain_user(new_register, include_roles=False)
 
     async def get_by_id(self, id: str) -> Optional[DomainUser]:
@@ -135,15 +165,11 @@ class UsersRepository(IUsersRepository):
         for attr, value in not_none_args.items():
             setattr(user, attr, value)
 
-        self.session.add(user)
-        await self.session.commit()
-        await self.session.refresh(user)
+        await self.session.flush()
         return self._to_domain_user(user, include_roles=False)
 
     async def delete(self, id: str) -> None:
         app_logger.info(f"[USER][DELETE] user_id: {id}")
         await self.session.execute(delete(User).where(User.id == id))
-        await self.session.commit()
-
-    def verify_password(self, plain: str, hashed: str) -> bool:
-        return pwd_ctx.verify(plain, hashed)
+        if self.membership_cache is not None:
+            run_after_commit(self.session, partial(self.membership_cache.invalidate_users, [str(id)]))
@@ -1,14 +1,80 @@
+import uuid
 from dataclasses import asdict
 from datetime import datetime
-from typing import Any, List, Optional
+from typing import Any, AsyncIterator, Iterable, List, Optional, Set
 
-from sqlalchemy import delete, insert, select
+from sqlalchemy import delete, select, text, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.work_day import WorkDay as DomainWorkDay
+from src.domain.errors import AlreadyExistsError, NotFoundError, ValidationError
+from src.infra.db.models.role import Role
 from src.infra.db.models.work_day import WorkDay
+from src.infra.db.read_models import WORKDAY
 from src.interfaces.iworkdays_repository import IWorkdaysRepository
-from src.interfaces.types.workday_types import PartialWorkdayUpdate
+from src.interfaces.types.workday_types import (
+    PartialWorkdayUpdate,
+    WorkdayConflictMode,
+    WorkdayCursor,
+    WorkdayImportResult,
+    WorkdayListFilters,
+    WorkdayPage,
+)
+
+_IMPORT_STAGING_TABLE = "_work_days_import"
+
+# SQLSTATE do PostgreSQL, exposto pelo adaptador do asyncpg em IntegrityError.orig
+_FOREIGN_KEY_VIOLATION = "23503"
+
+_IMPORT_STAGING_DDL = f"""
+CREATE TEMP TABLE {_IMPORT_STAGING_TABLE} (
+    seq bigserial,
+    role_id uuid NOT NULL,
+    date timestamptz NOT NULL,
+    weekday integer,
+    is_holiday boolean NOT NULL DEFAULT false
+) ON COMMIT DROP
+"""
+
+_IMPORT_CONFLICTS_SQL = f"""
+SELECT DISTINCT s.date
+FROM {_IMPORT_STAGING_TABLE} s
+JOIN work_days w ON w.role_id = s.role_id AND w.date = s.date
+ORDER BY s.date
+LIMIT 50
+"""
+
+# linhas com role_id bem formado mas sem cargo: recusadas antes do merge em vez de estourar a FK
+_IMPORT_UNKNOWN_ROLES_SQL = f"""
+SELECT DISTINCT s.role_id
+FROM {_IMPORT_STAGING_TABLE} s
+LEFT JOIN roles r ON r.id = s.role_id
+WHERE r.id IS NULL
+ORDER BY s.role_id
+LIMIT 50
+"""
+
+_IMPORT_ON_CONFLICT_UPDATE = "DO UPDATE SET is_holiday = EXCLUDED.is_holiday, weekday = EXCLUDED.weekday"
+
+# DISTINCT ON mantem a ultima linha do arquivo para cada (role_id, date); xmax = 0 identifica linhas novas
+_IMPORT_MERGE_SQL = f"""
+WITH merged AS (
+    INSERT INTO work_days (role_id, date, weekday, is_holiday)
+    SELECT DISTINCT ON (role_id, date) role_id, date, weekday, is_holiday
+    FROM {_IMPORT_STAGING_TABLE}
+    ORDER BY role_id, date, seq DESC
+    ON CONFLICT (role_id, date) {{on_conflict}}
+    RETURNING (xmax = 0) AS inserted
+)
+SELECT
+    count(*) FILTER (WHERE inserted),
+    count(*) FILTER (WHERE NOT inserted),
+    (SELECT count(*) FROM (SELECT DISTINCT role_id, date FROM {_IMPORT_STAGING_TABLE}) AS keys)
+FROM merged
+"""
 
 
 class WorkdaysRepository(IWorkdaysRepository):
@@ -25,40 +91,191 @@ class WorkdaysRepository(IWorkdaysRepository):
             weekday=model.weekday,
         )
 
-    async def list(self) -> List[DomainWorkDay]:
-        result = await self.session.execute(select(WorkDay).order_by(WorkDay.date.asc()))  # type: ignore[arg-type]
-        return [self._to_domain_workday(w) for w in result.scalars().all()]
+    async def list(self, filters: WorkdayListFilters) -> WorkdayPage:
+        stmt = select(*WORKDAY.columns)
+
+        if filters.role_id is not None:
+            stmt = stmt.where(WorkDay.role_id == filters.role_id)
+        if filters.company_id is not None:
+            stmt = stmt.join(Role, Role.id == WorkDay.role_id).where(Role.company_id == filters.company_id)
+        if filters.date_from is not None:
+            stmt = stmt.where(WorkDay.date >= filters.date_from)
+        if filters.date_to is not None:
+            stmt = stmt.where(WorkDay.date <= filters.date_to)
+        if filters.cursor is not None:
+            # keyset: continua estritamente depois do ultimo (date, id) entregue
+            stmt = stmt.where(tuple_(WorkDay.date, WorkDay.id) > tuple_(filters.cursor.date, filters.cursor.id))
+
+        # busca um registro extra so para saber se existe proxima pagina
+        stmt = stmt.order_by(WorkDay.date.asc(), WorkDay.id.asc()).limit(filters.limit + 1)  # type: ignore[arg-type]
+
+        rows = (await self.session.execute(stmt)).all()
+
+        items = [WORKDAY.from_row(row) for row in rows[: filters.limit]]
+        next_cursor = None
+        if len(rows) > filters.limit:
+            last = items[-1]
+            next_cursor = WorkdayCursor(date=last.date, id=last.id)  # type: ignore[arg-type]
+        return WorkdayPage(items=items, next_cursor=next_cursor)
 
     async def create(self, workday: DomainWorkDay) -> DomainWorkDay:
-        model = WorkDay(
-            role_id=workday.role_id,
-            date=workday.date,
-            is_holiday=workday.is_holiday,
-            weekday=workday.weekday,
-        )
-        self.session.add(model)
-        await self.session.commit()
-        await self.session.refresh(model)
-        return self._to_domain_workday(model)
+        # mesmo INSERT ... ON CONFLICT do lote: o indice unico decide o conflito, sem leitura antes
+        return (await self.batch_create([workday], conflict="error"))[0]
 
-    async def batch_create(self, payloads: List[DomainWorkDay]) -> List[DomainWorkDay]:
-        if not payloads:
-            return []
+    @staticmethod
+    def _conflict_key(role_id: Any, date: datetime) -> tuple[str, datetime]:
+        return str(uuid.UUID(str(role_id))), date
 
-        rows: List[dict[str, Any]] = [
-            {
+    def _insert(self):
+        # mesmo contrato de ON CONFLICT nos dois dialetos suportados
+        if self.session.get_bind().dialect.name == "sqlite":
+            return sqlite_insert(WorkDay)
+        return pg_insert(WorkDay)
+
+    def _rows_by_key(self, payloads: Iterable[DomainWorkDay]) -> dict[tuple[str, datetime], dict[str, Any]]:
+        # um mesmo (role_id, date) nao pode aparecer duas vezes no mesmo INSERT ... ON CONFLICT DO UPDATE
+        rows_by_key: dict[tuple[str, datetime], dict[str, Any]] = {}
+        for w in payloads:
+            rows_by_key[self._conflict_key(w.role_id, w.date)] = {
                 "role_id": w.role_id,
                 "weekday": w.weekday,
-                "date": datetime.fromisoformat(str(w.date)),
+                "date": w.date,
                 "is_holiday": w.is_holiday,
             }
-            for w in payloads
-        ]
+        return rows_by_key
+
+    def _upsert_statement(self, conflict: WorkdayConflictMode):
+        stmt = self._insert()
+        if conflict == "update":
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[WorkDay.role_id, WorkDay.date],
+                set_={"is_holiday": stmt.excluded.is_holiday, "weekday": stmt.excluded.weekday},
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=[WorkDay.role_id, WorkDay.date])
+        return stmt.returning(WorkDay).execution_options(populate_existing=True)
+
+    async def batch_create(self, payloads: List[DomainWorkDay], conflict: WorkdayConflictMode = "error") -> List[DomainWorkDay]:
+        if not payloads:
+            return []
+
+        rows_by_key = self._rows_by_key(payloads)
+
+        savepoint = await self.session.begin_nested()
+        try:
+            result = await self.session.execute(self._upsert_statement(conflict), list(rows_by_key.values()))
+        except IntegrityError as exc:
+            await savepoint.rollback()
+            if getattr(exc.orig, "sqlstate", None) == _FOREIGN_KEY_VIOLATION:
+                raise NotFoundError("Role not found") from exc
+            raise
+        created = [self._to_domain_workday(w) for w in result.scalars().all()]
+
+        if conflict == "error" and len(created) < len(rows_by_key):
+            await savepoint.rollback()
+            created_keys = {self._conflict_key(w.role_id, w.date) for w in created}
+            conflicting = [key[1].isoformat() for key in rows_by_key if key not in created_keys]
+            raise AlreadyExistsError(f"Workdays for dates {', '.join(conflicting)} already exist.")
+
+        await savepoint.commit()
+        return created
+
+    async def bulk_import(self, chunks: AsyncIterator[List[DomainWorkDay]], conflict: WorkdayConflictMode = "error") -> WorkdayImportResult:
+        savepoint = await self.session.begin_nested()
+        try:
+            if self.session.get_bind().dialect.driver == "asyncpg":
+                result = await self._copy_import(chunks, conflict)
+            else:
+                result = await self._insert_import(chunks, conflict)
+        except BaseException:
+            await savepoint.rollback()
+            raise
+
+        await savepoint.commit()
+        return result
+
+    async def _copy_import(self, chunks: AsyncIterator[List[DomainWorkDay]], conflict: WorkdayConflictMode) -> WorkdayImportResult:
+        await self.session.execute(text(_IMPORT_STAGING_DDL))
 
-        stmt = insert(WorkDay).returning(WorkDay)
-        result = await self.session.execute(stmt, rows)
-        await self.session.commit()
-        return [self._to_domain_workday(w) for w in result.scalars().all()]
+        # COPY direto na conexao asyncpg da transacao corrente, sem materializar o arquivo inteiro
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+
+        received = 0
+        async for chunk in chunks:
+            records = [(uuid.UUID(str(w.role_id)), w.date, w.weekday, w.is_holiday) for w in chunk]
+            await driver_connection.copy_records_to_table(_IMPORT_STAGING_TABLE, records=records, columns=["role_id", "date", "weekday", "is_holiday"])  # type: ignore[union-attr]
+            received += len(records)
+
+        result = await self.session.execute(text(_IMPORT_UNKNOWN_ROLES_SQL))
+        self._raise_unknown_roles([str(role_id) for role_id in result.scalars().all()])
+
+        if conflict == "error":
+            result = await self.session.execute(text(_IMPORT_CONFLICTS_SQL))
+            conflicting = [d.isoformat() for d in result.scalars().all()]
+            if conflicting:
+                raise AlreadyExistsError(f"Workdays for dates {', '.join(conflicting)} already exist.")
+
+        on_conflict = _IMPORT_ON_CONFLICT_UPDATE if conflict == "update" else "DO NOTHING"
+        result = await self.session.execute(text(_IMPORT_MERGE_SQL.format(on_conflict=on_conflict)))
+        inserted, updated, distinct = result.one()
+
+        await self.session.execute(text(f"DROP TABLE {_IMPORT_STAGING_TABLE}"))
+
+        if conflict == "error" and inserted < distinct:
+            # alguem inseriu as mesmas datas entre a checagem e o merge
+            raise AlreadyExistsError("Workdays for some of the imported dates already exist.")
+
+        return WorkdayImportResult(received=received, inserted=inserted, updated=updated, skipped=received - inserted - updated)
+
+    @staticmethod
+    def _raise_unknown_roles(role_ids: List[str]) -> None:
+        if role_ids:
+            raise ValidationError(f"Unknown role_id in import: {', '.join(role_ids)}")
+
+    async def _insert_import(self, chunks: AsyncIterator[List[DomainWorkDay]], conflict: WorkdayConflictMode) -> WorkdayImportResult:
+        # fallback sem COPY (ex.: SQLite nos testes): mesmo INSERT ... ON CONFLICT do batch_create, por chunk.
+        # Para bater com o DISTINCT ON do COPY, chaves que este import ja gravou em chunks anteriores nao sao conflito:
+        # a ultima linha vence e a chave conta uma vez so
+        received = inserted = updated = 0
+        written: set[tuple[str, datetime]] = set()
+        known_roles: set[str] = set()
+        async for chunk in chunks:
+            received += len(chunk)
+            rows_by_key = self._rows_by_key(chunk)
+
+            unchecked = {key[0] for key in rows_by_key} - known_roles
+            if unchecked:
+                result = await self.session.execute(select(Role.id).where(Role.id.in_(unchecked)))
+                known_roles.update(str(role_id) for role_id in result.scalars().all())
+                self._raise_unknown_roles(sorted(unchecked - known_roles))
+            repeated = {key: row for key, row in rows_by_key.items() if key in written}
+            fresh = {key: row for key, row in rows_by_key.items() if key not in written}
+
+            existing: set[tuple[str, datetime]] = set()
+            for role_id in {key[0] for key in fresh}:
+                dates = await self.find_existing_dates(role_id=role_id, dates=[key[1] for key in fresh if key[0] == role_id])
+                existing.update((role_id, date) for date in dates)
+
+            if conflict == "error" and existing:
+                conflicting = sorted(key[1].isoformat() for key in existing)
+                raise AlreadyExistsError(f"Workdays for dates {', '.join(conflicting)} already exist.")
+
+            if fresh:
+                await self.session.execute(self._upsert_statement(conflict), list(fresh.values()))
+            if repeated:
+                await self.session.execute(self._upsert_statement("update"), list(repeated.values()))
+
+            inserted += len(fresh) - len(existing)
+            if conflict == "update":
+                updated += len(existing)
+                written.update(fresh)
+            else:
+                # em "skip" a linha ja existente nao foi gravada por este import: continua sendo pulada nos proximos chunks
+                written.update(key for key in fresh if key not in existing)
+
+        return WorkdayImportResult(received=received, inserted=inserted, updated=updated, skipped=received - inserted - updated)
 
     async def get_by_id(self, workday_id: int) -> Optional[DomainWorkDay]:
         result = await self.session.execute(select(WorkDay).where(WorkDay.id == workday_id))
@@ -67,24 +284,56 @@ class WorkdaysRepository(IWorkdaysRepository):
             return None
         return self._to_domain_workday(model)
 
-    async def find_by_date(self, date: datetime) -> Optional[DomainWorkDay]:
-        result = await self.session.execute(select(WorkDay).where(WorkDay.date == date))
-        model = result.scalars().first()
-        if not model:
-            return None
-        return self._to_domain_workday(model)
+    async def find_existing_ids(self, workday_ids: Iterable[int]) -> Set[int]:
+        requested = set(workday_ids)
+        if not requested:
+            return set()
+        result = await self.session.execute(select(WorkDay.id).where(WorkDay.id.in_(requested)))
+        return set(result.scalars().all())
+
+    async def list_by_ids_for_company(self, company_id: str, workday_ids: Iterable[int]) -> List[DomainWorkDay]:
+        requested = set(workday_ids)
+        if not requested:
+            return []
+        # ids de outra empresa ficam de fora como se nao existissem
+        stmt = select(*WORKDAY.columns).join(Role, Role.id == WorkDay.role_id).where(Role.company_id == company_id, WorkDay.id.in_(requested))
+        return [WORKDAY.from_row(row) for row in (await self.session.execute(stmt)).all()]
+
+    async def find_existing_dates(self, role_id: str, dates: Iterable[datetime]) -> Set[datetime]:
+        requested = set(dates)
+        if not requested:
+            return set()
+
+        # uma unica consulta por intervalo (role_id, date) em vez de uma por dia
+        stmt = select(WorkDay.date).where(
+            WorkDay.role_id == role_id,
+            WorkDay.date >= min(requested),
+            WorkDay.date <= max(requested),
+        )
+        result = await self.session.execute(stmt)
+        return {d for d in result.scalars().all() if d in requested}
 
     async def update(self, workday_id: int, payload: PartialWorkdayUpdate) -> Optional[DomainWorkDay]:
         result = await self.session.execute(select(WorkDay).where(WorkDay.id == workday_id))
         workday = result.scalars().first()
         if not workday:
             return None
-        for key, value in asdict(payload).items():
-            if value is not None:
+        changes = {key: value for key, value in asdict(payload).items() if value is not None}
+        role_id, date = changes.get("role_id", workday.role_id), changes.get("date", workday.date)
+
+        # uq_work_days_role_id_date: mover o dia para um (role_id, date) ja ocupado e conflito, nao erro interno
+        savepoint = await self.session.begin_nested()
+        try:
+            for key, value in changes.items():
                 setattr(workday, key, value)
-        self.session.add(workday)
-        await self.session.commit()
-        await self.session.refresh(workday)
+            await self.session.flush()
+        except IntegrityError as exc:
+            await savepoint.rollback()
+            if getattr(exc.orig, "sqlstate", None) == _FOREIGN_KEY_VIOLATION:
+                raise NotFoundError(f"Role {role_id} not found") from exc
+            raise AlreadyExistsError(f"Workday for date {date.isoformat()} already exists.") from exc
+
+        await savepoint.commit()
         return self._to_domain_workday(workday)
 
     async def delete(self, workday_id: int) -> None:
@@ -92,9 +341,8 @@ class WorkdaysRepository(IWorkdaysRepository):
         workday = result.scalars().first()
         if workday:
             await self.session.delete(workday)
-            await self.session.commit()
+            await self.session.flush()
 
     async def batch_delete(self, workday_ids: List[int]) -> None:
         stmt = delete(WorkDay).where(WorkDay.id.in_(workday_ids))  # type: ignore[arg-type]
         await self.session.execute(stmt)
-        await self.session.commit()
@@ -0,0 +1,212 @@
+from collections import defaultdict
+from dataclasses import asdict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import and_, delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.work_shift import WorkShift as DomainWorkShift
+from src.domain.errors import AlreadyExistsError
+from src.domain.interval_tree import IntervalTree, overlapping_pairs
+from src.infra.db.models.role import Role
+from src.infra.db.models.work_day import WorkDay
+from src.infra.db.models.work_shift import WorkShift
+from src.infra.db.read_models import WORKSHIFT
+from src.interfaces.iworkshifts_repository import IWorkShiftsRepository
+from src.interfaces.types.workshift_types import PartialWorkShiftUpdate, SchedulableShift, WorkShiftListFilters
+
+
+class WorkShiftsRepository(IWorkShiftsRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @staticmethod
+    def _to_domain_work_shift(model: WorkShift) -> DomainWorkShift:
+        return DomainWorkShift(
+            id=model.id,
+            work_day_id=model.work_day_id,
+            start_time=model.start_time,
+            end_time=model.end_time,
+            user_id=str(model.user_id) if model.user_id else None,
+        )
+
+    @staticmethod
+    def _overlap_error(shift: DomainWorkShift) -> AlreadyExistsError:
+        return AlreadyExistsError(f"Work shift {shift.start_time.isoformat()} - {shift.end_time.isoformat()} overlaps another shift on work day {shift.work_day_id}.")
+
+    def _overlaps(self, start: datetime, end: datetime):
+        # no PostgreSQL a expressao e a mesma do indice GiST ix_work_shifts_time_range
+        if self.session.get_bind().dialect.name == "postgresql":
+            return func.tstzrange(WorkShift.start_time, WorkShift.end_time).op("&&")(func.tstzrange(start, end))
+        return and_(WorkShift.start_time < end, WorkShift.end_time > start)
+
+    async def list(self, filters: WorkShiftListFilters) -> List[DomainWorkShift]:
+        stmt = select(*WORKSHIFT.columns)
+
+        if filters.work_day_id is not None:
+            stmt = stmt.where(WorkShift.work_day_id == filters.work_day_id)
+        if filters.role_id is not None or filters.company_id is not None:
+            stmt = stmt.join(WorkDay, WorkDay.id == WorkShift.work_day_id)
+            if filters.role_id is not None:
+                stmt = stmt.where(WorkDay.role_id == filters.role_id)
+            if filters.company_id is not None:
+                stmt = stmt.join(Role, Role.id == WorkDay.role_id).where(Role.company_id == filters.company_id)
+        if filters.window_start is not None and filters.window_end is not None:
+            stmt = stmt.where(self._overlaps(filters.window_start, filters.window_end))
+        elif filters.window_start is not None:
+            stmt = stmt.where(WorkShift.end_time > filters.window_start)
+        elif filters.window_end is not None:
+            stmt = stmt.where(WorkShift.start_time < filters.window_end)
+
+        stmt = stmt.order_by(WorkShift.start_time.asc(), WorkShift.id.asc()).limit(filters.limit)  # type: ignore[arg-type]
+
+        result = await self.session.execute(stmt)
+        return [WORKSHIFT.from_row(row) for row in result]
+
+    async def find_conflicts(self, payloads: List[DomainWorkShift]) -> List[DomainWorkShift]:
+        if not payloads:
+            return []
+
+        # uma consulta pela janela que cobre o lote; o pareamento exato e feito em memoria
+        stmt = select(*WORKSHIFT.columns).where(
+            WorkShift.work_day_id.in_({p.work_day_id for p in payloads}),  # type: ignore[attr-defined]
+            self._overlaps(min(p.start_time for p in payloads), max(p.end_time for p in payloads)),
+        )
+        result = await self.session.execute(stmt)
+
+        existing_by_day: Dict[int, List[DomainWorkShift]] = defaultdict(list)
+        for row in result:
+            shift = WORKSHIFT.from_row(row)
+            existing_by_day[shift.work_day_id].append(shift)
+
+        trees = {day: IntervalTree((s.start_time, s.end_time, s) for s in shifts) for day, shifts in existing_by_day.items()}
+
+        conflicts: Dict[int, DomainWorkShift] = {}
+        for payload in payloads:
+            tree = trees.get(payload.work_day_id)
+            if tree is None:
+                continue
+            for shift in tree.overlapping(payload.start_time, payload.end_time):
+                if shift.id != payload.id:
+                    conflicts[shift.id] = shift  # type: ignore[index]
+        return sorted(conflicts.values(), key=lambda s: (s.start_time, s.id))
+
+    async def list_schedulable(self, company_id: str, date_from: datetime, date_to: datetime) -> List[SchedulableShift]:
+        # so as colunas que o escalonador usa; percorre ix_work_days_date_id e o indice por dia dos turnos
+        stmt = (
+            select(WorkShift.id, WorkShift.work_day_id, WorkDay.role_id, WorkDay.date, WorkDay.is_holiday, WorkShift.start_time, WorkShift.user_id)
+            .join(WorkDay, WorkDay.id == WorkShift.work_day_id)
+            .join(Role, Role.id == WorkDay.role_id)
+            .where(Role.company_id == company_id, WorkDay.date >= date_from, WorkDay.date <= date_to)
+            .order_by(WorkDay.date.asc(), WorkShift.start_time.asc(), WorkShift.id.asc())
+        )
+        result = await self.session.execute(stmt)
+        return [
+            SchedulableShift(
+                id=row.id,
+                work_day_id=row.work_day_id,
+                role_id=str(row.role_id),
+                date=row.date,
+                is_holiday=row.is_holiday,
+                start_time=row.start_time,
+                user_id=str(row.user_id) if row.user_id else None,
+            )
+            for row in result.all()
+        ]
+
+    async def list_assigned_dates(self, company_id: str, user_ids: List[str], since: datetime) -> List[datetime]:
+        if not user_ids:
+            return []
+        stmt = (
+            select(WorkDay.date)
+            .distinct()
+            .join(WorkShift, WorkShift.work_day_id == WorkDay.id)
+            .join(Role, Role.id == WorkDay.role_id)
+            .where(WorkShift.user_id.in_(user_ids), WorkShift.start_time >= since, Role.company_id == company_id)  # type: ignore[attr-defined]
+            .order_by(WorkDay.date.asc())
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def assign_users(self, assignments: Dict[int, Optional[str]]) -> None:
+        if not assignments:
+            return
+        # UPDATE em lote pela chave primaria (executemany)
+        await self.session.execute(update(WorkShift), [{"id": shift_id, "user_id": user_id} for shift_id, user_id in assignments.items()])
+
+    async def create(self, work_shift: DomainWorkShift) -> DomainWorkShift:
+        created = await self.batch_create([work_shift])
+        return created[0]
+
+    async def batch_create(self, payloads: List[DomainWorkShift]) -> List[DomainWorkShift]:
+        if not payloads:
+            return []
+
+        by_day: Dict[int, List[DomainWorkShift]] = defaultdict(list)
+        for payload in payloads:
+            by_day[payload.work_day_id].append(payload)
+        for shifts in by_day.values():
+            pairs = overlapping_pairs([(s.start_time, s.end_time, s) for s in shifts])
+            if pairs:
+                raise self._overlap_error(pairs[0][1])
+
+        conflicts = await self.find_conflicts(payloads)
+        if conflicts:
+            raise self._overlap_error(conflicts[0])
+
+        rows = [{"work_day_id": p.work_day_id, "start_time": p.start_time, "end_time": p.end_time} for p in payloads]
+
+        # a exclusion constraint ainda cobre insercoes concorrentes entre a checagem e o INSERT
+        savepoint = await self.session.begin_nested()
+        try:
+            result = await self.session.execute(insert(WorkShift).returning(WorkShift), rows)
+            created = [self._to_domain_work_shift(s) for s in result.scalars().all()]
+        except IntegrityError as exc:
+            await savepoint.rollback()
+            raise self._overlap_error(payloads[0]) from exc
+
+        await savepoint.commit()
+        return created
+
+    async def get_by_id(self, work_shift_id: int) -> Optional[DomainWorkShift]:
+        result = await self.session.execute(select(WorkShift).where(WorkShift.id == work_shift_id))
+        work_shift = result.scalars().first()
+        if not work_shift:
+            return None
+        return self._to_domain_work_shift(work_shift)
+
+    async def update(self, work_shift_id: int, payload: PartialWorkShiftUpdate) -> Optional[DomainWorkShift]:
+        result = await self.session.execute(select(WorkShift).where(WorkShift.id == work_shift_id))
+        work_shift = result.scalars().first()
+        if not work_shift:
+            return None
+
+        changes = {key: value for key, value in asdict(payload).items() if value is not None}
+        candidate = self._to_domain_work_shift(work_shift)
+        for key, value in changes.items():
+            setattr(candidate, key, value)
+
+        conflicts = await self.find_conflicts([candidate])
+        if conflicts:
+            raise self._overlap_error(candidate)
+
+        savepoint = await self.session.begin_nested()
+        try:
+            for key, value in changes.items():
+                setattr(work_shift, key, value)
+            await self.session.flush()
+        except IntegrityError as exc:
+            await savepoint.rollback()
+            raise self._overlap_error(candidate) from exc
+
+        await savepoint.commit()
+        return self._to_domain_work_shift(work_shift)
+
+    async def delete(self, work_shift_id: int) -> None:
+        await self.session.execute(delete(WorkShift).where(WorkShift.id == work_shift_id))
+
+    async def batch_delete(self, work_shift_ids: List[int]) -> None:
+        stmt = delete(WorkShift).where(WorkShift.id.in_(work_shift_ids))  # type: ignore[arg-type]
+        await self.session.execute(stmt)
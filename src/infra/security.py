@@ -12,10 +12,14 @@ from src.infra.settings.config import get_settings
 settings = get_settings()
 
 
-def create_access_token(subject: str):
+def build_access_payload(subject: str) -> dict:
     now = datetime.now(timezone.utc)
     expire = now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    payload = {"sub": subject, "iat": int(now.timestamp()), "exp": int(expire.timestamp())}
+    return {"sub": subject, "iat": int(now.timestamp()), "exp": int(expire.timestamp())}
+
+
+def create_access_token(subject: str):
+    payload = build_access_payload(subject)
     token = jwt.encode(payload, settings.ACCESS_SECRET, algorithm=settings.ALGORITHM)
     return token
 
@@ -0,0 +1,161 @@
+import hashlib
+import hmac
+import json
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature, encode_dss_signature
+from jose import JWTError, jwk, jwt
+
+from src.infra.services.jwt_keys import JWTKey, KeyRing, b64url_decode, b64url_encode
+from src.interfaces.ijwt_backend import IJWTBackend
+
+# poucos headers distintos por chave; o limite so protege contra headers forjados
+_HEADER_CACHE_SIZE = 64
+
+
+def _require_signing_key(key_ring: KeyRing) -> JWTKey:
+    if key_ring.active is None:
+        raise ValueError("Key ring has no signing key")
+    return key_ring.active
+
+
+def _header(key: JWTKey) -> Dict[str, Any]:
+    header = {"alg": key.alg, "typ": "JWT"}
+    if key.kid is not None:
+        header["kid"] = key.kid
+    return header
+
+
+def _claims_are_current(payload: Dict[str, Any], now: float) -> bool:
+    # mesmas regras do python-jose com leeway 0
+    exp = payload.get("exp")
+    if exp is not None and (not isinstance(exp, (int, float)) or exp < now):
+        return False
+    nbf = payload.get("nbf")
+    if nbf is not None and (not isinstance(nbf, (int, float)) or nbf > now):
+        return False
+    return True
+
+
+class JoseJWTBackend(IJWTBackend):
+    # implementacao historica (python-jose); nao suporta EdDSA
+    def __init__(self, key_ring: KeyRing):
+        self.key_ring = key_ring
+        self._keys: Dict[Optional[str], Tuple[str, Any, Any]] = {}
+        for key in key_ring.keys():
+            if key.alg == "EdDSA":
+                raise ValueError("python-jose backend does not support EdDSA keys")
+            if key.alg == "HS256":
+                signing = verifying = jwk.construct(key.signing_key, key.alg)
+            else:
+                signing = jwk.construct(key.jwk, key.alg) if key.can_sign else None
+                verifying = jwk.construct(key.public_jwk(), key.alg)
+            self._keys[key.kid] = (key.alg, signing, verifying)
+
+    def encode(self, payload: dict[str, Any]) -> str:
+        active = _require_signing_key(self.key_ring)
+        _, signing, _ = self._keys[active.kid]
+        headers = {"kid": active.kid} if active.kid is not None else None
+        return jwt.encode(payload, signing, algorithm=active.alg, headers=headers)
+
+    def decode(self, token: str) -> Optional[dict[str, Any]]:
+        try:
+            kid = jwt.get_unverified_header(token).get("kid")
+        except JWTError:
+            return None
+        key = self.key_ring.get(kid)
+        if key is None:
+            return None
+        alg, _, verifying = self._keys[key.kid]
+        try:
+            return jwt.decode(token, verifying, algorithms=[alg])
+        except JWTError:
+            return None
+
+
+class CryptographyJWTBackend(IJWTBackend):
+    # JWS compacto direto sobre o cryptography: sem o parse generico de chaves do jose a cada chamada
+    def __init__(self, key_ring: KeyRing, clock=time.time):
+        self.key_ring = key_ring
+        self._clock = clock
+        self._encoded_headers: Dict[Optional[str], str] = {
+            key.kid: b64url_encode(json.dumps(_header(key), separators=(",", ":")).encode()) for key in key_ring.keys()
+        }
+        self._known_headers: Dict[str, JWTKey] = {}
+
+    def encode(self, payload: dict[str, Any]) -> str:
+        key = _require_signing_key(self.key_ring)
+        signing_input = f"{self._encoded_headers[key.kid]}.{b64url_encode(json.dumps(payload, separators=(',', ':')).encode())}"
+        return f"{signing_input}.{b64url_encode(self._sign(key, signing_input.encode()))}"
+
+    def decode(self, token: str) -> Optional[dict[str, Any]]:
+        try:
+            header_segment, payload_segment, signature_segment = token.split(".")
+            key = self._resolve_key(header_segment)
+            if key is None:
+                return None
+            signing_input = token[: len(header_segment) + len(payload_segment) + 1].encode()
+            if not self._verify(key, signing_input, b64url_decode(signature_segment)):
+                return None
+            payload = json.loads(b64url_decode(payload_segment))
+        except (ValueError, TypeError):
+            # segmentos faltando, base64/json invalidos
+            return None
+        if not isinstance(payload, dict) or not _claims_are_current(payload, self._clock()):
+            return None
+        return payload
+
+    def _resolve_key(self, header_segment: str) -> Optional[JWTKey]:
+        key = self._known_headers.get(header_segment)
+        if key is not None:
+            return key
+
+        header = json.loads(b64url_decode(header_segment))
+        if not isinstance(header, dict):
+            return None
+        key = self.key_ring.get(header.get("kid"))
+        # o alg vem da chave, nunca do header (evita alg=none / troca de algoritmo)
+        if key is None or header.get("alg") != key.alg:
+            return None
+        if len(self._known_headers) < _HEADER_CACHE_SIZE:
+            self._known_headers[header_segment] = key
+        return key
+
+    @staticmethod
+    def _sign(key: JWTKey, message: bytes) -> bytes:
+        if key.alg == "HS256":
+            return hmac.new(key.signing_key, message, hashlib.sha256).digest()
+        if key.alg == "EdDSA":
+            return key.signing_key.sign(message)
+        r, s = decode_dss_signature(key.signing_key.sign(message, ec.ECDSA(hashes.SHA256())))
+        return r.to_bytes(32, "big") + s.to_bytes(32, "big")
+
+    @staticmethod
+    def _verify(key: JWTKey, message: bytes, signature: bytes) -> bool:
+        if key.alg == "HS256":
+            return hmac.compare_digest(hmac.new(key.verifying_key, message, hashlib.sha256).digest(), signature)
+        try:
+            if key.alg == "EdDSA":
+                key.verifying_key.verify(signature, message)
+            else:
+                if len(signature) != 64:
+                    return False
+                der = encode_dss_signature(int.from_bytes(signature[:32], "big"), int.from_bytes(signature[32:], "big"))
+                key.verifying_key.verify(der, message, ec.ECDSA(hashes.SHA256()))
+        except InvalidSignature:
+            return False
+        return True
+
+
+JWT_BACKENDS = {"jose": JoseJWTBackend, "cryptography": CryptographyJWTBackend}
+
+
+def build_jwt_backend(name: str, key_ring: KeyRing) -> IJWTBackend:
+    try:
+        return JWT_BACKENDS[name](key_ring)
+    except KeyError as exc:
+        raise ValueError(f"Unknown JWT backend {name!r}") from exc
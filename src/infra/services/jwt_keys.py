@@ -0,0 +1,144 @@
+import base64
+import json
+import secrets
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+# algoritmos aceitos por tipo de chave (JWK kty/crv)
+SUPPORTED_ALGORITHMS = ("HS256", "ES256", "EdDSA")
+
+
+def b64url_encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def b64url_decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _int_from_b64(data: str) -> int:
+    return int.from_bytes(b64url_decode(data), "big")
+
+
+def _int_to_b64(value: int, length: int) -> str:
+    return b64url_encode(value.to_bytes(length, "big"))
+
+
+@dataclass(slots=True, frozen=True)
+class JWTKey:
+    kid: Optional[str]
+    alg: str
+    # bytes (HS256) ou objeto de chave do cryptography, ja parseado
+    signing_key: Any
+    verifying_key: Any
+    jwk: Dict[str, Any]
+
+    @property
+    def can_sign(self) -> bool:
+        return self.signing_key is not None
+
+    def public_jwk(self) -> Optional[Dict[str, Any]]:
+        # chave simetrica nunca sai do processo
+        if self.alg == "HS256":
+            return None
+        public = {k: v for k, v in self.jwk.items() if k != "d"}
+        public.update({"alg": self.alg, "use": "sig"})
+        if self.kid is not None:
+            public["kid"] = self.kid
+        return public
+
+
+def parse_jwk(jwk: Dict[str, Any]) -> JWTKey:
+    kty = jwk.get("kty")
+    kid = jwk.get("kid")
+
+    if kty == "oct":
+        secret = b64url_decode(jwk["k"])
+        return JWTKey(kid=kid, alg=jwk.get("alg", "HS256"), signing_key=secret, verifying_key=secret, jwk=jwk)
+
+    if kty == "OKP" and jwk.get("crv") == "Ed25519":
+        public_key = ed25519.Ed25519PublicKey.from_public_bytes(b64url_decode(jwk["x"]))
+        private_key = ed25519.Ed25519PrivateKey.from_private_bytes(b64url_decode(jwk["d"])) if "d" in jwk else None
+        return JWTKey(kid=kid, alg="EdDSA", signing_key=private_key, verifying_key=public_key, jwk=jwk)
+
+    if kty == "EC" and jwk.get("crv") == "P-256":
+        public_key = ec.EllipticCurvePublicNumbers(_int_from_b64(jwk["x"]), _int_from_b64(jwk["y"]), ec.SECP256R1()).public_key()
+        private_key = ec.derive_private_key(_int_from_b64(jwk["d"]), ec.SECP256R1()) if "d" in jwk else None
+        return JWTKey(kid=kid, alg="ES256", signing_key=private_key, verifying_key=public_key, jwk=jwk)
+
+    raise ValueError(f"Unsupported JWK (kty={kty!r}, crv={jwk.get('crv')!r})")
+
+
+def generate_jwk(alg: str, kid: Optional[str] = None) -> Dict[str, Any]:
+    kid = kid or secrets.token_hex(8)
+    if alg == "HS256":
+        return {"kty": "oct", "kid": kid, "alg": "HS256", "k": b64url_encode(secrets.token_bytes(32))}
+    if alg == "EdDSA":
+        private_key = ed25519.Ed25519PrivateKey.generate()
+        raw_private = private_key.private_bytes_raw()
+        raw_public = private_key.public_key().public_bytes_raw()
+        return {"kty": "OKP", "crv": "Ed25519", "kid": kid, "x": b64url_encode(raw_public), "d": b64url_encode(raw_private)}
+    if alg == "ES256":
+        private_key = ec.generate_private_key(ec.SECP256R1())
+        numbers = private_key.private_numbers()
+        return {
+            "kty": "EC",
+            "crv": "P-256",
+            "kid": kid,
+            "x": _int_to_b64(numbers.public_numbers.x, 32),
+            "y": _int_to_b64(numbers.public_numbers.y, 32),
+            "d": _int_to_b64(numbers.private_value, 32),
+        }
+    raise ValueError(f"Unsupported algorithm {alg!r}")
+
+
+class KeyRing:
+    # chaves parseadas uma vez no startup; a ativa assina, todas verificam (rotacao por kid)
+    def __init__(self, keys: List[JWTKey], active_kid: Optional[str] = None):
+        if not keys:
+            raise ValueError("Key ring needs at least one key")
+        self._by_kid: Dict[Optional[str], JWTKey] = {key.kid: key for key in keys}
+        if len(self._by_kid) != len(keys):
+            raise ValueError("Duplicated kid in key ring")
+
+        signing = [key for key in keys if key.can_sign]
+        if active_kid is None and signing:
+            active_kid = signing[0].kid
+        self.active: Optional[JWTKey] = self._by_kid.get(active_kid)
+        if active_kid is not None and (self.active is None or not self.active.can_sign):
+            raise ValueError(f"Active key {active_kid!r} is missing or has no private part")
+
+    @classmethod
+    def from_secret(cls, secret: str, algorithm: str = "HS256") -> "KeyRing":
+        # modo legado: um segredo HMAC compartilhado e tokens sem kid
+        if algorithm != "HS256":
+            raise ValueError("A shared secret only supports HS256")
+        raw = secret.encode()
+        return cls([JWTKey(kid=None, alg="HS256", signing_key=raw, verifying_key=raw, jwk={"kty": "oct", "k": b64url_encode(raw)})])
+
+    @classmethod
+    def from_jwks(cls, jwks: Dict[str, Any]) -> "KeyRing":
+        return cls([parse_jwk(jwk) for jwk in jwks.get("keys", [])], active_kid=jwks.get("active_kid"))
+
+    @classmethod
+    def from_file(cls, path: str) -> "KeyRing":
+        with open(path, encoding="utf-8") as handle:
+            return cls.from_jwks(json.load(handle))
+
+    def get(self, kid: Any) -> Optional[JWTKey]:
+        # o kid vem do header ainda nao verificado: lista/objeto nao podem virar chave de dict
+        if kid is not None and not isinstance(kid, str):
+            return None
+        key = self._by_kid.get(kid)
+        # tokens sem kid (emitidos antes da rotacao) usam a chave ativa
+        if key is None and kid is None:
+            return self.active
+        return key
+
+    def keys(self) -> List[JWTKey]:
+        return list(self._by_kid.values())
+
+    def public_jwks(self) -> Dict[str, Any]:
+        return {"keys": [jwk for jwk in (key.public_jwk() for key in self._by_kid.values()) if jwk is not None]}
@@ -1,18 +1,83 @@
-from typing import Any, Optional
+import time
+from typing import Any, Callable, Optional
 
-from src.infra.security import create_access_token, generate_refresh_token_raw, hash_refresh_token, verify_access_token
+from src.infra.security import build_access_payload, create_access_token, generate_refresh_token_raw, hash_refresh_token, verify_access_token
+from src.infra.services.membership_cache import PER_PROCESS_BACKENDS, InProcessCacheBackend
+from src.infra.services.verified_token_cache import VerifiedTokenCache
+from src.interfaces.icache_backend import ICacheBackend
+from src.interfaces.ijwt_backend import IJWTBackend
 from src.interfaces.itoken_service import ITokenService
 
+_NOT_BEFORE_PREFIX = "access_not_before:"
+
+
+def access_revocation_warning(backend: str, workers: int) -> Optional[str]:
+    # mesma regra do cache de vinculos: marca guardada no processo nao chega aos outros workers
+    if workers > 1 and backend in PER_PROCESS_BACKENDS:
+        return (
+            f"Access token revocation backend {backend!r} is per process and WEB_CONCURRENCY={workers}; "
+            "a revocation only reaches the worker that made it, other workers keep accepting the revoked access "
+            "tokens until they expire. Configure a shared backend."
+        )
+    return None
+
 
 class JWTTokenService(ITokenService):
+    # sem backend usa as funcoes de src.infra.security (HS256 com ACCESS_SECRET)
+    def __init__(
+        self,
+        backend: Optional[IJWTBackend] = None,
+        cache: Optional[VerifiedTokenCache] = None,
+        revocations: Optional[ICacheBackend] = None,
+        access_token_ttl_seconds: float = 900,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.backend = backend
+        self.cache = cache
+        # subject -> iat minimo aceito, com TTL da vida do access token; so vale para todos os workers
+        # se o backend for compartilhado (ACCESS_TOKEN_REVOCATION_BACKEND)
+        self.revocations = revocations if revocations is not None else InProcessCacheBackend()
+        self.access_token_ttl_seconds = access_token_ttl_seconds
+        self._clock = clock
+
     def create_access_token(self, subject: str) -> str:
-        return create_access_token(subject)
+        if self.backend is None:
+            return create_access_token(subject)
+        return self.backend.encode(build_access_payload(subject))
 
-    def verify_access_token(self, token: str) -> Optional[dict[str, Any]]:
-        return verify_access_token(token)
+    def _decode(self, token: str) -> Optional[dict[str, Any]]:
+        if self.backend is None:
+            return verify_access_token(token)
+        return self.backend.decode(token)
+
+    async def _is_revoked(self, payload: dict[str, Any]) -> bool:
+        mark = await self.revocations.get(f"{_NOT_BEFORE_PREFIX}{payload.get('sub')}")
+        if mark is None:
+            return False
+        iat = payload.get("iat")
+        return not isinstance(iat, (int, float)) or iat < int(mark)
+
+    async def verify_access_token(self, token: str) -> Optional[dict[str, Any]]:
+        # o mesmo cookie chega centenas de vezes durante os 15 min do token
+        cached = self.cache.get(token) if self.cache is not None else None
+        payload = cached if cached is not None else self._decode(token)
+        if not payload or await self._is_revoked(payload):
+            return None
+        if cached is None and self.cache is not None:
+            self.cache.put(token, payload)
+        return payload
+
+    async def revoke_access_tokens(self, subject: str) -> None:
+        # iat tem resolucao de segundo: tokens do mesmo segundo da revogacao tambem caem
+        await self.revocations.set(f"{_NOT_BEFORE_PREFIX}{subject}", str(int(self._clock()) + 1), self.access_token_ttl_seconds)
+        if self.cache is not None:
+            self.cache.invalidate_subject(subject)
 
     def generate_refresh_token_raw(self) -> str:
         return generate_refresh_token_raw()
 
     def hash_refresh_token(self, token: str) -> str:
         return hash_refresh_token(token)
+
+    def metrics(self) -> dict:
+        return self.cache.metrics() if self.cache is not None else {}
@@ -0,0 +1,148 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from src.interfaces.icache_backend import ICacheBackend
+from src.interfaces.imembership_cache import IMembershipCache
+
+
+class InProcessCacheBackend(ICacheBackend):
+    # TTL + LRU limitado, so para este worker
+    def __init__(self, max_entries: int = 10_000, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._evictions = 0
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    async def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        self._entries[key] = (self._clock() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    async def delete(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def metrics(self) -> dict[str, Any]:
+        return {"backend": "memory", "size": len(self._entries), "max_entries": self.max_entries, "evictions": self._evictions}
+
+
+class LocalSharedStore:
+    # substituto local de um servidor de cache: um store, varios workers (backends) apontando para ele
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._data: Dict[str, Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= self._clock():
+                self._data.pop(key, None)
+                return None
+            return entry[1]
+
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        with self._lock:
+            self._data[key] = (self._clock() + ttl_seconds, value)
+
+    def delete(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class LocalSharedCacheBackend(ICacheBackend):
+    # mesmo contrato que um backend Redis teria; troca-se esta classe sem mexer no MembershipCache
+    def __init__(self, store: LocalSharedStore):
+        self.store = store
+
+    async def get(self, key: str) -> Optional[str]:
+        return self.store.get(key)
+
+    async def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        self.store.set(key, value, ttl_seconds)
+
+    async def delete(self, keys: Iterable[str]) -> None:
+        self.store.delete(list(keys))
+
+    def metrics(self) -> dict[str, Any]:
+        return {"backend": "local_shared", "size": len(self.store)}
+
+
+class MembershipCache(IMembershipCache):
+    def __init__(self, backend: ICacheBackend, ttl_seconds: float = 60, key_prefix: str = "membership:"):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def _key(self, user_id: str) -> str:
+        return f"{self.key_prefix}{user_id}"
+
+    async def get(self, user_id: str) -> Optional[Dict[str, bool]]:
+        raw = await self.backend.get(self._key(str(user_id)))
+        if raw is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        return json.loads(raw)
+
+    async def set(self, user_id: str, memberships: Dict[str, bool]) -> None:
+        await self.backend.set(self._key(str(user_id)), json.dumps(memberships, separators=(",", ":")), self.ttl_seconds)
+
+    async def invalidate_users(self, user_ids: Iterable[str]) -> None:
+        keys = [self._key(str(user_id)) for user_id in user_ids if user_id]
+        if keys:
+            self._invalidations += len(keys)
+            await self.backend.delete(keys)
+
+    def metrics(self) -> dict[str, Any]:
+        return {"hits": self._hits, "misses": self._misses, "invalidations": self._invalidations, "ttl_seconds": self.ttl_seconds, **self.backend.metrics()}
+
+
+# backends que vivem dentro do processo: a invalidacao de um worker nao chega aos outros
+PER_PROCESS_BACKENDS = frozenset({"memory", "local_shared"})
+
+
+def resolve_membership_cache_backend(backend: str, workers: int) -> Tuple[str, Optional[str]]:
+    # com varios workers um cache por processo responderia autorizacao com vinculos ja removidos ate o TTL
+    if workers > 1 and backend in PER_PROCESS_BACKENDS:
+        return "none", (
+            f"Membership cache disabled: backend {backend!r} is per process and WEB_CONCURRENCY={workers}; "
+            "invalidations would not reach the other workers. Configure a shared backend to enable it."
+        )
+    return backend, None
+
+
+def build_cache_backend(backend: str, max_entries: int, shared_store: Optional[LocalSharedStore] = None) -> ICacheBackend:
+    if backend == "memory":
+        return InProcessCacheBackend(max_entries=max_entries)
+    if backend == "local_shared":
+        return LocalSharedCacheBackend(shared_store or LocalSharedStore())
+    raise ValueError(f"Unknown cache backend {backend!r}")
+
+
+def build_membership_cache(backend: str, ttl_seconds: float, max_entries: int, shared_store: Optional[LocalSharedStore] = None) -> Optional[MembershipCache]:
+    if backend == "none":
+        return None
+    return MembershipCache(build_cache_backend(backend, max_entries, shared_store), ttl_seconds=ttl_seconds)
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Optional, TypeVar
+
+from passlib.context import CryptContext
+
+from src.domain.errors import ServiceOverloadedError
+from src.interfaces.ipassword_hasher import IPasswordHasher
+
+T = TypeVar("T")
+
+pwd_ctx = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# amostras recentes usadas para os percentis de espera na fila
+_WAIT_SAMPLES = 1024
+
+
+class ThreadPoolPasswordHasher(IPasswordHasher):
+    # bcrypt solta o GIL, entao cada worker ocupa um core sem travar o event loop;
+    # acima de max_workers + max_queue chamadas pendentes a requisicao e recusada
+    def __init__(self, max_workers: int = 4, max_queue: int = 64, context: Any = pwd_ctx):
+        self.context = context
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._completed = 0
+        self._rejected = 0
+        self._wait_ms: Deque[float] = deque(maxlen=_WAIT_SAMPLES)
+        self._wait_ms_max = 0.0
+
+    def _pool(self) -> ThreadPoolExecutor:
+        # criado sob demanda: depois do shutdown no fim do lifespan, o proximo uso sobe um pool novo
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password-hasher")
+        return self._executor
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        if self._pending >= self.max_workers + self.max_queue:
+            self._rejected += 1
+            raise ServiceOverloadedError("Password hashing queue is full, try again later")
+
+        submitted_at = time.perf_counter()
+
+        def _timed() -> T:
+            # roda na thread do pool: mede quanto a chamada esperou por um worker livre
+            wait_ms = (time.perf_counter() - submitted_at) * 1000
+            self._wait_ms.append(wait_ms)
+            self._wait_ms_max = max(self._wait_ms_max, wait_ms)
+            return func(*args)
+
+        with self._lock:
+            self._pending += 1
+        future = self._pool().submit(_timed)
+        # a vaga so e liberada quando a thread termina: cancelar quem aguarda (cliente desconectou)
+        # nao interrompe o bcrypt ja em execucao, entao nao pode abrir espaco na fila
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, future: "Future[Any]") -> None:
+        with self._lock:
+            self._pending -= 1
+            if not future.cancelled():
+                self._completed += 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.context.hash, password)
+
+    async def verify(self, plain: str, hashed: str) -> bool:
+        return await self._run(self.context.verify, plain, hashed)
+
+    def metrics(self) -> dict[str, Any]:
+        samples = sorted(self._wait_ms)
+
+        def _percentile(p: float) -> float:
+            if not samples:
+                return 0.0
+            return round(samples[min(len(samples) - 1, int(p * len(samples)))], 3)
+
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": self._pending,
+            "queued": max(0, self._pending - self.max_workers),
+            "completed": self._completed,
+            "rejected": self._rejected,
+            "queue_wait_ms": {"p50": _percentile(0.50), "p99": _percentile(0.99), "max": round(self._wait_ms_max, 3)},
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is None:
+            return
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
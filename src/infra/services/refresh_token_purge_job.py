@@ -0,0 +1,101 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional
+
+from src.infra.db.refresh_token_partitions import drop_expired_partitions, ensure_partitions, is_partitioned
+from src.infra.db.unit_of_work import SqlAlchemyUnitOfWork
+from src.infra.repositories.jwt_repository import JWTRepository
+from src.infra.settings.logging_config import app_logger
+
+
+class RefreshTokenPurgeJob:
+    # tarefa do lifespan: a cada interval_seconds apaga tokens expirados (e revogados antigos) em lotes;
+    # com a tabela particionada tambem derruba particoes vencidas e cria as proximas
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        interval_seconds: int = 3600,
+        batch_size: int = 1000,
+        max_batches: int = 100,
+        revoked_retention: timedelta = timedelta(days=7),
+        partition_months_ahead: int = 2,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ):
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+        self.revoked_retention = revoked_retention
+        self.partition_months_ahead = partition_months_ahead
+        self._clock = clock
+        self._task: Optional[asyncio.Task] = None
+        self._runs = 0
+        self._deleted = 0
+        self._dropped_partitions = 0
+        self._last_run_at: Optional[datetime] = None
+        self._last_error: Optional[str] = None
+
+    async def run_once(self) -> int:
+        now = self._clock()
+        deleted = 0
+        async with self.session_factory() as session:
+            if await is_partitioned(session):
+                dropped = await drop_expired_partitions(session, now)
+                await ensure_partitions(session, now, self.partition_months_ahead)
+                await session.commit()
+                self._dropped_partitions += len(dropped)
+                if dropped:
+                    app_logger.info(f"[REFRESH TOKEN][PURGE] dropped partitions: {dropped}")
+
+            repo = JWTRepository(session)
+            uow = SqlAlchemyUnitOfWork(session)
+            for _ in range(self.max_batches):
+                batch = await repo.purge_expired(now, now - self.revoked_retention, self.batch_size)
+                # um commit por lote: locks e WAL de cada lote saem antes do proximo
+                await uow.commit()
+                deleted += batch
+                if batch < self.batch_size:
+                    break
+                # cede o event loop entre lotes
+                await asyncio.sleep(0)
+
+        self._runs += 1
+        self._deleted += deleted
+        self._last_run_at = now
+        app_logger.info(f"[REFRESH TOKEN][PURGE] deleted: {deleted}")
+        return deleted
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await self.run_once()
+                self._last_error = None
+            except Exception as exc:  # noqa: BLE001 - a tarefa nao pode morrer por uma falha pontual
+                self._last_error = repr(exc)
+                app_logger.exception("[REFRESH TOKEN][PURGE] failed")
+
+    def start(self) -> None:
+        if self.interval_seconds <= 0 or (self._task is not None and not self._task.done()):
+            return
+        self._task = asyncio.create_task(self._loop(), name="refresh-token-purge")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def metrics(self) -> dict:
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "runs": self._runs,
+            "deleted": self._deleted,
+            "dropped_partitions": self._dropped_partitions,
+            "last_run_at": self._last_run_at.isoformat() if self._last_run_at else None,
+            "last_error": self._last_error,
+        }
@@ -0,0 +1,77 @@
+import hashlib
+import math
+import time
+from typing import Any, Callable
+
+from src.interfaces.irevoked_token_filter import IRevokedTokenFilter
+
+
+class _BloomGeneration:
+    __slots__ = ("bits", "size", "hashes", "count", "created_at")
+
+    def __init__(self, size: int, hashes: int, created_at: float):
+        self.bits = bytearray((size + 7) // 8)
+        self.size = size
+        self.hashes = hashes
+        self.count = 0
+        self.created_at = created_at
+
+    def _positions(self, jti: str):
+        # double hashing (Kirsch-Mitzenmacher) sobre um unico digest
+        digest = hashlib.blake2b(jti.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, jti: str) -> None:
+        for position in self._positions(jti):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, jti: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(jti))
+
+
+class RevokedJtiBloomFilter(IRevokedTokenFilter):
+    # jtis ja flagrados como reuso. Duas geracoes: quando a atual enche ou fica mais velha que o
+    # refresh token (max_age_seconds), a anterior e descartada — esses tokens ja expiraram.
+    def __init__(self, capacity: int = 100_000, false_positive_rate: float = 1e-6, max_age_seconds: float = 86_400, clock: Callable[[], float] = time.monotonic):
+        if capacity <= 0 or not 0 < false_positive_rate < 1:
+            raise ValueError("capacity must be > 0 and false_positive_rate between 0 and 1")
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._size = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._current = _BloomGeneration(self._size, self._hashes, clock())
+        self._previous = _BloomGeneration(self._size, self._hashes, clock())
+        self._hits = 0
+        self._rotations = 0
+
+    def _rotate_if_needed(self) -> None:
+        if self._current.count < self.capacity and self._clock() - self._current.created_at < self.max_age_seconds:
+            return
+        self._previous = self._current
+        self._current = _BloomGeneration(self._size, self._hashes, self._clock())
+        self._rotations += 1
+
+    def add(self, jti: str) -> None:
+        self._rotate_if_needed()
+        self._current.add(jti)
+
+    def might_contain(self, jti: str) -> bool:
+        found = jti in self._current or jti in self._previous
+        if found:
+            self._hits += 1
+        return found
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "false_positive_rate": self.false_positive_rate,
+            "bytes": 2 * len(self._current.bits),
+            "entries": self._current.count + self._previous.count,
+            "hits": self._hits,
+            "rotations": self._rotations,
+        }
@@ -0,0 +1,91 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+# (exp, sub, payload)
+_Entry = Tuple[float, Optional[str], Dict[str, Any]]
+
+
+class VerifiedTokenCache:
+    # LRU de payloads ja verificados; cada entrada vale ate o exp do proprio token.
+    # So tokens validos entram, entao lixo enviado no cookie nao ocupa espaco.
+    def __init__(self, max_entries: int = 10_000, clock: Callable[[], float] = time.time):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[bytes, _Entry]" = OrderedDict()
+        self._by_subject: Dict[str, Set[bytes]] = {}
+        # verify roda no event loop, mas dependencias sync do FastAPI rodam em threads
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def digest(token: str) -> bytes:
+        # chave curta: nao guarda o token cru em memoria
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        key = self.digest(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry[0] <= self._clock():
+                self._drop(key)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        # copia para o chamador nao alterar o payload cacheado
+        return dict(entry[2])
+
+    def put(self, token: str, payload: Dict[str, Any]) -> None:
+        exp = payload.get("exp")
+        if self.max_entries <= 0 or not isinstance(exp, (int, float)) or exp <= self._clock():
+            return
+
+        key = self.digest(token)
+        subject = payload.get("sub")
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (float(exp), subject, dict(payload))
+            if subject is not None:
+                self._by_subject.setdefault(subject, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate_subject(self, subject: str) -> None:
+        with self._lock:
+            for key in self._by_subject.pop(subject, ()):
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_subject.clear()
+
+    def _drop(self, key: bytes) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None or entry[1] is None:
+            return
+        keys = self._by_subject.get(entry[1])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_subject[entry[1]]
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
@@ -30,10 +30,79 @@ class Settings(BaseSettings):
 
     SQLALCHEMY_DATABASE_URI: str = os.getenv("SQLALCHEMY_DATABASE_URI", "sqlite:///./test.db")
 
+    # pool do engine async (por worker; ver src/infra/db/engine_factory.py)
+    DB_POOL_SIZE: int = 5
+
+    DB_MAX_OVERFLOW: int = 10
+
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+
+    DB_POOL_PRE_PING: bool = True
+
+    # prepared statements em cache por conexao (0 atras de pgbouncer em modo transaction)
+    DB_STATEMENT_CACHE_SIZE: int = 100
+
+    # 0 desliga
+    DB_STATEMENT_TIMEOUT_MS: int = 0
+
+    # workers do uvicorn/gunicorn, mesma variavel que eles leem
+    WEB_CONCURRENCY: int = 1
+
+    # conexoes disponiveis para a app no banco somando todos os workers (0 nao checa)
+    DB_CONNECTION_BUDGET: int = 0
+
+    # replicas de leitura separadas por virgula (vazio = tudo no primario); mesmo pool por replica
+    DB_REPLICA_URLS: str = ""
+
+    # depois de uma escrita, o mesmo usuario/cliente le do primario por esse tempo (atraso de replicacao)
+    DB_STICKY_PRIMARY_SECONDS: float = 5.0
+
     SERVER_URL: str = os.getenv("SERVER_URL", "http://localhost:8005/api")
 
     ACCESS_SECRET: str = os.getenv("ACCESS_SECRET", "change-me-super-secret")
 
+    # pool dedicado para bcrypt; chamadas alem de workers + fila recebem 503
+    PASSWORD_HASH_WORKERS: int = min(4, os.cpu_count() or 1)
+
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+
+    # payloads de access token ja verificados (0 desliga o cache)
+    ACCESS_TOKEN_CACHE_SIZE: int = 10_000
+
+    # "jose" (padrao) ou "cryptography" (JWS direto, suporta EdDSA)
+    JWT_BACKEND: Literal["jose", "cryptography"] = "jose"
+
+    # JWKS com chaves privadas ({"keys": [...], "active_kid": "..."}); sem ele usa ACCESS_SECRET em HS256
+    JWT_KEYS_FILE: str | None = None
+
+    # limpeza de refresh_tokens em background (0 desliga)
+    REFRESH_TOKEN_PURGE_INTERVAL_SECONDS: int = 3600
+
+    REFRESH_TOKEN_PURGE_BATCH_SIZE: int = 1000
+
+    # revogados ficam alguns dias para a deteccao de reuso continuar funcionando
+    REFRESH_TOKEN_REVOKED_RETENTION_DAYS: int = 7
+
+    # bloom filter de jtis ja flagrados como reuso (0 desliga)
+    REFRESH_REUSE_FILTER_CAPACITY: int = 100_000
+
+    # cache de vinculos usuario -> empresa ("memory" por worker, "local_shared" simula um cache compartilhado, "none" desliga);
+    # os dois primeiros vivem no processo e viram "none" com WEB_CONCURRENCY > 1
+    MEMBERSHIP_CACHE_BACKEND: Literal["memory", "local_shared", "none"] = "memory"
+
+    MEMBERSHIP_CACHE_TTL_SECONDS: int = 60
+
+    MEMBERSHIP_CACHE_MAX_ENTRIES: int = 10_000
+
+    # marcas de revogacao de access token (reuso de refresh detectado): "memory" e "local_shared" vivem no processo,
+    # entao com WEB_CONCURRENCY > 1 a revogacao so vale no worker que a fez (aviso no startup); use um backend compartilhado
+    ACCESS_TOKEN_REVOCATION_BACKEND: Literal["memory", "local_shared"] = "memory"
+
+    # uma marca por usuario revogado, viva pelo TTL do access token; o LRU nunca deve chegar a descartar uma
+    ACCESS_TOKEN_REVOCATION_MAX_ENTRIES: int = 100_000
+
     class Config:
         env_file = ".env"
 
@@ -1,20 +1,71 @@
-from typing import AsyncGenerator
+from functools import partial
+from typing import AsyncGenerator, Optional, Sequence
 
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 
+from src.infra.db.engine_factory import EngineOptions, build_engine
+from src.infra.db.replica_routing import READ_REPLICA_INFO_KEY, SAFE_METHODS, ReplicaRouter, parse_replica_urls
+from src.infra.db.unit_of_work import run_after_commit
 from src.infra.settings.config import get_settings
 
 settings = get_settings()
 DATABASE_URL = settings.SQLALCHEMY_DATABASE_URI
 
 
-engine: AsyncEngine = create_async_engine(DATABASE_URL)
+engine_options = EngineOptions.from_settings(settings)
+engine: AsyncEngine
+engine, pool_metrics = build_engine(DATABASE_URL, engine_options)
 async_session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)  # type: ignore
 
+# replicas de leitura: mesmo EngineOptions do primario, um pool por replica
+replica_engines = [build_engine(url, engine_options) for url in parse_replica_urls(settings.DB_REPLICA_URLS)]
+replica_router = ReplicaRouter(
+    async_session_factory,
+    [sessionmaker(replica, class_=AsyncSession, expire_on_commit=False) for replica, _ in replica_engines],  # type: ignore
+    sticky_seconds=settings.DB_STICKY_PRIMARY_SECONDS,
+)
 
-async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session_factory() as session:
+
+# prazo (epoch) ate quando o cliente le do primario; vai num cookie para valer em qualquer worker
+PRIMARY_UNTIL_COOKIE = "db_primary_until"
+PRIMARY_UNTIL_STATE = "db_primary_until"
+
+
+def _primary_until(request: Request) -> Optional[float]:
+    try:
+        return float(request.cookies[PRIMARY_UNTIL_COOKIE])
+    except (KeyError, ValueError):
+        return None
+
+
+async def _mark_committed(request: Request, keys: Sequence[str]) -> None:
+    deadline = replica_router.mark_committed(keys)
+    if deadline is not None:
+        setattr(request.state, PRIMARY_UNTIL_STATE, deadline)
+
+
+def _sticky_keys(request: Request) -> list[str]:
+    # por usuario; o IP so entra em rotas publicas (atras de proxy ele e compartilhado por todos)
+    user_id = getattr(request.state, "user_id", None)
+    if user_id:
+        return [f"user:{user_id}"]
+    if request.client is not None:
+        return [f"client:{request.client.host}"]
+    return []
+
+
+async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    # GET/HEAD leem de uma replica; escritas e leituras logo apos uma escrita ficam no primario
+    keys = _sticky_keys(request)
+    session_factory = replica_router.session_factory_for(request.method, keys, primary_until=_primary_until(request))
+    async with session_factory() as session:
+        if session_factory is not replica_router.primary:
+            session.info[READ_REPLICA_INFO_KEY] = True
+        elif request.method.upper() not in SAFE_METHODS:
+            # a janela recomeca no commit da unit of work, nao no inicio da escrita
+            run_after_commit(session, partial(_mark_committed, request, keys))
         yield session
 
 
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, Optional
+
+
+class ICacheBackend(ABC):
+    # contrato minimo de um cache compartilhado (Redis/Memcached): valores sao strings
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, keys: Iterable[str]) -> None:
+        pass
+
+    @abstractmethod
+    def metrics(self) -> dict[str, Any]:
+        pass
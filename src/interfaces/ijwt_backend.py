@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+
+class IJWTBackend(ABC):
+    @abstractmethod
+    def encode(self, payload: dict[str, Any]) -> str:
+        pass
+
+    @abstractmethod
+    def decode(self, token: str) -> Optional[dict[str, Any]]:
+        pass
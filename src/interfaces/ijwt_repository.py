@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import Optional
 
 from src.domain.entities.refresh_token import RefreshToken
+from src.interfaces.types.auth_types import RefreshRotationResult
 
 
 class IJWTRepository(ABC):
@@ -25,3 +26,13 @@ class IJWTRepository(ABC):
     @abstractmethod
     async def revoke_all_for_user(self, user_id: str) -> None:
         pass
+
+    @abstractmethod
+    async def rotate_refresh_token(
+        self, jti: str, token_hash: str, new_jti: str, new_token_hash: str, new_expires_at: datetime, now: datetime
+    ) -> RefreshRotationResult:
+        pass
+
+    @abstractmethod
+    async def purge_expired(self, now: datetime, revoked_before: datetime, batch_size: int) -> int:
+        pass
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Optional
+
+
+class IMembershipCache(ABC):
+    # company_id -> is_owner de cada empresa a que o usuario pertence
+    @abstractmethod
+    async def get(self, user_id: str) -> Optional[Dict[str, bool]]:
+        pass
+
+    @abstractmethod
+    async def set(self, user_id: str, memberships: Dict[str, bool]) -> None:
+        pass
+
+    @abstractmethod
+    async def invalidate_users(self, user_ids: Iterable[str]) -> None:
+        pass
+
+    @abstractmethod
+    def metrics(self) -> dict[str, Any]:
+        pass
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class IPasswordHasher(ABC):
+    @abstractmethod
+    async def hash(self, password: str) -> str:
+        pass
+
+    @abstractmethod
+    async def verify(self, plain: str, hashed: str) -> bool:
+        pass
+
+    @abstractmethod
+    def metrics(self) -> dict[str, Any]:
+        pass
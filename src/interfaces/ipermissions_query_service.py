@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+
+class IPermissionsQueryService(ABC):
+    @abstractmethod
+    async def is_company_owner(self, user_id: str, company_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def is_company_member(self, user_id: str, company_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def user_exists(self, user_id: str) -> bool:
+        pass
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class IRevokedTokenFilter(ABC):
+    @abstractmethod
+    def might_contain(self, jti: str) -> bool:
+        pass
+
+    @abstractmethod
+    def add(self, jti: str) -> None:
+        pass
+
+    @abstractmethod
+    def metrics(self) -> dict[str, Any]:
+        pass
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from src.interfaces.types.search_types import SearchHit
+
+
+class ISearchRepository(ABC):
+    @abstractmethod
+    async def search_users(self, query: str, limit: int) -> list[SearchHit]:
+        pass
+
+    @abstractmethod
+    async def search_companies(self, query: str, limit: int) -> list[SearchHit]:
+        pass
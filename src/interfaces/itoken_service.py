@@ -8,7 +8,12 @@ class ITokenService(ABC):
         pass
 
     @abstractmethod
-    def verify_access_token(self, token: str) -> Optional[dict[str, Any]]:
+    async def verify_access_token(self, token: str) -> Optional[dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def revoke_access_tokens(self, subject: str) -> None:
+        # access tokens do subject emitidos ate agora deixam de verificar
         pass
 
     @abstractmethod
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+
+class IUnitOfWork(ABC):
+    # fronteira da transacao do request: repositorios so fazem flush, o caso de uso confirma uma vez no fim
+    @abstractmethod
+    async def commit(self) -> None:
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        pass
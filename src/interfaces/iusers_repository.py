@@ -2,15 +2,16 @@ from abc import ABC, abstractmethod
 from typing import Optional
 
 from src.domain.entities.user import User
+from src.interfaces.types.user_types import UserListFilters, UserPage
 
 
 class IUsersRepository(ABC):
     @abstractmethod
-    async def list(self) -> list[User]:
+    async def list(self, filters: UserListFilters) -> UserPage:
         pass
 
     @abstractmethod
-    async def create(self, first_name: str, last_name: str, email: str, password: str, active: bool) -> User:
+    async def create(self, first_name: str, last_name: str, email: str, hashed_password: str, active: bool) -> User:
         pass
 
     @abstractmethod
@@ -28,7 +29,3 @@ class IUsersRepository(ABC):
     @abstractmethod
     async def delete(self, id: str) -> None:
         pass
-
-    @abstractmethod
-    def verify_password(self, plain: str, hashed: str) -> bool:
-        pass
@@ -1,20 +1,24 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, Iterable, List, Optional, Set
 
 from src.domain.entities.work_day import WorkDay
-from src.interfaces.types.workday_types import PartialWorkdayUpdate
+from src.interfaces.types.workday_types import PartialWorkdayUpdate, WorkdayConflictMode, WorkdayImportResult, WorkdayListFilters, WorkdayPage
 
 
 class IWorkdaysRepository(ABC):
     """Interface for Workdays Repository."""
 
     @abstractmethod
-    async def list(self) -> List[WorkDay]:
+    async def list(self, filters: WorkdayListFilters) -> WorkdayPage:
         pass
 
     @abstractmethod
-    async def batch_create(self, payloads: List[WorkDay]) -> List[WorkDay]:
+    async def batch_create(self, payloads: List[WorkDay], conflict: WorkdayConflictMode = "error") -> List[WorkDay]:
+        pass
+
+    @abstractmethod
+    async def bulk_import(self, chunks: AsyncIterator[List[WorkDay]], conflict: WorkdayConflictMode = "error") -> WorkdayImportResult:
         pass
 
     @abstractmethod
@@ -26,7 +30,15 @@ class IWorkdaysRepository(ABC):
         pass
 
     @abstractmethod
-    async def find_by_date(self, date: datetime) -> Optional[WorkDay]:
+    async def find_existing_ids(self, workday_ids: Iterable[int]) -> Set[int]:
+        pass
+
+    @abstractmethod
+    async def list_by_ids_for_company(self, company_id: str, workday_ids: Iterable[int]) -> List[WorkDay]:
+        pass
+
+    @abstractmethod
+    async def find_existing_dates(self, role_id: str, dates: Iterable[datetime]) -> Set[datetime]:
         pass
 
     @abstractmethod
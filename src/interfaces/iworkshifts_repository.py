@@ -0,0 +1,54 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from src.domain.entities.work_shift import WorkShift
+from src.interfaces.types.workshift_types import PartialWorkShiftUpdate, SchedulableShift, WorkShiftListFilters
+
+
+class IWorkShiftsRepository(ABC):
+    """Interface for Work Shifts Repository."""
+
+    @abstractmethod
+    async def list(self, filters: WorkShiftListFilters) -> List[WorkShift]:
+        pass
+
+    @abstractmethod
+    async def find_conflicts(self, payloads: List[WorkShift]) -> List[WorkShift]:
+        pass
+
+    @abstractmethod
+    async def list_schedulable(self, company_id: str, date_from: datetime, date_to: datetime) -> List[SchedulableShift]:
+        pass
+
+    @abstractmethod
+    async def list_assigned_dates(self, company_id: str, user_ids: List[str], since: datetime) -> List[datetime]:
+        pass
+
+    @abstractmethod
+    async def assign_users(self, assignments: Dict[int, Optional[str]]) -> None:
+        pass
+
+    @abstractmethod
+    async def create(self, work_shift: WorkShift) -> WorkShift:
+        pass
+
+    @abstractmethod
+    async def batch_create(self, payloads: List[WorkShift]) -> List[WorkShift]:
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, work_shift_id: int) -> Optional[WorkShift]:
+        pass
+
+    @abstractmethod
+    async def update(self, work_shift_id: int, payload: PartialWorkShiftUpdate) -> Optional[WorkShift]:
+        pass
+
+    @abstractmethod
+    async def delete(self, work_shift_id: int) -> None:
+        pass
+
+    @abstractmethod
+    async def batch_delete(self, work_shift_ids: List[int]) -> None:
+        pass
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from typing import Literal, Optional
+
+# resultado da rotacao atomica de refresh token:
+# "reused" e "invalid" ja revogaram todas as sessoes do usuario; "expired" nao revoga nada
+RefreshRotationStatus = Literal["rotated", "not_found", "reused", "invalid", "expired"]
+
+
+@dataclass(slots=True)
+class RefreshRotationResult:
+    status: RefreshRotationStatus
+    user_id: Optional[str] = None
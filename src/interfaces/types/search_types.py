@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from typing import Literal, Optional
+
+SearchKind = Literal["user", "company"]
+
+
+@dataclass(slots=True)
+class SearchHit:
+    kind: SearchKind
+    id: str
+    # nome da empresa ou "first_name last_name"
+    label: str
+    # email, para usuarios
+    detail: Optional[str]
+    score: float
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.domain.entities.user_company_requests import UserCompanyRequestStatus
 
@@ -93,3 +93,31 @@ class UserCompanyRequestWithUser:
     accepted: bool
     created_at: Optional[datetime]
     updated_at: Optional[datetime]
+
+
+# colunas que GET /users aceita em fields=
+USER_LIST_FIELDS: Tuple[str, ...] = ("id", "first_name", "last_name", "email", "active", "created_at")
+
+
+@dataclass(slots=True)
+class UserCursor:
+    created_at: datetime
+    id: str
+
+
+@dataclass(slots=True)
+class UserListFilters:
+    email_prefix: Optional[str] = None
+    # prefixo de first_name ou last_name
+    name_prefix: Optional[str] = None
+    # None = todas as colunas de USER_LIST_FIELDS
+    fields: Optional[Tuple[str, ...]] = None
+    cursor: Optional[UserCursor] = None
+    limit: int = 100
+
+
+@dataclass(slots=True)
+class UserPage:
+    # so as colunas pedidas, sem passar por entidade de dominio
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[UserCursor]
@@ -1,6 +1,12 @@
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import List, Literal, Optional
+
+from src.domain.entities.work_day import WorkDay
+
+# como batch_create trata (role_id, date) ja existentes:
+# "error" aborta tudo, "skip" ignora os existentes e "update" sobrescreve is_holiday/weekday
+WorkdayConflictMode = Literal["skip", "error", "update"]
 
 
 @dataclass(slots=True)
@@ -15,3 +21,39 @@ class BatchCreateWorkdays:
     start_date: datetime
     end_date: datetime
     role_id: str
+    conflict: WorkdayConflictMode = "error"
+    # regras de recorrencia (ver src/usecases/workdays/calendar_rules.py)
+    weekdays: Optional[List[int]] = None
+    every_n_days: int = 1
+    holidays: List[date] = field(default_factory=list)
+    apply_cooldown: bool = False
+
+
+@dataclass(slots=True)
+class WorkdayCursor:
+    date: datetime
+    id: int
+
+
+@dataclass(slots=True)
+class WorkdayListFilters:
+    role_id: Optional[str] = None
+    company_id: Optional[str] = None
+    date_from: Optional[datetime] = None
+    date_to: Optional[datetime] = None
+    cursor: Optional[WorkdayCursor] = None
+    limit: int = 100
+
+
+@dataclass(slots=True)
+class WorkdayPage:
+    items: List[WorkDay]
+    next_cursor: Optional[WorkdayCursor]
+
+
+@dataclass(slots=True)
+class WorkdayImportResult:
+    received: int
+    inserted: int
+    updated: int
+    skipped: int
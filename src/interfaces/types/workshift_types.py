@@ -0,0 +1,59 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+@dataclass(slots=True)
+class PartialWorkShiftUpdate:
+    work_day_id: Optional[int] = None
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+
+
+@dataclass(slots=True)
+class WorkShiftListFilters:
+    work_day_id: Optional[int] = None
+    role_id: Optional[str] = None
+    company_id: Optional[str] = None
+    # janela [window_start, window_end): devolve os turnos que a sobrepoem
+    window_start: Optional[datetime] = None
+    window_end: Optional[datetime] = None
+    limit: int = 500
+
+
+@dataclass(slots=True)
+class SchedulableShift:
+    id: int
+    work_day_id: int
+    role_id: str
+    date: datetime
+    is_holiday: bool
+    start_time: datetime
+    user_id: Optional[str] = None
+
+
+@dataclass(slots=True)
+class ShiftAssignmentChange:
+    shift_id: int
+    previous_user_id: Optional[str]
+    user_id: Optional[str]
+
+
+@dataclass(slots=True)
+class ScheduleSummary:
+    total_shifts: int
+    assigned: int
+    unassigned_shift_ids: List[int] = field(default_factory=list)
+    # turnos por usuario dentro do intervalo escalado
+    load: Dict[str, int] = field(default_factory=dict)
+    # somente os turnos cujo usuario mudou (e o que foi gravado)
+    changes: List[ShiftAssignmentChange] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class ScheduleChangeSet:
+    company_id: str
+    work_day_ids: List[int] = field(default_factory=list)
+    # usuarios desvinculados da empresa: seus turnos a partir de `since` sao redistribuidos
+    removed_user_ids: List[str] = field(default_factory=list)
+    since: Optional[datetime] = None
@@ -1,11 +1,15 @@
 import hmac
 import uuid
 from dataclasses import dataclass
+from typing import Optional
 from datetime import datetime, timedelta, timezone
 
 from src.domain.errors import InvalidCredentials, RefreshExpired, RefreshInvalid, RefreshNotFound, RefreshReuseDetected
 from src.interfaces.ijwt_repository import IJWTRepository
+from src.interfaces.ipassword_hasher import IPasswordHasher
+from src.interfaces.irevoked_token_filter import IRevokedTokenFilter
 from src.interfaces.itoken_service import ITokenService
+from src.interfaces.iunit_of_work import IUnitOfWork
 from src.interfaces.iusers_repository import IUsersRepository
 from src.interfaces.types.user_types import UserDetailDTO
 from src.usecases.users.mappers import to_user_detail
@@ -20,18 +24,31 @@ class AuthTokensDTO:
 
 
 class AuthService:
-    def __init__(self, user_repo: IUsersRepository, token_repo: IJWTRepository, token_service: ITokenService, refresh_token_expire_days: int):
+    def __init__(
+        self,
+        user_repo: IUsersRepository,
+        token_repo: IJWTRepository,
+        token_service: ITokenService,
+        refresh_token_expire_days: int,
+        password_hasher: IPasswordHasher,
+        uow: IUnitOfWork,
+        revoked_filter: Optional[IRevokedTokenFilter] = None,
+    ):
         self.user_repo = user_repo
         self.token_repo = token_repo
         self.token_service = token_service
         self.refresh_token_expire_days = refresh_token_expire_days
+        self.password_hasher = password_hasher
+        self.uow = uow
+        self.revoked_filter = revoked_filter
 
     def _new_jti(self) -> str:
         return str(uuid.uuid4())
 
     async def login(self, email: str, password: str) -> AuthTokensDTO:
         user = await self.user_repo.get_by_email(email)
-        if not user or not user.hashed_password or not self.user_repo.verify_password(password, user.hashed_password):
+        # bcrypt roda no pool do password_hasher, fora do event loop
+        if not user or not user.hashed_password or not await self.password_hasher.verify(password, user.hashed_password):
             raise InvalidCredentials("Usuário ou senha inválidos")
 
         access = self.token_service.create_access_token(user.id)
@@ -47,52 +64,60 @@ class AuthService:
             token_hash=refresh_hash,
             expires_at=expires_at,
         )
+        await self.uow.commit()
 
         return AuthTokensDTO(access_token=access, refresh_token=raw_refresh, refresh_jti=jti, user_id=user.id)
 
     async def rotate_refresh(self, raw_refresh: str, jti: str) -> AuthTokensDTO:
-        record = await self.token_repo.get_by_jti(jti)
-        if not record:
-            raise RefreshNotFound("Refresh token não encontrado")
-
-        if record.revoked:
-            await self.token_repo.revoke_all_for_user(record.user_id)
+        # reuso ja flagrado antes (sessoes ja revogadas): rejeita sem ir ao banco
+        if self.revoked_filter is not None and self.revoked_filter.might_contain(jti):
             raise RefreshReuseDetected("Refresh reutilizado. Sessões revogadas.")
 
-        if not hmac.compare_digest(record.token_hash, self.token_service.hash_refresh_token(raw_refresh)):
-            await self.token_repo.revoke_all_for_user(record.user_id)
-            raise RefreshInvalid("Refresh inválido. Sessões revogadas.")
-
-        if record.expires_at < datetime.now(timezone.utc):
-            raise RefreshExpired("Refresh expirado")
-
-        await self.token_repo.revoke_all_for_user(record.user_id)
-
         new_raw = self.token_service.generate_refresh_token_raw()
-        new_hash = self.token_service.hash_refresh_token(new_raw)
         new_jti = self._new_jti()
-        new_expires = datetime.now(timezone.utc) + timedelta(days=self.refresh_token_expire_days)
+        now = datetime.now(timezone.utc)
 
-        await self.token_repo.save_refresh_token(
-            jti=new_jti,
-            user_id=record.user_id,
-            token_hash=new_hash,
-            expires_at=new_expires,
+        # valida, revoga e insere numa unica transacao no repositorio (sem corrida entre abas)
+        result = await self.token_repo.rotate_refresh_token(
+            jti=jti,
+            token_hash=self.token_service.hash_refresh_token(raw_refresh),
+            new_jti=new_jti,
+            new_token_hash=self.token_service.hash_refresh_token(new_raw),
+            new_expires_at=now + timedelta(days=self.refresh_token_expire_days),
+            now=now,
         )
+        # confirma antes de qualquer erro: a revogacao por reuso precisa persistir
+        await self.uow.commit()
+
+        if result.status == "not_found":
+            raise RefreshNotFound("Refresh token não encontrado")
+        if result.status == "expired":
+            raise RefreshExpired("Refresh expirado")
+
+        if result.status in ("reused", "invalid"):
+            # o repositorio revogou todos os refresh do usuario; os access tokens ja emitidos caem junto
+            await self.token_service.revoke_access_tokens(result.user_id)
+            if self.revoked_filter is not None:
+                self.revoked_filter.add(jti)
+        if result.status == "reused":
+            raise RefreshReuseDetected("Refresh reutilizado. Sessões revogadas.")
+        if result.status == "invalid":
+            raise RefreshInvalid("Refresh inválido. Sessões revogadas.")
 
-        new_access = self.token_service.create_access_token(record.user_id)
+        new_access = self.token_service.create_access_token(result.user_id)
 
-        return AuthTokensDTO(access_token=new_access, refresh_token=new_raw, refresh_jti=new_jti, user_id=record.user_id)
+        return AuthTokensDTO(access_token=new_access, refresh_token=new_raw, refresh_jti=new_jti, user_id=result.user_id)
 
     async def logout_by_cookie(self, raw_refresh: str, jti: str) -> bool:
         record = await self.token_repo.get_by_jti(jti)
         if record and hmac.compare_digest(record.token_hash, self.token_service.hash_refresh_token(raw_refresh)):
             await self.token_repo.revoke_token(record)
+            await self.uow.commit()
             return True
         return False
 
     async def return_user_by_access_token(self, access_token: str) -> UserDetailDTO:
-        payload = self.token_service.verify_access_token(access_token)
+        payload = await self.token_service.verify_access_token(access_token)
         if not payload:
             raise InvalidCredentials("Token is not valid")
 
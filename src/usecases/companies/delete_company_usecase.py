@@ -1,9 +1,12 @@
 from src.interfaces.icompanies_repository import ICompaniesRepository
+from src.interfaces.iunit_of_work import IUnitOfWork
 
 
 class DeleteCompanyUseCase:
-    def __init__(self, companies_repository: ICompaniesRepository):
+    def __init__(self, companies_repository: ICompaniesRepository, uow: IUnitOfWork):
         self.companies_repository = companies_repository
+        self.uow = uow
 
     async def execute(self, company_id: str) -> None:
         await self.companies_repository.delete(id=company_id)
+        await self.uow.commit()
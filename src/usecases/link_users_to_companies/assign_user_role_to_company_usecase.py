@@ -1,9 +1,12 @@
+from src.interfaces.iunit_of_work import IUnitOfWork
 from src.interfaces.iuser_company_roles_repository import IUserCompanyRolesRepository
 
 
 class AssignUserRoleToCompanyUseCase:
-    def __init__(self, user_role_company_repository: IUserCompanyRolesRepository):
+    def __init__(self, user_role_company_repository: IUserCompanyRolesRepository, uow: IUnitOfWork):
         self.user_role_company_repository = user_role_company_repository
+        self.uow = uow
 
     async def execute(self, user_id: str, company_id: str, role_id: str | None) -> None:
         await self.user_role_company_repository.assign_user_and_role_to_company(user_id=user_id, company_id=company_id, role_id=role_id)
+        await self.uow.commit()
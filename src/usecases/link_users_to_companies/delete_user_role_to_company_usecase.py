@@ -1,9 +1,12 @@
+from src.interfaces.iunit_of_work import IUnitOfWork
 from src.interfaces.iuser_company_roles_repository import IUserCompanyRolesRepository
 
 
 class DeleteUserRoleToCompanyUseCase:
-    def __init__(self, user_role_company_repository: IUserCompanyRolesRepository):
+    def __init__(self, user_role_company_repository: IUserCompanyRolesRepository, uow: IUnitOfWork):
         self.user_role_company_repository = user_role_company_repository
+        self.uow = uow
 
     async def execute(self, register_id: str) -> None:
         await self.user_role_company_repository.remove_user_company_role_register(register_id=register_id)
+        await self.uow.commit()
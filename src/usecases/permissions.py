@@ -0,0 +1,11 @@
+from src.domain.errors import NotFoundError, PermissionDeniedError
+from src.interfaces.ipermissions_query_service import IPermissionsQueryService
+
+
+async def ensure_company_owner(permissions: IPermissionsQueryService, user_id: str, company_id: str, denied_message: str) -> None:
+    if await permissions.is_company_owner(user_id, company_id):
+        return
+    # so no caminho negado: diferencia usuario inexistente (404) de sem permissao (403)
+    if not await permissions.user_exists(user_id):
+        raise NotFoundError("User not found")
+    raise PermissionDeniedError(denied_message)
@@ -1,9 +1,12 @@
 from src.interfaces.iroles_repository import IRolesRepository
+from src.interfaces.iunit_of_work import IUnitOfWork
 
 
 class DeleteRoleUseCase:
-    def __init__(self, roles_repository: IRolesRepository):
+    def __init__(self, roles_repository: IRolesRepository, uow: IUnitOfWork):
         self.roles_repository = roles_repository
+        self.uow = uow
 
     async def execute(self, role_id: str) -> None:
         await self.roles_repository.delete(id=role_id)
+        await self.uow.commit()
@@ -1,14 +1,17 @@
 from src.interfaces.iroles_repository import IRolesRepository
+from src.interfaces.iunit_of_work import IUnitOfWork
 from src.interfaces.types.user_types import RoleDTO
 from src.usecases.roles.mappers import to_role_dto
 
 
 class UpdateRolesUsecase:
-    def __init__(self, roles_repository: IRolesRepository):
+    def __init__(self, roles_repository: IRolesRepository, uow: IUnitOfWork):
         self.roles_repository = roles_repository
+        self.uow = uow
 
     async def execute(self, id: str, name: str | None, number_of_cooldown_days: int | None) -> RoleDTO | None:
         role = await self.roles_repository.partial_update_by_id(id=id, name=name, number_of_cooldown_days=number_of_cooldown_days)
         if not role:
             return None
+        await self.uow.commit()
         return to_role_dto(role)
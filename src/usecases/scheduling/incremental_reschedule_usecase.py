@@ -0,0 +1,85 @@
+from datetime import date, datetime, time, timedelta, timezone
+from typing import List, Set, Tuple
+
+from src.domain.errors import NotFoundError
+from src.interfaces.ipermissions_query_service import IPermissionsQueryService
+from src.interfaces.iunit_of_work import IUnitOfWork
+from src.interfaces.iuser_company_roles_repository import IUserCompanyRolesRepository
+from src.interfaces.iworkdays_repository import IWorkdaysRepository
+from src.interfaces.iworkshifts_repository import IWorkShiftsRepository
+from src.interfaces.types.workshift_types import ScheduleChangeSet, ScheduleSummary
+from src.usecases.permissions import ensure_company_owner
+from src.usecases.scheduling.scheduling_context import SCHEDULE_DENIED_MESSAGE, load_team, solve_window
+
+# atribuicoes ao redor da janela que contam para o balanceamento de carga
+BALANCE_HORIZON_DAYS = 14
+
+
+def dependency_windows(changed_days: Set[date], cooldown_days: int) -> List[Tuple[date, date]]:
+    # um dia alterado so afeta quem pode trabalhar ate cooldown_days depois dele;
+    # janelas que encostam nas restricoes uma da outra sao resolvidas juntas
+    windows: List[Tuple[date, date]] = []
+    for day in sorted(changed_days):
+        end = day + timedelta(days=cooldown_days)
+        if windows and (day - windows[-1][1]).days <= cooldown_days + 1:
+            windows[-1] = (windows[-1][0], max(windows[-1][1], end))
+        else:
+            windows.append((day, end))
+    return windows
+
+
+def _utc_midnight(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+class IncrementalRescheduleUseCase:
+    def __init__(
+        self,
+        workshifts_repository: IWorkShiftsRepository,
+        workdays_repository: IWorkdaysRepository,
+        user_company_roles_repository: IUserCompanyRolesRepository,
+        permissions: IPermissionsQueryService,
+        uow: IUnitOfWork,
+    ):
+        self.workshifts_repository = workshifts_repository
+        self.workdays_repository = workdays_repository
+        self.user_company_roles_repository = user_company_roles_repository
+        self.permissions = permissions
+        self.uow = uow
+
+    async def execute(self, user_id: str, change_set: ScheduleChangeSet) -> ScheduleSummary:
+        await ensure_company_owner(self.permissions, user_id, change_set.company_id, SCHEDULE_DENIED_MESSAGE)
+
+        # uma consulta para todos os dias, restrita aos cargos da empresa: id de outra empresa responde como inexistente
+        requested = set(change_set.work_day_ids)
+        workdays = await self.workdays_repository.list_by_ids_for_company(change_set.company_id, requested)
+        missing = requested - {w.id for w in workdays}
+        if missing:
+            raise NotFoundError(f"Workday {min(missing)} not found")
+        changed_days: Set[date] = {w.date.date() for w in workdays}
+
+        since = change_set.since or datetime.now(timezone.utc)
+        for assigned in await self.workshifts_repository.list_assigned_dates(change_set.company_id, change_set.removed_user_ids, since):
+            changed_days.add(assigned.date())
+
+        team = await load_team(self.user_company_roles_repository, change_set.company_id)
+        summary = ScheduleSummary(total_shifts=0, assigned=0)
+        for start, end in dependency_windows(changed_days, team.max_cooldown_days):
+            solution = await solve_window(
+                self.workshifts_repository,
+                change_set.company_id,
+                team,
+                _utc_midnight(start),
+                _utc_midnight(end),
+                balance_horizon_days=BALANCE_HORIZON_DAYS,
+            )
+            summary.total_shifts += len(solution.shifts)
+            summary.assigned += len(solution.result.assignments)
+            summary.unassigned_shift_ids.extend(solution.result.unassigned)
+            summary.changes.extend(solution.changes)
+            summary.load.update(solution.result.load)
+
+        # grava somente o diff das janelas re-resolvidas
+        await self.workshifts_repository.assign_users({change.shift_id: change.user_id for change in summary.changes})
+        await self.uow.commit()
+        return summary
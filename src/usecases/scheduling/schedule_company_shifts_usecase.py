@@ -0,0 +1,44 @@
+from datetime import datetime
+
+from src.domain.errors import ValidationError
+from src.interfaces.ipermissions_query_service import IPermissionsQueryService
+from src.interfaces.iunit_of_work import IUnitOfWork
+from src.interfaces.iuser_company_roles_repository import IUserCompanyRolesRepository
+from src.interfaces.iworkshifts_repository import IWorkShiftsRepository
+from src.interfaces.types.workshift_types import ScheduleSummary
+from src.usecases.permissions import ensure_company_owner
+from src.usecases.scheduling.scheduling_context import SCHEDULE_DENIED_MESSAGE, load_team, solve_window
+
+
+class ScheduleCompanyShiftsUseCase:
+    def __init__(
+        self,
+        workshifts_repository: IWorkShiftsRepository,
+        user_company_roles_repository: IUserCompanyRolesRepository,
+        permissions: IPermissionsQueryService,
+        uow: IUnitOfWork,
+    ):
+        self.workshifts_repository = workshifts_repository
+        self.user_company_roles_repository = user_company_roles_repository
+        self.permissions = permissions
+        self.uow = uow
+
+    async def execute(self, user_id: str, company_id: str, date_from: datetime, date_to: datetime) -> ScheduleSummary:
+        if date_from > date_to:
+            raise ValidationError("'date_from' must be before 'date_to'")
+        await ensure_company_owner(self.permissions, user_id, company_id, SCHEDULE_DENIED_MESSAGE)
+
+        team = await load_team(self.user_company_roles_repository, company_id)
+        solution = await solve_window(self.workshifts_repository, company_id, team, date_from, date_to)
+
+        # so grava o que mudou
+        await self.workshifts_repository.assign_users({change.shift_id: change.user_id for change in solution.changes})
+        await self.uow.commit()
+
+        return ScheduleSummary(
+            total_shifts=len(solution.shifts),
+            assigned=len(solution.result.assignments),
+            unassigned_shift_ids=solution.result.unassigned,
+            load=solution.result.load,
+            changes=solution.changes,
+        )
@@ -0,0 +1,97 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from src.interfaces.iuser_company_roles_repository import IUserCompanyRolesRepository
+from src.interfaces.iworkshifts_repository import IWorkShiftsRepository
+from src.interfaces.types.workshift_types import SchedulableShift, ShiftAssignmentChange
+from src.usecases.scheduling.shift_scheduler import ScheduleResult, SchedulingProblem, ShiftSlot, solve_schedule
+
+SCHEDULE_DENIED_MESSAGE = "User does not have permission to schedule shifts for this company"
+
+
+@dataclass(slots=True)
+class SchedulingTeam:
+    users_by_role: Dict[str, List[str]] = field(default_factory=dict)
+    cooldown_by_role: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def max_cooldown_days(self) -> int:
+        return max(self.cooldown_by_role.values(), default=0)
+
+
+@dataclass(slots=True)
+class WindowSolution:
+    shifts: List[SchedulableShift]
+    result: ScheduleResult
+    changes: List[ShiftAssignmentChange]
+
+
+async def load_team(user_company_roles_repository: IUserCompanyRolesRepository, company_id: str) -> SchedulingTeam:
+    team = SchedulingTeam()
+    for member in await user_company_roles_repository.list_users_and_roles_by_company(company_id):
+        if member.role is None:
+            continue
+        team.users_by_role.setdefault(member.role.id, []).append(member.user.id)
+        team.cooldown_by_role[member.role.id] = member.role.number_of_cooldown_days
+    return team
+
+
+def _ordinal(shift: SchedulableShift) -> int:
+    return shift.date.date().toordinal()
+
+
+async def solve_window(
+    workshifts_repository: IWorkShiftsRepository,
+    company_id: str,
+    team: SchedulingTeam,
+    date_from: datetime,
+    date_to: datetime,
+    balance_horizon_days: int = 0,
+) -> WindowSolution:
+    """Re-escala os turnos de [date_from, date_to] mantendo fixo tudo que esta fora.
+
+    Atribuicoes ate max_cooldown dias antes/depois viram restricoes de descanso e as
+    de ate balance_horizon_days entram como carga inicial para o balanceamento.
+    """
+    margin = max(team.max_cooldown_days, balance_horizon_days)
+    shifts = await workshifts_repository.list_schedulable(company_id, date_from - timedelta(days=margin), date_to + timedelta(days=margin))
+
+    first_day = date_from.date().toordinal()
+    last_day = date_to.date().toordinal()
+    available_from: Dict[str, int] = {}
+    blocked_from: Dict[str, int] = {}
+    initial_load: Dict[str, int] = {}
+    in_range: List[SchedulableShift] = []
+    for shift in shifts:
+        day = _ordinal(shift)
+        if first_day <= day <= last_day:
+            in_range.append(shift)
+            continue
+        if not shift.user_id:
+            continue
+        if day < first_day:
+            free_day = day + team.cooldown_by_role.get(shift.role_id, 0) + 1
+            available_from[shift.user_id] = max(available_from.get(shift.user_id, 0), free_day)
+        else:
+            blocked_from[shift.user_id] = min(blocked_from.get(shift.user_id, day), day)
+        if first_day - balance_horizon_days <= day <= last_day + balance_horizon_days:
+            initial_load[shift.user_id] = initial_load.get(shift.user_id, 0) + 1
+
+    problem = SchedulingProblem(
+        slots=[ShiftSlot(shift_id=s.id, role_id=s.role_id, day=_ordinal(s), start_time=s.start_time) for s in in_range if not s.is_holiday],
+        users_by_role=team.users_by_role,
+        cooldown_by_role=team.cooldown_by_role,
+        available_from=available_from,
+        initial_load=initial_load,
+        blocked_from=blocked_from,
+    )
+    result = solve_schedule(problem)
+
+    # feriados e turnos sem ninguem disponivel ficam sem usuario
+    changes = [
+        ShiftAssignmentChange(shift_id=s.id, previous_user_id=s.user_id, user_id=result.assignments.get(s.id))
+        for s in in_range
+        if result.assignments.get(s.id) != s.user_id
+    ]
+    return WindowSolution(shifts=in_range, result=result, changes=changes)
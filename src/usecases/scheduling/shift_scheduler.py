@@ -0,0 +1,101 @@
+import heapq
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+
+@dataclass(slots=True, frozen=True)
+class ShiftSlot:
+    shift_id: int
+    role_id: str
+    # date.toordinal() do dia de trabalho
+    day: int
+    start_time: datetime
+
+
+@dataclass(slots=True)
+class SchedulingProblem:
+    slots: List[ShiftSlot]
+    users_by_role: Dict[str, List[str]]
+    cooldown_by_role: Dict[str, int]
+    # primeiro dia (ordinal) em que o usuario pode voltar a trabalhar, vindo de escalas anteriores
+    available_from: Dict[str, int] = field(default_factory=dict)
+    initial_load: Dict[str, int] = field(default_factory=dict)
+    # primeiro dia ja atribuido depois da janela: o descanso do turno novo precisa terminar antes dele
+    blocked_from: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class ScheduleResult:
+    assignments: Dict[int, str]
+    unassigned: List[int]
+    load: Dict[str, int]
+
+
+def solve_schedule(problem: SchedulingProblem) -> ScheduleResult:
+    """Greedy por dia: cada turno vai para o usuario disponivel com menos turnos.
+
+    Um heap por role guarda (carga, usuario) dos disponiveis e um heap global guarda
+    (dia livre, usuario) de quem esta em descanso. Entradas velhas sao descartadas
+    ao sair do heap, entao cada turno custa O(log U) amortizado.
+    """
+    users = sorted({user for role_users in problem.users_by_role.values() for user in role_users})
+    index = {user: i for i, user in enumerate(users)}
+    roles_of_user: List[List[str]] = [[] for _ in users]
+    for role_id, role_users in problem.users_by_role.items():
+        for user in set(role_users):
+            roles_of_user[index[user]].append(role_id)
+
+    load = [problem.initial_load.get(user, 0) for user in users]
+    next_free = [problem.available_from.get(user, 0) for user in users]
+    blocked_from = [problem.blocked_from.get(user) for user in users]
+
+    ready: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+    resting: List[Tuple[int, int]] = []
+    first_day = min((slot.day for slot in problem.slots), default=0)
+    for i in range(len(users)):
+        if next_free[i] <= first_day:
+            for role_id in roles_of_user[i]:
+                ready[role_id].append((load[i], i))
+        else:
+            resting.append((next_free[i], i))
+    for heap in ready.values():
+        heapq.heapify(heap)
+    heapq.heapify(resting)
+
+    assignments: Dict[int, str] = {}
+    unassigned: List[int] = []
+
+    for slot in sorted(problem.slots, key=lambda s: (s.day, s.start_time, s.shift_id)):
+        while resting and resting[0][0] <= slot.day:
+            free_day, i = heapq.heappop(resting)
+            if free_day != next_free[i]:
+                continue
+            for role_id in roles_of_user[i]:
+                heapq.heappush(ready[role_id], (load[i], i))
+
+        heap = ready[slot.role_id]
+        cooldown_days = problem.cooldown_by_role.get(slot.role_id, 0)
+        chosen: Optional[int] = None
+        while heap:
+            entry_load, i = heapq.heappop(heap)
+            # entrada velha: carga mudou ou o usuario ja trabalhou e esta em descanso
+            if entry_load != load[i] or next_free[i] > slot.day:
+                continue
+            # os dias so avancam, entao quem ja esbarra no bloqueio nao serve mais para esta role
+            if blocked_from[i] is not None and slot.day + cooldown_days >= blocked_from[i]:
+                continue
+            chosen = i
+            break
+
+        if chosen is None:
+            unassigned.append(slot.shift_id)
+            continue
+
+        load[chosen] += 1
+        next_free[chosen] = slot.day + cooldown_days + 1
+        heapq.heappush(resting, (next_free[chosen], chosen))
+        assignments[slot.shift_id] = users[chosen]
+
+    return ScheduleResult(assignments=assignments, unassigned=unassigned, load={user: load[i] for i, user in enumerate(users)})
@@ -0,0 +1,31 @@
+from typing import Literal
+
+from src.domain.errors import ValidationError
+from src.interfaces.isearch_repository import ISearchRepository
+from src.interfaces.types.search_types import SearchHit
+
+MAX_SEARCH_LIMIT = 50
+MIN_QUERY_LENGTH = 2
+
+SearchScope = Literal["all", "users", "companies"]
+
+
+class SearchUseCase:
+    def __init__(self, search_repository: ISearchRepository):
+        self.search_repository = search_repository
+
+    async def execute(self, query: str, scope: SearchScope = "all", limit: int = 20) -> list[SearchHit]:
+        query = query.strip()
+        if len(query) < MIN_QUERY_LENGTH:
+            raise ValidationError(f"Query must have at least {MIN_QUERY_LENGTH} characters")
+
+        limit = max(1, min(limit, MAX_SEARCH_LIMIT))
+        hits: list[SearchHit] = []
+        if scope in ("all", "users"):
+            hits.extend(await self.search_repository.search_users(query, limit))
+        if scope in ("all", "companies"):
+            hits.extend(await self.search_repository.search_companies(query, limit))
+
+        # cada lado ja vem ranqueado e limitado; aqui so intercala pelo score
+        hits.sort(key=lambda hit: (-hit.score, hit.label))
+        return hits[:limit]
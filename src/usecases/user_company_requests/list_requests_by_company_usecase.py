@@ -1,22 +1,16 @@
 from src.domain.entities.user_company_requests import UserCompanyRequestStatus
-from src.domain.errors import NotFoundError, PermissionDeniedError
 from src.interfaces.iuser_company_requests_repository import IUserCompanyRequestsRepository
-from src.interfaces.iusers_repository import IUsersRepository
+from src.interfaces.ipermissions_query_service import IPermissionsQueryService
 from src.interfaces.types.user_types import UserCompanyRequestWithUser
+from src.usecases.permissions import ensure_company_owner
 
 
 class ListRequestsByCompanyUseCase:
-    def __init__(self, user_company_requests_repository: IUserCompanyRequestsRepository, users_repository: IUsersRepository):
+    def __init__(self, user_company_requests_repository: IUserCompanyRequestsRepository, permissions: IPermissionsQueryService):
         self.user_company_requests_repository = user_company_requests_repository
-        self.users_repository = users_repository
+        self.permissions = permissions
 
     async def execute(self, user_id: str, company_id: str, status: UserCompanyRequestStatus | None = None) -> list[UserCompanyRequestWithUser]:
-        user = await self.users_repository.get_by_id(user_id)
-        if not user:
-            raise NotFoundError("User not found")
-
-        is_owner = any(company_role.company_id == company_id and company_role.is_owner for company_role in user.companies_roles)
-        if not is_owner:
-            raise PermissionDeniedError("User does not have permission to view requests for this company")
+        await ensure_company_owner(self.permissions, user_id, company_id, "User does not have permission to view requests for this company")
 
         return await self.user_company_requests_repository.list_by_company(company_id=company_id, status=status)
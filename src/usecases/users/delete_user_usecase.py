@@ -1,9 +1,12 @@
+from src.interfaces.iunit_of_work import IUnitOfWork
 from src.interfaces.iusers_repository import IUsersRepository
 
 
 class DeleteUserUseCase:
-    def __init__(self, users_repository: IUsersRepository):
+    def __init__(self, users_repository: IUsersRepository, uow: IUnitOfWork):
         self.users_repository = users_repository
+        self.uow = uow
 
     async def execute(self, user_id: str) -> None:
         await self.users_repository.delete(user_id)
+        await self.uow.commit()
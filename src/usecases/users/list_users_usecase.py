@@ -1,12 +1,23 @@
+from dataclasses import replace
+
+from src.domain.errors import ValidationError
 from src.interfaces.iusers_repository import IUsersRepository
-from src.interfaces.types.user_types import UserPublicDTO
-from src.usecases.users.mappers import to_user_public
+from src.interfaces.types.user_types import USER_LIST_FIELDS, UserListFilters, UserPage
+
+MAX_USERS_PAGE_SIZE = 500
 
 
 class ListUsersUseCase:
     def __init__(self, users_repository: IUsersRepository):
         self.users_repository = users_repository
 
-    async def execute(self) -> list[UserPublicDTO]:
-        users = await self.users_repository.list()
-        return [to_user_public(user) for user in users]
+    async def execute(self, filters: UserListFilters) -> UserPage:
+        if filters.fields is not None:
+            if not filters.fields:
+                raise ValidationError("fields must not be empty")
+            unknown = [name for name in filters.fields if name not in USER_LIST_FIELDS]
+            if unknown:
+                raise ValidationError(f"Unknown fields: {', '.join(unknown)}; allowed: {', '.join(USER_LIST_FIELDS)}")
+
+        limit = max(1, min(filters.limit, MAX_USERS_PAGE_SIZE))
+        return await self.users_repository.list(replace(filters, limit=limit))
@@ -1,12 +1,14 @@
 from src.domain.errors import NotFoundError
+from src.interfaces.iunit_of_work import IUnitOfWork
 from src.interfaces.iusers_repository import IUsersRepository
 from src.interfaces.types.user_types import UserPublicDTO, UserUpdatePayload
 from src.usecases.users.mappers import to_user_public
 
 
 class UpdateUserUseCase:
-    def __init__(self, users_repository: IUsersRepository):
+    def __init__(self, users_repository: IUsersRepository, uow: IUnitOfWork):
         self.users_repository = users_repository
+        self.uow = uow
 
     async def execute(self, user_id: str, payload: UserUpdatePayload) -> UserPublicDTO:
         user = await self.users_repository.partial_update_by_id(
@@ -21,4 +23,5 @@ class UpdateUserUseCase:
         if not user:
             raise NotFoundError("User not found")
 
+        await self.uow.commit()
         return to_user_public(user)
@@ -1,11 +1,14 @@
 from typing import List
 
+from src.interfaces.iunit_of_work import IUnitOfWork
 from src.interfaces.iworkdays_repository import IWorkdaysRepository
 
 
 class BatchDeleteWorkdayUseCase:
-    def __init__(self, workdays_repository: IWorkdaysRepository):
+    def __init__(self, workdays_repository: IWorkdaysRepository, uow: IUnitOfWork):
         self.workdays_repository = workdays_repository
+        self.uow = uow
 
     async def execute(self, workday_ids: List[int]) -> None:
         await self.workdays_repository.batch_delete(workday_ids)
+        await self.uow.commit()
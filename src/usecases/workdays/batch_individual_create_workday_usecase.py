@@ -1,31 +1,19 @@
-from datetime import datetime
 from typing import List
 
 from src.domain.entities.work_day import WorkDay
-from src.domain.errors import AlreadyExistsError
+from src.interfaces.iunit_of_work import IUnitOfWork
 from src.interfaces.iworkdays_repository import IWorkdaysRepository
+from src.interfaces.types.workday_types import WorkdayConflictMode
 
 
 class BatchIndividualCreateWorkdayUseCase:
-    def __init__(self, workdays_repository: IWorkdaysRepository):
+    def __init__(self, workdays_repository: IWorkdaysRepository, uow: IUnitOfWork):
         self.workdays_repository = workdays_repository
+        self.uow = uow
 
-    async def execute(self, payloads: List[WorkDay]):
-        days_with_errors: List[str] = []
-
-        workdays: List[WorkDay] = []
-
-        for day in payloads:
-            inserted_workday = await self.workdays_repository.find_by_date(datetime.fromisoformat(str(day.date)))
-
-            if inserted_workday:
-                days_with_errors.append(str(day.date))
-                continue
-            workdays.append(day)
-
-        if days_with_errors:
-            raise AlreadyExistsError(f"Workdays for dates {', '.join(days_with_errors)} already exist.")
-
-        created_workdays = await self.workdays_repository.batch_create(payloads=workdays)
+    async def execute(self, payloads: List[WorkDay], conflict: WorkdayConflictMode = "error"):
+        # conflitos de (role_id, date) sao resolvidos pelo indice unico no proprio INSERT
+        created_workdays = await self.workdays_repository.batch_create(payloads=payloads, conflict=conflict)
+        await self.uow.commit()
 
         return created_workdays
@@ -1,50 +1,56 @@
-from datetime import datetime
 from typing import List
 
 from src.domain.entities.work_day import WorkDay
-from src.domain.errors import AlreadyExistsError
+from src.domain.errors import NotFoundError, ValidationError
+from src.interfaces.iroles_repository import IRolesRepository
+from src.interfaces.iunit_of_work import IUnitOfWork
 from src.interfaces.iworkdays_repository import IWorkdaysRepository
 from src.interfaces.types.workday_types import BatchCreateWorkdays
-from src.usecases.workdays.utils import days_between_iso_utc
+from src.usecases.workdays.calendar_rules import RecurrenceRule, generate_utc_datetimes
 
 
 class BatchIntervalCreateWorkdayUseCase:
-    def __init__(self, workdays_repository: IWorkdaysRepository):
+    def __init__(self, workdays_repository: IWorkdaysRepository, roles_repository: IRolesRepository, uow: IUnitOfWork):
         self.workdays_repository = workdays_repository
+        self.roles_repository = roles_repository
+        self.uow = uow
+
+    async def _build_rule(self, payload: BatchCreateWorkdays) -> RecurrenceRule:
+        cooldown_days = 0
+        if payload.apply_cooldown:
+            role = await self.roles_repository.get_by_id(payload.role_id)
+            if not role:
+                raise NotFoundError("Role not found")
+            cooldown_days = role.number_of_cooldown_days
+
+        try:
+            return RecurrenceRule(
+                weekdays=frozenset(payload.weekdays) if payload.weekdays is not None else None,
+                every_n_days=payload.every_n_days,
+                holidays=frozenset(payload.holidays),
+                cooldown_days=cooldown_days,
+            )
+        except ValueError as exc:
+            raise ValidationError(str(exc)) from exc
 
     async def execute(self, payload: BatchCreateWorkdays):
-        start_date = payload.start_date
-
-        end_date = payload.end_date
-
-        role_id = payload.role_id
-
-        list_of_days = days_between_iso_utc(start_date, end_date)
+        rule = await self._build_rule(payload)
 
-        workdays_list: List[WorkDay] = []
+        list_of_days = generate_utc_datetimes(payload.start_date, payload.end_date, rule)
 
-        days_with_errors: List[str] = []
-
-        for day in list_of_days:
-            inserted_workday = await self.workdays_repository.find_by_date(datetime.fromisoformat(str(day)))
-
-            if inserted_workday:
-                days_with_errors.append(day)
-                continue
-
-            workdays_list.append(
-                WorkDay(
-                    id=None,
-                    role_id=role_id,
-                    date=datetime.fromisoformat(day),
-                    is_holiday=False,
-                    weekday=datetime.fromisoformat(day).weekday(),
-                )
+        workdays_list: List[WorkDay] = [
+            WorkDay(
+                id=None,
+                role_id=payload.role_id,
+                date=day,
+                is_holiday=False,
+                weekday=day.weekday(),
             )
+            for day in list_of_days
+        ]
 
-        if days_with_errors:
-            raise AlreadyExistsError(f"Workdays for dates {', '.join(days_with_errors)} already exist.")
-
-        created_workdays = await self.workdays_repository.batch_create(payloads=workdays_list)
+        # conflitos de (role_id, date) sao resolvidos pelo indice unico no proprio INSERT
+        created_workdays = await self.workdays_repository.batch_create(payloads=workdays_list, conflict=payload.conflict)
+        await self.uow.commit()
 
         return created_workdays
@@ -0,0 +1,68 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timezone
+from typing import FrozenSet, List, Optional
+
+# date.fromordinal(1) e uma segunda-feira, entao weekday == (ordinal - 1) % 7
+_MONDAY_ORDINAL_OFFSET = 1
+
+WEEKDAYS_ONLY: FrozenSet[int] = frozenset(range(5))
+
+
+@dataclass(slots=True, frozen=True)
+class RecurrenceRule:
+    # None = todos os dias da semana; 0 = segunda ... 6 = domingo
+    weekdays: Optional[FrozenSet[int]] = None
+    every_n_days: int = 1
+    holidays: FrozenSet[date] = field(default_factory=frozenset)
+    # dias de descanso obrigatorios depois de cada dia gerado (Role.number_of_cooldown_days)
+    cooldown_days: int = 0
+
+    def __post_init__(self):
+        if self.every_n_days < 1:
+            raise ValueError("every_n_days must be >= 1")
+        if self.cooldown_days < 0:
+            raise ValueError("cooldown_days must be >= 0")
+        if self.weekdays is not None and not self.weekdays <= frozenset(range(7)):
+            raise ValueError("weekdays must be between 0 (monday) and 6 (sunday)")
+
+
+def _as_date(value: date) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def generate_ordinals(start: date, end: date, rule: RecurrenceRule = RecurrenceRule()) -> List[int]:
+    start_ordinal = _as_date(start).toordinal()
+    end_ordinal = _as_date(end).toordinal()
+    if start_ordinal > end_ordinal:
+        start_ordinal, end_ordinal = end_ordinal, start_ordinal
+
+    # cooldown so depende da distancia entre dias aceitos; sem filtros vira um passo fixo do range
+    if rule.weekdays is None and not rule.holidays:
+        step = rule.every_n_days
+        if rule.cooldown_days:
+            step = rule.every_n_days * -(-(rule.cooldown_days + 1) // rule.every_n_days)
+        return list(range(start_ordinal, end_ordinal + 1, step))
+
+    weekdays = rule.weekdays
+    holidays = {d.toordinal() for d in rule.holidays}
+    min_gap = rule.cooldown_days + 1
+
+    ordinals: List[int] = []
+    last = start_ordinal - min_gap
+    for ordinal in range(start_ordinal, end_ordinal + 1, rule.every_n_days):
+        if weekdays is not None and (ordinal - _MONDAY_ORDINAL_OFFSET) % 7 not in weekdays:
+            continue
+        if ordinal in holidays or ordinal - last < min_gap:
+            continue
+        ordinals.append(ordinal)
+        last = ordinal
+    return ordinals
+
+
+def generate_dates(start: date, end: date, rule: RecurrenceRule = RecurrenceRule()) -> List[date]:
+    return [date.fromordinal(ordinal) for ordinal in generate_ordinals(start, end, rule)]
+
+
+def generate_utc_datetimes(start: date, end: date, rule: RecurrenceRule = RecurrenceRule()) -> List[datetime]:
+    # meia-noite UTC, mesmo formato salvo em work_days.date
+    return [datetime.combine(date.fromordinal(ordinal), time.min, tzinfo=timezone.utc) for ordinal in generate_ordinals(start, end, rule)]
@@ -1,19 +1,15 @@
-from datetime import datetime
-
 from src.domain.entities.work_day import WorkDay
-from src.domain.errors import AlreadyExistsError
+from src.interfaces.iunit_of_work import IUnitOfWork
 from src.interfaces.iworkdays_repository import IWorkdaysRepository
 
 
 class CreateWorkdayUseCase:
-    def __init__(self, workdays_repository: IWorkdaysRepository):
+    def __init__(self, workdays_repository: IWorkdaysRepository, uow: IUnitOfWork):
         self.workdays_repository = workdays_repository
+        self.uow = uow
 
     async def execute(self, workday: WorkDay) -> WorkDay:
-        inserted_workday = await self.workdays_repository.find_by_date(datetime.fromisoformat(str(workday.date)))
-
-        if inserted_workday:
-            raise AlreadyExistsError(f"Workday for date {workday.date} already exists.")
-
+        # sem checagem previa: o repositorio levanta AlreadyExistsError pelo indice unico (role_id, date)
         created_workday = await self.workdays_repository.create(workday)
+        await self.uow.commit()
         return created_workday
@@ -1,9 +1,12 @@
+from src.interfaces.iunit_of_work import IUnitOfWork
 from src.interfaces.iworkdays_repository import IWorkdaysRepository
 
 
 class DeleteWorkdayUseCase:
-    def __init__(self, workdays_repository: IWorkdaysRepository):
+    def __init__(self, workdays_repository: IWorkdaysRepository, uow: IUnitOfWork):
         self.workdays_repository = workdays_repository
+        self.uow = uow
 
     async def execute(self, workday_id: int) -> None:
         await self.workdays_repository.delete(workday_id)
+        await self.uow.commit()
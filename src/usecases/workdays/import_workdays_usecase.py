@@ -0,0 +1,30 @@
+from typing import AsyncIterator, List
+
+from src.domain.entities.work_day import WorkDay
+from src.interfaces.iunit_of_work import IUnitOfWork
+from src.interfaces.iworkdays_repository import IWorkdaysRepository
+from src.interfaces.types.workday_types import WorkdayConflictMode, WorkdayImportResult
+
+IMPORT_CHUNK_SIZE = 5000
+
+
+class ImportWorkdaysUseCase:
+    def __init__(self, workdays_repository: IWorkdaysRepository, uow: IUnitOfWork):
+        self.workdays_repository = workdays_repository
+        self.uow = uow
+
+    @staticmethod
+    async def _chunked(workdays: AsyncIterator[WorkDay], chunk_size: int) -> AsyncIterator[List[WorkDay]]:
+        chunk: List[WorkDay] = []
+        async for workday in workdays:
+            chunk.append(workday)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    async def execute(self, workdays: AsyncIterator[WorkDay], conflict: WorkdayConflictMode = "error", chunk_size: int = IMPORT_CHUNK_SIZE) -> WorkdayImportResult:
+        result = await self.workdays_repository.bulk_import(self._chunked(workdays, chunk_size), conflict=conflict)
+        await self.uow.commit()
+        return result
@@ -1,10 +1,19 @@
-from src.domain.entities.work_day import WorkDay
+from dataclasses import replace
+
+from src.domain.errors import ValidationError
 from src.interfaces.iworkdays_repository import IWorkdaysRepository
+from src.interfaces.types.workday_types import WorkdayListFilters, WorkdayPage
+
+MAX_WORKDAYS_PAGE_SIZE = 500
 
 
 class ListWorkdaysUseCase:
     def __init__(self, workdays_repository: IWorkdaysRepository):
         self.workdays_repository = workdays_repository
 
-    async def execute(self) -> list[WorkDay]:
-        return await self.workdays_repository.list()
+    async def execute(self, filters: WorkdayListFilters) -> WorkdayPage:
+        if filters.date_from and filters.date_to and filters.date_from > filters.date_to:
+            raise ValidationError("'from' must be before 'to'")
+
+        limit = max(1, min(filters.limit, MAX_WORKDAYS_PAGE_SIZE))
+        return await self.workdays_repository.list(replace(filters, limit=limit))
@@ -0,0 +1,14 @@
+from typing import List
+
+from src.interfaces.iunit_of_work import IUnitOfWork
+from src.interfaces.iworkshifts_repository import IWorkShiftsRepository
+
+
+class BatchDeleteWorkShiftsUseCase:
+    def __init__(self, workshifts_repository: IWorkShiftsRepository, uow: IUnitOfWork):
+        self.workshifts_repository = workshifts_repository
+        self.uow = uow
+
+    async def execute(self, work_shift_ids: List[int]) -> None:
+        await self.workshifts_repository.batch_delete(work_shift_ids)
+        await self.uow.commit()
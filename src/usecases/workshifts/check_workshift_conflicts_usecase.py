@@ -0,0 +1,15 @@
+from typing import List
+
+from src.domain.entities.work_shift import WorkShift
+from src.interfaces.iworkshifts_repository import IWorkShiftsRepository
+from src.usecases.workshifts.validation import ensure_valid_time_range
+
+
+class CheckWorkShiftConflictsUseCase:
+    def __init__(self, workshifts_repository: IWorkShiftsRepository):
+        self.workshifts_repository = workshifts_repository
+
+    async def execute(self, payloads: List[WorkShift]) -> List[WorkShift]:
+        for work_shift in payloads:
+            ensure_valid_time_range(work_shift)
+        return await self.workshifts_repository.find_conflicts(payloads)
@@ -0,0 +1,21 @@
+from src.domain.entities.work_shift import WorkShift
+from src.interfaces.iunit_of_work import IUnitOfWork
+from src.interfaces.iworkdays_repository import IWorkdaysRepository
+from src.interfaces.iworkshifts_repository import IWorkShiftsRepository
+from src.usecases.workshifts.validation import ensure_valid_time_range, ensure_work_days_exist
+
+
+class CreateWorkShiftUseCase:
+    def __init__(self, workshifts_repository: IWorkShiftsRepository, workdays_repository: IWorkdaysRepository, uow: IUnitOfWork):
+        self.workshifts_repository = workshifts_repository
+        self.workdays_repository = workdays_repository
+        self.uow = uow
+
+    async def execute(self, work_shift: WorkShift) -> WorkShift:
+        ensure_valid_time_range(work_shift)
+        await ensure_work_days_exist(self.workdays_repository, [work_shift.work_day_id])
+
+        # sobreposicao com outro turno do mesmo dia vira AlreadyExistsError no repositorio
+        created = await self.workshifts_repository.create(work_shift)
+        await self.uow.commit()
+        return created
@@ -0,0 +1,12 @@
+from src.interfaces.iunit_of_work import IUnitOfWork
+from src.interfaces.iworkshifts_repository import IWorkShiftsRepository
+
+
+class DeleteWorkShiftUseCase:
+    def __init__(self, workshifts_repository: IWorkShiftsRepository, uow: IUnitOfWork):
+        self.workshifts_repository = workshifts_repository
+        self.uow = uow
+
+    async def execute(self, work_shift_id: int) -> None:
+        await self.workshifts_repository.delete(work_shift_id)
+        await self.uow.commit()
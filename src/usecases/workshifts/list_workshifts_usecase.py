@@ -0,0 +1,21 @@
+from dataclasses import replace
+from typing import List
+
+from src.domain.entities.work_shift import WorkShift
+from src.domain.errors import ValidationError
+from src.interfaces.iworkshifts_repository import IWorkShiftsRepository
+from src.interfaces.types.workshift_types import WorkShiftListFilters
+
+MAX_WORKSHIFTS_PAGE_SIZE = 500
+
+
+class ListWorkShiftsUseCase:
+    def __init__(self, workshifts_repository: IWorkShiftsRepository):
+        self.workshifts_repository = workshifts_repository
+
+    async def execute(self, filters: WorkShiftListFilters) -> List[WorkShift]:
+        if filters.window_start and filters.window_end and filters.window_start >= filters.window_end:
+            raise ValidationError("'from' must be before 'to'")
+
+        limit = max(1, min(filters.limit, MAX_WORKSHIFTS_PAGE_SIZE))
+        return await self.workshifts_repository.list(replace(filters, limit=limit))
@@ -0,0 +1,32 @@
+from dataclasses import replace
+
+from src.domain.entities.work_shift import WorkShift
+from src.domain.errors import NotFoundError
+from src.interfaces.iunit_of_work import IUnitOfWork
+from src.interfaces.iworkdays_repository import IWorkdaysRepository
+from src.interfaces.iworkshifts_repository import IWorkShiftsRepository
+from src.interfaces.types.workshift_types import PartialWorkShiftUpdate
+from src.usecases.workshifts.validation import ensure_valid_time_range, ensure_work_days_exist
+
+
+class UpdateWorkShiftUseCase:
+    def __init__(self, workshifts_repository: IWorkShiftsRepository, workdays_repository: IWorkdaysRepository, uow: IUnitOfWork):
+        self.workshifts_repository = workshifts_repository
+        self.workdays_repository = workdays_repository
+        self.uow = uow
+
+    async def execute(self, work_shift_id: int, payload: PartialWorkShiftUpdate) -> WorkShift:
+        current = await self.workshifts_repository.get_by_id(work_shift_id)
+        if not current:
+            raise NotFoundError("Work shift not found")
+
+        changes = {key: getattr(payload, key) for key in ("work_day_id", "start_time", "end_time") if getattr(payload, key) is not None}
+        ensure_valid_time_range(replace(current, **changes))
+        if payload.work_day_id is not None:
+            await ensure_work_days_exist(self.workdays_repository, [payload.work_day_id])
+
+        updated = await self.workshifts_repository.update(work_shift_id, payload)
+        if not updated:
+            raise NotFoundError("Work shift not found")
+        await self.uow.commit()
+        return updated
@@ -0,0 +1,18 @@
+from typing import Iterable
+
+from src.domain.entities.work_shift import WorkShift
+from src.domain.errors import NotFoundError, ValidationError
+from src.interfaces.iworkdays_repository import IWorkdaysRepository
+
+
+def ensure_valid_time_range(work_shift: WorkShift) -> None:
+    if work_shift.end_time <= work_shift.start_time:
+        raise ValidationError("end_time must be after start_time")
+
+
+async def ensure_work_days_exist(workdays_repository: IWorkdaysRepository, work_day_ids: Iterable[int]) -> None:
+    # um unico WHERE id IN (...) para o lote inteiro; o primeiro id ausente vira o 404
+    requested = set(work_day_ids)
+    missing = requested - await workdays_repository.find_existing_ids(requested)
+    if missing:
+        raise NotFoundError(f"Workday {min(missing)} not found")
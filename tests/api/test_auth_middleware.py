@@ -24,3 +24,38 @@ async def test_protected_routes_require_access_token(client, method: str, path:
 
     assert response.status_code == 401
     assert response.json()["detail"] == "Access token not found"
+
+
+@pytest.mark.asyncio
+async def test_access_cookie_is_read_among_other_cookies(client):
+    from src.infra.security import create_access_token
+
+    response = await client.get(
+        "/workdays",
+        headers={"cookie": f"theme=dark; access_token={create_access_token('00000000-0000-0000-0000-000000000001')}; lang=pt"},
+    )
+
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_invalid_access_cookie_is_rejected(client):
+    response = await client.get("/workdays", headers={"cookie": "access_token=not-a-jwt"})
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Access token invalid or expired"
+
+
+@pytest.mark.asyncio
+async def test_public_paths_match_by_prefix(client):
+    assert (await client.get("/health")).status_code == 200
+    assert (await client.get("/docs")).status_code == 200
+    assert (await client.get("/healthz")).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_jwks_is_public_and_hides_the_shared_secret(client):
+    response = await client.get("/.well-known/jwks.json")
+
+    assert response.status_code == 200
+    assert response.json() == {"keys": []}
@@ -0,0 +1,47 @@
+import pytest
+
+from src.infra.settings.config import get_settings
+
+
+async def _register_and_login(client, email: str) -> str:
+    await client.post("/users/register", json={"first_name": "A", "last_name": "B", "email": email, "password": "secret", "active": True})
+    response = await client.post("/auth/login", json={"email": email, "password": "secret"})
+    assert response.status_code == 200
+    return client.cookies.get(get_settings().REFRESH_COOKIE_NAME)
+
+
+@pytest.mark.asyncio
+async def test_refresh_rotates_cookie(client):
+    settings = get_settings()
+    original = await _register_and_login(client, "refresh@b.com")
+
+    response = await client.post("/auth/refresh")
+
+    assert response.status_code == 200
+    rotated = client.cookies.get(settings.REFRESH_COOKIE_NAME)
+    assert rotated and rotated != original
+
+
+@pytest.mark.asyncio
+async def test_reusing_rotated_refresh_is_rejected(client):
+    settings = get_settings()
+    original = await _register_and_login(client, "refresh-reuse@b.com")
+    assert (await client.post("/auth/refresh")).status_code == 200
+    rotated = client.cookies.get(settings.REFRESH_COOKIE_NAME)
+
+    client.cookies.set(settings.REFRESH_COOKIE_NAME, original)
+    reused = await client.post("/auth/refresh")
+
+    assert reused.status_code == 401
+    # deteccao de reuso derruba tambem o token que acabou de ser emitido
+    client.cookies.set(settings.REFRESH_COOKIE_NAME, rotated)
+    assert (await client.post("/auth/refresh")).status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_refresh_with_malformed_jti_is_rejected(client):
+    client.cookies.set(get_settings().REFRESH_COOKIE_NAME, "not-a-uuid:raw")
+
+    response = await client.post("/auth/refresh")
+
+    assert response.status_code == 401
@@ -0,0 +1,62 @@
+import pytest
+
+from src.infra.repositories.user_company_roles_repository import UserCompanyRolesRepository
+from src.infra.security import create_access_token
+from src.infra.settings.config import get_settings
+
+
+async def _register_user(client, *, email: str):
+    payload = {"first_name": "A", "last_name": "B", "email": email, "password": "secret", "active": True}
+    response = await client.post("/users/register", json=payload)
+    assert response.status_code == 201
+    return response
+
+
+def _authenticate_client_with_access_cookie(client, user_id: str):
+    settings = get_settings()
+    client.cookies.set(settings.ACCESS_COOKIE_NAME, create_access_token(user_id))
+
+
+@pytest.mark.asyncio
+async def test_schedule_and_incremental_reschedule_after_holiday(client, db_session):
+    owner_id = (await _register_user(client, email="schedule-owner@b.com")).json()["id"]
+    nurse_ids = [(await _register_user(client, email=f"schedule-nurse-{i}@b.com")).json()["id"] for i in range(2)]
+    _authenticate_client_with_access_cookie(client, owner_id)
+
+    company_id = (await client.post("/companies/create", json={"name": "Schedule Co"})).json()["id"]
+    role = await client.post("/roles/create", json={"name": "Nurse", "company_id": company_id, "number_of_cooldown_days": 1})
+    assert role.status_code == 201
+    role_id = role.json()["id"]
+    for nurse_id in nurse_ids:
+        await UserCompanyRolesRepository(db_session).assign_user_and_role_to_company(nurse_id, company_id, role_id)
+
+    workdays = await client.post("/workdays/batch", json={"start_date": "2026-05-01T00:00:00Z", "end_date": "2026-05-06T00:00:00Z", "role_id": role_id})
+    shifts = [{"work_day_id": w["id"], "start_time": w["date"].replace("00:00:00", "08:00:00"), "end_time": w["date"].replace("00:00:00", "16:00:00")} for w in workdays.json()]
+    assert (await client.post("/workshifts/batch", json={"shifts": shifts})).status_code == 201
+
+    full = await client.post("/schedules", json={"company_id": company_id, "date_from": "2026-05-01T00:00:00Z", "date_to": "2026-05-06T00:00:00Z"})
+    assert full.status_code == 200
+    assert full.json()["assigned"] == 6
+    assert full.json()["load"] == {nurse_ids[0]: 3, nurse_ids[1]: 3}
+    assert len(full.json()["changes"]) == 6
+
+    holiday_id = workdays.json()[2]["id"]
+    assert (await client.patch(f"/workdays/{holiday_id}", json={"is_holiday": True})).status_code == 200
+
+    incremental = await client.post("/schedules/incremental", json={"company_id": company_id, "work_day_ids": [holiday_id]})
+    assert incremental.status_code == 200
+    changed = {c["shift_id"]: c["user_id"] for c in incremental.json()["changes"]}
+    holiday_shift = (await client.get("/workshifts", params={"work_day_id": holiday_id})).json()[0]
+    assert changed[holiday_shift["id"]] is None
+    assert holiday_shift["user_id"] is None
+    assert len(changed) <= 2
+
+    stranger_id = (await _register_user(client, email="schedule-stranger@b.com")).json()["id"]
+    _authenticate_client_with_access_cookie(client, stranger_id)
+    forbidden = await client.post("/schedules/incremental", json={"company_id": company_id, "work_day_ids": [holiday_id]})
+    assert forbidden.status_code == 403
+
+    # o estranho e dono da propria empresa, mas o dia pertence a outra: responde como inexistente
+    own_company_id = (await client.post("/companies/create", json={"name": "Stranger Co"})).json()["id"]
+    foreign = await client.post("/schedules/incremental", json={"company_id": own_company_id, "work_day_ids": [holiday_id]})
+    assert foreign.status_code == 404
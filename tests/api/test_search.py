@@ -0,0 +1,63 @@
+import pytest
+from sqlalchemy import text
+
+from src.infra.repositories import search_repository
+
+
+async def _register_user(client, *, email: str, first_name: str = "A", last_name: str = "B"):
+    payload = {"first_name": first_name, "last_name": last_name, "email": email, "password": "secret", "active": True}
+    response = await client.post("/users/register", json=payload)
+    assert response.status_code == 201
+    return response
+
+
+async def _login_user(client, *, email: str, password: str):
+    response = await client.post("/auth/login", json={"email": email, "password": password})
+    assert response.status_code == 200
+    return response
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_users_and_companies(client, db_session):
+    if not await db_session.scalar(text("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")):
+        pytest.skip("pg_trgm is not installed on the test database")
+    await _register_user(client, email="searcher@b.com")
+    await _register_user(client, email="jorge.silva@b.com", first_name="Jorge", last_name="Silva")
+    await _login_user(client, email="searcher@b.com", password="secret")
+    assert (await client.post("/companies/create", json={"name": "Padaria Sao Jorge"})).status_code == 201
+    assert (await client.post("/companies/create", json={"name": "Oficina Central"})).status_code == 201
+
+    res = await client.get("/search", params={"q": "jorge"})
+    assert res.status_code == 200
+    items = res.json()["items"]
+    assert {(item["kind"], item["label"]) for item in items} == {("user", "Jorge Silva"), ("company", "Padaria Sao Jorge")}
+    assert all(item["score"] >= 0.6 for item in items)
+
+    companies = await client.get("/search", params={"q": "padaria", "type": "companies", "limit": 1})
+    assert [item["label"] for item in companies.json()["items"]] == ["Padaria Sao Jorge"]
+
+
+@pytest.mark.asyncio
+async def test_search_requires_auth_and_a_query(client):
+    assert (await client.get("/search", params={"q": "jorge"})).status_code == 401
+
+    await _register_user(client, email="search-short@b.com")
+    await _login_user(client, email="search-short@b.com", password="secret")
+    assert (await client.get("/search", params={"q": " j "})).status_code == 400
+    assert (await client.get("/search", params={"q": "jorge", "type": "roles"})).status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_search_returns_503_without_pg_trgm(client, monkeypatch):
+    monkeypatch.setattr(search_repository, "_TRGM_INSTALLED", set())
+
+    async def _not_installed(self):
+        return False
+
+    monkeypatch.setattr(search_repository.SearchRepository, "_pg_trgm_installed", _not_installed)
+    await _register_user(client, email="search-503@b.com")
+    await _login_user(client, email="search-503@b.com", password="secret")
+
+    res = await client.get("/search", params={"q": "jorge"})
+    assert res.status_code == 503
+    assert "pg_trgm" in res.json()["detail"]
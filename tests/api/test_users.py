@@ -80,10 +80,39 @@ async def test_list_users_success(client):
 
     res = await client.get("/users")
     assert res.status_code == 200
-    users = res.json()
+    users = res.json()["items"]
     assert any(user["email"] == "list@b.com" for user in users)
 
 
+@pytest.mark.asyncio
+async def test_list_users_paginates_filters_and_projects(client):
+    for i in range(3):
+        await _register_user(client, email=f"page-{i}@b.com")
+    await _register_user(client, email="other-page@b.com")
+    await _login_user(client, email="page-0@b.com", password="secret")
+
+    first = await client.get("/users", params={"email": "page-", "fields": "id,email", "limit": 2})
+    assert first.status_code == 200
+    assert all(set(user) == {"id", "email"} for user in first.json()["items"])
+    assert first.json()["next_cursor"]
+
+    second = await client.get("/users", params={"email": "page-", "fields": "id,email", "limit": 2, "cursor": first.json()["next_cursor"]})
+    assert second.status_code == 200
+    assert second.json()["next_cursor"] is None
+
+    emails = [user["email"] for user in first.json()["items"] + second.json()["items"]]
+    assert sorted(emails) == ["page-0@b.com", "page-1@b.com", "page-2@b.com"]
+
+
+@pytest.mark.asyncio
+async def test_list_users_rejects_unknown_fields_and_bad_cursor(client):
+    await _register_user(client, email="list-bad@b.com")
+    await _login_user(client, email="list-bad@b.com", password="secret")
+
+    assert (await client.get("/users", params={"fields": "id,hashed_password"})).status_code == 400
+    assert (await client.get("/users", params={"cursor": "not-a-cursor"})).status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_retrieve_user_not_found(client):
     await _register_user(client, email="retrieve@b.com")
@@ -0,0 +1,99 @@
+import pytest
+
+from src.infra.repositories.roles_repository import RolesRepository
+from src.infra.security import create_access_token
+from src.infra.settings.config import get_settings
+
+
+async def _register_user(client, *, email: str):
+    payload = {"first_name": "A", "last_name": "B", "email": email, "password": "secret", "active": True}
+    response = await client.post("/users/register", json=payload)
+    assert response.status_code == 201
+    return response
+
+
+def _authenticate_client_with_access_cookie(client, user_id: str):
+    settings = get_settings()
+    client.cookies.set(settings.ACCESS_COOKIE_NAME, create_access_token(user_id))
+
+
+@pytest.mark.asyncio
+async def test_list_workdays_returns_cursor_pages_for_role(client, db_session):
+    user_res = await _register_user(client, email="workdays-list@b.com")
+    _authenticate_client_with_access_cookie(client, user_res.json()["id"])
+    role = await RolesRepository(db_session).create(company_id=None, name="Role", number_of_cooldown_days=0)  # type: ignore[arg-type]
+
+    batch_res = await client.post(
+        "/workdays/batch",
+        json={"start_date": "2026-01-01T00:00:00Z", "end_date": "2026-01-05T00:00:00Z", "role_id": role.id},
+    )
+    assert batch_res.status_code == 200
+
+    first = await client.get("/workdays", params={"role_id": role.id, "limit": 3})
+    assert first.status_code == 200
+    assert len(first.json()["items"]) == 3
+    assert first.json()["next_cursor"]
+
+    second = await client.get("/workdays", params={"role_id": role.id, "limit": 3, "cursor": first.json()["next_cursor"]})
+    assert second.status_code == 200
+    assert [w["date"][:10] for w in second.json()["items"]] == ["2026-01-04", "2026-01-05"]
+    assert second.json()["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_workdays_rejects_invalid_cursor(client):
+    user_res = await _register_user(client, email="workdays-cursor@b.com")
+    _authenticate_client_with_access_cookie(client, user_res.json()["id"])
+
+    res = await client.get("/workdays", params={"cursor": "not-a-cursor"})
+    assert res.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_import_workdays_streams_ndjson_and_reports_counts(client, db_session):
+    user_res = await _register_user(client, email="workdays-import@b.com")
+    _authenticate_client_with_access_cookie(client, user_res.json()["id"])
+    role = await RolesRepository(db_session).create(company_id=None, name="Role", number_of_cooldown_days=0)  # type: ignore[arg-type]
+
+    body = "\n".join(f'{{"role_id": "{role.id}", "date": "2026-09-{day:02d}T00:00:00Z"}}' for day in range(1, 11))
+    res = await client.post("/workdays/import", content=body, headers={"content-type": "application/x-ndjson"})
+
+    assert res.status_code == 200
+    assert res.json() == {"received": 10, "inserted": 10, "updated": 0, "skipped": 0}
+
+    csv_body = f"role_id,date,is_holiday\n{role.id},2026-09-01T00:00:00Z,true\n{role.id},2026-09-11T00:00:00Z,false\n"
+    res = await client.post("/workdays/import", params={"conflict": "skip"}, content=csv_body, headers={"content-type": "text/csv"})
+
+    assert res.status_code == 200
+    assert res.json() == {"received": 2, "inserted": 1, "updated": 0, "skipped": 1}
+
+
+@pytest.mark.asyncio
+async def test_update_workday_onto_an_existing_role_date_is_a_conflict(client, db_session):
+    user_res = await _register_user(client, email="workdays-update@b.com")
+    _authenticate_client_with_access_cookie(client, user_res.json()["id"])
+    role = await RolesRepository(db_session).create(company_id=None, name="Role", number_of_cooldown_days=0)  # type: ignore[arg-type]
+    batch_res = await client.post("/workdays/batch", json={"start_date": "2026-03-02T00:00:00Z", "end_date": "2026-03-03T00:00:00Z", "role_id": role.id})
+    first, second = batch_res.json()
+
+    res = await client.patch(f"/workdays/{second['id']}", json={"date": first["date"]})
+    assert res.status_code == 409
+
+    # a transacao segue utilizavel e o dia nao mudou
+    moved = await client.patch(f"/workdays/{second['id']}", json={"is_holiday": True})
+    assert moved.status_code == 200
+    assert (moved.json()["date"], moved.json()["is_holiday"]) == (second["date"], True)
+    unknown_role = await client.patch(f"/workdays/{second['id']}", json={"role_id": "00000000-0000-0000-0000-000000000001"})
+    assert unknown_role.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_import_workdays_rejects_unknown_role_ids(client):
+    user_res = await _register_user(client, email="workdays-import-role@b.com")
+    _authenticate_client_with_access_cookie(client, user_res.json()["id"])
+    unknown = "00000000-0000-0000-0000-000000000001"
+
+    body = f'{{"role_id": "{unknown}", "date": "2026-11-02T00:00:00Z", "is_holiday": false}}\n'
+    res = await client.post("/workdays/import", content=body, headers={"content-type": "application/x-ndjson"})
+    assert res.status_code == 400
+    assert unknown in res.json()["detail"]
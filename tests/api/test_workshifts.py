@@ -0,0 +1,62 @@
+import pytest
+
+from src.infra.repositories.roles_repository import RolesRepository
+from src.infra.security import create_access_token
+from src.infra.settings.config import get_settings
+
+
+async def _register_user(client, *, email: str):
+    payload = {"first_name": "A", "last_name": "B", "email": email, "password": "secret", "active": True}
+    response = await client.post("/users/register", json=payload)
+    assert response.status_code == 201
+    return response
+
+
+def _authenticate_client_with_access_cookie(client, user_id: str):
+    settings = get_settings()
+    client.cookies.set(settings.ACCESS_COOKIE_NAME, create_access_token(user_id))
+
+
+async def _create_workday(client, db_session) -> int:
+    role = await RolesRepository(db_session).create(company_id=None, name="Role", number_of_cooldown_days=0)  # type: ignore[arg-type]
+    res = await client.post("/workdays/batch", json={"start_date": "2026-04-01T00:00:00Z", "end_date": "2026-04-01T00:00:00Z", "role_id": role.id})
+    assert res.status_code == 200
+    return res.json()[0]["id"]
+
+
+@pytest.mark.asyncio
+async def test_workshift_crud_and_overlap_conflicts(client, db_session):
+    user_res = await _register_user(client, email="workshifts@b.com")
+    _authenticate_client_with_access_cookie(client, user_res.json()["id"])
+    work_day_id = await _create_workday(client, db_session)
+
+    batch = await client.post(
+        "/workshifts/batch",
+        json={
+            "shifts": [
+                {"work_day_id": work_day_id, "start_time": "2026-04-01T08:00:00Z", "end_time": "2026-04-01T12:00:00Z"},
+                {"work_day_id": work_day_id, "start_time": "2026-04-01T13:00:00Z", "end_time": "2026-04-01T18:00:00Z"},
+            ]
+        },
+    )
+    assert batch.status_code == 201
+    morning_id = batch.json()[0]["id"]
+
+    overlapping = {"work_day_id": work_day_id, "start_time": "2026-04-01T11:00:00Z", "end_time": "2026-04-01T14:00:00Z"}
+    conflicts = await client.post("/workshifts/conflicts", json={"shifts": [overlapping]})
+    assert conflicts.status_code == 200
+    assert len(conflicts.json()) == 2
+
+    assert (await client.post("/workshifts", json=overlapping)).status_code == 409
+    assert (await client.post("/workshifts", json={**overlapping, "end_time": "2026-04-01T10:00:00Z"})).status_code == 400
+    assert (await client.post("/workshifts", json={**overlapping, "work_day_id": 999999})).status_code == 404
+
+    listed = await client.get("/workshifts", params={"work_day_id": work_day_id, "from": "2026-04-01T09:00:00Z", "to": "2026-04-01T10:00:00Z"})
+    assert [s["id"] for s in listed.json()] == [morning_id]
+
+    patched = await client.patch(f"/workshifts/{morning_id}", json={"start_time": "2026-04-01T07:00:00Z"})
+    assert patched.status_code == 200
+    assert patched.json()["start_time"].startswith("2026-04-01T07:00:00")
+
+    assert (await client.delete(f"/workshifts/{morning_id}")).status_code == 200
+    assert len((await client.get("/workshifts", params={"work_day_id": work_day_id})).json()) == 1
@@ -0,0 +1,42 @@
+import pytest
+from sqlalchemy import exc, text
+
+from src.infra.db.engine_factory import EngineOptions, build_engine, connection_budget_warning
+
+
+def test_connection_budget_warning_uses_workers_times_pool_size():
+    assert connection_budget_warning(EngineOptions(workers=4, pool_size=5, connection_budget=0)) is None
+    assert connection_budget_warning(EngineOptions(workers=4, pool_size=5, max_overflow=0, connection_budget=20)) is None
+
+    oversubscribed = connection_budget_warning(EngineOptions(workers=4, pool_size=10, connection_budget=20))
+    assert oversubscribed is not None and "40 connections > budget 20" in oversubscribed
+
+    peak = connection_budget_warning(EngineOptions(workers=4, pool_size=5, max_overflow=10, connection_budget=20))
+    assert peak is not None and "60 > budget 20" in peak
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_engine_applies_pool_options_and_records_checkout_metrics(async_engine):
+    options = EngineOptions(pool_size=1, max_overflow=0, pool_timeout_seconds=0.2, statement_timeout_ms=1500, statement_cache_size=0)
+    engine, metrics = build_engine(async_engine.url.render_as_string(hide_password=False), options)
+    assert metrics is not None
+    try:
+        async with engine.connect() as conn:
+            assert await conn.scalar(text("SHOW statement_timeout")) == "1500ms"
+            assert metrics.snapshot(engine.pool)["in_use"] == 1
+
+            # pool cheio: o segundo checkout espera pool_timeout e falha
+            with pytest.raises(exc.TimeoutError):
+                async with engine.connect():
+                    pass
+
+        snapshot = metrics.snapshot(engine.pool)
+        assert snapshot["checkouts"] == 1
+        assert snapshot["timeouts"] == 1
+        assert snapshot["wait_seconds_max"] >= 0.2
+        assert snapshot["in_use"] == 0
+        assert snapshot["overflow"] == 0
+    finally:
+        await engine.dispose()
+
@@ -0,0 +1,175 @@
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event, update
+
+from src.infra.db.models.refresh_token import RefreshToken
+from src.infra.repositories.jwt_repository import JWTRepository
+from src.infra.repositories.users_repository import UsersRepository
+from src.infra.services.refresh_token_purge_job import RefreshTokenPurgeJob
+
+
+async def _create_user(db_session, email: str) -> str:
+    user = await UsersRepository(db_session).create(first_name="Token", last_name="Owner", email=email, hashed_password="hashed", active=True)
+    return user.id
+
+
+async def _save(repo: JWTRepository, user_id: str, token_hash: str, expires_in: timedelta = timedelta(days=1)) -> str:
+    jti = str(uuid.uuid4())
+    await repo.save_refresh_token(jti=jti, user_id=user_id, token_hash=token_hash, expires_at=datetime.now(timezone.utc) + expires_in)
+    return jti
+
+
+async def _rotate(repo: JWTRepository, jti: str, token_hash: str):
+    new_jti = str(uuid.uuid4())
+    now = datetime.now(timezone.utc)
+    result = await repo.rotate_refresh_token(
+        jti=jti, token_hash=token_hash, new_jti=new_jti, new_token_hash=f"{token_hash}-next", new_expires_at=now + timedelta(days=1), now=now
+    )
+    return result, new_jti
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_save_only_flushes_and_reads_created_at_from_returning(db_session):
+    repo = JWTRepository(db_session)
+    user_id = await _create_user(db_session, "returning@b.com")
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sync_engine = db_session.get_bind().engine
+    event.listen(sync_engine, "before_cursor_execute", _count)
+    try:
+        token = await repo.save_refresh_token(jti=str(uuid.uuid4()), user_id=user_id, token_hash="hash", expires_at=datetime.now(timezone.utc) + timedelta(days=1))
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", _count)
+
+    # um INSERT ... RETURNING, sem commit nem SELECT de refresh()
+    assert len(statements) == 1 and "RETURNING refresh_tokens.created_at" in statements[0]
+    assert db_session.in_transaction()
+    assert token.created_at is not None
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_rotate_revokes_user_sessions_and_chains_replaced_by(db_session):
+    repo = JWTRepository(db_session)
+    user_id = await _create_user(db_session, "rotate@b.com")
+    jti = await _save(repo, user_id, "hash-a")
+    other_jti = await _save(repo, user_id, "hash-b")
+
+    result, new_jti = await _rotate(repo, jti, "hash-a")
+
+    assert result.status == "rotated"
+    assert result.user_id == user_id
+    old, other, new = await repo.get_by_jti(jti), await repo.get_by_jti(other_jti), await repo.get_by_jti(new_jti)
+    assert old.revoked is True and old.replaced_by == new_jti
+    assert other.revoked is True and other.replaced_by is None
+    assert new is not None and new.revoked is False and new.token_hash == "hash-a-next"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_rotating_twice_is_reported_as_reuse(db_session):
+    repo = JWTRepository(db_session)
+    user_id = await _create_user(db_session, "reuse@b.com")
+    jti = await _save(repo, user_id, "hash-a")
+
+    first, new_jti = await _rotate(repo, jti, "hash-a")
+    second, second_jti = await _rotate(repo, jti, "hash-a")
+
+    assert first.status == "rotated"
+    assert second.status == "reused"
+    assert (await repo.get_by_jti(new_jti)).revoked is True
+    assert await repo.get_by_jti(second_jti) is None
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_rotate_with_wrong_hash_revokes_everything(db_session):
+    repo = JWTRepository(db_session)
+    user_id = await _create_user(db_session, "invalid@b.com")
+    jti = await _save(repo, user_id, "hash-a")
+
+    result, new_jti = await _rotate(repo, jti, "forged")
+
+    assert result.status == "invalid"
+    assert (await repo.get_by_jti(jti)).revoked is True
+    assert await repo.get_by_jti(new_jti) is None
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_rotate_expired_token_revokes_nothing(db_session):
+    repo = JWTRepository(db_session)
+    user_id = await _create_user(db_session, "expired@b.com")
+    jti = await _save(repo, user_id, "hash-a", expires_in=timedelta(minutes=-1))
+    other_jti = await _save(repo, user_id, "hash-b")
+
+    result, new_jti = await _rotate(repo, jti, "hash-a")
+
+    assert result.status == "expired"
+    assert (await repo.get_by_jti(other_jti)).revoked is False
+    assert await repo.get_by_jti(new_jti) is None
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_rotate_unknown_or_malformed_jti(db_session):
+    repo = JWTRepository(db_session)
+
+    unknown, _ = await _rotate(repo, str(uuid.uuid4()), "hash-a")
+    malformed, _ = await _rotate(repo, "not-a-uuid", "hash-a")
+
+    assert unknown.status == "not_found"
+    assert malformed.status == "not_found"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_purge_job_deletes_expired_and_old_revoked_tokens_in_batches(db_session):
+    repo = JWTRepository(db_session)
+    user_id = await _create_user(db_session, "purge@b.com")
+    expired = [await _save(repo, user_id, f"expired-{i}", expires_in=timedelta(minutes=-5)) for i in range(3)]
+    old_revoked = await _save(repo, user_id, "old-revoked")
+    recent_revoked = await _save(repo, user_id, "recent-revoked")
+    active = await _save(repo, user_id, "active")
+    await db_session.execute(
+        update(RefreshToken).where(RefreshToken.id == uuid.UUID(old_revoked)).values(revoked=True, created_at=datetime.now(timezone.utc) - timedelta(days=30))
+    )
+    await db_session.execute(update(RefreshToken).where(RefreshToken.id == uuid.UUID(recent_revoked)).values(revoked=True))
+
+    @asynccontextmanager
+    async def _session_factory():
+        yield db_session
+
+    job = RefreshTokenPurgeJob(_session_factory, batch_size=2, revoked_retention=timedelta(days=7))
+    deleted = await job.run_once()
+
+    assert deleted == 4
+    assert job.metrics()["deleted"] == 4
+    for jti in [*expired, old_revoked]:
+        assert await repo.get_by_jti(jti) is None
+    # revogado recente continua para a deteccao de reuso
+    assert (await repo.get_by_jti(recent_revoked)).revoked is True
+    assert await repo.get_by_jti(active) is not None
+
+
+@pytest.mark.asyncio
+async def test_purge_job_start_and_stop_are_idempotent():
+    job = RefreshTokenPurgeJob(session_factory=lambda: None, interval_seconds=3600)
+    job.start()
+    job.start()
+    assert job.metrics()["running"] is True
+
+    await job.stop()
+    await job.stop()
+    assert job.metrics()["running"] is False
+
+    disabled = RefreshTokenPurgeJob(session_factory=lambda: None, interval_seconds=0)
+    disabled.start()
+    assert disabled.metrics()["running"] is False
@@ -0,0 +1,166 @@
+import uuid
+
+import pytest
+from sqlalchemy import delete, event, select
+
+from src.infra.db.models.user_company_role import UserCompanyRole
+from src.infra.db.replica_routing import READ_REPLICA_INFO_KEY
+from src.infra.db.unit_of_work import SqlAlchemyUnitOfWork
+from src.infra.repositories.companies_repository import CompaniesRepository
+from src.infra.repositories.permissions_query_service import PermissionsQueryService
+from src.infra.repositories.user_company_requests_repository import UserCompanyRequestsRepository
+from src.infra.repositories.user_company_roles_repository import UserCompanyRolesRepository
+from src.infra.repositories.users_repository import UsersRepository
+from src.infra.services.membership_cache import InProcessCacheBackend, MembershipCache
+
+
+async def _create_user(db_session, email: str) -> str:
+    user = await UsersRepository(db_session).create(first_name="Perm", last_name="User", email=email, hashed_password="hashed", active=True)
+    return user.id
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_is_company_owner_answers_with_exists(db_session):
+    owner_id = await _create_user(db_session, "perm-owner@b.com")
+    member_id = await _create_user(db_session, "perm-member@b.com")
+    company = await CompaniesRepository(db_session).create(name="Perm Co", owner_id=owner_id)
+    service = PermissionsQueryService(db_session)
+
+    assert await service.is_company_owner(owner_id, company.id) is True
+    assert await service.is_company_owner(member_id, company.id) is False
+    assert await service.is_company_owner(owner_id, "not-a-uuid") is False
+    assert await service.user_exists(member_id) is True
+    assert await service.user_exists(str(uuid.uuid4())) is False
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_is_company_owner_is_memoized_per_instance(db_session):
+    owner_id = await _create_user(db_session, "perm-memo@b.com")
+    company = await CompaniesRepository(db_session).create(name="Memo Co", owner_id=owner_id)
+    service = PermissionsQueryService(db_session)
+
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sync_engine = db_session.get_bind().engine
+    event.listen(sync_engine, "before_cursor_execute", _count)
+    try:
+        for _ in range(3):
+            assert await service.is_company_owner(owner_id, company.id) is True
+        assert await service.user_exists(owner_id) is True
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", _count)
+
+    assert len(statements) == 1
+
+    # outra request (outra instancia) ve o estado atual do banco
+    await db_session.execute(delete(UserCompanyRole).where(UserCompanyRole.user_id == owner_id))
+    assert await PermissionsQueryService(db_session).is_company_owner(owner_id, company.id) is False
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_membership_cache_is_shared_across_requests(db_session):
+    owner_id = await _create_user(db_session, "perm-cache@b.com")
+    cache = MembershipCache(InProcessCacheBackend())
+    company = await CompaniesRepository(db_session, cache).create(name="Cache Co", owner_id=owner_id)
+
+    assert await PermissionsQueryService(db_session, cache).is_company_owner(owner_id, company.id) is True
+
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sync_engine = db_session.get_bind().engine
+    event.listen(sync_engine, "before_cursor_execute", _count)
+    try:
+        service = PermissionsQueryService(db_session, cache)
+        assert await service.is_company_owner(owner_id, company.id) is True
+        assert await service.is_company_member(owner_id, company.id) is True
+        assert await service.user_exists(owner_id) is True
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", _count)
+
+    assert statements == []
+    assert cache.metrics()["hits"] == 1
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_membership_cache_is_invalidated_by_repository_writes(db_session):
+    owner_id = await _create_user(db_session, "perm-inv-owner@b.com")
+    member_id = await _create_user(db_session, "perm-inv-member@b.com")
+    cache = MembershipCache(InProcessCacheBackend())
+    companies = CompaniesRepository(db_session, cache)
+    links = UserCompanyRolesRepository(db_session, cache)
+    requests = UserCompanyRequestsRepository(db_session, cache)
+    uow = SqlAlchemyUnitOfWork(db_session)
+    company = await companies.create(name="Inv Co", owner_id=owner_id)
+    await uow.commit()
+
+    async def is_member() -> bool:
+        return await PermissionsQueryService(db_session, cache).is_company_member(member_id, company.id)
+
+    assert await is_member() is False
+
+    await links.assign_user_and_role_to_company(user_id=member_id, company_id=company.id, role_id=None)
+    await uow.commit()
+    assert await is_member() is True
+
+    register_id = await db_session.scalar(select(UserCompanyRole.id).where(UserCompanyRole.user_id == member_id))
+    await links.remove_user_company_role_register(str(register_id))
+    await uow.commit()
+    assert await is_member() is False
+
+    request = await requests.create(user_id=member_id, company_id=company.id)
+    await requests.approve(request_id=request.id, role_id=None)
+    await uow.commit()
+    assert await is_member() is True
+
+    await companies.delete(company.id)
+    await uow.commit()
+    assert await is_member() is False
+    assert await PermissionsQueryService(db_session, cache).is_company_owner(owner_id, company.id) is False
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_membership_cache_is_kept_until_the_unit_of_work_commits(db_session):
+    owner_id = await _create_user(db_session, "perm-uow-owner@b.com")
+    member_id = await _create_user(db_session, "perm-uow-member@b.com")
+    cache = MembershipCache(InProcessCacheBackend())
+    uow = SqlAlchemyUnitOfWork(db_session)
+    company = await CompaniesRepository(db_session, cache).create(name="Uow Co", owner_id=owner_id)
+    await uow.commit()
+    assert await PermissionsQueryService(db_session, cache).is_company_member(member_id, company.id) is False
+    invalidations = cache.metrics()["invalidations"]
+
+    await UserCompanyRolesRepository(db_session, cache).assign_user_and_role_to_company(user_id=member_id, company_id=company.id, role_id=None)
+    assert cache.metrics()["invalidations"] == invalidations
+
+    await uow.rollback()
+    assert cache.metrics()["invalidations"] == invalidations
+    assert await PermissionsQueryService(db_session, cache).is_company_member(member_id, company.id) is False
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_memberships_read_from_a_replica_are_not_cached(db_session):
+    owner_id = await _create_user(db_session, "perm-replica@b.com")
+    cache = MembershipCache(InProcessCacheBackend())
+    company = await CompaniesRepository(db_session, cache).create(name="Replica Co", owner_id=owner_id)
+
+    db_session.info[READ_REPLICA_INFO_KEY] = True
+    try:
+        assert await PermissionsQueryService(db_session, cache).is_company_owner(owner_id, company.id) is True
+    finally:
+        db_session.info.pop(READ_REPLICA_INFO_KEY)
+    assert await cache.get(owner_id) is None
+
+    assert await PermissionsQueryService(db_session, cache).is_company_owner(owner_id, company.id) is True
+    assert await cache.get(owner_id) == {company.id: True}
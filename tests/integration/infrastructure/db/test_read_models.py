@@ -0,0 +1,46 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from src.domain.entities.work_day import WorkDay
+from src.infra.repositories.companies_repository import CompaniesRepository
+from src.infra.repositories.roles_repository import RolesRepository
+from src.infra.repositories.user_company_requests_repository import UserCompanyRequestsRepository
+from src.infra.repositories.user_company_roles_repository import UserCompanyRolesRepository
+from src.infra.repositories.users_repository import UsersRepository
+from src.infra.repositories.workdays_repository import WorkdaysRepository
+from src.interfaces.types.workday_types import WorkdayListFilters
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_listings_map_rows_without_loading_orm_entities(db_session):
+    owner = await UsersRepository(db_session).create(first_name="Ana", last_name="Lima", email="light-owner@b.com", hashed_password="hashed", active=True)
+    member = await UsersRepository(db_session).create(first_name="Bia", last_name="Reis", email="light-member@b.com", hashed_password="hashed", active=False)
+    company = await CompaniesRepository(db_session).create(name="Light Co", owner_id=owner.id)
+    role = await RolesRepository(db_session).create(company_id=company.id, name="Nurse", number_of_cooldown_days=2)
+    await WorkdaysRepository(db_session).create(WorkDay(id=None, role_id=role.id, date=datetime(2026, 5, 4, tzinfo=timezone.utc), is_holiday=False, weekday=0))
+    await UserCompanyRolesRepository(db_session).assign_user_and_role_to_company(user_id=member.id, company_id=company.id, role_id=role.id)
+    await UserCompanyRequestsRepository(db_session).create(user_id=member.id, company_id=company.id)
+    # so as listagens daqui para frente: nenhuma entidade pode voltar para o identity map
+    db_session.expunge_all()
+
+    roles = await RolesRepository(db_session).list()
+    companies = await CompaniesRepository(db_session).list()
+    page = await WorkdaysRepository(db_session).list(WorkdayListFilters(role_id=role.id))
+    by_company = await UserCompanyRolesRepository(db_session).list_users_and_roles_by_company(company.id)
+    by_user = await UserCompanyRolesRepository(db_session).list_companies_and_roles_by_user(owner.id)
+    requests = await UserCompanyRequestsRepository(db_session).list_by_company(company.id)
+
+    assert len(db_session.identity_map) == 0
+    assert role in roles and company in companies
+    assert [(w.role_id, w.weekday) for w in page.items] == [(role.id, 0)]
+
+    links = {link.user.id: link for link in by_company}
+    assert links[member.id].role is not None and links[member.id].role.number_of_cooldown_days == 2
+    assert (links[member.id].user.name, links[member.id].user.active, links[member.id].is_owner) == ("Bia.Reis", False, False)
+    # vinculo do dono nao tem cargo: o LEFT JOIN volta None, nao um RoleDTO vazio
+    assert links[owner.id].is_owner is True and links[owner.id].role is None
+    assert [(c.company.id, c.is_owner, c.role) for c in by_user] == [(company.id, True, None)]
+
+    assert [(r.user.id, r.user.email, r.company_id) for r in requests] == [(member.id, "light-member@b.com", company.id)]
@@ -0,0 +1,85 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+from starlette.requests import Request
+
+from src.infra.db.engine_factory import EngineOptions, build_engine
+from src.infra.db.replica_routing import ReplicaRouter, is_replica_session
+from src.infra.db.unit_of_work import SqlAlchemyUnitOfWork
+from src.infra.settings import connection
+
+
+def _request(method: str, user_id: str, cookie: str = "") -> Request:
+    headers = [(b"cookie", cookie.encode())] if cookie else []
+    return Request({"type": "http", "method": method, "path": "/", "headers": headers, "client": ("10.0.0.1", 1234), "state": {"user_id": user_id}})
+
+
+async def _statement_timeout(method: str, user_id: str, cookie: str = "") -> str:
+    sessions = connection.get_db_session(_request(method, user_id, cookie))
+    session = await sessions.__anext__()
+    try:
+        timeout = await session.scalar(text("SHOW statement_timeout"))
+        assert is_replica_session(session) is (timeout == "1234ms")
+        return timeout
+    finally:
+        await sessions.aclose()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_get_db_session_routes_reads_to_the_replica_pool(async_engine, monkeypatch):
+    url = async_engine.url.render_as_string(hide_password=False)
+    # mesmo banco nas duas URLs; o statement_timeout diferente identifica qual pool atendeu
+    primary, _ = build_engine(url, EngineOptions(pool_size=1, statement_timeout_ms=0))
+    replica, _ = build_engine(url, EngineOptions(pool_size=1, statement_timeout_ms=1234))
+    router = ReplicaRouter(
+        sessionmaker(primary, class_=AsyncSession, expire_on_commit=False),  # type: ignore
+        [sessionmaker(replica, class_=AsyncSession, expire_on_commit=False)],  # type: ignore
+        sticky_seconds=60,
+    )
+    monkeypatch.setattr(connection, "replica_router", router)
+    try:
+        assert await _statement_timeout("GET", "user-a") == "1234ms"
+        assert await _statement_timeout("POST", "user-a") == "0"
+        # leitura logo apos a escrita do mesmo usuario fica no primario
+        assert await _statement_timeout("GET", "user-a") == "0"
+        assert await _statement_timeout("GET", "user-b") == "1234ms"
+    finally:
+        await primary.dispose()
+        await replica.dispose()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_committed_write_hands_a_primary_deadline_to_other_workers(async_engine, monkeypatch):
+    url = async_engine.url.render_as_string(hide_password=False)
+    primary, _ = build_engine(url, EngineOptions(pool_size=1, statement_timeout_ms=0))
+    replica, _ = build_engine(url, EngineOptions(pool_size=1, statement_timeout_ms=1234))
+
+    def _router() -> ReplicaRouter:
+        return ReplicaRouter(
+            sessionmaker(primary, class_=AsyncSession, expire_on_commit=False),  # type: ignore
+            [sessionmaker(replica, class_=AsyncSession, expire_on_commit=False)],  # type: ignore
+            sticky_seconds=60,
+        )
+
+    monkeypatch.setattr(connection, "replica_router", _router())
+    try:
+        request = _request("POST", "user-a")
+        sessions = connection.get_db_session(request)
+        session = await sessions.__anext__()
+        try:
+            assert getattr(request.state, connection.PRIMARY_UNTIL_STATE, None) is None
+            await SqlAlchemyUnitOfWork(session).commit()
+        finally:
+            await sessions.aclose()
+        deadline = getattr(request.state, connection.PRIMARY_UNTIL_STATE)
+
+        # outro worker: janela local vazia, so o cookie leva a leitura ao primario
+        monkeypatch.setattr(connection, "replica_router", _router())
+        assert await _statement_timeout("GET", "user-a") == "1234ms"
+        assert await _statement_timeout("GET", "user-a", f"{connection.PRIMARY_UNTIL_COOKIE}={deadline:.3f}") == "0"
+    finally:
+        await primary.dispose()
+        await replica.dispose()
@@ -0,0 +1,30 @@
+import pytest
+from sqlalchemy import text
+
+from src.infra.repositories import search_repository
+from src.infra.repositories.companies_repository import CompaniesRepository
+from src.infra.repositories.search_repository import SearchRepository
+from src.infra.repositories.users_repository import UsersRepository
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_trigram_search_runs_in_the_database(db_session, monkeypatch):
+    if not await db_session.scalar(text("SELECT EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm')")):
+        pytest.skip("pg_trgm is not available on this server")
+    # a extensao criada aqui some no rollback do teste: o cache positivo nao pode vazar para os outros testes
+    monkeypatch.setattr(search_repository, "_TRGM_INSTALLED", set())
+    await db_session.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+    owner = await UsersRepository(db_session).create(first_name="Jorge", last_name="Silva", email="jorge.trgm@b.com", hashed_password="hashed", active=True)
+    await UsersRepository(db_session).create(first_name="Ana", last_name="Lima", email="ana.trgm@b.com", hashed_password="hashed", active=True)
+    company = await CompaniesRepository(db_session).create(name="Padaria Sao Jorge", owner_id=owner.id)
+    await CompaniesRepository(db_session).create(name="Oficina Central", owner_id=owner.id)
+    repo = SearchRepository(db_session)
+
+    users = await repo.search_users("jorge", 10)
+    companies = await repo.search_companies("padaria", 1)
+
+    assert [(hit.id, hit.label, hit.detail) for hit in users] == [(str(owner.id), "Jorge Silva", "jorge.trgm@b.com")]
+    assert users[0].score >= 0.6
+    assert [(hit.id, hit.label) for hit in companies] == [(str(company.id), "Padaria Sao Jorge")]
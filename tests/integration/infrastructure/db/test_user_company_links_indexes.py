@@ -0,0 +1,102 @@
+import pytest
+from sqlalchemy import text
+
+from src.domain.errors import AlreadyExistsError
+from src.infra.repositories.companies_repository import CompaniesRepository
+from src.infra.repositories.user_company_requests_repository import UserCompanyRequestsRepository
+from src.infra.repositories.user_company_roles_repository import UserCompanyRolesRepository
+from src.infra.repositories.users_repository import UsersRepository
+
+USERS = 400
+COMPANIES = 80
+LINKS_PER_USER = 3
+
+# ids deterministicos (md5 -> uuid) para os parametros do EXPLAIN
+SEED_SQL = [
+    """
+    INSERT INTO users (id, first_name, last_name, email, hashed_password, active)
+    SELECT md5('idx-user-' || i)::uuid, 'Idx', 'User', 'idx-user-' || i || '@b.com', 'hashed', true
+    FROM generate_series(1, :users) AS i
+    """,
+    """
+    INSERT INTO companies (id, name)
+    SELECT md5('idx-company-' || i)::uuid, 'Idx Co ' || i
+    FROM generate_series(1, :companies) AS i
+    """,
+    """
+    INSERT INTO roles (id, name, company_id, number_of_cooldown_days)
+    SELECT md5('idx-role-' || i)::uuid, 'Idx Role', md5('idx-company-' || i)::uuid, 0
+    FROM generate_series(1, :companies) AS i
+    """,
+    """
+    INSERT INTO user_company_roles (id, user_id, company_id, role_id, is_owner)
+    SELECT gen_random_uuid(), md5('idx-user-' || u)::uuid, md5('idx-company-' || c)::uuid,
+           CASE WHEN u % 2 = 0 THEN md5('idx-role-' || c)::uuid END, k = 0 AND u <= :companies
+    FROM generate_series(1, :users) AS u
+    CROSS JOIN generate_series(0, :links - 1) AS k
+    CROSS JOIN LATERAL (SELECT ((u + k * 7) % :companies) + 1 AS c) AS pick
+    """,
+    """
+    INSERT INTO user_company_requests (id, user_id, company_id, status, accepted, created_at, updated_at)
+    SELECT gen_random_uuid(), md5('idx-user-' || u)::uuid, md5('idx-company-' || ((u + 3) % :companies + 1))::uuid,
+           (ARRAY['pending', 'approved', 'rejected'])[u % 3 + 1]::user_company_request_status, u % 3 = 1,
+           now() - make_interval(mins => u), now()
+    FROM generate_series(1, :users) AS u
+    """,
+    "ANALYZE users",
+    "ANALYZE companies",
+    "ANALYZE roles",
+    "ANALYZE user_company_roles",
+    "ANALYZE user_company_requests",
+]
+
+HOT_QUERIES = {
+    "links_by_user": "SELECT * FROM user_company_roles WHERE user_id = md5('idx-user-10')::uuid",
+    "links_by_company": "SELECT * FROM user_company_roles WHERE company_id = md5('idx-company-10')::uuid",
+    "link_by_user_and_company": (
+        "SELECT company_id, is_owner FROM user_company_roles WHERE user_id = md5('idx-user-10')::uuid AND company_id = md5('idx-company-11')::uuid"
+    ),
+    "links_by_role": "UPDATE user_company_roles SET role_id = NULL WHERE role_id = md5('idx-role-10')::uuid",
+    "pending_by_user_and_company": (
+        "SELECT * FROM user_company_requests WHERE user_id = md5('idx-user-10')::uuid "
+        "AND company_id = md5('idx-company-14')::uuid AND status = 'pending'"
+    ),
+    "requests_by_company_and_status": (
+        "SELECT * FROM user_company_requests WHERE company_id = md5('idx-company-14')::uuid AND status = 'pending' ORDER BY created_at DESC"
+    ),
+    "requests_by_company": "SELECT * FROM user_company_requests WHERE company_id = md5('idx-company-14')::uuid ORDER BY created_at DESC",
+    "requests_by_user": "DELETE FROM user_company_requests WHERE user_id = md5('idx-user-10')::uuid",
+}
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+@pytest.mark.parametrize("query_name", sorted(HOT_QUERIES))
+async def test_hot_link_queries_do_not_seq_scan(db_session, query_name):
+    for statement in SEED_SQL:
+        await db_session.execute(text(statement), {"users": USERS, "companies": COMPANIES, "links": LINKS_PER_USER})
+
+    plan = "\n".join(row[0] for row in await db_session.execute(text("EXPLAIN " + HOT_QUERIES[query_name])))
+
+    assert "Seq Scan" not in plan, plan
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_duplicate_link_and_pending_request_are_rejected(db_session):
+    owner = await UsersRepository(db_session).create(first_name="A", last_name="B", email="idx-dup-owner@b.com", hashed_password="hashed", active=True)
+    member = await UsersRepository(db_session).create(first_name="A", last_name="B", email="idx-dup-member@b.com", hashed_password="hashed", active=True)
+    company = await CompaniesRepository(db_session).create(name="Dup Co", owner_id=owner.id)
+    links = UserCompanyRolesRepository(db_session)
+    requests = UserCompanyRequestsRepository(db_session)
+
+    with pytest.raises(AlreadyExistsError):
+        await links.assign_user_and_role_to_company(user_id=owner.id, company_id=company.id, role_id=None)
+
+    request = await requests.create(user_id=member.id, company_id=company.id)
+    with pytest.raises(AlreadyExistsError):
+        await requests.create(user_id=member.id, company_id=company.id)
+
+    await links.assign_user_and_role_to_company(user_id=member.id, company_id=company.id, role_id=None)
+    with pytest.raises(AlreadyExistsError):
+        await requests.approve(request_id=request.id, role_id=None)
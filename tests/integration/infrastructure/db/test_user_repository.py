@@ -1,6 +1,7 @@
 import pytest
 
 from src.infra.repositories.users_repository import UsersRepository
+from src.interfaces.types.user_types import UserListFilters
 
 
 @pytest.mark.integration
@@ -8,7 +9,7 @@ from src.infra.repositories.users_repository import UsersRepository
 async def test_repository_can_persist_user(db_session):
     repo = UsersRepository(db_session)
 
-    created = await repo.create(first_name="A", last_name="B", email="a@b.com", password="secret", active=True)
+    created = await repo.create(first_name="A", last_name="B", email="a@b.com", hashed_password="hashed", active=True)
     fetched = await repo.get_by_email("a@b.com")
 
     assert created.email == "a@b.com"
@@ -20,7 +21,7 @@ async def test_repository_can_persist_user(db_session):
 @pytest.mark.asyncio
 async def test_repository_partial_update_updates_user(db_session):
     repo = UsersRepository(db_session)
-    created = await repo.create(first_name="Old", last_name="Name", email="old@b.com", password="secret", active=True)
+    created = await repo.create(first_name="Old", last_name="Name", email="old@b.com", hashed_password="hashed", active=True)
 
     updated = await repo.partial_update_by_id(
         created.id,
@@ -40,9 +41,35 @@ async def test_repository_partial_update_updates_user(db_session):
 @pytest.mark.asyncio
 async def test_repository_delete_removes_user(db_session):
     repo = UsersRepository(db_session)
-    created = await repo.create(first_name="Delete", last_name="Me", email="delete@b.com", password="secret", active=True)
+    created = await repo.create(first_name="Delete", last_name="Me", email="delete@b.com", hashed_password="hashed", active=True)
 
     await repo.delete(created.id)
     fetched = await repo.get_by_id(created.id)
 
     assert fetched is None
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_list_paginates_by_created_at_and_id_with_prefix_filters(db_session):
+    repo = UsersRepository(db_session)
+    for i in range(5):
+        await repo.create(first_name=f"Keyset{i}", last_name="B", email=f"keyset-{i}@b.com", hashed_password="hashed", active=True)
+    await repo.create(first_name="Other", last_name="Keyset_", email="keyset-other@c.com", hashed_password="hashed", active=True)
+
+    filters = UserListFilters(email_prefix="keyset-", name_prefix="Keyset", fields=("email",), limit=2)
+    seen = []
+    while True:
+        page = await repo.list(filters)
+        seen.extend(page.items)
+        if page.next_cursor is None:
+            break
+        filters.cursor = page.next_cursor
+
+    assert len(seen) == 6
+    assert all(set(item) == {"email"} for item in seen)
+    assert len({item["email"] for item in seen}) == 6
+
+    # "_" e escapado: nao casa com qualquer caractere
+    underscore = await repo.list(UserListFilters(name_prefix="Keyset_"))
+    assert [item["email"] for item in underscore.items] == ["keyset-other@c.com"]
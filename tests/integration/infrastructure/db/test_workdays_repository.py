@@ -0,0 +1,199 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.domain.entities.work_day import WorkDay
+from src.domain.errors import AlreadyExistsError, NotFoundError, ValidationError
+from src.infra.repositories.companies_repository import CompaniesRepository
+from src.infra.repositories.roles_repository import RolesRepository
+from src.infra.repositories.users_repository import UsersRepository
+from src.infra.repositories.workdays_repository import WorkdaysRepository
+from src.interfaces.types.workday_types import WorkdayListFilters
+
+
+async def _create_role(db_session, name: str = "Role", company_id: str | None = None):
+    return await RolesRepository(db_session).create(company_id=company_id, name=name, number_of_cooldown_days=0)  # type: ignore[arg-type]
+
+
+def _workday(role_id: str, date: datetime) -> WorkDay:
+    return WorkDay(id=None, role_id=role_id, date=date, is_holiday=False, weekday=date.weekday())
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_find_existing_dates_returns_only_requested_dates_for_role(db_session):
+    role = await _create_role(db_session)
+    other_role = await _create_role(db_session, name="Other")
+    repo = WorkdaysRepository(db_session)
+
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    await repo.batch_create([_workday(role.id, start + timedelta(days=i)) for i in range(0, 10, 2)])
+    await repo.batch_create([_workday(other_role.id, start + timedelta(days=1))])
+
+    requested = [start + timedelta(days=i) for i in range(1, 5)]
+    existing = await repo.find_existing_dates(role_id=role.id, dates=requested)
+
+    assert existing == {start + timedelta(days=2), start + timedelta(days=4)}
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_find_existing_ids_returns_only_stored_ids(db_session):
+    role = await _create_role(db_session)
+    repo = WorkdaysRepository(db_session)
+
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    created = await repo.batch_create([_workday(role.id, start + timedelta(days=i)) for i in range(3)])
+    ids = [w.id for w in created]
+
+    assert await repo.find_existing_ids([ids[0], ids[2], -1]) == {ids[0], ids[2]}
+    assert await repo.find_existing_ids([]) == set()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_create_relies_on_the_unique_role_date_index(db_session):
+    role = await _create_role(db_session)
+    other_role = await _create_role(db_session, name="Other")
+    repo = WorkdaysRepository(db_session)
+    day = datetime(2026, 1, 20, tzinfo=timezone.utc)
+
+    created = await repo.create(_workday(role.id, day))
+    with pytest.raises(AlreadyExistsError):
+        await repo.create(_workday(role.id, day))
+    with pytest.raises(NotFoundError):
+        await repo.create(_workday("00000000-0000-0000-0000-000000000001", day))
+
+    # o savepoint desfaz so a insercao recusada: a sessao continua utilizavel
+    assert (await repo.create(_workday(other_role.id, day))).id != created.id
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_batch_create_conflict_modes_use_unique_role_date_index(db_session):
+    role = await _create_role(db_session)
+    repo = WorkdaysRepository(db_session)
+
+    start = datetime(2026, 2, 1, tzinfo=timezone.utc)
+    first = await repo.batch_create([_workday(role.id, start)])
+    assert len(first) == 1
+
+    payloads = [_workday(role.id, start), _workday(role.id, start + timedelta(days=1))]
+
+    with pytest.raises(AlreadyExistsError):
+        await repo.batch_create(payloads, conflict="error")
+    assert await repo.find_existing_dates(role_id=role.id, dates=[start + timedelta(days=1)]) == set()
+
+    skipped = await repo.batch_create(payloads, conflict="skip")
+    assert [w.date for w in skipped] == [start + timedelta(days=1)]
+
+    payloads[0].is_holiday = True
+    updated = await repo.batch_create(payloads, conflict="update")
+    assert len(updated) == 2
+    assert {w.id for w in updated} == {first[0].id, skipped[0].id}
+    assert (await repo.get_by_id(first[0].id)).is_holiday is True  # type: ignore[union-attr]
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_list_paginates_by_date_and_id_with_filters(db_session):
+    owner = await UsersRepository(db_session).create(first_name="A", last_name="B", email="workdays-owner@b.com", hashed_password="hashed", active=True)
+    company = await CompaniesRepository(db_session).create(name="Workdays Co", owner_id=owner.id)
+    role = await _create_role(db_session, company_id=company.id)
+    other_role = await _create_role(db_session, name="Other")
+    repo = WorkdaysRepository(db_session)
+
+    start = datetime(2026, 5, 1, tzinfo=timezone.utc)
+    await repo.batch_create([_workday(role.id, start + timedelta(days=i)) for i in range(31)])
+    await repo.batch_create([_workday(other_role.id, start + timedelta(days=i)) for i in range(31)])
+
+    filters = WorkdayListFilters(company_id=company.id, date_from=start + timedelta(days=5), date_to=start + timedelta(days=14), limit=4)
+    seen = []
+    while True:
+        page = await repo.list(filters)
+        seen.extend(page.items)
+        if page.next_cursor is None:
+            break
+        filters.cursor = page.next_cursor
+
+    assert [w.date for w in seen] == [start + timedelta(days=i) for i in range(5, 15)]
+    assert {w.role_id for w in seen} == {role.id}
+
+
+async def _chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_bulk_import_copies_through_staging_and_merges(db_session):
+    role = await _create_role(db_session)
+    repo = WorkdaysRepository(db_session)
+
+    start = datetime(2026, 7, 1, tzinfo=timezone.utc)
+    await repo.batch_create([_workday(role.id, start)])
+
+    holiday = _workday(role.id, start)
+    holiday.is_holiday = True
+    chunks = [[holiday, _workday(role.id, start + timedelta(days=1))], [_workday(role.id, start + timedelta(days=2))]]
+
+    with pytest.raises(AlreadyExistsError):
+        await repo.bulk_import(_chunks(*chunks), conflict="error")
+
+    result = await repo.bulk_import(_chunks(*chunks), conflict="update")
+
+    assert (result.received, result.inserted, result.updated, result.skipped) == (3, 2, 1, 0)
+    assert await repo.find_existing_dates(role_id=role.id, dates=[start + timedelta(days=i) for i in range(3)]) == {start + timedelta(days=i) for i in range(3)}
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_bulk_import_insert_fallback_matches_copy_counts(db_session):
+    role = await _create_role(db_session)
+    repo = WorkdaysRepository(db_session)
+
+    start = datetime(2026, 8, 1, tzinfo=timezone.utc)
+    await repo.batch_create([_workday(role.id, start)])
+
+    result = await repo._insert_import(_chunks([_workday(role.id, start), _workday(role.id, start + timedelta(days=1))]), conflict="skip")
+
+    assert (result.received, result.inserted, result.updated, result.skipped) == (2, 1, 0, 1)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+@pytest.mark.parametrize("conflict", ["error", "skip", "update"])
+async def test_bulk_import_insert_fallback_matches_copy_across_chunks(db_session, conflict):
+    repo = WorkdaysRepository(db_session)
+    start = datetime(2026, 9, 1, tzinfo=timezone.utc)
+
+    async def _import(importer, name: str):
+        role = await _create_role(db_session, name=name)
+        if conflict != "error":
+            await repo.batch_create([_workday(role.id, start)])
+        # dia 2 aparece nos dois chunks: a ultima linha (feriado) vence e conta uma vez
+        repeated = _workday(role.id, start + timedelta(days=2))
+        repeated.is_holiday = True
+        chunks = [[_workday(role.id, start), _workday(role.id, start + timedelta(days=1)), _workday(role.id, start + timedelta(days=2))], [repeated, _workday(role.id, start)]]
+        if conflict == "error":
+            chunks = [[w for w in chunk if w.date != start] for chunk in chunks]
+        result = await importer(_chunks(*chunks), conflict)
+        stored = (await repo.list(WorkdayListFilters(role_id=role.id))).items
+        return (result.received, result.inserted, result.updated, result.skipped), [(w.date, w.is_holiday) for w in stored]
+
+    assert await _import(repo._copy_import, "Copy") == await _import(repo._insert_import, "Insert")
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["_copy_import", "_insert_import"])
+async def test_bulk_import_rejects_unknown_role_ids_before_merging(db_session, path):
+    role = await _create_role(db_session)
+    repo = WorkdaysRepository(db_session)
+    unknown = "00000000-0000-0000-0000-000000000001"
+    start = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    chunks = [[_workday(role.id, start)], [_workday(unknown, start + timedelta(days=1))]]
+
+    with pytest.raises(ValidationError, match=unknown):
+        await getattr(repo, path)(_chunks(*chunks), "error")
@@ -0,0 +1,120 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import text
+
+from src.domain.entities.work_day import WorkDay
+from src.domain.entities.work_shift import WorkShift
+from src.domain.errors import AlreadyExistsError
+from src.infra.repositories.companies_repository import CompaniesRepository
+from src.infra.repositories.roles_repository import RolesRepository
+from src.infra.repositories.users_repository import UsersRepository
+from src.infra.repositories.workdays_repository import WorkdaysRepository
+from src.infra.repositories.workshifts_repository import WorkShiftsRepository
+from src.interfaces.types.workshift_types import PartialWorkShiftUpdate, WorkShiftListFilters
+
+DAY = datetime(2026, 3, 2, tzinfo=timezone.utc)
+
+
+async def _create_workday(db_session, name: str = "Role", date: datetime = DAY, company_id: str | None = None) -> WorkDay:
+    role = await RolesRepository(db_session).create(company_id=company_id, name=name, number_of_cooldown_days=0)  # type: ignore[arg-type]
+    created = await WorkdaysRepository(db_session).batch_create([WorkDay(id=None, role_id=role.id, date=date, is_holiday=False, weekday=date.weekday())])
+    return created[0]
+
+
+def _shift(work_day_id: int, start_hour: int, end_hour: int) -> WorkShift:
+    return WorkShift(id=None, work_day_id=work_day_id, start_time=DAY + timedelta(hours=start_hour), end_time=DAY + timedelta(hours=end_hour))
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_batch_create_rejects_overlaps_inside_batch_and_with_existing(db_session):
+    workday = await _create_workday(db_session)
+    repo = WorkShiftsRepository(db_session)
+
+    created = await repo.batch_create([_shift(workday.id, 8, 12), _shift(workday.id, 12, 18)])  # type: ignore[arg-type]
+    assert [s.id is not None for s in created] == [True, True]
+
+    with pytest.raises(AlreadyExistsError):
+        await repo.batch_create([_shift(workday.id, 18, 20), _shift(workday.id, 19, 22)])  # type: ignore[arg-type]
+    with pytest.raises(AlreadyExistsError):
+        await repo.create(_shift(workday.id, 11, 13))  # type: ignore[arg-type]
+
+    conflicts = await repo.find_conflicts([_shift(workday.id, 11, 13), _shift(workday.id, 20, 22)])  # type: ignore[arg-type]
+    assert [(c.start_time.hour, c.end_time.hour) for c in conflicts] == [(8, 12), (12, 18)]
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_exclusion_constraint_blocks_overlapping_insert_that_skips_the_check(db_session):
+    workday = await _create_workday(db_session)
+    repo = WorkShiftsRepository(db_session)
+    await repo.create(_shift(workday.id, 8, 12))  # type: ignore[arg-type]
+
+    async def _no_conflicts(payloads):
+        return []
+
+    # simula uma corrida: a checagem previa nao viu o turno concorrente
+    repo.find_conflicts = _no_conflicts  # type: ignore[method-assign]
+    with pytest.raises(AlreadyExistsError):
+        await repo.create(_shift(workday.id, 10, 14))  # type: ignore[arg-type]
+
+    assert len(await WorkShiftsRepository(db_session).list(WorkShiftListFilters(work_day_id=workday.id))) == 1
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_list_filters_by_role_and_time_window(db_session):
+    workday = await _create_workday(db_session)
+    other_workday = await _create_workday(db_session, name="Other")
+    repo = WorkShiftsRepository(db_session)
+    await repo.batch_create([_shift(workday.id, 0, 6), _shift(workday.id, 8, 12), _shift(other_workday.id, 8, 12)])  # type: ignore[arg-type]
+
+    shifts = await repo.list(WorkShiftListFilters(role_id=workday.role_id, window_start=DAY + timedelta(hours=5), window_end=DAY + timedelta(hours=9)))
+
+    assert [(s.work_day_id, s.start_time.hour) for s in shifts] == [(workday.id, 0), (workday.id, 8)]
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_update_moves_shift_unless_it_would_overlap(db_session):
+    workday = await _create_workday(db_session)
+    repo = WorkShiftsRepository(db_session)
+    morning, afternoon = await repo.batch_create([_shift(workday.id, 8, 12), _shift(workday.id, 13, 18)])  # type: ignore[arg-type]
+
+    moved = await repo.update(morning.id, PartialWorkShiftUpdate(end_time=DAY + timedelta(hours=13)))  # type: ignore[arg-type]
+    assert moved is not None and moved.end_time == DAY + timedelta(hours=13)
+
+    with pytest.raises(AlreadyExistsError):
+        await repo.update(afternoon.id, PartialWorkShiftUpdate(start_time=DAY + timedelta(hours=12)))  # type: ignore[arg-type]
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_window_query_uses_gist_range_index(db_session):
+    await db_session.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = await db_session.execute(
+        text("EXPLAIN SELECT id FROM work_shifts WHERE tstzrange(start_time, end_time) && tstzrange(:start, :end)"),
+        {"start": DAY, "end": DAY + timedelta(hours=1)},
+    )
+
+    assert "ix_work_shifts_time_range" in "\n".join(row[0] for row in plan)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_list_schedulable_and_assign_users_for_company(db_session):
+    owner = await UsersRepository(db_session).create(first_name="A", last_name="B", email="shifts-schedule@b.com", hashed_password="hashed", active=True)
+    company = await CompaniesRepository(db_session).create(name="Shifts Co", owner_id=owner.id)
+    workday = await _create_workday(db_session, company_id=company.id)
+    outside = await _create_workday(db_session, name="Other")
+    repo = WorkShiftsRepository(db_session)
+    first, second = await repo.batch_create([_shift(workday.id, 8, 12), _shift(workday.id, 13, 18)])  # type: ignore[arg-type]
+    await repo.create(_shift(outside.id, 8, 12))  # type: ignore[arg-type]
+
+    await repo.assign_users({first.id: owner.id})  # type: ignore[dict-item]
+
+    shifts = await repo.list_schedulable(company.id, DAY, DAY)
+    assert [(s.id, s.role_id, s.user_id) for s in shifts] == [(first.id, workday.role_id, owner.id), (second.id, workday.role_id, None)]
+    assert await repo.list_assigned_dates(company.id, [owner.id], DAY) == [DAY]
+    assert await repo.list_assigned_dates(company.id, [owner.id], DAY + timedelta(hours=9)) == []
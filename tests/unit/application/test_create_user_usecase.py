@@ -12,13 +12,13 @@ class FakeUserRepo:
     async def list(self):
         return list(self.users.values())
 
-    async def create(self, first_name: str, last_name: str, email: str, password: str, active: bool):
+    async def create(self, first_name: str, last_name: str, email: str, hashed_password: str, active: bool):
         user = User(
             id="1",
             first_name=first_name,
             last_name=last_name,
             email=email,
-            hashed_password="hashed",
+            hashed_password=hashed_password,
             active=active,
             created_at=None,
             companies_roles=[],
@@ -38,30 +38,55 @@ class FakeUserRepo:
     async def delete(self, id: str):
         return None
 
-    def verify_password(self, plain: str, hashed: str) -> bool:
-        return True
+
+class FakeUnitOfWork:
+    def __init__(self):
+        self.commits = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        pass
+
+
+class FakePasswordHasher:
+    async def hash(self, password: str) -> str:
+        return f"hashed:{password}"
+
+    async def verify(self, plain: str, hashed: str) -> bool:
+        return hashed == f"hashed:{plain}"
+
+    def metrics(self):
+        return {}
 
 
 @pytest.mark.asyncio
 async def test_create_user_success():
     # Arrange
     repo = FakeUserRepo()
-    usecase = CreateUserUseCase(repo)
+    uow = FakeUnitOfWork()
+    usecase = CreateUserUseCase(repo, FakePasswordHasher(), uow)
 
     # Act
     user = await usecase.execute(first_name="A", last_name="B", email="a@b.com", password="secret", active=True)
 
     # Assert
     assert user.email == "a@b.com"
+    assert repo.users["a@b.com"].hashed_password == "hashed:secret"
+    assert uow.commits == 1
 
 
 @pytest.mark.asyncio
 async def test_create_user_conflict():
     # Arrange
     repo = FakeUserRepo()
-    usecase = CreateUserUseCase(repo)
+    uow = FakeUnitOfWork()
+    usecase = CreateUserUseCase(repo, FakePasswordHasher(), uow)
     await usecase.execute(first_name="A", last_name="B", email="a@b.com", password="secret", active=True)
 
     # Act / Assert
     with pytest.raises(AlreadyExistsError):
         await usecase.execute(first_name="A", last_name="B", email="a@b.com", password="secret", active=True)
+
+    assert uow.commits == 1
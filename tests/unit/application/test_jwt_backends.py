@@ -0,0 +1,108 @@
+import json
+import time
+
+import pytest
+
+from src.infra.security import create_access_token
+from src.infra.services.jwt_backends import CryptographyJWTBackend, JoseJWTBackend, build_jwt_backend
+from src.infra.services.jwt_keys import KeyRing, b64url_encode, generate_jwk
+from src.infra.services.jwt_token_service import JWTTokenService
+from src.infra.settings.config import get_settings
+
+
+def _payload(ttl: int = 60) -> dict:
+    return {"sub": "user-1", "exp": int(time.time()) + ttl}
+
+
+@pytest.mark.parametrize("alg", ["HS256", "ES256", "EdDSA"])
+def test_cryptography_backend_round_trip(alg):
+    backend = CryptographyJWTBackend(KeyRing.from_jwks({"keys": [generate_jwk(alg)]}))
+    payload = _payload()
+
+    assert backend.decode(backend.encode(payload)) == payload
+
+
+@pytest.mark.parametrize("alg", ["HS256", "ES256"])
+def test_backends_accept_each_others_tokens(alg):
+    ring = KeyRing.from_jwks({"keys": [generate_jwk(alg)]})
+    jose_backend, fast_backend = JoseJWTBackend(ring), CryptographyJWTBackend(ring)
+    payload = _payload()
+
+    assert fast_backend.decode(jose_backend.encode(payload)) == payload
+    assert jose_backend.decode(fast_backend.encode(payload)) == payload
+
+
+def test_jose_backend_rejects_eddsa_keys():
+    with pytest.raises(ValueError):
+        JoseJWTBackend(KeyRing.from_jwks({"keys": [generate_jwk("EdDSA")]}))
+
+
+@pytest.mark.parametrize("backend_name", ["jose", "cryptography"])
+def test_rotation_keeps_old_kid_verifiable(backend_name):
+    old_key, new_key = generate_jwk("ES256", kid="2025-01"), generate_jwk("ES256", kid="2025-02")
+    old_token = build_jwt_backend(backend_name, KeyRing.from_jwks({"keys": [old_key]})).encode(_payload())
+
+    # a nova chave assina; a antiga continua no anel so com a parte publica
+    old_public = {k: v for k, v in old_key.items() if k != "d"}
+    rotated = build_jwt_backend(backend_name, KeyRing.from_jwks({"keys": [new_key, old_public], "active_kid": "2025-02"}))
+
+    assert rotated.decode(old_token)["sub"] == "user-1"
+    assert rotated.decode(rotated.encode(_payload()))["sub"] == "user-1"
+    # depois que a chave antiga sai do anel, os tokens dela deixam de valer
+    assert build_jwt_backend(backend_name, KeyRing.from_jwks({"keys": [new_key]})).decode(old_token) is None
+
+
+@pytest.mark.parametrize("backend_name", ["jose", "cryptography"])
+def test_rejects_expired_tampered_and_unknown_tokens(backend_name):
+    backend = build_jwt_backend(backend_name, KeyRing.from_jwks({"keys": [generate_jwk("HS256", kid="a")]}))
+    other = build_jwt_backend(backend_name, KeyRing.from_jwks({"keys": [generate_jwk("HS256", kid="b")]}))
+    header, _, signature = backend.encode(_payload()).split(".")
+    forged_body = b64url_encode(b'{"sub":"admin"}')
+
+    assert backend.decode(backend.encode(_payload(ttl=-10))) is None
+    assert backend.decode(f"{header}.{forged_body}.{signature}") is None
+    assert backend.decode(other.encode(_payload())) is None
+    assert backend.decode("not-a-jwt") is None
+
+
+@pytest.mark.parametrize("backend_name", ["jose", "cryptography"])
+@pytest.mark.parametrize("kid", [[1], {"k": 1}, 1])
+def test_rejects_tokens_with_non_string_kid(backend_name, kid):
+    ring = KeyRing.from_secret("s")
+    _, body, signature = build_jwt_backend(backend_name, ring).encode(_payload()).split(".")
+    forged_header = b64url_encode(json.dumps({"alg": "HS256", "kid": kid}).encode())
+
+    assert ring.get(kid) is None
+    assert build_jwt_backend(backend_name, ring).decode(f"{forged_header}.{body}.{signature}") is None
+
+
+def test_cryptography_backend_ignores_header_algorithm():
+    ring = KeyRing.from_jwks({"keys": [generate_jwk("ES256", kid="k1")]})
+    token = CryptographyJWTBackend(ring).encode(_payload())
+    _, body, _ = token.split(".")
+    forged_header = b64url_encode(b'{"alg":"none","typ":"JWT","kid":"k1"}')
+
+    assert CryptographyJWTBackend(ring).decode(f"{forged_header}.{body}.") is None
+
+
+@pytest.mark.asyncio
+async def test_legacy_tokens_without_kid_verify_with_shared_secret():
+    service = JWTTokenService(backend=CryptographyJWTBackend(KeyRing.from_secret(get_settings().ACCESS_SECRET)))
+
+    assert (await service.verify_access_token(create_access_token("user-1")))["sub"] == "user-1"
+
+
+def test_public_jwks_never_exposes_private_or_symmetric_keys():
+    ring = KeyRing.from_jwks({"keys": [generate_jwk("EdDSA", kid="ed"), generate_jwk("ES256", kid="ec"), generate_jwk("HS256", kid="hs")]})
+
+    keys = ring.public_jwks()["keys"]
+
+    assert sorted(key["kid"] for key in keys) == ["ec", "ed"]
+    assert all("d" not in key for key in keys)
+
+
+def test_active_key_must_have_private_part():
+    public_only = {k: v for k, v in generate_jwk("EdDSA", kid="ed").items() if k != "d"}
+
+    with pytest.raises(ValueError):
+        KeyRing.from_jwks({"keys": [public_only], "active_kid": "ed"})
@@ -0,0 +1,77 @@
+import pytest
+
+from src.infra.services.membership_cache import (
+    InProcessCacheBackend,
+    LocalSharedCacheBackend,
+    LocalSharedStore,
+    MembershipCache,
+    build_membership_cache,
+    resolve_membership_cache_backend,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = MembershipCache(InProcessCacheBackend(clock=clock), ttl_seconds=30)
+
+    await cache.set("user-1", {"company-1": True})
+    assert await cache.get("user-1") == {"company-1": True}
+
+    clock.now += 31
+    assert await cache.get("user-1") is None
+    assert cache.metrics()["hits"] == 1
+    assert cache.metrics()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_in_process_backend_evicts_least_recently_used():
+    backend = InProcessCacheBackend(max_entries=2)
+    cache = MembershipCache(backend)
+
+    await cache.set("user-1", {})
+    await cache.set("user-2", {})
+    await cache.get("user-1")
+    await cache.set("user-3", {})
+
+    assert await cache.get("user-2") is None
+    assert await cache.get("user-1") == {}
+    assert backend.metrics()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_shared_backend_invalidation_reaches_every_worker():
+    store = LocalSharedStore()
+    worker_a = MembershipCache(LocalSharedCacheBackend(store))
+    worker_b = MembershipCache(LocalSharedCacheBackend(store))
+
+    await worker_a.set("user-1", {"company-1": False})
+    assert await worker_b.get("user-1") == {"company-1": False}
+
+    await worker_b.invalidate_users(["user-1"])
+    assert await worker_a.get("user-1") is None
+
+
+def test_build_membership_cache_by_name():
+    assert build_membership_cache("none", ttl_seconds=60, max_entries=10) is None
+    assert build_membership_cache("memory", ttl_seconds=60, max_entries=10).metrics()["backend"] == "memory"
+    assert build_membership_cache("local_shared", ttl_seconds=60, max_entries=10).metrics()["backend"] == "local_shared"
+    with pytest.raises(ValueError):
+        build_membership_cache("redis", ttl_seconds=60, max_entries=10)
+
+
+def test_per_process_backends_are_disabled_with_several_workers():
+    assert resolve_membership_cache_backend("memory", workers=1) == ("memory", None)
+    for backend in ("memory", "local_shared"):
+        resolved, warning = resolve_membership_cache_backend(backend, workers=4)
+        assert resolved == "none"
+        assert warning is not None and "WEB_CONCURRENCY=4" in warning
+    assert resolve_membership_cache_backend("none", workers=4) == ("none", None)
@@ -0,0 +1,30 @@
+from src.domain.ngram_index import NGramIndex, trigrams
+
+
+def test_trigrams_match_pg_trgm_padding():
+    assert trigrams("Cat") == {"  c", " ca", "cat", "at "}
+    assert trigrams("a-b") == {"  a", " a ", "  b", " b "}
+
+
+def test_search_ranks_prefix_and_typo_matches():
+    index: NGramIndex[str] = NGramIndex()
+    index.add("1", "Padaria Sao Jorge")
+    index.add("2", "Padaria Central")
+    index.add("3", "Oficina do Joao")
+
+    results = index.search("jorge", limit=10)
+    assert [key for key, _ in results] == ["1"]
+    assert results[0][1] == 1.0
+
+    assert {key for key, _ in index.search("padaria", limit=10)} == {"1", "2"}
+    # erro de digitacao: 5 dos 7 trigramas de "padria" estao em "padaria"
+    assert {key for key, _ in index.search("padria", limit=10)} == {"1", "2"}
+    assert index.search("zzz", limit=10) == []
+
+
+def test_search_respects_limit_and_multiple_texts_per_key():
+    index: NGramIndex[str] = NGramIndex()
+    for i in range(5):
+        index.add(str(i), f"user{i}@shiftly.com", "Maria", "Souza")
+
+    assert len(index.search("souza", limit=3)) == 3
@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.domain.errors import ServiceOverloadedError
+from src.infra.services.password_hasher import ThreadPoolPasswordHasher
+
+
+class SlowContext:
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.threads: set[str] = set()
+
+    def hash(self, password: str) -> str:
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        return f"hashed:{password}"
+
+    def verify(self, plain: str, hashed: str) -> bool:
+        time.sleep(self.delay)
+        return hashed == f"hashed:{plain}"
+
+
+@pytest.mark.asyncio
+async def test_hashing_runs_off_the_event_loop():
+    context = SlowContext(delay=0.2)
+    hasher = ThreadPoolPasswordHasher(max_workers=2, max_queue=4, context=context)
+
+    ticks = 0
+
+    async def _ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker = asyncio.create_task(_ticker())
+    hashed = await hasher.hash("secret")
+    ticker.cancel()
+
+    assert hashed == "hashed:secret"
+    assert await hasher.verify("secret", hashed)
+    # o loop continuou girando enquanto o bcrypt (simulado) rodava
+    assert ticks >= 10
+    assert all(name.startswith("password-hasher") for name in context.threads)
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_rejects_calls_beyond_workers_plus_queue_and_reports_metrics():
+    hasher = ThreadPoolPasswordHasher(max_workers=1, max_queue=2, context=SlowContext(delay=0.05))
+
+    results = await asyncio.gather(*(hasher.hash(str(i)) for i in range(5)), return_exceptions=True)
+
+    assert [r for r in results if isinstance(r, ServiceOverloadedError)] and len([r for r in results if isinstance(r, str)]) == 3
+    metrics = hasher.metrics()
+    assert metrics["completed"] == 3
+    assert metrics["rejected"] == 2
+    assert metrics["in_flight"] == 0
+    # a terceira chamada esperou as duas primeiras no unico worker
+    assert metrics["queue_wait_ms"]["max"] >= 80
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_releases_the_pool_and_a_later_call_starts_a_new_one():
+    context = SlowContext(delay=0.01)
+    hasher = ThreadPoolPasswordHasher(max_workers=1, max_queue=1, context=context)
+    await hasher.hash("first")
+    first_pool = hasher._executor
+
+    hasher.shutdown()
+    hasher.shutdown()
+
+    assert first_pool is not None and first_pool._shutdown
+    assert await hasher.hash("second") == "hashed:second"
+    assert hasher._executor is not None and hasher._executor is not first_pool
+    hasher.shutdown()
+
+
+class BlockingContext:
+    def __init__(self):
+        self.release = threading.Event()
+
+    def hash(self, password: str) -> str:
+        self.release.wait(timeout=5)
+        return f"hashed:{password}"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_callers_keep_their_slot_until_the_thread_finishes():
+    context = BlockingContext()
+    hasher = ThreadPoolPasswordHasher(max_workers=1, max_queue=1, context=context)
+    running = asyncio.create_task(hasher.hash("running"))
+    queued = asyncio.create_task(hasher.hash("queued"))
+    await asyncio.sleep(0.05)
+
+    running.cancel()
+    queued.cancel()
+    await asyncio.gather(running, queued, return_exceptions=True)
+
+    # o job na fila foi cancelado de fato; o que ja rodava continua ocupando o worker
+    assert hasher.metrics()["in_flight"] == 1
+    blocked = asyncio.create_task(hasher.hash("queued-again"))
+    await asyncio.sleep(0.01)
+    with pytest.raises(ServiceOverloadedError):
+        await hasher.hash("rejected")
+
+    context.release.set()
+    assert await blocked == "hashed:queued-again"
+    assert hasher.metrics()["in_flight"] == 0
+    hasher.shutdown()
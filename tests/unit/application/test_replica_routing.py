@@ -0,0 +1,116 @@
+import asyncio
+
+from src.app.controllers.middlewares.primary_stickiness_middleware import PrimaryStickinessMiddleware
+from src.infra.db.replica_routing import ReplicaRouter, parse_replica_urls
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _factory(name: str):
+    def _open():
+        return name
+
+    return _open
+
+
+def test_reads_round_robin_over_replicas_and_writes_go_to_primary():
+    primary, replica_a, replica_b = _factory("primary"), _factory("a"), _factory("b")
+    router = ReplicaRouter(primary, [replica_a, replica_b])
+
+    assert [router.session_factory_for("GET", ["user:1"]) for _ in range(3)] == [replica_a, replica_b, replica_a]
+    assert router.session_factory_for("HEAD") is replica_b
+    for method in ("POST", "PUT", "PATCH", "DELETE"):
+        assert router.session_factory_for(method, ["user:2"]) is primary
+
+
+def test_reads_after_a_write_stick_to_primary_for_the_window():
+    clock = FakeClock()
+    primary, replica = _factory("primary"), _factory("replica")
+    router = ReplicaRouter(primary, [replica], sticky_seconds=5, clock=clock)
+
+    router.session_factory_for("POST", ["user:1"])
+    assert router.session_factory_for("GET", ["user:1"]) is primary
+    # outro usuario nao e afetado pela escrita
+    assert router.session_factory_for("GET", ["user:2"]) is replica
+
+    clock.now += 6
+    assert router.session_factory_for("GET", ["user:1"]) is replica
+
+    metrics = router.metrics()
+    assert metrics["writes"] == 1
+    assert metrics["sticky_primary_reads"] == 1
+    assert metrics["replica_reads"] == 2
+    assert metrics["sticky_clients"] == 0
+
+
+def test_without_replicas_everything_goes_to_primary():
+    primary = _factory("primary")
+    router = ReplicaRouter(primary)
+
+    assert router.session_factory_for("GET", ["user:1"]) is primary
+    assert router.session_factory_for("POST", ["user:1"]) is primary
+    assert router.metrics()["sticky_clients"] == 0
+
+
+def test_sticky_window_is_bounded():
+    router = ReplicaRouter(_factory("primary"), [_factory("replica")], max_tracked_clients=2)
+    for user in ("user:1", "user:2", "user:3"):
+        router.session_factory_for("POST", [user])
+
+    assert router.metrics()["sticky_clients"] == 2
+    assert router.session_factory_for("GET", ["user:1"]) is not router.primary
+
+
+def test_window_restarts_at_commit_and_deadline_is_honoured_by_other_workers():
+    clock, wall = FakeClock(), FakeClock(50_000.0)
+    primary, replica = _factory("primary"), _factory("replica")
+    router = ReplicaRouter(primary, [replica], sticky_seconds=5, clock=clock, wall_clock=wall)
+
+    router.session_factory_for("POST", ["user:1"])
+    # escrita mais lenta que a janela: o commit marca de novo
+    clock.now += 6
+    wall.now += 6
+    deadline = router.mark_committed(["user:1"])
+    assert deadline == wall.now + 5
+    assert router.session_factory_for("GET", ["user:1"]) is primary
+
+    # outro worker nao tem a janela local, mas respeita o prazo que veio no cookie
+    other_worker = ReplicaRouter(primary, [replica], sticky_seconds=5, clock=clock, wall_clock=wall)
+    assert other_worker.session_factory_for("GET", ["user:1"], primary_until=deadline) is primary
+    assert other_worker.session_factory_for("GET", ["user:1"], primary_until=wall.now + 3600) is replica
+    wall.now += 6
+    assert other_worker.session_factory_for("GET", ["user:1"], primary_until=deadline) is replica
+    assert ReplicaRouter(primary).mark_committed(["user:1"]) is None
+
+
+def test_stickiness_middleware_sets_cookie_only_after_a_committed_write():
+    async def app(scope, receive, send):
+        if scope["path"] == "/write":
+            scope.setdefault("state", {})["db_primary_until"] = 123.5
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    middleware = PrimaryStickinessMiddleware(app, cookie_name="db_primary_until", state_key="db_primary_until", max_age_seconds=2.5)
+
+    async def headers_for(path: str):
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        await middleware({"type": "http", "path": path, "headers": []}, None, send)
+        return sent[0]["headers"]
+
+    assert asyncio.run(headers_for("/write")) == [(b"set-cookie", b"db_primary_until=123.500; Max-Age=3; Path=/; HttpOnly; SameSite=lax")]
+    assert asyncio.run(headers_for("/read")) == []
+
+
+def test_parse_replica_urls():
+    assert parse_replica_urls("") == []
+    assert parse_replica_urls(" postgresql+asyncpg://r1/db , postgresql+asyncpg://r2/db,") == ["postgresql+asyncpg://r1/db", "postgresql+asyncpg://r2/db"]
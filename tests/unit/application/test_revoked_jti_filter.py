@@ -0,0 +1,117 @@
+import uuid
+
+import pytest
+
+from src.domain.errors import RefreshReuseDetected
+from src.infra.services.revoked_jti_filter import RevokedJtiBloomFilter
+from src.interfaces.types.auth_types import RefreshRotationResult
+from src.usecases.auth_service import AuthService
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeTokenService:
+    def __init__(self):
+        self.revoked_subjects: list[str] = []
+
+    def create_access_token(self, subject: str) -> str:
+        return f"access-{subject}"
+
+    def generate_refresh_token_raw(self) -> str:
+        return "raw"
+
+    def hash_refresh_token(self, token: str) -> str:
+        return f"hash-{token}"
+
+    async def revoke_access_tokens(self, subject: str) -> None:
+        self.revoked_subjects.append(subject)
+
+
+class FakeUnitOfWork:
+    def __init__(self):
+        self.commits = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        pass
+
+
+class FakeRotatingRepository:
+    def __init__(self, status: str):
+        self.status = status
+        self.calls = 0
+
+    async def rotate_refresh_token(self, **kwargs) -> RefreshRotationResult:
+        self.calls += 1
+        return RefreshRotationResult(status=self.status, user_id="user-1")
+
+
+def test_added_jtis_are_always_found():
+    bloom = RevokedJtiBloomFilter(capacity=1_000)
+    jtis = [str(uuid.uuid4()) for _ in range(1_000)]
+    for jti in jtis:
+        bloom.add(jti)
+
+    assert all(bloom.might_contain(jti) for jti in jtis)
+
+
+def test_false_positive_rate_stays_near_target():
+    bloom = RevokedJtiBloomFilter(capacity=5_000, false_positive_rate=1e-3)
+    for _ in range(5_000):
+        bloom.add(str(uuid.uuid4()))
+
+    false_positives = sum(bloom.might_contain(str(uuid.uuid4())) for _ in range(20_000))
+
+    assert false_positives < 20_000 * 1e-3 * 3
+
+
+def test_generations_age_out():
+    clock = FakeClock()
+    bloom = RevokedJtiBloomFilter(capacity=10, max_age_seconds=100, clock=clock)
+    bloom.add("old")
+
+    clock.now = 150
+    bloom.add("newer")
+    assert bloom.might_contain("old")
+
+    clock.now = 300
+    bloom.add("newest")
+    assert not bloom.might_contain("old")
+    assert bloom.might_contain("newer")
+
+
+@pytest.mark.asyncio
+async def test_detected_reuse_is_rejected_again_without_hitting_the_repository():
+    repository = FakeRotatingRepository(status="reused")
+    token_service = FakeTokenService()
+    service = AuthService(None, repository, token_service, 1, None, FakeUnitOfWork(), revoked_filter=RevokedJtiBloomFilter(capacity=100))
+    jti = str(uuid.uuid4())
+
+    for _ in range(3):
+        with pytest.raises(RefreshReuseDetected):
+            await service.rotate_refresh("raw", jti)
+
+    assert repository.calls == 1
+    assert token_service.revoked_subjects == ["user-1"]
+
+
+@pytest.mark.asyncio
+async def test_successful_rotation_does_not_mark_the_jti():
+    bloom = RevokedJtiBloomFilter(capacity=100)
+    token_service = FakeTokenService()
+    service = AuthService(None, FakeRotatingRepository(status="rotated"), token_service, 1, None, FakeUnitOfWork(), revoked_filter=bloom)
+    jti = str(uuid.uuid4())
+
+    await service.rotate_refresh("raw", jti)
+
+    assert not bloom.might_contain(jti)
+    # rotacao normal so troca o refresh; os access tokens das outras sessoes continuam validos
+    assert token_service.revoked_subjects == []
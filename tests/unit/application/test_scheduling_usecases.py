@@ -0,0 +1,265 @@
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from benchmarks.shift_scheduler_benchmark import build_problem
+from src.domain.errors import NotFoundError, PermissionDeniedError
+from src.interfaces.types.user_types import RoleDTO, UsersRolesFromCompany, UserSummaryDTO
+from src.domain.entities.work_day import WorkDay
+from src.interfaces.types.workshift_types import ScheduleChangeSet, SchedulableShift
+from src.usecases.scheduling.incremental_reschedule_usecase import IncrementalRescheduleUseCase, dependency_windows
+from src.usecases.scheduling.schedule_company_shifts_usecase import ScheduleCompanyShiftsUseCase
+from src.usecases.scheduling.shift_scheduler import SchedulingProblem, ShiftSlot, solve_schedule
+
+DAY0 = date(2026, 1, 1).toordinal()
+
+
+def _slot(shift_id: int, role_id: str, day_offset: int) -> ShiftSlot:
+    start = datetime.combine(date.fromordinal(DAY0 + day_offset), datetime.min.time(), tzinfo=timezone.utc)
+    return ShiftSlot(shift_id=shift_id, role_id=role_id, day=DAY0 + day_offset, start_time=start)
+
+
+def _assert_cooldown_respected(problem: SchedulingProblem, assignments: dict[int, str]):
+    days_by_user = defaultdict(list)
+    slots = {s.shift_id: s for s in problem.slots}
+    for shift_id, user in assignments.items():
+        days_by_user[user].append((slots[shift_id].day, problem.cooldown_by_role[slots[shift_id].role_id]))
+    for worked in days_by_user.values():
+        worked.sort()
+        for (day, cooldown), (next_day, _) in zip(worked, worked[1:]):
+            assert next_day - day > cooldown
+
+
+def test_solve_schedule_respects_cooldown_and_balances_load():
+    problem = SchedulingProblem(
+        slots=[_slot(day, "nurse", day) for day in range(30)],
+        users_by_role={"nurse": ["ana", "bia", "caio"]},
+        cooldown_by_role={"nurse": 2},
+    )
+
+    result = solve_schedule(problem)
+
+    assert result.unassigned == []
+    _assert_cooldown_respected(problem, result.assignments)
+    assert sorted(result.load.values()) == [10, 10, 10]
+
+
+def test_solve_schedule_leaves_slots_unassigned_when_everyone_is_resting():
+    problem = SchedulingProblem(
+        slots=[_slot(1, "nurse", 0), _slot(2, "nurse", 0), _slot(3, "nurse", 1)],
+        users_by_role={"nurse": ["ana"]},
+        cooldown_by_role={"nurse": 1},
+        available_from={"ana": DAY0},
+    )
+
+    result = solve_schedule(problem)
+
+    assert result.assignments == {1: "ana"}
+    assert result.unassigned == [2, 3]
+
+
+def test_solve_schedule_shares_cooldown_between_roles_of_the_same_user():
+    problem = SchedulingProblem(
+        slots=[_slot(1, "nurse", 0), _slot(2, "doctor", 1), _slot(3, "doctor", 2)],
+        users_by_role={"nurse": ["ana"], "doctor": ["ana", "bia"]},
+        cooldown_by_role={"nurse": 1, "doctor": 0},
+    )
+
+    result = solve_schedule(problem)
+
+    assert result.assignments == {1: "ana", 2: "bia", 3: "ana"}
+
+
+def test_solve_schedule_keeps_rest_before_assignments_after_the_window():
+    problem = SchedulingProblem(
+        slots=[_slot(1, "nurse", 0)],
+        users_by_role={"nurse": ["ana", "bia"]},
+        cooldown_by_role={"nurse": 1},
+        initial_load={"bia": 5},
+        blocked_from={"ana": DAY0 + 1},
+    )
+
+    # ana tem menos carga, mas ja trabalha amanha e precisa descansar um dia
+    assert solve_schedule(problem).assignments == {1: "bia"}
+
+
+def test_dependency_windows_extend_by_cooldown_and_merge_close_days():
+    days = {date(2026, 1, 1), date(2026, 1, 4), date(2026, 2, 1)}
+
+    assert dependency_windows(days, 2) == [(date(2026, 1, 1), date(2026, 1, 6)), (date(2026, 2, 1), date(2026, 2, 3))]
+    assert dependency_windows(set(), 2) == []
+
+
+def test_solve_schedule_handles_500_users_for_a_year_quickly():
+    problem = build_problem(users=500, days=365, cooldown_days=1)
+
+    started = time.perf_counter()
+    result = solve_schedule(problem)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 5
+    assert result.unassigned == []
+    _assert_cooldown_respected(problem, result.assignments)
+    loads = result.load.values()
+    assert max(loads) - min(loads) <= 1
+
+
+class FakeUnitOfWork:
+    def __init__(self):
+        self.commits = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        pass
+
+
+class FakePermissions:
+    def __init__(self, owners: set[tuple[str, str]], users: set[str] | None = None):
+        self.owners = owners
+        self.users = users if users is not None else {user_id for user_id, _ in owners}
+
+    async def is_company_owner(self, user_id: str, company_id: str) -> bool:
+        return (user_id, company_id) in self.owners
+
+    async def is_company_member(self, user_id: str, company_id: str) -> bool:
+        return (user_id, company_id) in self.owners
+
+    async def user_exists(self, user_id: str) -> bool:
+        return user_id in self.users
+
+
+class FakeUserCompanyRolesRepo:
+    def __init__(self, members: list[UsersRolesFromCompany]):
+        self.members = members
+
+    async def list_users_and_roles_by_company(self, company_id: str):
+        return self.members
+
+
+class FakeWorkShiftsRepo:
+    def __init__(self, shifts: list[SchedulableShift]):
+        self.shifts = shifts
+        self.assigned: dict[int, str | None] = {}
+
+    async def list_schedulable(self, company_id: str, date_from: datetime, date_to: datetime):
+        return [s for s in self.shifts if date_from <= s.date <= date_to]
+
+    async def list_assigned_dates(self, company_id: str, user_ids: list[str], since: datetime):
+        return sorted({s.date for s in self.shifts if s.user_id in user_ids and s.start_time >= since})
+
+    async def assign_users(self, assignments):
+        self.assigned.update(assignments)
+        for shift in self.shifts:
+            if shift.id in assignments:
+                shift.user_id = assignments[shift.id]
+
+
+class FakeWorkdaysRepo:
+    def __init__(self, shifts: list[SchedulableShift], company_id: str = "company-1"):
+        self.workdays = {s.work_day_id: WorkDay(id=s.work_day_id, role_id=s.role_id, date=s.date, is_holiday=s.is_holiday) for s in shifts}
+        self.company_id = company_id
+        self.queries = 0
+
+    async def list_by_ids_for_company(self, company_id: str, workday_ids):
+        self.queries += 1
+        if company_id != self.company_id:
+            return []
+        return [self.workdays[i] for i in workday_ids if i in self.workdays]
+
+
+def _member(user_id: str, role_id: str, cooldown: int) -> UsersRolesFromCompany:
+    return UsersRolesFromCompany(
+        user=UserSummaryDTO(id=user_id, name=user_id, email=f"{user_id}@b.com", active=True),
+        is_owner=False,
+        role=RoleDTO(id=role_id, name=role_id, company_id="company-1", number_of_cooldown_days=cooldown),
+    )
+
+
+def _schedulable(shift_id: int, day: int, user_id: str | None = None, is_holiday: bool = False) -> SchedulableShift:
+    when = datetime(2026, 1, day, tzinfo=timezone.utc)
+    return SchedulableShift(id=shift_id, work_day_id=shift_id, role_id="nurse", date=when, is_holiday=is_holiday, start_time=when + timedelta(hours=8), user_id=user_id)
+
+
+@pytest.mark.asyncio
+async def test_schedule_company_shifts_uses_history_and_skips_holidays():
+    shifts_repo = FakeWorkShiftsRepo(
+        [
+            _schedulable(1, 4, user_id="ana"),
+            _schedulable(2, 5),
+            _schedulable(3, 6, user_id="bia", is_holiday=True),
+            _schedulable(4, 7),
+        ]
+    )
+    usecase = ScheduleCompanyShiftsUseCase(
+        shifts_repo,
+        FakeUserCompanyRolesRepo([_member("ana", "nurse", 1), _member("bia", "nurse", 1)]),
+        FakePermissions(owners={("owner", "company-1")}, users={"owner", "other"}),
+        FakeUnitOfWork(),
+    )
+
+    with pytest.raises(PermissionDeniedError):
+        await usecase.execute("other", "company-1", datetime(2026, 1, 5, tzinfo=timezone.utc), datetime(2026, 1, 7, tzinfo=timezone.utc))
+
+    summary = await usecase.execute("owner", "company-1", datetime(2026, 1, 5, tzinfo=timezone.utc), datetime(2026, 1, 7, tzinfo=timezone.utc))
+
+    # ana trabalhou no dia 4 e ainda descansa no dia 5
+    assert shifts_repo.assigned == {2: "bia", 3: None, 4: "ana"}
+    assert summary.total_shifts == 3
+    assert summary.assigned == 2
+    assert summary.unassigned_shift_ids == []
+
+
+@pytest.mark.asyncio
+async def test_incremental_reschedule_only_touches_the_dependency_window():
+    # escala completa de 30 dias com 3 enfermeiros e 1 dia de descanso
+    shifts = [_schedulable(day, day) for day in range(1, 31)]
+    shifts_repo = FakeWorkShiftsRepo(shifts)
+    members = FakeUserCompanyRolesRepo([_member("ana", "nurse", 1), _member("bia", "nurse", 1), _member("caio", "nurse", 1)])
+    permissions = FakePermissions(owners={("owner", "company-1")})
+    await ScheduleCompanyShiftsUseCase(shifts_repo, members, permissions, FakeUnitOfWork()).execute(
+        "owner", "company-1", datetime(2026, 1, 1, tzinfo=timezone.utc), datetime(2026, 1, 30, tzinfo=timezone.utc)
+    )
+    before = {s.id: s.user_id for s in shifts}
+
+    # dia 10 vira feriado
+    shifts[9].is_holiday = True
+    shifts_repo.assigned.clear()
+    uow = FakeUnitOfWork()
+    workdays = FakeWorkdaysRepo(shifts)
+    usecase = IncrementalRescheduleUseCase(shifts_repo, workdays, members, permissions, uow)
+    summary = await usecase.execute("owner", ScheduleChangeSet(company_id="company-1", work_day_ids=[10]))
+    assert workdays.queries == 1
+
+    assert set(shifts_repo.assigned) <= {10, 11}
+    assert shifts_repo.assigned[10] is None
+    assert [c.shift_id for c in summary.changes] == sorted(shifts_repo.assigned)
+    assert all(s.user_id == before[s.id] for s in shifts if s.id not in (10, 11))
+    assert uow.commits == 1
+
+    # caio sai da empresa: os turnos dele a partir do dia 20 sao redistribuidos
+    members.members = [m for m in members.members if m.user.id != "caio"]
+    caio_days = [s.id for s in shifts if s.user_id == "caio" and s.id >= 20]
+    await usecase.execute(
+        "owner", ScheduleChangeSet(company_id="company-1", removed_user_ids=["caio"], since=datetime(2026, 1, 20, tzinfo=timezone.utc))
+    )
+
+    assert caio_days and all(shifts[i - 1].user_id != "caio" for i in caio_days)
+    assert all(s.user_id == "caio" for s in shifts if s.id < 20 and before[s.id] == "caio" and s.id not in (10, 11))
+
+
+@pytest.mark.asyncio
+async def test_incremental_reschedule_rejects_workdays_from_another_company():
+    shifts = [_schedulable(day, day) for day in range(1, 4)]
+    members = FakeUserCompanyRolesRepo([_member("ana", "nurse", 1)])
+    permissions = FakePermissions(owners={("owner", "company-2")})
+    uow = FakeUnitOfWork()
+    # os dias pertencem a company-1; o dono da company-2 nao pode reescalar por id
+    usecase = IncrementalRescheduleUseCase(FakeWorkShiftsRepo(shifts), FakeWorkdaysRepo(shifts), members, permissions, uow)
+
+    with pytest.raises(NotFoundError, match="Workday 2 not found"):
+        await usecase.execute("owner", ScheduleChangeSet(company_id="company-2", work_day_ids=[2]))
+    assert uow.commits == 0
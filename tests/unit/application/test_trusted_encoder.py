@@ -0,0 +1,63 @@
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydantic import TypeAdapter
+
+from src.app.controllers.schemas.pydantic.schedule_dtos import SCHEDULE_ENCODER, ScheduleResponse
+from src.app.controllers.schemas.pydantic.trusted_encoder import TrustedDTOEncoder
+from src.app.controllers.schemas.pydantic.user_schemas import USERS_ROLES_FROM_COMPANY_ENCODER, UserResponse, UsersRolesFromCompanyResponse
+from src.app.controllers.schemas.pydantic.workdays_dtos import WORKDAY_ENCODER, WorkdayPageResponse, WorkdayResponse
+from src.domain.entities.role import Role
+from src.domain.entities.user import User
+from src.domain.entities.work_day import WorkDay
+from src.interfaces.types.user_types import RoleDTO, UsersRolesFromCompany, UserSummaryDTO
+from src.interfaces.types.workshift_types import ScheduleSummary, ShiftAssignmentChange
+
+
+def _via_response_model(model, value) -> bytes:
+    # o que o FastAPI faz com o retorno do endpoint: valida pelo response_model e serializa
+    adapter = TypeAdapter(model)
+    return adapter.dump_json(adapter.validate_python(value))
+
+
+def test_workday_page_matches_response_model_output():
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    items = [WorkDay(id=i, role_id="role-1", date=start + timedelta(days=i), is_holiday=i % 7 == 6, weekday=(start + timedelta(days=i)).weekday()) for i in range(20)]
+
+    response = WORKDAY_ENCODER.page(items, "cursor")
+
+    assert response.media_type == "application/json"
+    assert response.body == _via_response_model(WorkdayPageResponse, {"items": [asdict(w) for w in items], "next_cursor": "cursor"})
+
+
+def test_one_keeps_status_code_and_response_model_output():
+    workday = WorkDay(id=None, role_id="role-1", date=datetime(2026, 3, 2, tzinfo=timezone.utc), is_holiday=False)
+
+    response = WORKDAY_ENCODER.one(workday, status_code=201)
+
+    assert response.status_code == 201
+    assert response.body == _via_response_model(WorkdayResponse, asdict(workday))
+
+
+def test_nested_dataclasses_match_response_model_output():
+    links = [
+        UsersRolesFromCompany(user=UserSummaryDTO(id="u1", name="Ana.Silva", email="ana@x.com", active=True), is_owner=True, role=None),
+        UsersRolesFromCompany(
+            user=UserSummaryDTO(id="u2", name="Bia.Souza", email="bia@x.com", active=False),
+            is_owner=False,
+            role=RoleDTO(id="r1", name="Nurse", company_id="c1", number_of_cooldown_days=2),
+        ),
+    ]
+    summary = ScheduleSummary(total_shifts=2, assigned=1, unassigned_shift_ids=[7], load={"u1": 1}, changes=[ShiftAssignmentChange(shift_id=3, previous_user_id=None, user_id="u1")])
+
+    assert USERS_ROLES_FROM_COMPANY_ENCODER.many(links).body == _via_response_model(list[UsersRolesFromCompanyResponse], [asdict(link) for link in links])
+    assert SCHEDULE_ENCODER.one(summary).body == _via_response_model(ScheduleResponse, asdict(summary))
+
+
+def test_rejects_dataclass_with_fields_outside_the_response_model():
+    # User tem hashed_password: nunca pode ir direto para o JSON
+    with pytest.raises(TypeError, match="hashed_password"):
+        TrustedDTOEncoder(User, UserResponse)
+    with pytest.raises(TypeError):
+        TrustedDTOEncoder(Role, WorkdayResponse)
@@ -4,10 +4,8 @@ import pytest
 
 from src.domain.entities.company import Company
 from src.domain.entities.user import User
-from src.domain.entities.user_company_role import UserCompanyRole
 from src.domain.entities.user_company_requests import UserCompanyRequestStatus, UserCompanyRequests
-from src.domain.errors import AlreadyExistsError, PermissionDeniedError
-from src.interfaces.types.user_types import CompaniesRolesFromUser, CompanyDTO
+from src.domain.errors import AlreadyExistsError, NotFoundError, PermissionDeniedError, ValidationError
 from src.usecases.user_company_requests.approve_user_company_request_usecase import ApproveUserCompanyRequestUseCase
 from src.usecases.user_company_requests.create_user_company_request_usecase import CreateUserCompanyRequestUseCase
 
@@ -28,21 +26,31 @@ class FakeCompaniesRepo:
         return self.companies.get(id)
 
 
-class FakeUserCompanyRolesRepo:
-    def __init__(self):
-        self.links: dict[str, list[CompaniesRolesFromUser]] = {}
+class FakePermissions:
+    def __init__(self, owners: set[tuple[str, str]], users: set[str] | None = None, members: set[tuple[str, str]] | None = None):
+        self.owners = owners
+        self.users = users if users is not None else {user_id for user_id, _ in owners}
+        self.members = owners | (members or set())
 
-    async def list_companies_and_roles_by_user(self, user_id: str):
-        return self.links.get(user_id, [])
+    async def is_company_owner(self, user_id: str, company_id: str) -> bool:
+        return (user_id, company_id) in self.owners
 
-    async def list_users_and_roles_by_company(self, company_id: str):
-        return []
+    async def is_company_member(self, user_id: str, company_id: str) -> bool:
+        return (user_id, company_id) in self.members
 
-    async def assign_user_and_role_to_company(self, user_id: str, company_id: str, role_id: str | None):
-        self.links.setdefault(user_id, []).append(CompaniesRolesFromUser(company=CompanyDTO(id=company_id, name=""), role=None))
+    async def user_exists(self, user_id: str) -> bool:
+        return user_id in self.users
 
-    async def remove_user_company_role_register(self, register_id: str):
-        return None
+
+class FakeUnitOfWork:
+    def __init__(self):
+        self.commits = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        pass
 
 
 class FakeUserCompanyRequestsRepo:
@@ -107,10 +115,9 @@ async def test_create_company_request_success():
         }
     )
     companies_repo = FakeCompaniesRepo({"company-1": Company(id="company-1", name="Company")})
-    roles_repo = FakeUserCompanyRolesRepo()
     requests_repo = FakeUserCompanyRequestsRepo()
 
-    usecase = CreateUserCompanyRequestUseCase(requests_repo, users_repo, companies_repo, roles_repo)
+    usecase = CreateUserCompanyRequestUseCase(requests_repo, users_repo, companies_repo, FakePermissions(owners=set()), FakeUnitOfWork())
     result = await usecase.execute(user_id="user-1", company_id="company-1")
 
     assert result.status == UserCompanyRequestStatus.PENDING
@@ -134,10 +141,9 @@ async def test_create_company_request_duplicate_pending():
         }
     )
     companies_repo = FakeCompaniesRepo({"company-1": Company(id="company-1", name="Company")})
-    roles_repo = FakeUserCompanyRolesRepo()
     requests_repo = FakeUserCompanyRequestsRepo()
 
-    usecase = CreateUserCompanyRequestUseCase(requests_repo, users_repo, companies_repo, roles_repo)
+    usecase = CreateUserCompanyRequestUseCase(requests_repo, users_repo, companies_repo, FakePermissions(owners=set()), FakeUnitOfWork())
     await usecase.execute(user_id="user-1", company_id="company-1")
 
     with pytest.raises(AlreadyExistsError):
@@ -146,56 +152,44 @@ async def test_create_company_request_duplicate_pending():
 
 @pytest.mark.asyncio
 async def test_approve_request_requires_owner():
-    non_owner = User(
-        id="owner-1",
-        first_name="Owner",
-        last_name="User",
-        email="owner@b.com",
-        hashed_password="hashed",
-        active=True,
-        created_at=datetime.now(timezone.utc),
-        companies_roles=[],
-    )
-    users_repo = FakeUsersRepo({"owner-1": non_owner})
-    roles_repo = FakeUserCompanyRolesRepo()
     requests_repo = FakeUserCompanyRequestsRepo()
     request = await requests_repo.create(user_id="user-2", company_id="company-1")
 
-    usecase = ApproveUserCompanyRequestUseCase(requests_repo, users_repo, roles_repo)
+    usecase = ApproveUserCompanyRequestUseCase(requests_repo, FakePermissions(owners=set(), users={"owner-1"}), FakeUnitOfWork())
 
     with pytest.raises(PermissionDeniedError):
         await usecase.execute(request_id=request.id, owner_id="owner-1")
 
 
+@pytest.mark.asyncio
+async def test_approve_request_unknown_owner_is_not_found():
+    requests_repo = FakeUserCompanyRequestsRepo()
+    request = await requests_repo.create(user_id="user-2", company_id="company-1")
+
+    usecase = ApproveUserCompanyRequestUseCase(requests_repo, FakePermissions(owners=set()), FakeUnitOfWork())
+
+    with pytest.raises(NotFoundError):
+        await usecase.execute(request_id=request.id, owner_id="ghost")
+
+
 @pytest.mark.asyncio
 async def test_approve_request_success():
-    owner = User(
-        id="owner-1",
-        first_name="Owner",
-        last_name="User",
-        email="owner@b.com",
-        hashed_password="hashed",
-        active=True,
-        created_at=datetime.now(timezone.utc),
-        companies_roles=[
-            UserCompanyRole(
-                id="ucr-1",
-                user_id="owner-1",
-                company_id="company-1",
-                role_id=None,
-                is_owner=True,
-                company=None,
-                role=None,
-            )
-        ],
-    )
-    users_repo = FakeUsersRepo({"owner-1": owner})
-    roles_repo = FakeUserCompanyRolesRepo()
     requests_repo = FakeUserCompanyRequestsRepo()
     request = await requests_repo.create(user_id="user-2", company_id="company-1")
 
-    usecase = ApproveUserCompanyRequestUseCase(requests_repo, users_repo, roles_repo)
+    usecase = ApproveUserCompanyRequestUseCase(requests_repo, FakePermissions(owners={("owner-1", "company-1")}), FakeUnitOfWork())
     result = await usecase.execute(request_id=request.id, owner_id="owner-1")
 
     assert result.status == UserCompanyRequestStatus.APPROVED
-    assert result.accepted is True
+
+
+@pytest.mark.asyncio
+async def test_approve_request_already_linked_user():
+    requests_repo = FakeUserCompanyRequestsRepo()
+    request = await requests_repo.create(user_id="user-2", company_id="company-1")
+    permissions = FakePermissions(owners={("owner-1", "company-1")}, members={("user-2", "company-1")})
+
+    usecase = ApproveUserCompanyRequestUseCase(requests_repo, permissions, FakeUnitOfWork())
+
+    with pytest.raises(ValidationError):
+        await usecase.execute(request_id=request.id, owner_id="owner-1")
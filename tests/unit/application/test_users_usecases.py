@@ -3,10 +3,10 @@ from datetime import datetime, timezone
 import pytest
 
 from src.domain.entities.user import User
-from src.domain.errors import NotFoundError
-from src.interfaces.types.user_types import UserUpdatePayload
+from src.domain.errors import NotFoundError, ValidationError
+from src.interfaces.types.user_types import USER_LIST_FIELDS, UserListFilters, UserPage, UserUpdatePayload
 from src.usecases.users.delete_user_usecase import DeleteUserUseCase
-from src.usecases.users.list_users_usecase import ListUsersUseCase
+from src.usecases.users.list_users_usecase import MAX_USERS_PAGE_SIZE, ListUsersUseCase
 from src.usecases.users.retrieve_user_usecase import RetrieveUserUseCase
 from src.usecases.users.update_user_usecase import UpdateUserUseCase
 
@@ -15,18 +15,22 @@ class FakeUserRepo:
     def __init__(self):
         self.users: dict[str, User] = {}
         self.deleted_ids: list[str] = []
+        self.last_filters: UserListFilters | None = None
 
-    async def list(self):
-        return list(self.users.values())
+    async def list(self, filters: UserListFilters):
+        self.last_filters = filters
+        fields = filters.fields or USER_LIST_FIELDS
+        items = [{name: getattr(user, name) for name in fields} for user in self.users.values()]
+        return UserPage(items=items[: filters.limit], next_cursor=None)
 
-    async def create(self, first_name: str, last_name: str, email: str, password: str, active: bool):
+    async def create(self, first_name: str, last_name: str, email: str, hashed_password: str, active: bool):
         user_id = str(len(self.users) + 1)
         user = User(
             id=user_id,
             first_name=first_name,
             last_name=last_name,
             email=email,
-            hashed_password="hashed",
+            hashed_password=hashed_password,
             active=active,
             created_at=datetime.now(timezone.utc),
             companies_roles=[],
@@ -64,22 +68,37 @@ class FakeUserRepo:
         self.deleted_ids.append(id)
         self.users.pop(id, None)
 
-    def verify_password(self, plain: str, hashed: str) -> bool:
-        return plain == "secret"
+
+class FakeUnitOfWork:
+    def __init__(self):
+        self.commits = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        pass
 
 
 @pytest.mark.asyncio
-async def test_list_users_usecase_returns_public_dtos():
+async def test_list_users_usecase_caps_limit_and_projects_fields():
     repo = FakeUserRepo()
     await repo.create("A", "B", "first@b.com", "secret", True)
     await repo.create("C", "D", "second@b.com", "secret", False)
 
     usecase = ListUsersUseCase(repo)
-    users = await usecase.execute()
+    page = await usecase.execute(UserListFilters(fields=("email",), limit=10_000))
 
-    assert len(users) == 2
-    assert users[0].email == "first@b.com"
-    assert users[1].email == "second@b.com"
+    assert repo.last_filters is not None and repo.last_filters.limit == MAX_USERS_PAGE_SIZE
+    assert page.items == [{"email": "first@b.com"}, {"email": "second@b.com"}]
+
+
+@pytest.mark.asyncio
+async def test_list_users_usecase_rejects_unknown_fields():
+    usecase = ListUsersUseCase(FakeUserRepo())
+
+    with pytest.raises(ValidationError):
+        await usecase.execute(UserListFilters(fields=("hashed_password",)))
 
 
 @pytest.mark.asyncio
@@ -109,28 +128,33 @@ async def test_update_user_usecase_updates_fields():
     repo = FakeUserRepo()
     created = await repo.create("A", "B", "update@b.com", "secret", True)
 
-    usecase = UpdateUserUseCase(repo)
+    uow = FakeUnitOfWork()
+    usecase = UpdateUserUseCase(repo, uow)
     updated = await usecase.execute(created.id, UserUpdatePayload(first_name="Updated", active=False))
 
     assert updated.first_name == "Updated"
     assert updated.active is False
+    assert uow.commits == 1
 
 
 @pytest.mark.asyncio
 async def test_update_user_usecase_not_found():
     repo = FakeUserRepo()
-    usecase = UpdateUserUseCase(repo)
+    uow = FakeUnitOfWork()
+    usecase = UpdateUserUseCase(repo, uow)
 
     with pytest.raises(NotFoundError):
         await usecase.execute("missing-id", UserUpdatePayload(first_name="Updated"))
 
+    assert uow.commits == 0
+
 
 @pytest.mark.asyncio
 async def test_delete_user_usecase_calls_repository_delete():
     repo = FakeUserRepo()
     created = await repo.create("A", "B", "delete@b.com", "secret", True)
 
-    usecase = DeleteUserUseCase(repo)
+    usecase = DeleteUserUseCase(repo, FakeUnitOfWork())
     await usecase.execute(created.id)
 
     assert created.id in repo.deleted_ids
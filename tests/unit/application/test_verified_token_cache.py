@@ -0,0 +1,181 @@
+import threading
+import time
+
+import pytest
+from jose import jwt
+
+from src.infra.security import create_access_token
+from src.infra.settings.config import get_settings
+from src.infra.services import jwt_token_service
+from src.infra.services.jwt_token_service import JWTTokenService, access_revocation_warning
+from src.infra.services.membership_cache import InProcessCacheBackend, LocalSharedCacheBackend, LocalSharedStore
+from src.infra.services.verified_token_cache import VerifiedTokenCache
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _counting_verify(monkeypatch):
+    calls = {"count": 0}
+    original = jwt_token_service.verify_access_token
+
+    def _verify(token):
+        calls["count"] += 1
+        return original(token)
+
+    monkeypatch.setattr(jwt_token_service, "verify_access_token", _verify)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_repeated_verification_hits_the_cache(monkeypatch):
+    calls = _counting_verify(monkeypatch)
+    service = JWTTokenService(cache=VerifiedTokenCache(max_entries=10))
+    token = create_access_token("user-1")
+
+    for _ in range(5):
+        assert (await service.verify_access_token(token))["sub"] == "user-1"
+
+    assert calls["count"] == 1
+    assert service.metrics()["hits"] == 4
+
+
+@pytest.mark.asyncio
+async def test_invalid_tokens_are_not_cached(monkeypatch):
+    calls = _counting_verify(monkeypatch)
+    service = JWTTokenService(cache=VerifiedTokenCache(max_entries=10))
+
+    assert await service.verify_access_token("not-a-jwt") is None
+    assert await service.verify_access_token("not-a-jwt") is None
+
+    assert calls["count"] == 2
+    assert service.metrics()["size"] == 0
+
+
+def test_entries_expire_at_token_exp():
+    clock = FakeClock()
+    cache = VerifiedTokenCache(max_entries=10, clock=clock)
+    cache.put("token", {"sub": "user-1", "exp": 1_060})
+
+    assert cache.get("token") == {"sub": "user-1", "exp": 1_060}
+    clock.now = 1_060
+    assert cache.get("token") is None
+    assert cache.metrics()["size"] == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = VerifiedTokenCache(max_entries=2, clock=FakeClock())
+    cache.put("a", {"sub": "u", "exp": 2_000})
+    cache.put("b", {"sub": "u", "exp": 2_000})
+    cache.get("a")
+    cache.put("c", {"sub": "u", "exp": 2_000})
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+    assert cache.metrics()["evictions"] == 1
+
+
+def test_invalidate_subject_drops_only_that_subject():
+    cache = VerifiedTokenCache(max_entries=10, clock=FakeClock())
+    cache.put("a1", {"sub": "alice", "exp": 2_000})
+    cache.put("a2", {"sub": "alice", "exp": 2_000})
+    cache.put("b1", {"sub": "bob", "exp": 2_000})
+
+    cache.invalidate_subject("alice")
+
+    assert cache.get("a1") is None
+    assert cache.get("a2") is None
+    assert cache.get("b1") is not None
+
+
+def test_cached_payload_is_not_shared_with_callers():
+    cache = VerifiedTokenCache(max_entries=10, clock=FakeClock())
+    cache.put("token", {"sub": "user-1", "exp": 2_000})
+
+    cache.get("token")["sub"] = "someone-else"
+
+    assert cache.get("token")["sub"] == "user-1"
+
+
+def test_concurrent_access_keeps_cache_bounded():
+    cache = VerifiedTokenCache(max_entries=50, clock=FakeClock())
+
+    def _worker(prefix: str):
+        for i in range(500):
+            cache.put(f"{prefix}-{i}", {"sub": prefix, "exp": 2_000})
+            cache.get(f"{prefix}-{i // 2}")
+        cache.invalidate_subject(prefix)
+
+    threads = [threading.Thread(target=_worker, args=(f"t{n}",)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert cache.metrics()["size"] == 0
+
+
+def _token(subject: str, iat: int) -> str:
+    settings = get_settings()
+    return jwt.encode({"sub": subject, "iat": iat, "exp": iat + 900}, settings.ACCESS_SECRET, algorithm=settings.ALGORITHM)
+
+
+@pytest.mark.asyncio
+async def test_revoked_subject_tokens_stop_verifying_even_after_a_cache_miss():
+    now = int(time.time())
+    clock = FakeClock(now)
+    service = JWTTokenService(cache=VerifiedTokenCache(max_entries=10), access_token_ttl_seconds=900, clock=clock)
+    old, other = _token("alice", now - 60), _token("bob", now - 60)
+    assert (await service.verify_access_token(old))["sub"] == "alice"
+
+    await service.revoke_access_tokens("alice")
+
+    # sem a marca o token seria verificado de novo e voltaria ao cache
+    assert await service.verify_access_token(old) is None
+    assert await service.verify_access_token(old) is None
+    assert service.metrics()["size"] == 0
+    assert (await service.verify_access_token(other))["sub"] == "bob"
+    # login depois da revogacao emite token com iat posterior
+    assert (await service.verify_access_token(_token("alice", now + 1)))["sub"] == "alice"
+
+
+@pytest.mark.asyncio
+async def test_revocation_marks_are_dropped_after_the_access_token_lifetime():
+    clock = FakeClock(1_000)
+    revocations = InProcessCacheBackend(clock=clock)
+    service = JWTTokenService(revocations=revocations, access_token_ttl_seconds=900, clock=clock)
+    await service.revoke_access_tokens("alice")
+    clock.now = 1_901
+    await service.revoke_access_tokens("bob")
+
+    assert await revocations.get("access_not_before:alice") is None
+    assert await revocations.get("access_not_before:bob") == "1902"
+
+
+@pytest.mark.asyncio
+async def test_revocation_reaches_every_worker_sharing_the_backend():
+    now = int(time.time())
+    store = LocalSharedStore()
+    # dois workers: caches de payload separados, mesmo backend de revogacao
+    worker_a, worker_b = (
+        JWTTokenService(cache=VerifiedTokenCache(max_entries=10), revocations=LocalSharedCacheBackend(store), clock=FakeClock(now)) for _ in range(2)
+    )
+    stolen = _token("alice", now - 60)
+    assert (await worker_b.verify_access_token(stolen))["sub"] == "alice"
+
+    await worker_a.revoke_access_tokens("alice")
+
+    # o payload continua no cache do worker B, mas a marca compartilhada vale sobre ele
+    assert await worker_b.verify_access_token(stolen) is None
+
+
+def test_per_process_revocation_backend_warns_with_several_workers():
+    assert access_revocation_warning("memory", workers=1) is None
+    assert "WEB_CONCURRENCY=4" in access_revocation_warning("memory", workers=4)
+    assert "WEB_CONCURRENCY=2" in access_revocation_warning("local_shared", workers=2)
@@ -0,0 +1,189 @@
+from datetime import date, datetime, timezone
+
+import pytest
+
+from src.domain.entities.role import Role
+from src.domain.entities.work_day import WorkDay
+from src.domain.errors import AlreadyExistsError, NotFoundError, ValidationError
+from src.interfaces.types.workday_types import BatchCreateWorkdays
+from src.usecases.workdays.batch_individual_create_workday_usecase import BatchIndividualCreateWorkdayUseCase
+from src.usecases.workdays.batch_interval_create_workday_usecase import BatchIntervalCreateWorkdayUseCase
+from src.usecases.workdays.create_workday_usecase import CreateWorkdayUseCase
+from src.usecases.workdays.calendar_rules import WEEKDAYS_ONLY, RecurrenceRule, generate_dates
+
+
+class FakeWorkdaysRepo:
+    def __init__(self):
+        self.workdays: dict[tuple[str, datetime], WorkDay] = {}
+        self.batch_create_calls = 0
+
+    async def create(self, workday: WorkDay):
+        return (await self.batch_create([workday]))[0]
+
+    async def batch_create(self, payloads: list[WorkDay], conflict: str = "error"):
+        self.batch_create_calls += 1
+        conflicting = [w for w in payloads if (w.role_id, w.date) in self.workdays]
+        if conflict == "error" and conflicting:
+            raise AlreadyExistsError(f"Workdays for dates {', '.join(str(w.date) for w in conflicting)} already exist.")
+
+        created = []
+        for workday in payloads:
+            key = (workday.role_id, workday.date)
+            if key in self.workdays:
+                if conflict == "skip":
+                    continue
+                workday.id = self.workdays[key].id
+            else:
+                workday.id = len(self.workdays) + 1
+            self.workdays[key] = workday
+            created.append(workday)
+        return created
+
+
+class FakeUnitOfWork:
+    def __init__(self):
+        self.commits = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        pass
+
+
+class FakeRolesRepo:
+    def __init__(self, roles: list[Role] | None = None):
+        self.roles = {role.id: role for role in roles or []}
+
+    async def get_by_id(self, role_id: str):
+        return self.roles.get(role_id)
+
+
+def _utc(year: int, month: int, day: int) -> datetime:
+    return datetime(year, month, day, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_create_workday_only_conflicts_within_the_same_role():
+    repo = FakeWorkdaysRepo()
+    uow = FakeUnitOfWork()
+    usecase = CreateWorkdayUseCase(repo, uow)
+    await usecase.execute(WorkDay(id=None, role_id="role-1", date=_utc(2026, 1, 2), is_holiday=False, weekday=4))
+
+    other_role = await usecase.execute(WorkDay(id=None, role_id="role-2", date=_utc(2026, 1, 2), is_holiday=False, weekday=4))
+    assert other_role.id == 2
+    with pytest.raises(AlreadyExistsError):
+        await usecase.execute(WorkDay(id=None, role_id="role-1", date=_utc(2026, 1, 2), is_holiday=True, weekday=4))
+    assert uow.commits == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_interval_create_builds_one_workday_per_day_in_a_single_call():
+    repo = FakeWorkdaysRepo()
+    usecase = BatchIntervalCreateWorkdayUseCase(repo, FakeRolesRepo(), FakeUnitOfWork())
+
+    created = await usecase.execute(BatchCreateWorkdays(start_date=_utc(2026, 1, 1), end_date=_utc(2026, 12, 31), role_id="role-1"))
+
+    assert len(created) == 365
+    assert repo.batch_create_calls == 1
+    assert created[0].date == _utc(2026, 1, 1)
+    assert created[0].weekday == _utc(2026, 1, 1).weekday()
+
+
+@pytest.mark.asyncio
+async def test_batch_interval_create_conflict_modes():
+    repo = FakeWorkdaysRepo()
+    await repo.batch_create([WorkDay(id=None, role_id="role-1", date=_utc(2026, 1, 2), is_holiday=True, weekday=4)])
+    usecase = BatchIntervalCreateWorkdayUseCase(repo, FakeRolesRepo(), FakeUnitOfWork())
+
+    with pytest.raises(AlreadyExistsError):
+        await usecase.execute(BatchCreateWorkdays(start_date=_utc(2026, 1, 1), end_date=_utc(2026, 1, 3), role_id="role-1"))
+
+    skipped = await usecase.execute(BatchCreateWorkdays(start_date=_utc(2026, 1, 1), end_date=_utc(2026, 1, 3), role_id="role-1", conflict="skip"))
+    assert [w.date for w in skipped] == [_utc(2026, 1, 1), _utc(2026, 1, 3)]
+
+    updated = await usecase.execute(BatchCreateWorkdays(start_date=_utc(2026, 1, 1), end_date=_utc(2026, 1, 3), role_id="role-1", conflict="update"))
+    assert len(updated) == 3
+    assert repo.workdays[("role-1", _utc(2026, 1, 2))].is_holiday is False
+
+
+@pytest.mark.asyncio
+async def test_batch_individual_create_forwards_conflict_mode():
+    repo = FakeWorkdaysRepo()
+    await repo.batch_create([WorkDay(id=None, role_id="role-1", date=_utc(2026, 3, 10), is_holiday=False, weekday=1)])
+    usecase = BatchIndividualCreateWorkdayUseCase(repo, FakeUnitOfWork())
+
+    payloads = [
+        WorkDay(id=None, role_id="role-1", date=_utc(2026, 3, 9), is_holiday=False, weekday=0),
+        WorkDay(id=None, role_id="role-1", date=_utc(2026, 3, 10), is_holiday=False, weekday=1),
+    ]
+
+    with pytest.raises(AlreadyExistsError):
+        await usecase.execute(payloads)
+
+    created = await usecase.execute(payloads, conflict="skip")
+    assert [w.date for w in created] == [_utc(2026, 3, 9)]
+
+
+def test_generate_dates_weekdays_only_skips_weekends_and_holidays():
+    rule = RecurrenceRule(weekdays=WEEKDAYS_ONLY, holidays=frozenset({date(2026, 1, 1)}))
+
+    days = generate_dates(date(2026, 1, 1), date(2026, 1, 11), rule)
+
+    assert days == [date(2026, 1, 2), date(2026, 1, 5), date(2026, 1, 6), date(2026, 1, 7), date(2026, 1, 8), date(2026, 1, 9)]
+
+
+def test_generate_dates_every_n_days_and_cooldown():
+    assert generate_dates(date(2026, 1, 1), date(2026, 1, 10), RecurrenceRule(every_n_days=3)) == [
+        date(2026, 1, 1),
+        date(2026, 1, 4),
+        date(2026, 1, 7),
+        date(2026, 1, 10),
+    ]
+    # cooldown de 2 dias com passo 2 -> proximo dia valido e 4 dias depois
+    assert generate_dates(date(2026, 1, 1), date(2026, 1, 10), RecurrenceRule(every_n_days=2, cooldown_days=2)) == [
+        date(2026, 1, 1),
+        date(2026, 1, 5),
+        date(2026, 1, 9),
+    ]
+    # com filtro de dias da semana o cooldown conta a partir do ultimo dia aceito
+    assert generate_dates(date(2026, 1, 5), date(2026, 1, 16), RecurrenceRule(weekdays=WEEKDAYS_ONLY, cooldown_days=1)) == [
+        date(2026, 1, 5),
+        date(2026, 1, 7),
+        date(2026, 1, 9),
+        date(2026, 1, 12),
+        date(2026, 1, 14),
+        date(2026, 1, 16),
+    ]
+
+
+def test_recurrence_rule_rejects_invalid_values():
+    with pytest.raises(ValueError):
+        RecurrenceRule(every_n_days=0)
+    with pytest.raises(ValueError):
+        RecurrenceRule(weekdays=frozenset({7}))
+
+
+@pytest.mark.asyncio
+async def test_batch_interval_create_applies_rules_and_role_cooldown():
+    repo = FakeWorkdaysRepo()
+    usecase = BatchIntervalCreateWorkdayUseCase(repo, FakeRolesRepo([Role(id="role-1", name="Nurse", company_id=None, number_of_cooldown_days=1)]), FakeUnitOfWork())
+
+    created = await usecase.execute(
+        BatchCreateWorkdays(
+            start_date=_utc(2026, 1, 5),
+            end_date=_utc(2026, 1, 11),
+            role_id="role-1",
+            weekdays=[0, 1, 2, 3, 4],
+            holidays=[date(2026, 1, 7)],
+            apply_cooldown=True,
+        )
+    )
+
+    assert [w.date for w in created] == [_utc(2026, 1, 5), _utc(2026, 1, 8)]
+    assert [w.weekday for w in created] == [0, 3]
+
+    with pytest.raises(NotFoundError):
+        await usecase.execute(BatchCreateWorkdays(start_date=_utc(2026, 1, 5), end_date=_utc(2026, 1, 11), role_id="missing", apply_cooldown=True))
+    with pytest.raises(ValidationError):
+        await usecase.execute(BatchCreateWorkdays(start_date=_utc(2026, 1, 5), end_date=_utc(2026, 1, 11), role_id="role-1", every_n_days=0))
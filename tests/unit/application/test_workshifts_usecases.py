@@ -0,0 +1,149 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.domain.entities.work_day import WorkDay
+from src.domain.entities.work_shift import WorkShift
+from src.domain.errors import AlreadyExistsError, NotFoundError, ValidationError
+from src.domain.interval_tree import IntervalTree, overlapping_pairs
+from src.interfaces.types.workshift_types import PartialWorkShiftUpdate
+from src.usecases.workshifts.batch_create_workshifts_usecase import BatchCreateWorkShiftsUseCase
+from src.usecases.workshifts.create_workshift_usecase import CreateWorkShiftUseCase
+from src.usecases.workshifts.update_workshift_usecase import UpdateWorkShiftUseCase
+
+
+class FakeUnitOfWork:
+    def __init__(self):
+        self.commits = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        pass
+
+
+class FakeWorkdaysRepo:
+    def __init__(self, workday_ids: list[int]):
+        self.workdays = {i: WorkDay(id=i, role_id="role-1", date=_at(1, 0), is_holiday=False, weekday=3) for i in workday_ids}
+
+        self.existence_queries = 0
+
+    async def find_existing_ids(self, workday_ids):
+        self.existence_queries += 1
+        return {i for i in workday_ids if i in self.workdays}
+
+
+class FakeWorkShiftsRepo:
+    def __init__(self):
+        self.shifts: dict[int, WorkShift] = {}
+
+    async def find_conflicts(self, payloads: list[WorkShift]):
+        return [
+            s
+            for p in payloads
+            for s in self.shifts.values()
+            if s.work_day_id == p.work_day_id and s.id != p.id and s.start_time < p.end_time and s.end_time > p.start_time
+        ]
+
+    async def batch_create(self, payloads: list[WorkShift]):
+        if await self.find_conflicts(payloads):
+            raise AlreadyExistsError("overlap")
+        for payload in payloads:
+            payload.id = len(self.shifts) + 1
+            self.shifts[payload.id] = payload
+        return payloads
+
+    async def create(self, work_shift: WorkShift):
+        return (await self.batch_create([work_shift]))[0]
+
+    async def get_by_id(self, work_shift_id: int):
+        return self.shifts.get(work_shift_id)
+
+    async def update(self, work_shift_id: int, payload: PartialWorkShiftUpdate):
+        shift = self.shifts.get(work_shift_id)
+        if shift and payload.start_time:
+            shift.start_time = payload.start_time
+        if shift and payload.end_time:
+            shift.end_time = payload.end_time
+        return shift
+
+
+def _at(day: int, hour: int) -> datetime:
+    return datetime(2026, 1, day, tzinfo=timezone.utc) + timedelta(hours=hour)
+
+
+def _shift(work_day_id: int, start_hour: int, end_hour: int) -> WorkShift:
+    return WorkShift(id=None, work_day_id=work_day_id, start_time=_at(1, start_hour), end_time=_at(1, end_hour))
+
+
+def test_interval_tree_matches_brute_force_on_half_open_intervals():
+    rng = random.Random(7)
+    intervals = []
+    for i in range(300):
+        start = rng.randint(0, 1000)
+        intervals.append((start, start + rng.randint(1, 50), i))
+    tree = IntervalTree(intervals)
+
+    for _ in range(200):
+        start = rng.randint(0, 1000)
+        end = start + rng.randint(1, 80)
+        expected = {i for s, e, i in intervals if s < end and e > start}
+        assert set(tree.overlapping(start, end)) == expected
+
+    # intervalos que apenas se tocam nao se sobrepoem
+    assert IntervalTree([(0, 10, "a")]).overlapping(10, 20) == []
+    assert IntervalTree([]).overlapping(0, 1) == []
+
+
+def test_overlapping_pairs_finds_only_intersecting_intervals():
+    pairs = overlapping_pairs([(8, 12, "morning"), (12, 18, "afternoon"), (11, 13, "lunch")])
+
+    assert sorted(pairs) == [("lunch", "afternoon"), ("morning", "lunch")]
+
+
+@pytest.mark.asyncio
+async def test_create_workshift_validates_time_range_and_workday():
+    repo = FakeWorkShiftsRepo()
+    usecase = CreateWorkShiftUseCase(repo, FakeWorkdaysRepo([1]), FakeUnitOfWork())
+
+    with pytest.raises(ValidationError):
+        await usecase.execute(_shift(1, 12, 8))
+    with pytest.raises(NotFoundError):
+        await usecase.execute(_shift(99, 8, 12))
+
+    created = await usecase.execute(_shift(1, 8, 12))
+    assert created.id == 1
+
+    with pytest.raises(AlreadyExistsError):
+        await usecase.execute(_shift(1, 11, 14))
+
+
+@pytest.mark.asyncio
+async def test_batch_create_workshifts_checks_every_workday_once():
+    repo = FakeWorkShiftsRepo()
+    workdays = FakeWorkdaysRepo([1, 2])
+    usecase = BatchCreateWorkShiftsUseCase(repo, workdays, FakeUnitOfWork())
+
+    created = await usecase.execute([_shift(1, 8, 12), _shift(1, 12, 18), _shift(2, 8, 12)])
+    assert [s.id for s in created] == [1, 2, 3]
+    assert workdays.existence_queries == 1
+
+    with pytest.raises(NotFoundError, match="Workday 3 not found"):
+        await usecase.execute([_shift(1, 13, 14), _shift(3, 8, 12)])
+
+
+@pytest.mark.asyncio
+async def test_update_workshift_validates_merged_time_range():
+    repo = FakeWorkShiftsRepo()
+    await repo.create(_shift(1, 8, 12))
+    usecase = UpdateWorkShiftUseCase(repo, FakeWorkdaysRepo([1]), FakeUnitOfWork())
+
+    with pytest.raises(ValidationError):
+        await usecase.execute(1, PartialWorkShiftUpdate(start_time=_at(1, 13)))
+    with pytest.raises(NotFoundError):
+        await usecase.execute(42, PartialWorkShiftUpdate(end_time=_at(1, 13)))
+
+    updated = await usecase.execute(1, PartialWorkShiftUpdate(end_time=_at(1, 14)))
+    assert updated.end_time == _at(1, 14)